@@ -1,7 +1,9 @@
 from common.config import (
     CHUNK_ENCODING,
     CONTENT_KEY,
+    EMBEDDING_DIMENSIONS,
     EMBEDDING_MODEL,
+    EMBEDDING_VERSION,
     FILES_DIR,
     IMAGE_MIME_PREFIX,
     ROLE_ASSISTANT,
@@ -29,7 +31,9 @@ from common.utils import normalize_text, now_ms
 __all__ = [
     "CHUNK_ENCODING",
     "CONTENT_KEY",
+    "EMBEDDING_DIMENSIONS",
     "EMBEDDING_MODEL",
+    "EMBEDDING_VERSION",
     "FILES_DIR",
     "IMAGE_MIME_PREFIX",
     "ROLE_ASSISTANT",
@@ -10,12 +10,20 @@ from common.config.message_constants import (
     SUMMARY_BATCH_SIZE,
     SUMMARY_TRIGGER_SIZE,
 )
-from common.config.model_constants import CHUNK_ENCODING, EMBEDDING_MODEL
+from common.config.model_constants import (
+    CHUNK_ENCODING,
+    EMBEDDING_DIMENSIONS,
+    EMBEDDING_MODEL,
+    EMBEDDING_VERSION,
+    embedding_version,
+)
 
 __all__ = [
     "CHUNK_ENCODING",
     "CONTENT_KEY",
+    "EMBEDDING_DIMENSIONS",
     "EMBEDDING_MODEL",
+    "EMBEDDING_VERSION",
     "FILES_DIR",
     "IMAGE_MIME_PREFIX",
     "ROLE_ASSISTANT",
@@ -25,6 +33,7 @@ __all__ = [
     "ROLE_USER",
     "SUMMARY_BATCH_SIZE",
     "SUMMARY_TRIGGER_SIZE",
+    "embedding_version",
     "get_env_bool",
     "get_env_float",
     "get_env_int",
@@ -2,5 +2,18 @@ from __future__ import annotations
 
 import os
 
+from common.config.env import get_env_int
+
 CHUNK_ENCODING = "cl100k_base"
 EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+# text-embedding-3-* models return Matryoshka embeddings that can be shortened at request time; the
+# embedding columns must be converted to the same size (scripts/convert_embedding_storage.py).
+EMBEDDING_DIMENSIONS = max(1, get_env_int("EMBEDDING_DIMENSIONS", 1536))
+
+
+def embedding_version(model: str, dimensions: int) -> str:
+    """Label stored next to every embedding so rows record which model and size produced them."""
+    return f"{model}@{dimensions}"
+
+
+EMBEDDING_VERSION = embedding_version(EMBEDDING_MODEL, EMBEDDING_DIMENSIONS)
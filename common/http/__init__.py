@@ -1,3 +1,37 @@
 from common.http.http_client import HttpClient, HttpClientError, DEFAULT_TTL, DEFAULT_USER_AGENT, build_headers
+from common.http.circuit_breaker import (
+    DEFAULT_CIRCUIT_BREAKER_POLICY,
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitOpenError,
+    circuit_breaker_states,
+    get_circuit_breaker,
+)
+from common.http.rate_limiter import (
+    InProcessRateLimiter,
+    PostgresRateLimiter,
+    RateLimitPolicy,
+    RateLimiter,
+    get_rate_limiter,
+    parse_retry_after,
+)
 
-__all__ = ["HttpClient", "HttpClientError", "DEFAULT_TTL", "DEFAULT_USER_AGENT", "build_headers"]
+__all__ = [
+    "CircuitBreaker",
+    "CircuitBreakerPolicy",
+    "CircuitOpenError",
+    "HttpClient",
+    "HttpClientError",
+    "DEFAULT_CIRCUIT_BREAKER_POLICY",
+    "DEFAULT_TTL",
+    "DEFAULT_USER_AGENT",
+    "InProcessRateLimiter",
+    "PostgresRateLimiter",
+    "RateLimitPolicy",
+    "RateLimiter",
+    "build_headers",
+    "circuit_breaker_states",
+    "get_circuit_breaker",
+    "get_rate_limiter",
+    "parse_retry_after",
+]
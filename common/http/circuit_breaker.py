@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+
+CIRCUIT_STATE_CLOSED = "closed"
+CIRCUIT_STATE_OPEN = "open"
+CIRCUIT_STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    def __init__(self, key: str, retry_in_seconds: float) -> None:
+        super().__init__(f"Circuit open for '{key}'; upstream marked unhealthy, retry in {retry_in_seconds:.1f}s.")
+        self.key = key
+        self.retry_in_seconds = retry_in_seconds
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy:
+    window_size: int = 20
+    min_calls: int = 5
+    failure_rate_threshold: float = 0.5
+    slow_call_seconds: float = 8.0
+    slow_call_rate_threshold: float = 0.8
+    open_seconds: float = 30.0
+    half_open_max_calls: int = 1
+
+
+DEFAULT_CIRCUIT_BREAKER_POLICY = CircuitBreakerPolicy()
+
+
+@dataclass(frozen=True)
+class _CallOutcome:
+    latency_seconds: float
+    failed: bool
+
+
+class CircuitBreaker:
+    def __init__(self, key: str, policy: CircuitBreakerPolicy) -> None:
+        self.key = key
+        self.policy = policy
+        self._outcomes: deque[_CallOutcome] = deque(maxlen=max(1, policy.window_size))
+        self._state = CIRCUIT_STATE_CLOSED
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._lock = Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh_state(monotonic())
+            return self._state
+
+    def before_call(self) -> None:
+        with self._lock:
+            now = monotonic()
+            self._refresh_state(now)
+            if self._state == CIRCUIT_STATE_OPEN:
+                raise CircuitOpenError(self.key, self._opened_at + self.policy.open_seconds - now)
+            if self._state == CIRCUIT_STATE_HALF_OPEN:
+                if self._half_open_in_flight >= self.policy.half_open_max_calls:
+                    raise CircuitOpenError(self.key, 0.0)
+                self._half_open_in_flight += 1
+
+    def record_success(self, latency_seconds: float) -> None:
+        self._record(_CallOutcome(latency_seconds=latency_seconds, failed=False))
+
+    def record_failure(self, latency_seconds: float) -> None:
+        self._record(_CallOutcome(latency_seconds=latency_seconds, failed=True))
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        with self._lock:
+            latencies = sorted(outcome.latency_seconds for outcome in self._outcomes if not outcome.failed)
+        if len(latencies) < self.policy.min_calls:
+            return None
+        index = min(len(latencies) - 1, max(0, math.ceil(percentile * len(latencies)) - 1))
+        return latencies[index]
+
+    def _record(self, outcome: _CallOutcome) -> None:
+        with self._lock:
+            now = monotonic()
+            if self._state == CIRCUIT_STATE_HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                if outcome.failed or outcome.latency_seconds >= self.policy.slow_call_seconds:
+                    self._open(now)
+                else:
+                    self._state = CIRCUIT_STATE_CLOSED
+                    self._outcomes.clear()
+                    self._outcomes.append(outcome)
+                return
+            self._outcomes.append(outcome)
+            if self._state == CIRCUIT_STATE_CLOSED and self._is_unhealthy():
+                self._open(now)
+
+    def _is_unhealthy(self) -> bool:
+        total = len(self._outcomes)
+        if total < self.policy.min_calls:
+            return False
+        failures = sum(1 for outcome in self._outcomes if outcome.failed)
+        slow_calls = sum(1 for outcome in self._outcomes if outcome.latency_seconds >= self.policy.slow_call_seconds)
+        return (
+            failures / total >= self.policy.failure_rate_threshold
+            or slow_calls / total >= self.policy.slow_call_rate_threshold
+        )
+
+    def _open(self, now: float) -> None:
+        self._state = CIRCUIT_STATE_OPEN
+        self._opened_at = now
+        self._half_open_in_flight = 0
+
+    def _refresh_state(self, now: float) -> None:
+        if self._state == CIRCUIT_STATE_OPEN and now - self._opened_at >= self.policy.open_seconds:
+            self._state = CIRCUIT_STATE_HALF_OPEN
+            self._half_open_in_flight = 0
+
+
+_CIRCUIT_BREAKERS: dict[str, CircuitBreaker] = {}
+_CIRCUIT_BREAKERS_LOCK = Lock()
+
+
+def get_circuit_breaker(key: str, policy: CircuitBreakerPolicy) -> CircuitBreaker:
+    with _CIRCUIT_BREAKERS_LOCK:
+        breaker = _CIRCUIT_BREAKERS.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(key, policy)
+            _CIRCUIT_BREAKERS[key] = breaker
+        return breaker
+
+
+def circuit_breaker_states() -> dict[str, str]:
+    with _CIRCUIT_BREAKERS_LOCK:
+        breakers = list(_CIRCUIT_BREAKERS.values())
+    return {breaker.key: breaker.state for breaker in breakers}
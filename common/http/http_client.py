@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import timedelta
-from typing import Any
+from time import perf_counter
+from typing import Any, Callable
 
 import requests
 
 from cache.rest_cache_repository import RestCacheRepository
+from common.http.circuit_breaker import CircuitBreaker, CircuitBreakerPolicy, CircuitOpenError, get_circuit_breaker
+from common.http.rate_limiter import RateLimitPolicy, get_rate_limiter, parse_retry_after
 
 DEFAULT_TTL = timedelta(hours=1)
 DEFAULT_USER_AGENT = "POCProductSearch/1.0"
+HEDGE_LATENCY_PERCENTILE = 0.95
+
+_HEDGE_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="http-hedge")
 
 _DEFAULT_HEADERS = {
     "Accept": "application/json",
@@ -25,7 +32,22 @@ def build_headers(user_agent: str | None = None, **extra: str) -> dict[str, str]
 
 
 class HttpClientError(RuntimeError):
-    pass
+    def __init__(
+        self,
+        message: str,
+        *,
+        status_code: int | None = None,
+        retry_after_seconds: float | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after_seconds = retry_after_seconds
+
+
+def _is_upstream_failure(exc: Exception) -> bool:
+    if isinstance(exc, HttpClientError):
+        return exc.status_code is not None and exc.status_code >= 500
+    return isinstance(exc, requests.RequestException)
 
 
 class HttpClient:
@@ -35,11 +57,81 @@ class HttpClient:
         headers: dict[str, str] | None = None,
         cache: RestCacheRepository | None = None,
         ttl: timedelta = DEFAULT_TTL,
+        rate_limit_key: str | None = None,
+        rate_limit_policy: RateLimitPolicy | None = None,
+        circuit_breaker_key: str | None = None,
+        circuit_breaker_policy: CircuitBreakerPolicy | None = None,
+        hedge_requests: bool = False,
     ):
         self._timeout_s = timeout_s
         self._headers = {**_DEFAULT_HEADERS, **(headers or {})}
         self._cache = cache
         self._ttl = ttl
+        self._rate_limit_key = rate_limit_key
+        self._rate_limit_policy = rate_limit_policy
+        self._circuit_breaker_key = circuit_breaker_key or rate_limit_key
+        self._circuit_breaker_policy = circuit_breaker_policy
+        self._hedge_requests = hedge_requests
+
+    def _circuit_breaker(self) -> CircuitBreaker | None:
+        if not self._circuit_breaker_key or self._circuit_breaker_policy is None:
+            return None
+        return get_circuit_breaker(self._circuit_breaker_key, self._circuit_breaker_policy)
+
+    def _acquire_rate_limit_slot(self) -> None:
+        if self._rate_limit_key and self._rate_limit_policy is not None:
+            get_rate_limiter().acquire(self._rate_limit_key, self._rate_limit_policy)
+
+    def _raise_for_status(self, resp: requests.Response, url: str) -> None:
+        if resp.ok:
+            return
+        retry_after_seconds = parse_retry_after(resp.headers.get("Retry-After"))
+        if resp.status_code == 429 and self._rate_limit_key:
+            get_rate_limiter().penalize(self._rate_limit_key, retry_after_seconds)
+        raise HttpClientError(
+            f"HTTP {resp.status_code} on {url}: {resp.text[:500]}",
+            status_code=resp.status_code,
+            retry_after_seconds=retry_after_seconds,
+        )
+
+    def _send(self, send: Callable[[], requests.Response], url: str, *, hedge: bool = False) -> requests.Response:
+        breaker = self._circuit_breaker()
+        if breaker is not None:
+            try:
+                breaker.before_call()
+            except CircuitOpenError as exc:
+                raise HttpClientError(str(exc)) from exc
+        started_at = perf_counter()
+        try:
+            resp = self._send_hedged(send, breaker) if hedge and breaker is not None else send()
+            self._raise_for_status(resp, url)
+        except Exception as exc:
+            if breaker is not None:
+                latency_seconds = perf_counter() - started_at
+                if _is_upstream_failure(exc):
+                    breaker.record_failure(latency_seconds)
+                else:
+                    breaker.record_success(latency_seconds)
+            raise
+        if breaker is not None:
+            breaker.record_success(perf_counter() - started_at)
+        return resp
+
+    def _send_hedged(self, send: Callable[[], requests.Response], breaker: CircuitBreaker) -> requests.Response:
+        hedge_after_seconds = breaker.latency_percentile(HEDGE_LATENCY_PERCENTILE)
+        if hedge_after_seconds is None:
+            return send()
+        primary = _HEDGE_EXECUTOR.submit(send)
+        done, _ = wait([primary], timeout=hedge_after_seconds)
+        if done:
+            return primary.result()
+        self._acquire_rate_limit_slot()
+        hedged = _HEDGE_EXECUTOR.submit(send)
+        done, _ = wait([primary, hedged], return_when=FIRST_COMPLETED)
+        first = next(iter(done))
+        if first.exception() is None:
+            return first.result()
+        return (hedged if first is primary else primary).result()
 
     def get(self, url: str, params: dict[str, Any] | None = None) -> Any:
         params = params or {}
@@ -48,9 +140,12 @@ class HttpClient:
             if cached is not None:
                 return cached
 
-        resp = requests.get(url, params=params, headers=self._headers, timeout=self._timeout_s)
-        if not resp.ok:
-            raise HttpClientError(f"HTTP {resp.status_code} on {url}: {resp.text[:500]}")
+        self._acquire_rate_limit_slot()
+        resp = self._send(
+            lambda: requests.get(url, params=params, headers=self._headers, timeout=self._timeout_s),
+            url,
+            hedge=self._hedge_requests,
+        )
 
         payload = resp.json()
 
@@ -66,9 +161,11 @@ class HttpClient:
             if cached is not None:
                 return cached
 
-        resp = requests.post(url, json=json_payload, headers=self._headers, timeout=self._timeout_s)
-        if not resp.ok:
-            raise HttpClientError(f"HTTP {resp.status_code} on {url}: {resp.text[:500]}")
+        self._acquire_rate_limit_slot()
+        resp = self._send(
+            lambda: requests.post(url, json=json_payload, headers=self._headers, timeout=self._timeout_s),
+            url,
+        )
 
         payload = resp.json()
         if self._cache:
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import psycopg
+from psycopg.rows import dict_row
+
+
+class RateLimitBucketRepository:
+    def __init__(self, conn: psycopg.Connection):
+        self._conn = conn
+
+    def reserve(self, bucket_key: str, *, capacity: int, refill_per_second: float) -> float:
+        """Take one token from the shared bucket and return how long the caller must wait for it."""
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                """
+                INSERT INTO rate_limit_bucket (bucket_key, tokens, capacity, refill_per_second, updated_at)
+                VALUES (%(bucket_key)s, %(capacity)s - 1, %(capacity)s, %(refill_per_second)s, clock_timestamp())
+                ON CONFLICT (bucket_key) DO UPDATE
+                    SET tokens = LEAST(
+                            EXCLUDED.capacity::double precision,
+                            rate_limit_bucket.tokens
+                                + EXTRACT(EPOCH FROM clock_timestamp() - rate_limit_bucket.updated_at)
+                                * EXCLUDED.refill_per_second
+                        ) - 1,
+                        capacity = EXCLUDED.capacity,
+                        refill_per_second = EXCLUDED.refill_per_second,
+                        updated_at = clock_timestamp()
+                RETURNING GREATEST(
+                    0,
+                    -tokens / NULLIF(refill_per_second, 0),
+                    EXTRACT(EPOCH FROM COALESCE(blocked_until, clock_timestamp()) - clock_timestamp())
+                ) AS wait_seconds
+                """,
+                {
+                    "bucket_key": bucket_key,
+                    "capacity": capacity,
+                    "refill_per_second": refill_per_second,
+                },
+            )
+            row = cur.fetchone()
+        if row is None or row["wait_seconds"] is None:
+            return 0.0
+        return float(row["wait_seconds"])
+
+    def block(self, bucket_key: str, retry_after_seconds: float) -> None:
+        with self._conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE rate_limit_bucket
+                SET tokens = LEAST(tokens, 0),
+                    blocked_until = GREATEST(
+                        COALESCE(blocked_until, clock_timestamp()),
+                        clock_timestamp() + %s
+                    )
+                WHERE bucket_key = %s
+                """,
+                (timedelta(seconds=retry_after_seconds), bucket_key),
+            )
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from time import monotonic, sleep
+
+import psycopg
+
+from common.config import get_env_float
+from common.http.rate_limit_repository import RateLimitBucketRepository
+from db.connection import get_connection
+
+RATE_LIMITER_BACKEND_MEMORY = "memory"
+RATE_LIMITER_BACKEND_POSTGRES = "postgres"
+# Applied when a 429 carries no usable Retry-After header.
+RATE_LIMIT_DEFAULT_COOLDOWN_SECONDS = max(0.0, get_env_float("RATE_LIMIT_DEFAULT_COOLDOWN_SECONDS", 1.0))
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    max_requests: int
+    window_seconds: float
+
+    @property
+    def refill_per_second(self) -> float:
+        if self.window_seconds <= 0:
+            return float("inf")
+        return self.max_requests / self.window_seconds
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if value is None:
+        return None
+    normalized = value.strip()
+    if not normalized:
+        return None
+    try:
+        return max(0.0, float(normalized))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(normalized)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter(ABC):
+    """Token bucket limiter. Callers reserve a token up front and sleep once for their slot."""
+
+    def acquire(self, key: str, policy: RateLimitPolicy) -> float:
+        if policy.window_seconds <= 0 or policy.max_requests <= 0:
+            return 0.0
+        wait_seconds = self._reserve(key, policy)
+        if wait_seconds > 0:
+            sleep(wait_seconds)
+        return wait_seconds
+
+    def penalize(self, key: str, retry_after_seconds: float | None) -> None:
+        """Hold `key` back after a 429; without a Retry-After the default cooldown applies."""
+        cooldown_seconds = RATE_LIMIT_DEFAULT_COOLDOWN_SECONDS if retry_after_seconds is None else retry_after_seconds
+        if cooldown_seconds > 0:
+            self._block(key, cooldown_seconds)
+
+    @abstractmethod
+    def _reserve(self, key: str, policy: RateLimitPolicy) -> float:
+        """Take a token for `key` and return how long the caller must wait for it."""
+
+    @abstractmethod
+    def _block(self, key: str, retry_after_seconds: float) -> None:
+        """Hand out no tokens for `key` until `retry_after_seconds` from now."""
+
+
+@dataclass
+class _BucketState:
+    tokens: float
+    updated_at: float
+    blocked_until: float = 0.0
+    lock: Lock = field(default_factory=Lock)
+
+
+class InProcessRateLimiter(RateLimiter):
+    def __init__(self) -> None:
+        self._buckets: dict[str, _BucketState] = {}
+        self._buckets_lock = Lock()
+
+    def _bucket(self, key: str, policy: RateLimitPolicy) -> _BucketState:
+        with self._buckets_lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = _BucketState(tokens=float(policy.max_requests), updated_at=monotonic())
+                self._buckets[key] = bucket
+            return bucket
+
+    def _reserve(self, key: str, policy: RateLimitPolicy) -> float:
+        bucket = self._bucket(key, policy)
+        refill_per_second = policy.refill_per_second
+        with bucket.lock:
+            now = monotonic()
+            elapsed = max(0.0, now - bucket.updated_at)
+            bucket.tokens = min(float(policy.max_requests), bucket.tokens + elapsed * refill_per_second)
+            bucket.updated_at = now
+            bucket.tokens -= 1
+            wait_seconds = 0.0 if bucket.tokens >= 0 else -bucket.tokens / refill_per_second
+            return max(wait_seconds, bucket.blocked_until - now)
+
+    def _block(self, key: str, retry_after_seconds: float) -> None:
+        with self._buckets_lock:
+            bucket = self._buckets.get(key)
+        if bucket is None:
+            return
+        with bucket.lock:
+            bucket.tokens = min(bucket.tokens, 0.0)
+            bucket.blocked_until = max(bucket.blocked_until, monotonic() + retry_after_seconds)
+
+
+class PostgresRateLimiter(RateLimiter):
+    """Shares buckets across processes through the rate_limit_bucket table.
+
+    Falls back to an in-process bucket whenever the database is unavailable.
+    """
+
+    def __init__(self, conn: psycopg.Connection | None = None) -> None:
+        self._conn = conn
+        self._conn_lock = Lock()
+        self._fallback = InProcessRateLimiter()
+
+    def _repository(self) -> RateLimitBucketRepository:
+        if self._conn is None:
+            self._conn = get_connection()
+        return RateLimitBucketRepository(self._conn)
+
+    def _reserve(self, key: str, policy: RateLimitPolicy) -> float:
+        try:
+            with self._conn_lock:
+                return self._repository().reserve(
+                    key,
+                    capacity=policy.max_requests,
+                    refill_per_second=policy.refill_per_second,
+                )
+        except psycopg.Error:
+            self._conn = None
+            return self._fallback._reserve(key, policy)
+
+    def _block(self, key: str, retry_after_seconds: float) -> None:
+        self._fallback._block(key, retry_after_seconds)
+        try:
+            with self._conn_lock:
+                self._repository().block(key, retry_after_seconds)
+        except psycopg.Error:
+            self._conn = None
+
+
+_RATE_LIMITER: RateLimiter | None = None
+_RATE_LIMITER_LOCK = Lock()
+
+
+def build_rate_limiter(backend: str | None = None) -> RateLimiter:
+    resolved_backend = (backend or os.getenv("RATE_LIMITER_BACKEND", RATE_LIMITER_BACKEND_MEMORY)).strip().lower()
+    if resolved_backend == RATE_LIMITER_BACKEND_POSTGRES:
+        return PostgresRateLimiter()
+    return InProcessRateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    global _RATE_LIMITER
+    with _RATE_LIMITER_LOCK:
+        if _RATE_LIMITER is None:
+            _RATE_LIMITER = build_rate_limiter()
+        return _RATE_LIMITER
@@ -3,7 +3,9 @@ from __future__ import annotations
 from typing import Any
 from uuid import UUID
 
+from conversation.models.conversation_models import NewConversationEvent, NewRoundtripPrompt
 from conversation.repository.repo_factory import get_conversation_repo
+from conversation.repository.unit_of_work import get_current_unit_of_work
 from request_orchestrator.shared.runtime_context import (
     get_current_conversation_id,
     get_current_roundtrip_id,
@@ -31,13 +33,9 @@ def create_conversation_event(
         resolved_roundtrip_id = get_current_roundtrip_id()
 
     try:
-        get_conversation_repo().create_conversation_event(
+        event = NewConversationEvent(
             conversation_id=UUID(resolved_conversation_id),
-            roundtrip_id=(
-                None
-                if not resolved_roundtrip_id
-                else UUID(str(resolved_roundtrip_id))
-            ),
+            roundtrip_id=None if not resolved_roundtrip_id else UUID(str(resolved_roundtrip_id)),
             event_type=event_type,
             source=source,
             agent_name=agent_name,
@@ -46,6 +44,11 @@ def create_conversation_event(
             iteration=iteration,
             payload={} if payload is None else dict(payload),
         )
+        unit_of_work = get_current_unit_of_work()
+        if unit_of_work is not None:
+            unit_of_work.add_conversation_event(event)
+            return
+        get_conversation_repo().create_conversation_event(**vars(event))
     except Exception:
         return
 
@@ -59,12 +62,18 @@ def log_roundtrip_prompt(
 ) -> None:
     if roundtrip_id is not None:
         try:
-            get_conversation_repo().create_roundtrip_prompt(
-                roundtrip_id,
-                agent=agent,
-                prompt_step=prompt_step,
-                prompt=prompt,
-            )
+            unit_of_work = get_current_unit_of_work()
+            if unit_of_work is not None:
+                unit_of_work.add_roundtrip_prompt(
+                    NewRoundtripPrompt(roundtrip_id=roundtrip_id, agent=agent, prompt_step=prompt_step, prompt=prompt)
+                )
+            else:
+                get_conversation_repo().create_roundtrip_prompt(
+                    roundtrip_id,
+                    agent=agent,
+                    prompt_step=prompt_step,
+                    prompt=prompt,
+                )
         except Exception:
             pass
 
@@ -1,4 +1,5 @@
+from common.utils.batching import RequestCoalescer
 from common.utils.text import normalize_text
 from common.utils.time import now_ms
 
-__all__ = ["normalize_text", "now_ms"]
+__all__ = ["RequestCoalescer", "normalize_text", "now_ms"]
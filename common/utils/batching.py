@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from threading import Lock
+from time import sleep
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class RequestCoalescer(Generic[K, V]):
+    """Coalesces concurrent single-key lookups into one batched fetch.
+
+    The first caller in a window becomes the leader: it waits for the window to collect other
+    keys, then fetches them all and resolves every waiter. Callers asking for a key that is
+    already pending share its result, and a batch that reaches `max_batch_size` flushes
+    immediately. `fetch` may receive more keys than that when one caller adds several at once.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[list[K]], dict[K, V]],
+        *,
+        window_seconds: float,
+        max_batch_size: int,
+    ) -> None:
+        self._fetch = fetch
+        self._window_seconds = window_seconds
+        self._max_batch_size = max(1, max_batch_size)
+        self._pending: dict[K, Future[V | None]] = {}
+        self._lock = Lock()
+
+    def _flush(self) -> None:
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        try:
+            values = self._fetch(list(batch))
+        except Exception as exc:
+            for future in batch.values():
+                future.set_exception(exc)
+            return
+        for key, future in batch.items():
+            future.set_result(values.get(key))
+
+    def get_many(self, keys: list[K]) -> dict[K, V]:
+        """Values for `keys`, fetched together with whatever other keys are pending in the window."""
+        with self._lock:
+            is_leader = not self._pending
+            futures: dict[K, Future[V | None]] = {}
+            for key in keys:
+                future = self._pending.get(key)
+                if future is None:
+                    future = Future()
+                    self._pending[key] = future
+                futures[key] = future
+            is_full = len(self._pending) >= self._max_batch_size
+        if is_full:
+            self._flush()
+        elif is_leader:
+            sleep(self._window_seconds)
+            self._flush()
+        values: dict[K, V] = {}
+        for key, future in futures.items():
+            value = future.result()
+            if value is not None:
+                values[key] = value
+        return values
+
+    def get(self, key: K) -> V | None:
+        return self.get_many([key]).get(key)
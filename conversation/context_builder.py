@@ -4,6 +4,7 @@ from conversation.models.conversation_models import (
     ConversationContext,
     RecentRoundtrip,
     RecentRoundtripToolSummary,
+    RoundtripProjection,
     ToolSummaryContext,
 )
 from conversation.repository.repo_factory import get_conversation_repo
@@ -20,6 +21,7 @@ def build_roundtrip_context(conversation_id: str, limit: int = 5) -> Conversatio
         limit=limit,
         after_message_index=after_index,
         newest_first=True,
+        projection=RoundtripProjection.CONTEXT,
     )
 
     recent_roundtrips = [
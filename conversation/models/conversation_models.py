@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
+from enum import StrEnum
 from typing import Any, Optional
 from uuid import UUID
 
@@ -56,6 +57,20 @@ class Conversation:
     summary_embedding: Optional[list[float]] = None
 
 
+class RoundtripProjection(StrEnum):
+    """Which `conversation_roundtrip` columns a read loads.
+
+    CONTEXT: text fields plus `response_payload.tool_summary`, for prompts and summaries.
+    RENDER: text fields, the full `response_payload` and feedback id, for the chat history.
+    FULL: every column except the summary embedding, which is only read on request through
+    `ConversationRepository.get_roundtrip_summary_embedding`.
+    """
+
+    CONTEXT = "context"
+    RENDER = "render"
+    FULL = "full"
+
+
 @dataclass(frozen=False)
 class ConversationRoundtrip:
     id: UUID
@@ -88,6 +103,27 @@ class ConversationEvent:
     created_at: str
 
 
+@dataclass(frozen=True)
+class NewConversationEvent:
+    conversation_id: UUID
+    roundtrip_id: Optional[UUID]
+    event_type: str
+    source: str
+    agent_name: str = ""
+    node_name: str = ""
+    step_id: str = ""
+    iteration: Optional[int] = None
+    payload: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class NewRoundtripPrompt:
+    roundtrip_id: UUID
+    agent: str
+    prompt_step: str
+    prompt: str
+
+
 @dataclass(frozen=False)
 class RoundtripFeedback:
     id: UUID
@@ -119,6 +155,16 @@ class ConversationSummary:
     created_at: str
 
 
+@dataclass(frozen=True)
+class ConversationSummaryState:
+    """The running top-level summary and the last roundtrip folded into it."""
+
+    conversation_id: UUID
+    summary: str
+    summary_message_index: int
+    summary_embedding_source: Optional[str]
+
+
 @dataclass(frozen=False)
 class ConversationMemory:
     conversation_id: UUID
@@ -139,6 +185,24 @@ class RoundtripMemory:
     relevance_score: float
 
 
+@dataclass(frozen=False)
+class MemoryIndexHit:
+    """One entry of the unified memory ranking: a conversation, a roundtrip or a user attribute."""
+
+    memory_type: str
+    memory_id: str
+    title: str
+    summary: str
+    occurred_at: str
+    similarity: float
+    recency: float
+    score: float
+    conversation_id: Optional[UUID] = None
+    roundtrip_id: Optional[UUID] = None
+    message_index: Optional[int] = None
+    importance: Optional[float] = None
+
+
 @dataclass(frozen=False)
 class LlmUsage:
     input_tokens: int
@@ -147,6 +211,20 @@ class LlmUsage:
     cached_input_tokens: int = 0
 
 
+@dataclass(frozen=False)
+class LlmUsageAggregate:
+    roundtrip_id: UUID
+    call_count: int
+    input_tokens: int
+    cached_input_tokens: int
+    output_tokens: int
+    total_tokens: int
+    total_latency_ms: int
+    computed_input_cost: Decimal
+    computed_output_cost: Decimal
+    computed_total_cost: Decimal
+
+
 @dataclass(frozen=False)
 class LlmCallRecord:
     id: UUID
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from common.config import SUMMARY_BATCH_SIZE, SUMMARY_TRIGGER_SIZE
+from conversation.models.conversation_models import RoundtripProjection
 from conversation.models.replay_models import PopulatedReplayConversation, PreparedReplayConversation
 from conversation.repository.repo_factory import get_conversation_repo
-from conversation.summary_service import rebuild_conversation_summaries
+from jobs.enqueue import enqueue_conversation_summary
 from tool.repository.tool_call_repository import ToolCallRepository
 
 
@@ -16,7 +16,7 @@ def _resolve_replay_source(
 ):
     repo = get_conversation_repo()
     parsed_roundtrip_id = UUID(str(roundtrip_id))
-    source_roundtrip = repo.get_roundtrip(parsed_roundtrip_id)
+    source_roundtrip = repo.get_roundtrip(parsed_roundtrip_id, projection=RoundtripProjection.CONTEXT)
     if source_roundtrip is None:
         raise ValueError(f"Roundtrip {parsed_roundtrip_id} was not found.")
 
@@ -72,6 +72,7 @@ def execute_replay(
         repo.list_roundtrips_through_message_index(
             source_conversation_id,
             history_cutoff,
+            projection=RoundtripProjection.CONTEXT,
         )
         if history_cutoff >= 0
         else []
@@ -85,11 +86,7 @@ def execute_replay(
     if roundtrip_id_map:
         ToolCallRepository().copy_tool_calls(roundtrip_id_map)
 
-    rebuild_conversation_summaries(
-        str(parsed_conversation_id),
-        summary_batch_size=SUMMARY_BATCH_SIZE,
-        summary_trigger_size=SUMMARY_TRIGGER_SIZE,
-    )
+    enqueue_conversation_summary(parsed_conversation_id)
 
     return PopulatedReplayConversation(
         conversation_id=str(parsed_conversation_id),
@@ -15,19 +15,77 @@ from conversation.models.conversation_models import (
     ConversationMemory,
     ConversationRoundtrip,
     LlmCallRecord,
+    LlmUsageAggregate,
+    NewConversationEvent,
+    NewRoundtripPrompt,
     ConversationSummary,
+    ConversationSummaryState,
     RoundtripFeedback,
     RoundtripMemory,
+    RoundtripProjection,
     RoundtripPrompt,
 )
-from db.connection import get_connection
+from db.connection import PooledConnection
+from db.embedding_migration import resolve_embedding_slot
+from db.vector import CONVERSATION_SUMMARY_EMBEDDING, EMBEDDING_SQL_TYPE, ROUNDTRIP_SUMMARY_EMBEDDING
 from llm.repository.conversation_model_config_repository import ConversationModelConfigRepository
 
 
+_ROUNDTRIP_BASE_COLUMNS = """
+    rt.id,
+    rt.conversation_id,
+    rt.message_index,
+    rt.user_prompt,
+    rt.generated_response,
+    rt.roundtrip_summary,
+    rt.created_at,
+    rt.model"""
+
+_ROUNDTRIP_PROJECTION_COLUMNS: dict[RoundtripProjection, str] = {
+    RoundtripProjection.CONTEXT: _ROUNDTRIP_BASE_COLUMNS + """,
+    rt.response_payload->'tool_summary' AS tool_summary""",
+    RoundtripProjection.RENDER: _ROUNDTRIP_BASE_COLUMNS + """,
+    rt.response_payload,
+    fb.id AS feedback_id""",
+    RoundtripProjection.FULL: _ROUNDTRIP_BASE_COLUMNS + """,
+    rt.response_payload,
+    rt.parsed_query,
+    rt.metadata,
+    fb.id AS feedback_id""",
+}
+
+_ROUNDTRIP_FEEDBACK_JOIN = "LEFT JOIN roundtrip_feedback fb ON fb.roundtrip_id = rt.id"
+
+
+def _summary_embedding_sql() -> str:
+    return f"{resolve_embedding_slot(CONVERSATION_SUMMARY_EMBEDDING).name}::vector AS summary_embedding"
+
+
+def _roundtrip_select(projection: RoundtripProjection) -> str:
+    feedback_join = "" if projection == RoundtripProjection.CONTEXT else _ROUNDTRIP_FEEDBACK_JOIN
+    return f"SELECT {_ROUNDTRIP_PROJECTION_COLUMNS[projection]}\nFROM conversation_roundtrip rt\n{feedback_join}"
+
+
+def _row_to_roundtrip(row: dict[str, Any]) -> ConversationRoundtrip:
+    """Build a roundtrip from any projection; columns it did not load keep empty defaults."""
+    if "tool_summary" in row:
+        tool_summary = row.pop("tool_summary")
+        row["response_payload"] = {} if tool_summary is None else {"tool_summary": tool_summary}
+    row.setdefault("roundtrip_summary_embedding", None)
+    row.setdefault("response_payload", {})
+    row.setdefault("parsed_query", {})
+    row.setdefault("metadata", {})
+    return ConversationRoundtrip(**row)
+
+
 class ConversationRepository:
     def __init__(self, conn: psycopg.Connection | None = None):
-        self._conn = conn or get_connection()
-        register_vector(self._conn)
+        if conn is None:
+            # Pooled connections get pgvector types registered when the pool opens them.
+            self._conn: psycopg.Connection | PooledConnection = PooledConnection()
+        else:
+            self._conn = conn
+            register_vector(self._conn)
 
     def create_conversation(self, user_id: str, metadata: Optional[dict[str, Any]] = None) -> Conversation:
         metadata = metadata or {}
@@ -57,20 +115,30 @@ class ConversationRepository:
         metadata: Optional[dict[str, Any]] = None,
     ) -> ConversationRoundtrip:
         metadata = metadata or {}
+        embedding_slot = resolve_embedding_slot(ROUNDTRIP_SUMMARY_EMBEDDING)
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
-                INSERT INTO conversation_roundtrip (conversation_id, message_index, user_prompt, generated_response, roundtrip_summary, roundtrip_summary_embedding, response_payload, parsed_query, model, metadata)
-                SELECT %s, COALESCE(MAX(message_index), -1) + 1, %s, '', %s, (%s)::vector, '{}'::jsonb, '{}'::jsonb, %s, %s
+                f"""
+                INSERT INTO conversation_roundtrip (conversation_id, message_index, user_prompt, generated_response, roundtrip_summary, {embedding_slot.name}, {embedding_slot.model_column}, response_payload, parsed_query, model, metadata)
+                SELECT %s, COALESCE(MAX(message_index), -1) + 1, %s, '', %s, (%s)::{EMBEDDING_SQL_TYPE}, %s, '{{}}'::jsonb, '{{}}'::jsonb, %s, %s
                 FROM conversation_roundtrip
                 WHERE conversation_id = %s
-                RETURNING id, conversation_id, message_index, user_prompt, generated_response, roundtrip_summary, roundtrip_summary_embedding, response_payload, parsed_query, created_at, metadata, model
+                RETURNING id, conversation_id, message_index, user_prompt, generated_response, roundtrip_summary, response_payload, parsed_query, created_at, metadata, model
                 """,
-                (conversation_id, user_prompt, roundtrip_summary, roundtrip_summary_embedding, model, Jsonb(metadata), conversation_id),
+                (
+                    conversation_id,
+                    user_prompt,
+                    roundtrip_summary,
+                    roundtrip_summary_embedding,
+                    embedding_slot.model_for(roundtrip_summary_embedding),
+                    model,
+                    Jsonb(metadata),
+                    conversation_id,
+                ),
             )
             row = cur.fetchone()
             assert row is not None
-            return ConversationRoundtrip(**row)
+            return _row_to_roundtrip(row)
 
     def update_roundtrip(
         self,
@@ -80,23 +148,43 @@ class ConversationRepository:
         roundtrip_summary: Optional[str] = None,
         roundtrip_summary_embedding: Optional[list[float]] = None,
     ) -> ConversationRoundtrip:
+        # Without a new embedding the stored one, and its model version, are kept.
+        embedding_sql = ""
+        embedding_params: tuple[Any, ...] = ()
+        if roundtrip_summary_embedding is not None:
+            embedding_slot = resolve_embedding_slot(ROUNDTRIP_SUMMARY_EMBEDDING)
+            embedding_sql = f"{embedding_slot.assignment_sql()},"
+            embedding_params = (roundtrip_summary_embedding, embedding_slot.version)
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
+                f"""
                 UPDATE conversation_roundtrip
                 SET generated_response = %s,
                     roundtrip_summary = COALESCE(%s, roundtrip_summary),
-                    roundtrip_summary_embedding = COALESCE((%s)::vector, roundtrip_summary_embedding),
+                    {embedding_sql}
                     response_payload = %s,
                     updated_at = now()
                 WHERE id = %s
-                RETURNING id, conversation_id, message_index, user_prompt, generated_response, roundtrip_summary, roundtrip_summary_embedding, response_payload, parsed_query, created_at, metadata, model
+                RETURNING id, conversation_id, message_index, user_prompt, generated_response, roundtrip_summary, response_payload, parsed_query, created_at, metadata, model
                 """,
-                (response, roundtrip_summary, roundtrip_summary_embedding, Jsonb(payload), roundtrip_id),
+                (response, roundtrip_summary, *embedding_params, Jsonb(payload), roundtrip_id),
             )
             row = cur.fetchone()
             assert row is not None
-            return ConversationRoundtrip(**row)
+            return _row_to_roundtrip(row)
+
+    def update_roundtrip_summary_embedding(self, roundtrip_id: UUID, roundtrip_summary_embedding: list[float]) -> None:
+        embedding_slot = resolve_embedding_slot(ROUNDTRIP_SUMMARY_EMBEDDING)
+        with self._conn.cursor() as cur:
+            cur.execute(
+                f"""
+                UPDATE conversation_roundtrip
+                SET {embedding_slot.assignment_sql()},
+                    updated_at = now()
+                WHERE id = %s
+                """,
+                (roundtrip_summary_embedding, embedding_slot.version, roundtrip_id),
+            )
 
     def append_roundtrip(
         self,
@@ -113,17 +201,19 @@ class ConversationRepository:
         metadata = metadata or {}
         response_payload = response_payload or {}
         parsed_query = parsed_query or {}
+        embedding_slot = resolve_embedding_slot(ROUNDTRIP_SUMMARY_EMBEDDING)
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
-                INSERT INTO conversation_roundtrip (conversation_id, message_index, user_prompt, generated_response, roundtrip_summary, roundtrip_summary_embedding, response_payload, parsed_query, model, metadata)
+                f"""
+                INSERT INTO conversation_roundtrip (conversation_id, message_index, user_prompt, generated_response, roundtrip_summary, {embedding_slot.name}, {embedding_slot.model_column}, response_payload, parsed_query, model, metadata)
                 SELECT
                     %s,
                     COALESCE(MAX(message_index), -1) + 1,
                     %s,
                     %s,
                     %s,
-                    (%s)::vector,
+                    (%s)::{EMBEDDING_SQL_TYPE},
+                    %s,
                     %s,
                     %s,
                     %s,
@@ -131,9 +221,21 @@ class ConversationRepository:
                     %s
                 FROM conversation_roundtrip
                 WHERE conversation_id = %s
-                RETURNING id, conversation_id, message_index, user_prompt, generated_response, roundtrip_summary, roundtrip_summary_embedding, response_payload, parsed_query, created_at, metadata, model
+                RETURNING id, conversation_id, message_index, user_prompt, generated_response, roundtrip_summary, response_payload, parsed_query, created_at, metadata, model
                 """,
-                (conversation_id, user_prompt, generated_response, roundtrip_summary, roundtrip_summary_embedding, Jsonb(response_payload), Jsonb(parsed_query), model, Jsonb(metadata), conversation_id),
+                (
+                    conversation_id,
+                    user_prompt,
+                    generated_response,
+                    roundtrip_summary,
+                    roundtrip_summary_embedding,
+                    embedding_slot.model_for(roundtrip_summary_embedding),
+                    Jsonb(response_payload),
+                    Jsonb(parsed_query),
+                    model,
+                    Jsonb(metadata),
+                    conversation_id,
+                ),
             )
             row = cur.fetchone()
             assert row is not None
@@ -146,7 +248,7 @@ class ConversationRepository:
                 """,
                 (conversation_id,),
             )
-            return ConversationRoundtrip(**row)
+            return _row_to_roundtrip(row)
 
     def create_roundtrip_prompt(
         self,
@@ -168,6 +270,54 @@ class ConversationRepository:
             assert row is not None
             return RoundtripPrompt(**row)
 
+    def create_roundtrip_prompts(self, prompts: Sequence[NewRoundtripPrompt]) -> None:
+        if not prompts:
+            return
+        with self._conn.cursor() as cur:
+            cur.executemany(
+                """
+                INSERT INTO roundtrip_prompts (roundtrip_id, agent, prompt_step, prompt)
+                VALUES (%s, %s, %s, %s)
+                """,
+                [(prompt.roundtrip_id, prompt.agent, prompt.prompt_step, prompt.prompt) for prompt in prompts],
+            )
+
+    def create_conversation_events(self, events: Sequence[NewConversationEvent]) -> None:
+        """Insert events in order through one pipelined `executemany` instead of a round trip each."""
+        if not events:
+            return
+        with self._conn.cursor() as cur:
+            cur.executemany(
+                """
+                INSERT INTO conversation_event (
+                    conversation_id,
+                    roundtrip_id,
+                    event_type,
+                    source,
+                    agent_name,
+                    node_name,
+                    step_id,
+                    iteration,
+                    payload
+                )
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """,
+                [
+                    (
+                        event.conversation_id,
+                        event.roundtrip_id,
+                        event.event_type,
+                        event.source,
+                        event.agent_name,
+                        event.node_name,
+                        event.step_id,
+                        event.iteration,
+                        Jsonb(event.payload),
+                    )
+                    for event in events
+                ],
+            )
+
     def create_conversation_event(
         self,
         *,
@@ -363,6 +513,52 @@ class ConversationRepository:
                 updated_at=str(row['updated_at']),
             )
 
+    def summarize_llm_calls_for_roundtrips(self, roundtrip_ids: Sequence[UUID]) -> dict[UUID, LlmUsageAggregate]:
+        """Usage totals per roundtrip in one grouped query; roundtrips without calls are absent."""
+        if not roundtrip_ids:
+            return {}
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                """
+                SELECT
+                    roundtrip_id,
+                    COUNT(*) AS call_count,
+                    COALESCE(SUM(input_tokens), 0) AS input_tokens,
+                    COALESCE(SUM(cached_input_tokens), 0) AS cached_input_tokens,
+                    COALESCE(SUM(output_tokens), 0) AS output_tokens,
+                    COALESCE(SUM(total_tokens), 0) AS total_tokens,
+                    COALESCE(SUM(
+                        CASE
+                            WHEN metadata->>'latency_ms' ~ '^[0-9]+$' THEN (metadata->>'latency_ms')::bigint
+                            ELSE 0
+                        END
+                    ), 0) AS total_latency_ms,
+                    COALESCE(SUM(computed_input_cost), 0) AS computed_input_cost,
+                    COALESCE(SUM(computed_output_cost), 0) AS computed_output_cost,
+                    COALESCE(SUM(computed_total_cost), 0) AS computed_total_cost
+                FROM llm_call
+                WHERE roundtrip_id = ANY(%s)
+                GROUP BY roundtrip_id
+                """,
+                (list(roundtrip_ids),),
+            )
+            rows = cur.fetchall()
+            return {
+                row['roundtrip_id']: LlmUsageAggregate(
+                    roundtrip_id=row['roundtrip_id'],
+                    call_count=int(row['call_count']),
+                    input_tokens=int(row['input_tokens']),
+                    cached_input_tokens=int(row['cached_input_tokens']),
+                    output_tokens=int(row['output_tokens']),
+                    total_tokens=int(row['total_tokens']),
+                    total_latency_ms=int(row['total_latency_ms']),
+                    computed_input_cost=Decimal(row['computed_input_cost']),
+                    computed_output_cost=Decimal(row['computed_output_cost']),
+                    computed_total_cost=Decimal(row['computed_total_cost']),
+                )
+                for row in rows
+            }
+
     def list_llm_calls_for_roundtrip(self, roundtrip_id: UUID) -> list[LlmCallRecord]:
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
@@ -481,23 +677,66 @@ class ConversationRepository:
             assert row is not None
             return ConversationSummary(**row)
 
+    def get_conversation_summary_state(self, conversation_id: UUID) -> Optional[ConversationSummaryState]:
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                """
+                SELECT id AS conversation_id,
+                       COALESCE(summary, '') AS summary,
+                       summary_message_index,
+                       summary_embedding_source
+                FROM conversation
+                WHERE id = %s
+                """,
+                (conversation_id,),
+            )
+            row = cur.fetchone()
+            return ConversationSummaryState(**row) if row else None
+
     def update_conversation_summary(
         self,
         conversation_id: UUID,
         summary: str,
+        *,
+        message_index_cutoff: int,
         summary_embedding: Optional[list[float]] = None,
-    ) -> None:
+    ) -> bool:
+        """Advance the running summary to `message_index_cutoff`.
+
+        Without `summary_embedding` the stored embedding is kept. Returns False when the summary has
+        already been folded past the cutoff, so a stale write never moves the watermark back.
+        """
+        embedding_slot = resolve_embedding_slot(CONVERSATION_SUMMARY_EMBEDDING)
+        embedding_sql = embedding_slot.assignment_sql(
+            f"(%(embedding)s)::{EMBEDDING_SQL_TYPE}",
+            "%(embedding_model)s",
+            when="%(reembed)s",
+        )
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
+                f"""
                 UPDATE conversation
-                SET summary = %s,
-                    summary_embedding = (%s)::vector,
+                SET summary = %(summary)s,
+                    summary_message_index = %(cutoff)s,
+                    {embedding_sql},
+                    summary_embedding_source = CASE
+                        WHEN %(reembed)s THEN %(summary)s
+                        ELSE summary_embedding_source
+                    END,
                     updated_at = now()
-                WHERE id = %s
+                WHERE id = %(conversation_id)s
+                  AND summary_message_index < %(cutoff)s
                 """,
-                (summary, summary_embedding, conversation_id),
+                {
+                    "summary": summary,
+                    "cutoff": message_index_cutoff,
+                    "reembed": summary_embedding is not None,
+                    "embedding": summary_embedding,
+                    "embedding_model": embedding_slot.version,
+                    "conversation_id": conversation_id,
+                },
             )
+            return cur.rowcount > 0
 
     def get_summary(
         self,
@@ -515,67 +754,57 @@ class ConversationRepository:
             row = cur.fetchone()
             return ConversationSummary(**row) if row else None
 
-    def get_roundtrip(self, roundtrip_id: UUID) -> Optional[ConversationRoundtrip]:
+    def get_roundtrip(
+        self,
+        roundtrip_id: UUID,
+        projection: RoundtripProjection = RoundtripProjection.FULL,
+    ) -> Optional[ConversationRoundtrip]:
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
-                SELECT
-                    rt.id,
-                    rt.conversation_id,
-                    rt.message_index,
-                    rt.user_prompt,
-                    rt.generated_response,
-                    rt.roundtrip_summary,
-                    rt.roundtrip_summary_embedding,
-                    rt.response_payload,
-                    rt.parsed_query,
-                    rt.created_at,
-                    rt.metadata,
-                    rt.model,
-                    fb.id AS feedback_id
-                FROM conversation_roundtrip rt
-                LEFT JOIN roundtrip_feedback fb ON fb.roundtrip_id = rt.id
+                f"""
+                {_roundtrip_select(projection)}
                 WHERE rt.id = %s
                 """,
                 (roundtrip_id,),
             )
             row = cur.fetchone()
-            return ConversationRoundtrip(**row) if row else None
+            return _row_to_roundtrip(row) if row else None
 
-    def get_roundtrip_for_user(self, roundtrip_id: UUID, user_id: str | None) -> Optional[ConversationRoundtrip]:
+    def get_roundtrip_summary_embedding(self, roundtrip_id: UUID) -> Optional[list[float]]:
+        """The summary embedding on its own, for callers that loaded a lighter projection."""
+        embedding_slot = resolve_embedding_slot(ROUNDTRIP_SUMMARY_EMBEDDING)
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
-                SELECT
-                    rt.id,
-                    rt.conversation_id,
-                    rt.message_index,
-                    rt.user_prompt,
-                    rt.generated_response,
-                    rt.roundtrip_summary,
-                    rt.roundtrip_summary_embedding,
-                    rt.response_payload,
-                    rt.parsed_query,
-                    rt.created_at,
-                    rt.metadata,
-                    rt.model,
-                    fb.id AS feedback_id
-                FROM conversation_roundtrip rt
+                f"SELECT {embedding_slot.name}::vector AS roundtrip_summary_embedding FROM conversation_roundtrip WHERE id = %s",
+                (roundtrip_id,),
+            )
+            row = cur.fetchone()
+            return row["roundtrip_summary_embedding"] if row else None
+
+    def get_roundtrip_for_user(
+        self,
+        roundtrip_id: UUID,
+        user_id: str | None,
+        projection: RoundtripProjection = RoundtripProjection.FULL,
+    ) -> Optional[ConversationRoundtrip]:
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                f"""
+                {_roundtrip_select(projection)}
                 JOIN conversation c ON c.id = rt.conversation_id
-                LEFT JOIN roundtrip_feedback fb ON fb.roundtrip_id = rt.id
                 WHERE rt.id = %s
                   AND (CAST(%s AS text) IS NULL OR c.user_id = %s)
                 """,
                 (roundtrip_id, user_id, user_id),
             )
             row = cur.fetchone()
-            return ConversationRoundtrip(**row) if row else None
+            return _row_to_roundtrip(row) if row else None
 
     def get_conversation(self, conversation_id: UUID) -> Optional[Conversation]:
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
-                SELECT id, user_id, title, created_at, metadata, tone_state, summary, summary_embedding
+                f"""
+                SELECT id, user_id, title, created_at, metadata, tone_state, summary, {_summary_embedding_sql()}
                 FROM conversation
                 WHERE id = %s
                 """,
@@ -590,64 +819,29 @@ class ConversationRepository:
         limit: int = 50,
         after_message_index: Optional[int] = None,
         newest_first: bool = False,
+        projection: RoundtripProjection = RoundtripProjection.FULL,
     ) -> list[ConversationRoundtrip]:
         with self._conn.cursor(row_factory=dict_row) as cur:
             order_direction = "DESC" if newest_first else "ASC"
-            if after_message_index is None:
-                cur.execute(
-                    f"""
-                    SELECT
-                        rt.id,
-                        rt.conversation_id,
-                        rt.message_index,
-                        rt.user_prompt,
-                        rt.generated_response,
-                        rt.roundtrip_summary,
-                        rt.roundtrip_summary_embedding,
-                        rt.response_payload,
-                        rt.parsed_query,
-                        rt.created_at,
-                        rt.metadata,
-                        rt.model,
-                        fb.id AS feedback_id
-                    FROM conversation_roundtrip rt
-                    LEFT JOIN roundtrip_feedback fb ON fb.roundtrip_id = rt.id
-                    WHERE rt.conversation_id = %s
-                      AND BTRIM(COALESCE(rt.generated_response, '')) <> ''
-                    ORDER BY rt.message_index {order_direction}
-                    LIMIT %s
-                    """,
-                    (conversation_id, limit),
-                )
-            else:
-                cur.execute(
-                    f"""
-                    SELECT
-                        rt.id,
-                        rt.conversation_id,
-                        rt.message_index,
-                        rt.user_prompt,
-                        rt.generated_response,
-                        rt.roundtrip_summary,
-                        rt.roundtrip_summary_embedding,
-                        rt.response_payload,
-                        rt.parsed_query,
-                        rt.created_at,
-                        rt.metadata,
-                        rt.model,
-                        fb.id AS feedback_id
-                    FROM conversation_roundtrip rt
-                    LEFT JOIN roundtrip_feedback fb ON fb.roundtrip_id = rt.id
-                    WHERE rt.conversation_id = %s
-                      AND rt.message_index > %s
-                      AND BTRIM(COALESCE(rt.generated_response, '')) <> ''
-                    ORDER BY rt.message_index {order_direction}
-                    LIMIT %s
-                    """,
-                    (conversation_id, after_message_index, limit),
-                )
+            after_clause = "" if after_message_index is None else "AND rt.message_index > %s"
+            params: tuple[Any, ...] = (
+                (conversation_id, limit)
+                if after_message_index is None
+                else (conversation_id, after_message_index, limit)
+            )
+            cur.execute(
+                f"""
+                {_roundtrip_select(projection)}
+                WHERE rt.conversation_id = %s
+                  {after_clause}
+                  AND BTRIM(COALESCE(rt.generated_response, '')) <> ''
+                ORDER BY rt.message_index {order_direction}
+                LIMIT %s
+                """,
+                params,
+            )
             rows = cur.fetchall()
-            roundtrips = [ConversationRoundtrip(**r) for r in rows]
+            roundtrips = [_row_to_roundtrip(r) for r in rows]
             if newest_first:
                 roundtrips.reverse()
             return roundtrips
@@ -656,26 +850,12 @@ class ConversationRepository:
         self,
         conversation_id: UUID,
         message_index: int,
+        projection: RoundtripProjection = RoundtripProjection.FULL,
     ) -> list[ConversationRoundtrip]:
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
-                SELECT
-                    rt.id,
-                    rt.conversation_id,
-                    rt.message_index,
-                    rt.user_prompt,
-                    rt.generated_response,
-                    rt.roundtrip_summary,
-                    rt.roundtrip_summary_embedding,
-                    rt.response_payload,
-                    rt.parsed_query,
-                    rt.created_at,
-                    rt.metadata,
-                    rt.model,
-                    fb.id AS feedback_id
-                FROM conversation_roundtrip rt
-                LEFT JOIN roundtrip_feedback fb ON fb.roundtrip_id = rt.id
+                f"""
+                {_roundtrip_select(projection)}
                 WHERE rt.conversation_id = %s
                   AND rt.message_index <= %s
                 ORDER BY rt.message_index ASC
@@ -683,7 +863,7 @@ class ConversationRepository:
                 (conversation_id, message_index),
             )
             rows = cur.fetchall()
-            return [ConversationRoundtrip(**r) for r in rows]
+            return [_row_to_roundtrip(r) for r in rows]
 
     def get_latest_summary(self, conversation_id: UUID) -> Optional[ConversationSummary]:
         with self._conn.cursor(row_factory=dict_row) as cur:
@@ -703,8 +883,8 @@ class ConversationRepository:
     def list_conversations(self, user_id: str, limit: int = 50) -> list[Conversation]:
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
-                SELECT id, user_id, created_at, metadata, title, tone_state, summary, summary_embedding
+                f"""
+                SELECT id, user_id, created_at, metadata, title, tone_state, summary, {_summary_embedding_sql()}
                 FROM conversation
                 WHERE user_id = %s
                 ORDER BY updated_at DESC
@@ -733,6 +913,7 @@ class ConversationRepository:
         conversation_id: UUID,
         source_roundtrip: ConversationRoundtrip,
     ) -> ConversationRoundtrip:
+        """Copy a stored roundtrip row server-side, so its embedding and payload never leave the database."""
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
                 """
@@ -743,6 +924,9 @@ class ConversationRepository:
                     generated_response,
                     roundtrip_summary,
                     roundtrip_summary_embedding,
+                    roundtrip_summary_embedding_model,
+                    roundtrip_summary_embedding_alt,
+                    roundtrip_summary_embedding_alt_model,
                     response_payload,
                     parsed_query,
                     created_at,
@@ -750,27 +934,31 @@ class ConversationRepository:
                     model,
                     metadata
                 )
-                VALUES (%s, %s, %s, %s, %s, (%s)::vector, %s, %s, %s, %s, %s, %s)
-                RETURNING id, conversation_id, message_index, user_prompt, generated_response, roundtrip_summary, roundtrip_summary_embedding, response_payload, parsed_query, created_at, metadata, model
+                SELECT
+                    %s,
+                    source.message_index,
+                    source.user_prompt,
+                    source.generated_response,
+                    source.roundtrip_summary,
+                    source.roundtrip_summary_embedding,
+                    source.roundtrip_summary_embedding_model,
+                    source.roundtrip_summary_embedding_alt,
+                    source.roundtrip_summary_embedding_alt_model,
+                    source.response_payload,
+                    source.parsed_query,
+                    source.created_at,
+                    source.created_at,
+                    source.model,
+                    source.metadata
+                FROM conversation_roundtrip source
+                WHERE source.id = %s
+                RETURNING id, conversation_id, message_index, user_prompt, generated_response, roundtrip_summary, created_at, model
                 """,
-                (
-                    conversation_id,
-                    source_roundtrip.message_index,
-                    source_roundtrip.user_prompt,
-                    source_roundtrip.generated_response,
-                    source_roundtrip.roundtrip_summary,
-                    source_roundtrip.roundtrip_summary_embedding,
-                    Jsonb(source_roundtrip.response_payload or {}),
-                    Jsonb(source_roundtrip.parsed_query or {}),
-                    source_roundtrip.created_at,
-                    source_roundtrip.created_at,
-                    source_roundtrip.model,
-                    Jsonb(source_roundtrip.metadata or {}),
-                ),
+                (conversation_id, source_roundtrip.id),
             )
             row = cur.fetchone()
             assert row is not None
-            return ConversationRoundtrip(**row)
+            return _row_to_roundtrip(row)
 
     def search_conversation_memories(
         self,
@@ -778,19 +966,20 @@ class ConversationRepository:
         limit: int = 5,
         user_id: str | None = None,
     ) -> list[ConversationMemory]:
+        embedding_column = resolve_embedding_slot(CONVERSATION_SUMMARY_EMBEDDING).name
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
+                f"""
                 SELECT
                     id AS conversation_id,
                     summary,
                     updated_at AS last_used_date,
-                    (summary_embedding <-> (%s)::vector) AS relevance_score
+                    ({embedding_column} <-> (%s)::{EMBEDDING_SQL_TYPE}) AS relevance_score
                 FROM conversation
-                WHERE summary_embedding IS NOT NULL
+                WHERE {embedding_column} IS NOT NULL
                   AND BTRIM(summary) <> ''
                   AND (CAST(%s AS text) IS NULL OR user_id = %s)
-                ORDER BY summary_embedding <-> (%s)::vector ASC
+                ORDER BY {embedding_column} <-> (%s)::{EMBEDDING_SQL_TYPE} ASC
                 LIMIT %s
                 """,
                 (list(query_embedding), user_id, user_id, list(query_embedding), limit),
@@ -816,9 +1005,10 @@ class ConversationRepository:
         if not conversation_ids:
             return []
 
+        embedding_column = resolve_embedding_slot(ROUNDTRIP_SUMMARY_EMBEDDING).name
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
+                f"""
                 SELECT
                     rt.conversation_id,
                     rt.id AS roundtrip_id,
@@ -827,14 +1017,14 @@ class ConversationRepository:
                     rt.generated_response,
                     rt.roundtrip_summary,
                     rt.created_at,
-                    (rt.roundtrip_summary_embedding <-> (%s)::vector) AS relevance_score
+                    (rt.{embedding_column} <-> (%s)::{EMBEDDING_SQL_TYPE}) AS relevance_score
                 FROM conversation_roundtrip rt
                 JOIN conversation c ON c.id = rt.conversation_id
                 WHERE rt.conversation_id = ANY(%s)
                   AND (CAST(%s AS text) IS NULL OR c.user_id = %s)
-                  AND rt.roundtrip_summary_embedding IS NOT NULL
+                  AND rt.{embedding_column} IS NOT NULL
                   AND BTRIM(COALESCE(rt.roundtrip_summary, '')) <> ''
-                ORDER BY rt.roundtrip_summary_embedding <-> (%s)::vector ASC
+                ORDER BY rt.{embedding_column} <-> (%s)::{EMBEDDING_SQL_TYPE} ASC
                 LIMIT %s
                 """,
                 (list(query_embedding), list(conversation_ids), user_id, user_id, list(query_embedding), limit),
@@ -870,8 +1060,8 @@ class ConversationRepository:
     def get_latest_conversation(self, user_id: str) -> Conversation:
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
-                SELECT id, user_id, title, created_at, metadata, tone_state, summary, summary_embedding
+                f"""
+                SELECT id, user_id, title, created_at, metadata, tone_state, summary, {_summary_embedding_sql()}
                 FROM conversation
                 WHERE user_id = %s
                 order by updated_at DESC
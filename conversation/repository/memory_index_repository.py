@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any, Optional, Sequence
+
+import psycopg
+from psycopg.rows import dict_row
+
+from common.config import get_env_float, get_env_int
+from conversation.models.conversation_models import MemoryIndexHit
+from db.connection import PooledConnection
+from db.embedding_migration import resolve_embedding_slot
+from db.vector import (
+    CONVERSATION_SUMMARY_EMBEDDING,
+    EMBEDDING_SQL_TYPE,
+    ROUNDTRIP_SUMMARY_EMBEDDING,
+    USER_ATTRIBUTE_EMBEDDING,
+)
+
+# Conversations kept by the coarse pass; only their roundtrips are scanned by the fine pass.
+MEMORY_INDEX_CONVERSATION_CANDIDATES = max(1, get_env_int("MEMORY_INDEX_CONVERSATION_CANDIDATES", 5))
+MEMORY_INDEX_ROUNDTRIP_CANDIDATES = max(1, get_env_int("MEMORY_INDEX_ROUNDTRIP_CANDIDATES", 10))
+MEMORY_INDEX_ATTRIBUTE_CANDIDATES = max(0, get_env_int("MEMORY_INDEX_ATTRIBUTE_CANDIDATES", 5))
+MEMORY_INDEX_RECENCY_HALF_LIFE_DAYS = max(0.1, get_env_float("MEMORY_INDEX_RECENCY_HALF_LIFE_DAYS", 30.0))
+# Share of the score (0-1) that decays with age / scales with attribute importance; the rest is similarity alone.
+MEMORY_INDEX_RECENCY_WEIGHT = min(1.0, max(0.0, get_env_float("MEMORY_INDEX_RECENCY_WEIGHT", 0.3)))
+MEMORY_INDEX_IMPORTANCE_WEIGHT = min(1.0, max(0.0, get_env_float("MEMORY_INDEX_IMPORTANCE_WEIGHT", 0.2)))
+
+# Embeddings are unit length, so an L2 distance d maps to cosine similarity 1 - d^2 / 2; that puts
+# conversation, roundtrip and attribute hits on one scale before they are merged.
+_MEMORY_INDEX_SQL = """
+WITH query AS (
+    SELECT (%(embedding)s)::{embedding_type} AS embedding
+),
+conversation_hits AS (
+    SELECT
+        c.id AS conversation_id,
+        c.summary,
+        c.updated_at,
+        c.{summary_embedding} <-> query.embedding AS distance
+    FROM conversation c
+    CROSS JOIN query
+    WHERE c.user_id = %(user_id)s
+      AND c.{summary_embedding} IS NOT NULL
+      AND BTRIM(COALESCE(c.summary, '')) <> ''
+    ORDER BY distance
+    LIMIT %(conversation_limit)s
+),
+roundtrip_hits AS (
+    SELECT
+        rt.conversation_id,
+        rt.id AS roundtrip_id,
+        rt.message_index,
+        rt.user_prompt,
+        rt.roundtrip_summary,
+        rt.created_at,
+        rt.{roundtrip_embedding} <-> query.embedding AS distance
+    FROM conversation_roundtrip rt
+    JOIN conversation_hits ch ON ch.conversation_id = rt.conversation_id
+    CROSS JOIN query
+    WHERE rt.{roundtrip_embedding} IS NOT NULL
+      AND BTRIM(COALESCE(rt.roundtrip_summary, '')) <> ''
+    ORDER BY distance
+    LIMIT %(roundtrip_limit)s
+),
+attribute_hits AS (
+    SELECT
+        a.id,
+        a.attribute_type,
+        a.value,
+        a.updated_at,
+        a.importance,
+        a.{attribute_embedding} <-> query.embedding AS distance
+    FROM user_attributes a
+    CROSS JOIN query
+    WHERE a.user_id = %(user_id)s
+      AND a.is_active
+      AND a.{attribute_embedding} IS NOT NULL
+    ORDER BY distance
+    LIMIT %(attribute_limit)s
+),
+candidates AS (
+    SELECT
+        'conversation' AS memory_type,
+        conversation_id::text AS memory_id,
+        conversation_id,
+        NULL::uuid AS roundtrip_id,
+        NULL::integer AS message_index,
+        'Conversation memory' AS title,
+        summary,
+        updated_at AS occurred_at,
+        NULL::double precision AS importance,
+        distance
+    FROM conversation_hits
+    UNION ALL
+    SELECT
+        'roundtrip',
+        roundtrip_id::text,
+        conversation_id,
+        roundtrip_id,
+        message_index,
+        'Memory from message ' || message_index,
+        roundtrip_summary,
+        created_at,
+        NULL::double precision,
+        distance
+    FROM roundtrip_hits
+    UNION ALL
+    SELECT
+        'user_attribute',
+        id::text,
+        NULL::uuid,
+        NULL::uuid,
+        NULL::integer,
+        COALESCE(attribute_type, 'User attribute'),
+        array_to_string(value, '; '),
+        updated_at,
+        importance,
+        distance
+    FROM attribute_hits
+),
+scored AS (
+    SELECT
+        candidates.*,
+        GREATEST(0.0, 1.0 - (distance * distance) / 2.0) AS similarity,
+        power(
+            0.5::double precision,
+            GREATEST(0.0, EXTRACT(EPOCH FROM now() - occurred_at)::double precision)
+                / 86400.0 / %(half_life_days)s::double precision
+        ) AS recency
+    FROM candidates
+)
+SELECT
+    memory_type,
+    memory_id,
+    conversation_id,
+    roundtrip_id,
+    message_index,
+    title,
+    summary,
+    occurred_at,
+    importance,
+    similarity,
+    recency,
+    similarity
+        * (1.0 - %(recency_weight)s + %(recency_weight)s * recency)
+        * (1.0 - %(importance_weight)s + %(importance_weight)s * LEAST(1.0, GREATEST(0.0, COALESCE(importance, 1.0))))
+        AS score
+FROM scored
+ORDER BY score DESC, memory_type, memory_id
+LIMIT %(limit)s
+"""
+
+
+def _memory_index_sql() -> str:
+    return _MEMORY_INDEX_SQL.format(
+        embedding_type=EMBEDDING_SQL_TYPE,
+        summary_embedding=resolve_embedding_slot(CONVERSATION_SUMMARY_EMBEDDING).name,
+        roundtrip_embedding=resolve_embedding_slot(ROUNDTRIP_SUMMARY_EMBEDDING).name,
+        attribute_embedding=resolve_embedding_slot(USER_ATTRIBUTE_EMBEDDING).name,
+    )
+
+
+def _row_to_memory_index_hit(row: dict[str, Any]) -> MemoryIndexHit:
+    return MemoryIndexHit(
+        memory_type=row["memory_type"],
+        memory_id=row["memory_id"],
+        title=row["title"],
+        summary=(row["summary"] or "").strip(),
+        occurred_at=str(row["occurred_at"]),
+        similarity=float(row["similarity"]),
+        recency=float(row["recency"]),
+        score=float(row["score"]),
+        conversation_id=row["conversation_id"],
+        roundtrip_id=row["roundtrip_id"],
+        message_index=row["message_index"],
+        importance=None if row["importance"] is None else float(row["importance"]),
+    )
+
+
+class MemoryIndexRepository:
+    """Ranks a user's conversation summaries, roundtrips and attributes against one query embedding.
+
+    A single statement does the whole lookup: a coarse pass over conversation summaries, a fine pass
+    over the roundtrips of the best conversations, and the user's active attributes, merged on a
+    common similarity scale and weighted by recency and importance.
+    """
+
+    def __init__(self, conn: psycopg.Connection | None = None):
+        self._conn = conn or PooledConnection()
+
+    def search(
+        self,
+        query_embedding: Sequence[float],
+        *,
+        user_id: str,
+        limit: int = 5,
+        conversation_limit: int = MEMORY_INDEX_CONVERSATION_CANDIDATES,
+        roundtrip_limit: int = MEMORY_INDEX_ROUNDTRIP_CANDIDATES,
+        attribute_limit: int = MEMORY_INDEX_ATTRIBUTE_CANDIDATES,
+        recency_half_life_days: float = MEMORY_INDEX_RECENCY_HALF_LIFE_DAYS,
+        recency_weight: float = MEMORY_INDEX_RECENCY_WEIGHT,
+        importance_weight: float = MEMORY_INDEX_IMPORTANCE_WEIGHT,
+        include_attributes: bool = True,
+    ) -> list[MemoryIndexHit]:
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                _memory_index_sql(),
+                {
+                    "embedding": list(query_embedding),
+                    "user_id": user_id,
+                    "conversation_limit": conversation_limit,
+                    "roundtrip_limit": roundtrip_limit,
+                    "attribute_limit": attribute_limit if include_attributes else 0,
+                    "half_life_days": recency_half_life_days,
+                    "recency_weight": recency_weight,
+                    "importance_weight": importance_weight,
+                    "limit": limit,
+                },
+            )
+            return [_row_to_memory_index_hit(row) for row in cur.fetchall()]
+
+
+_MEMORY_INDEX_REPOSITORY: Optional[MemoryIndexRepository] = None
+_MEMORY_INDEX_REPOSITORY_LOCK = Lock()
+
+
+def get_memory_index_repo() -> MemoryIndexRepository:
+    global _MEMORY_INDEX_REPOSITORY
+    with _MEMORY_INDEX_REPOSITORY_LOCK:
+        if _MEMORY_INDEX_REPOSITORY is None:
+            _MEMORY_INDEX_REPOSITORY = MemoryIndexRepository()
+        return _MEMORY_INDEX_REPOSITORY
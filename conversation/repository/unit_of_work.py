@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from threading import Lock
+from typing import Iterator
+
+from common.config import get_env_int
+from conversation.models.conversation_models import NewConversationEvent, NewRoundtripPrompt
+from conversation.repository.conversation_repository import ConversationRepository
+from conversation.repository.repo_factory import get_conversation_repo
+
+ROUNDTRIP_WRITE_BATCH_SIZE = max(1, get_env_int("ROUNDTRIP_WRITE_BATCH_SIZE", 64))
+
+
+class RoundtripUnitOfWork:
+    """Write-behind buffer for one roundtrip's conversation events and prompt rows.
+
+    Executor workers inherit the unit of work through the copied runtime context, so every thread of
+    the roundtrip appends to the same buffer; rows are written in append order, a batch at a time,
+    and whatever is left is written when the roundtrip ends. Writes that arrive after that (late tool
+    results) go straight through.
+    """
+
+    def __init__(self, repository: ConversationRepository, *, batch_size: int = ROUNDTRIP_WRITE_BATCH_SIZE) -> None:
+        self._repository = repository
+        self._batch_size = max(1, batch_size)
+        self._events: list[NewConversationEvent] = []
+        self._prompts: list[NewRoundtripPrompt] = []
+        self._closed = False
+        self._buffer_lock = Lock()
+        self._flush_lock = Lock()
+
+    def add_conversation_event(self, event: NewConversationEvent) -> None:
+        with self._buffer_lock:
+            self._events.append(event)
+            should_flush = self._closed or len(self._events) + len(self._prompts) >= self._batch_size
+        if should_flush:
+            self.flush()
+
+    def add_roundtrip_prompt(self, prompt: NewRoundtripPrompt) -> None:
+        with self._buffer_lock:
+            self._prompts.append(prompt)
+            should_flush = self._closed or len(self._events) + len(self._prompts) >= self._batch_size
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        # Serialized so batches land in the order they were taken and event ids stay in append order.
+        with self._flush_lock:
+            with self._buffer_lock:
+                events, self._events = self._events, []
+                prompts, self._prompts = self._prompts, []
+            if prompts:
+                self._repository.create_roundtrip_prompts(prompts)
+            if events:
+                self._repository.create_conversation_events(events)
+
+    def close(self) -> None:
+        with self._buffer_lock:
+            self._closed = True
+        self.flush()
+
+
+_current_unit_of_work: ContextVar[RoundtripUnitOfWork | None] = ContextVar("current_roundtrip_unit_of_work", default=None)
+
+
+def get_current_unit_of_work() -> RoundtripUnitOfWork | None:
+    return _current_unit_of_work.get()
+
+
+@contextmanager
+def roundtrip_unit_of_work(repository: ConversationRepository | None = None) -> Iterator[RoundtripUnitOfWork]:
+    unit_of_work = RoundtripUnitOfWork(repository or get_conversation_repo())
+    token: Token[RoundtripUnitOfWork | None] = _current_unit_of_work.set(unit_of_work)
+    try:
+        yield unit_of_work
+    finally:
+        _current_unit_of_work.reset(token)
+        try:
+            unit_of_work.close()
+        except Exception:
+            pass
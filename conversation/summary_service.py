@@ -1,40 +1,84 @@
 from __future__ import annotations
 
+from difflib import SequenceMatcher
 from uuid import UUID
 
+from common.config import SUMMARY_BATCH_SIZE, get_env_float, get_env_int
 from conversation.conversation import generate_conversation_summary
-from conversation.models.conversation_models import ConversationRoundtrip
+from conversation.models.conversation_models import RoundtripProjection
 from conversation.repository.repo_factory import get_conversation_repo
 from llm.clients.embeddings import embed_text
 from tool.repository.tool_call_repository import ToolCallRepository
 
+# Roundtrips that must be waiting before the running summary is regenerated, and the most one fold sends.
+CONVERSATION_SUMMARY_FOLD_BATCH_SIZE = max(1, get_env_int("CONVERSATION_SUMMARY_FOLD_BATCH_SIZE", 2))
+CONVERSATION_SUMMARY_FOLD_MAX_ROUNDTRIPS = max(
+    CONVERSATION_SUMMARY_FOLD_BATCH_SIZE,
+    get_env_int("CONVERSATION_SUMMARY_FOLD_MAX_ROUNDTRIPS", SUMMARY_BATCH_SIZE),
+)
+# Text similarity (0-1) to the last embedded summary at or above which the stored embedding is kept.
+CONVERSATION_SUMMARY_REEMBED_SIMILARITY = get_env_float("CONVERSATION_SUMMARY_REEMBED_SIMILARITY", 0.95)
 
-def _update_top_level_conversation_summary(
-    conversation_id: str,
-    *,
-    previous_summary: str,
-    unsummarized_roundtrips: list[ConversationRoundtrip],
-    tool_calls_by_roundtrip,
-) -> None:
-    if not previous_summary and not unsummarized_roundtrips:
-        return
 
+def summary_needs_reembedding(embedded_text: str | None, summary_text: str) -> bool:
+    """Whether `summary_text` has drifted far enough from the embedded text to be embedded again."""
+    if not summary_text:
+        return False
+    if not embedded_text:
+        return True
+    if " ".join(embedded_text.split()) == " ".join(summary_text.split()):
+        return False
+    similarity = SequenceMatcher(None, embedded_text, summary_text, autojunk=False).ratio()
+    return similarity < CONVERSATION_SUMMARY_REEMBED_SIMILARITY
+
+
+def _fold_new_roundtrips_into_conversation_summary(conversation_id: str, *, fold_batch_size: int) -> None:
+    """Fold roundtrips past the conversation's watermark into its running summary.
+
+    Nothing is generated until `fold_batch_size` roundtrips are waiting, so one LLM call covers
+    several turns. Only the new roundtrips are sent, on top of the running summary, and the summary
+    is embedded again only when its text moved away from the text that was last embedded.
+    """
     conversation_repository = get_conversation_repo()
-    if unsummarized_roundtrips:
-        top_level_summary = generate_conversation_summary(
-            unsummarized_roundtrips,
+    state = conversation_repository.get_conversation_summary_state(UUID(conversation_id))
+    if state is None:
+        return
+    summary_text = state.summary.strip()
+    embedded_text = state.summary_embedding_source
+    watermark = state.summary_message_index
+
+    while True:
+        new_roundtrips = conversation_repository.list_roundtrips(
+            UUID(conversation_id),
+            limit=CONVERSATION_SUMMARY_FOLD_MAX_ROUNDTRIPS,
+            after_message_index=watermark,
+            projection=RoundtripProjection.CONTEXT,
+        )
+        if not new_roundtrips or len(new_roundtrips) < fold_batch_size:
+            return
+
+        roundtrip_ids = [rt.id for rt in new_roundtrips]
+        tool_calls_by_roundtrip = ToolCallRepository().get_tool_calls_by_roundtrips(roundtrip_ids)
+        folded_summary = generate_conversation_summary(
+            new_roundtrips,
             tool_call_map=tool_calls_by_roundtrip,
-            previous_summary=previous_summary or None,
+            previous_summary=summary_text or None,
         )
-        summary_text = top_level_summary.conversation_summary.strip()
-    else:
-        summary_text = previous_summary.strip()
-    summary_embedding = embed_text(summary_text) if summary_text else None
-    conversation_repository.update_conversation_summary(
-        UUID(conversation_id),
-        summary_text,
-        summary_embedding=summary_embedding,
-    )
+        summary_text = folded_summary.conversation_summary.strip() or summary_text
+        watermark = new_roundtrips[-1].message_index
+        summary_embedding = None
+        if summary_needs_reembedding(embedded_text, summary_text):
+            summary_embedding = embed_text(summary_text)
+            embedded_text = summary_text
+        if not conversation_repository.update_conversation_summary(
+            UUID(conversation_id),
+            summary_text,
+            message_index_cutoff=watermark,
+            summary_embedding=summary_embedding,
+        ):
+            return
+        if len(new_roundtrips) < CONVERSATION_SUMMARY_FOLD_MAX_ROUNDTRIPS:
+            return
 
 
 def _update_batched_conversation_summaries(conversation_id: str, summary_batch_size: int, summary_trigger_size: int) -> None:
@@ -48,6 +92,7 @@ def _update_batched_conversation_summaries(conversation_id: str, summary_batch_s
             UUID(conversation_id),
             limit=summary_trigger_size,
             after_message_index=last_cutoff,
+            projection=RoundtripProjection.CONTEXT,
         )
         if len(unsummarized_roundtrips) < summary_trigger_size:
             return
@@ -75,25 +120,11 @@ def rebuild_conversation_summaries(
     *,
     summary_batch_size: int,
     summary_trigger_size: int,
+    fold_batch_size: int = CONVERSATION_SUMMARY_FOLD_BATCH_SIZE,
 ) -> None:
-    conversation_repository = get_conversation_repo()
     _update_batched_conversation_summaries(
         conversation_id,
         summary_batch_size=summary_batch_size,
         summary_trigger_size=summary_trigger_size,
     )
-    latest_summary = conversation_repository.get_latest_summary(UUID(conversation_id))
-    last_cutoff = latest_summary.message_index_cutoff if latest_summary else -1
-    unsummarized_roundtrips = conversation_repository.list_roundtrips(
-        UUID(conversation_id),
-        limit=summary_trigger_size,
-        after_message_index=last_cutoff,
-    )
-    roundtrip_ids = [rt.id for rt in unsummarized_roundtrips]
-    tool_calls_by_roundtrip = ToolCallRepository().get_tool_calls_by_roundtrips(roundtrip_ids)
-    _update_top_level_conversation_summary(
-        conversation_id,
-        previous_summary="" if latest_summary is None else latest_summary.summary,
-        unsummarized_roundtrips=unsummarized_roundtrips,
-        tool_calls_by_roundtrip=tool_calls_by_roundtrip,
-    )
+    _fold_new_roundtrips_into_conversation_summary(conversation_id, fold_batch_size=max(1, fold_batch_size))
@@ -1,12 +1,83 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from threading import Lock, local
+from typing import Any, Iterator
+
 import psycopg
+from pgvector.psycopg import register_vector
 from psycopg.rows import dict_row
+from psycopg_pool import ConnectionPool
 
-from db.constants import DB_URL
+from db.constants import DB_POOL_MAX_SIZE, DB_POOL_MIN_SIZE, DB_POOL_TIMEOUT_SECONDS, DB_URL
 
 
 def get_connection() -> psycopg.Connection:
     conn = psycopg.connect(DB_URL, row_factory=dict_row)
     conn.autocommit = True
     return conn
+
+
+def _configure_pooled_connection(conn: psycopg.Connection) -> None:
+    register_vector(conn)
+
+
+_CONNECTION_POOL: ConnectionPool | None = None
+_CONNECTION_POOL_LOCK = Lock()
+
+
+def get_connection_pool() -> ConnectionPool:
+    """The process-wide pool of autocommit connections with pgvector types registered."""
+    global _CONNECTION_POOL
+    with _CONNECTION_POOL_LOCK:
+        if _CONNECTION_POOL is None:
+            # A direct connect fails fast when the database is unreachable; the pool would wait out its timeout.
+            psycopg.connect(DB_URL).close()
+            _CONNECTION_POOL = ConnectionPool(
+                DB_URL,
+                min_size=DB_POOL_MIN_SIZE,
+                max_size=DB_POOL_MAX_SIZE,
+                timeout=DB_POOL_TIMEOUT_SECONDS,
+                kwargs={"autocommit": True, "row_factory": dict_row},
+                configure=_configure_pooled_connection,
+                open=True,
+            )
+        return _CONNECTION_POOL
+
+
+class PooledConnection:
+    """Stands in for the `psycopg.Connection` a repository holds, backed by the shared pool.
+
+    Each `cursor()` scope borrows a pool connection and hands it back when the scope ends, so one
+    repository instance can serve many threads at once instead of serializing them on a single
+    connection. `connection()` pins one pooled connection to the calling thread for a multi-statement
+    scope; cursors and transactions opened inside it reuse that connection.
+    """
+
+    def __init__(self, pool: ConnectionPool | None = None) -> None:
+        self._pool = pool
+        self._pinned = local()
+
+    @contextmanager
+    def connection(self) -> Iterator[psycopg.Connection]:
+        pinned = getattr(self._pinned, "conn", None)
+        if pinned is not None:
+            yield pinned
+            return
+        pool = self._pool or get_connection_pool()
+        with pool.connection() as conn:
+            self._pinned.conn = conn
+            try:
+                yield conn
+            finally:
+                self._pinned.conn = None
+
+    @contextmanager
+    def cursor(self, *args: Any, **kwargs: Any) -> Iterator[psycopg.Cursor]:
+        with self.connection() as conn, conn.cursor(*args, **kwargs) as cur:
+            yield cur
+
+    @contextmanager
+    def transaction(self) -> Iterator[psycopg.Transaction]:
+        with self.connection() as conn, conn.transaction() as tx:
+            yield tx
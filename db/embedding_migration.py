@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Any, Optional, Sequence
+
+import psycopg
+from psycopg.rows import dict_row
+
+from common.config import EMBEDDING_VERSION, get_env_float
+from db.connection import PooledConnection
+from db.vector import (
+    EMBEDDING_COLUMNS,
+    EMBEDDING_SQL_TYPE,
+    EMBEDDING_STORAGE,
+    PRODUCT_EMBEDDING,
+    EmbeddingColumn,
+    embedding_index_sql,
+)
+
+# How long a process trusts its copy of `embedding_migration`; a slot switch reaches every process
+# within this window.
+EMBEDDING_MIGRATION_STATE_TTL_SECONDS = max(0.0, get_env_float("EMBEDDING_MIGRATION_STATE_TTL_SECONDS", 15.0))
+
+_STATE_COLUMNS = "table_name, column_name, active_slot, active_model, target_model, previous_model, checkpoint, rows_done"
+
+
+def embedding_version_dimensions(version: str) -> int:
+    return int(version.rsplit("@", 1)[1])
+
+
+def embedding_version_model(version: str) -> str:
+    return version.rsplit("@", 1)[0]
+
+
+def get_embedding_column(key: str) -> EmbeddingColumn:
+    """Look up an embedding column by its `table.column` key."""
+    for column in EMBEDDING_COLUMNS:
+        if column.key == key:
+            return column
+    raise ValueError(f"Unknown embedding column: {key}")
+
+
+@dataclass(frozen=True)
+class EmbeddingMigrationState:
+    table_name: str
+    column_name: str
+    active_slot: str
+    active_model: str
+    target_model: Optional[str] = None
+    previous_model: Optional[str] = None
+    checkpoint: Optional[str] = None
+    rows_done: int = 0
+
+    @property
+    def key(self) -> str:
+        return f"{self.table_name}.{self.column_name}"
+
+    @property
+    def in_progress(self) -> bool:
+        return self.target_model is not None
+
+    @property
+    def fill_model(self) -> str:
+        """The version a re-embedding run writes: the target while migrating, else the active model."""
+        return self.target_model or self.active_model
+
+    def fill_slot(self, column: EmbeddingColumn) -> str:
+        return column.other_slot(self.active_slot) if self.in_progress else self.active_slot
+
+    def slot_for(self, column: EmbeddingColumn, version: str) -> str:
+        """The slot holding `version` vectors; processes on an unknown model use the active slot."""
+        if version != self.active_model and version in (self.target_model, self.previous_model):
+            return column.other_slot(self.active_slot)
+        return self.active_slot
+
+
+def _row_to_state(row: dict[str, Any]) -> EmbeddingMigrationState:
+    return EmbeddingMigrationState(
+        table_name=row["table_name"],
+        column_name=row["column_name"],
+        active_slot=row["active_slot"],
+        active_model=row["active_model"],
+        target_model=row["target_model"],
+        previous_model=row["previous_model"],
+        checkpoint=row["checkpoint"],
+        rows_done=int(row["rows_done"] or 0),
+    )
+
+
+@dataclass(frozen=True)
+class EmbeddingSlot:
+    """The physical slot this process reads and writes for one embedding column."""
+
+    column: EmbeddingColumn
+    name: str
+    version: str
+    # Writes to the active slot make the other slot's vector stale, so it is cleared for re-embedding.
+    clears_other: bool = True
+
+    @property
+    def model_column(self) -> str:
+        return EmbeddingColumn.model_column(self.name)
+
+    def model_for(self, embedding: Optional[Sequence[float]]) -> Optional[str]:
+        return None if embedding is None else self.version
+
+    def assignment_sql(
+        self,
+        value_sql: str = f"(%s)::{EMBEDDING_SQL_TYPE}",
+        model_sql: str = "%s",
+        *,
+        when: Optional[str] = None,
+    ) -> str:
+        """SET-list items storing a vector and its model version, optionally only `when` a condition holds."""
+        assignments = [(self.name, value_sql), (self.model_column, model_sql)]
+        if self.clears_other:
+            other = self.column.other_slot(self.name)
+            assignments += [(other, "NULL"), (EmbeddingColumn.model_column(other), "NULL")]
+        if when is None:
+            return ", ".join(f"{target} = {value}" for target, value in assignments)
+        return ", ".join(f"{target} = CASE WHEN {when} THEN {value} ELSE {target} END" for target, value in assignments)
+
+
+_STATES: dict[str, EmbeddingMigrationState] = {}
+_STATES_EXPIRE_AT = 0.0
+_STATES_LOCK = Lock()
+
+
+def _embedding_migration_states() -> dict[str, EmbeddingMigrationState]:
+    global _STATES, _STATES_EXPIRE_AT
+    with _STATES_LOCK:
+        if monotonic() < _STATES_EXPIRE_AT:
+            return _STATES
+        _STATES_EXPIRE_AT = monotonic() + EMBEDDING_MIGRATION_STATE_TTL_SECONDS
+        try:
+            _STATES = {state.key: state for state in get_embedding_migration_repo().list_states()}
+        except Exception:
+            # Keep the last known slots; the statement that needs them reports the database error itself.
+            pass
+        return _STATES
+
+
+def invalidate_embedding_migration_states() -> None:
+    global _STATES_EXPIRE_AT
+    with _STATES_LOCK:
+        _STATES_EXPIRE_AT = 0.0
+
+
+def resolve_embedding_slot(column: EmbeddingColumn, version: str = EMBEDDING_VERSION) -> EmbeddingSlot:
+    """Pick the slot holding this process' embedding model for `column`."""
+    state = _embedding_migration_states().get(column.key)
+    if state is None:
+        return EmbeddingSlot(column, column.column, version)
+    slot = state.slot_for(column, version)
+    return EmbeddingSlot(column, slot, version, clears_other=slot == state.active_slot)
+
+
+class EmbeddingMigrationRepository:
+    """Slot bookkeeping and batch reads/writes for re-embedding a column with another model.
+
+    A run starts by recreating the inactive slot for the target model, fills it in primary-key
+    order from a stored checkpoint, and ends by switching which slot is active. The switch only
+    updates `embedding_migration`; no step rewrites the table or holds a long lock.
+    """
+
+    def __init__(self, conn: psycopg.Connection | None = None):
+        self._conn = conn or PooledConnection()
+
+    def list_states(self) -> list[EmbeddingMigrationState]:
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(f"SELECT {_STATE_COLUMNS} FROM embedding_migration")
+            return [_row_to_state(row) for row in cur.fetchall()]
+
+    def get_state(self, column: EmbeddingColumn, *, for_update: bool = False) -> Optional[EmbeddingMigrationState]:
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                f"""
+                SELECT {_STATE_COLUMNS}
+                FROM embedding_migration
+                WHERE table_name = %s AND column_name = %s
+                {"FOR UPDATE" if for_update else ""}
+                """,
+                (column.table, column.column),
+            )
+            row = cur.fetchone()
+            return _row_to_state(row) if row else None
+
+    def begin(
+        self,
+        column: EmbeddingColumn,
+        target_model: str,
+        *,
+        active_model: str = EMBEDDING_VERSION,
+        storage: str = EMBEDDING_STORAGE,
+    ) -> EmbeddingMigrationState:
+        """Start re-embedding `column` with `target_model`, or return the run already under way for it.
+
+        `active_model` labels the vectors currently served when the column has never been migrated.
+        """
+        with self._conn.transaction():
+            with self._conn.cursor() as cur:
+                cur.execute(
+                    """
+                    INSERT INTO embedding_migration (table_name, column_name, active_slot, active_model)
+                    VALUES (%s, %s, %s, %s)
+                    ON CONFLICT (table_name, column_name) DO NOTHING
+                    """,
+                    (column.table, column.column, column.column, active_model),
+                )
+            state = self.get_state(column, for_update=True)
+            assert state is not None
+            if state.target_model == target_model:
+                return state
+            if state.active_model == target_model:
+                raise ValueError(f"{column.key} already serves {target_model}")
+            slot = column.other_slot(state.active_slot)
+            model_column = EmbeddingColumn.model_column(slot)
+            slot_type = f"{storage}({embedding_version_dimensions(target_model)})"
+            with self._conn.cursor(row_factory=dict_row) as cur:
+                # Dropping and re-adding the slot is a catalog change; retyping it would rewrite the table.
+                cur.execute(
+                    f"""
+                    ALTER TABLE {column.table}
+                        DROP COLUMN IF EXISTS {slot},
+                        DROP COLUMN IF EXISTS {model_column},
+                        ADD COLUMN {slot} {slot_type},
+                        ADD COLUMN {model_column} TEXT
+                    """
+                )
+                cur.execute(
+                    f"""
+                    UPDATE embedding_migration
+                    SET target_model = %s,
+                        previous_model = NULL,
+                        checkpoint = NULL,
+                        rows_done = 0,
+                        started_at = now(),
+                        updated_at = now()
+                    WHERE table_name = %s AND column_name = %s
+                    RETURNING {_STATE_COLUMNS}
+                    """,
+                    (target_model, column.table, column.column),
+                )
+                row = cur.fetchone()
+        invalidate_embedding_migration_states()
+        assert row is not None
+        return _row_to_state(row)
+
+    @staticmethod
+    def _pending_sql(column: EmbeddingColumn, slot: str) -> str:
+        # Rows without text to embed are skipped; a slot holding another model's vector is redone.
+        return (
+            f"BTRIM(COALESCE({column.source_sql}, '')) <> '' "
+            f"AND ({slot} IS NULL OR {EmbeddingColumn.model_column(slot)} <> %s)"
+        )
+
+    def pending_rows(
+        self,
+        column: EmbeddingColumn,
+        state: EmbeddingMigrationState,
+        *,
+        limit: int,
+    ) -> list[tuple[str, str]]:
+        """The next `(primary key, source text)` pairs after the checkpoint that still need a vector."""
+        slot = state.fill_slot(column)
+        conditions = [self._pending_sql(column, slot)]
+        params: list[Any] = [state.fill_model]
+        if state.checkpoint is not None:
+            conditions.append(f"id > (%s)::{column.pk_type}")
+            params.append(state.checkpoint)
+        params.append(limit)
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                f"""
+                SELECT id::text AS row_id, {column.source_sql} AS source_text
+                FROM {column.table}
+                WHERE {" AND ".join(conditions)}
+                ORDER BY id
+                LIMIT %s
+                """,
+                params,
+            )
+            return [(row["row_id"], row["source_text"]) for row in cur.fetchall()]
+
+    def count_pending(self, column: EmbeddingColumn, state: EmbeddingMigrationState) -> int:
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                f"SELECT COUNT(*) AS pending FROM {column.table} WHERE {self._pending_sql(column, state.fill_slot(column))}",
+                (state.fill_model,),
+            )
+            row = cur.fetchone()
+            return int(row["pending"]) if row else 0
+
+    def store_embeddings(
+        self,
+        column: EmbeddingColumn,
+        state: EmbeddingMigrationState,
+        rows: Sequence[tuple[str, str]],
+        embeddings: Sequence[Sequence[float]],
+        *,
+        storage: str = EMBEDDING_STORAGE,
+    ) -> int:
+        """Write one batch and advance the checkpoint past it in the same transaction.
+
+        A row whose text changed after it was read is left alone; the final sweep picks it up again.
+        """
+        if not rows:
+            return 0
+        slot = state.fill_slot(column)
+        slot_type = f"{storage}({embedding_version_dimensions(state.fill_model)})"
+        with self._conn.transaction(), self._conn.cursor() as cur:
+            cur.executemany(
+                f"""
+                UPDATE {column.table}
+                SET {slot} = (%s)::{slot_type},
+                    {EmbeddingColumn.model_column(slot)} = %s
+                WHERE id = (%s)::{column.pk_type}
+                  AND md5({column.source_sql}) = md5(%s)
+                """,
+                [
+                    (list(embedding), state.fill_model, row_id, source_text)
+                    for (row_id, source_text), embedding in zip(rows, embeddings)
+                ],
+            )
+            written = max(0, cur.rowcount)
+            self._save_checkpoint(cur, column, rows[-1][0], rows_done=len(rows))
+        return written
+
+    def restart_sweep(self, column: EmbeddingColumn) -> None:
+        """Clear the checkpoint so the next batch starts over at the lowest primary key."""
+        with self._conn.cursor() as cur:
+            self._save_checkpoint(cur, column, None, rows_done=0)
+
+    @staticmethod
+    def _save_checkpoint(cur: psycopg.Cursor, column: EmbeddingColumn, checkpoint: Optional[str], *, rows_done: int) -> None:
+        cur.execute(
+            """
+            UPDATE embedding_migration
+            SET checkpoint = %s,
+                rows_done = rows_done + %s,
+                updated_at = now()
+            WHERE table_name = %s AND column_name = %s
+            """,
+            (checkpoint, rows_done, column.table, column.column),
+        )
+
+    def build_indexes(self, column: EmbeddingColumn, state: EmbeddingMigrationState, *, storage: str = EMBEDDING_STORAGE) -> None:
+        """Build the vector indexes of the slot being filled without blocking writes."""
+        statements = embedding_index_sql(
+            column,
+            slot=state.fill_slot(column),
+            storage=storage,
+            dimensions=embedding_version_dimensions(state.fill_model),
+            concurrently=True,
+        )
+        # CREATE INDEX CONCURRENTLY refuses to run inside a transaction block; pooled connections autocommit.
+        with self._conn.cursor() as cur:
+            for statement in statements:
+                cur.execute(statement)
+
+    def switch_slots(self, column: EmbeddingColumn) -> EmbeddingMigrationState:
+        """Serve the re-embedded slot; the old slot stays readable for processes still on the old model."""
+        with self._conn.transaction():
+            state = self.get_state(column, for_update=True)
+            if state is None or not state.in_progress:
+                raise ValueError(f"No re-embedding run in progress for {column.key}")
+            pending = self.count_pending(column, state)
+            if pending:
+                raise RuntimeError(f"{column.key} still has {pending} rows without a {state.target_model} embedding")
+            with self._conn.cursor(row_factory=dict_row) as cur:
+                cur.execute(
+                    f"""
+                    UPDATE embedding_migration
+                    SET active_slot = %s,
+                        active_model = target_model,
+                        previous_model = active_model,
+                        target_model = NULL,
+                        checkpoint = NULL,
+                        updated_at = now()
+                    WHERE table_name = %s AND column_name = %s
+                    RETURNING {_STATE_COLUMNS}
+                    """,
+                    (column.other_slot(state.active_slot), column.table, column.column),
+                )
+                row = cur.fetchone()
+                if column == PRODUCT_EMBEDDING:
+                    # The in-process product index is rebuilt when the catalog version moves.
+                    cur.execute("UPDATE product_catalog_version SET version = version + 1, updated_at = now()")
+        invalidate_embedding_migration_states()
+        assert row is not None
+        return _row_to_state(row)
+
+
+_EMBEDDING_MIGRATION_REPOSITORY: Optional[EmbeddingMigrationRepository] = None
+_EMBEDDING_MIGRATION_REPOSITORY_LOCK = Lock()
+
+
+def get_embedding_migration_repo() -> EmbeddingMigrationRepository:
+    global _EMBEDDING_MIGRATION_REPOSITORY
+    with _EMBEDDING_MIGRATION_REPOSITORY_LOCK:
+        if _EMBEDDING_MIGRATION_REPOSITORY is None:
+            _EMBEDDING_MIGRATION_REPOSITORY = EmbeddingMigrationRepository()
+        return _EMBEDDING_MIGRATION_REPOSITORY
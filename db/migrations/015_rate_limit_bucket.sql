@@ -0,0 +1,9 @@
+CREATE TABLE IF NOT EXISTS rate_limit_bucket (
+    bucket_key TEXT PRIMARY KEY,
+    tokens DOUBLE PRECISION NOT NULL,
+    capacity INTEGER NOT NULL,
+    refill_per_second DOUBLE PRECISION NOT NULL,
+    blocked_until TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    CONSTRAINT rate_limit_bucket_capacity_positive CHECK (capacity > 0)
+);
@@ -0,0 +1,8 @@
+CREATE TABLE IF NOT EXISTS geocode_cache (
+    name_key TEXT PRIMARY KEY,
+    location_payload JSONB,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_geocode_cache_expires_at ON geocode_cache (expires_at);
@@ -0,0 +1,12 @@
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE products
+ADD COLUMN IF NOT EXISTS search_tsv tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', COALESCE(name, '')), 'A')
+    || setweight(to_tsvector('english', COALESCE(category, '')), 'B')
+    || setweight(to_tsvector('english', COALESCE(description, '')), 'C')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS products_search_tsv_idx ON products USING GIN (search_tsv);
+CREATE INDEX IF NOT EXISTS products_name_trgm_idx ON products USING GIN (LOWER(name) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS products_style_trgm_idx ON products USING GIN (LOWER(style) gin_trgm_ops);
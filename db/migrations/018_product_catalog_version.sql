@@ -0,0 +1,20 @@
+CREATE TABLE IF NOT EXISTS product_catalog_version (
+    singleton BOOLEAN PRIMARY KEY DEFAULT TRUE,
+    version BIGINT NOT NULL DEFAULT 1,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    CONSTRAINT product_catalog_version_singleton CHECK (singleton)
+);
+
+INSERT INTO product_catalog_version (singleton) VALUES (TRUE) ON CONFLICT (singleton) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_product_catalog_version() RETURNS trigger AS $$
+BEGIN
+    UPDATE product_catalog_version SET version = version + 1, updated_at = now();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS products_catalog_version_trigger ON products;
+CREATE TRIGGER products_catalog_version_trigger
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON products
+FOR EACH STATEMENT EXECUTE FUNCTION bump_product_catalog_version();
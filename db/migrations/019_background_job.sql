@@ -0,0 +1,35 @@
+CREATE TABLE IF NOT EXISTS background_job (
+    id BIGSERIAL PRIMARY KEY,
+    job_type TEXT NOT NULL,
+    job_key TEXT NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 5,
+    run_after TIMESTAMPTZ NOT NULL DEFAULT now(),
+    locked_at TIMESTAMPTZ,
+    locked_by TEXT,
+    last_error TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    CONSTRAINT background_job_status_valid CHECK (status IN ('pending', 'running', 'completed', 'failed')),
+    CONSTRAINT background_job_max_attempts_positive CHECK (max_attempts > 0)
+);
+
+-- One queued job per key: enqueueing again while one is pending coalesces into it.
+CREATE UNIQUE INDEX IF NOT EXISTS uq_background_job_pending_key
+    ON background_job (job_type, job_key)
+    WHERE status = 'pending';
+
+-- One running job per key, so a follow-up never runs alongside the job it follows.
+CREATE UNIQUE INDEX IF NOT EXISTS uq_background_job_running_key
+    ON background_job (job_type, job_key)
+    WHERE status = 'running';
+
+CREATE INDEX IF NOT EXISTS idx_background_job_ready
+    ON background_job (run_after, id)
+    WHERE status = 'pending';
+
+CREATE INDEX IF NOT EXISTS idx_background_job_locked_at
+    ON background_job (locked_at)
+    WHERE status = 'running';
@@ -0,0 +1,23 @@
+-- The top-level conversation summary is folded forward incrementally: `summary_message_index` is the last
+-- roundtrip folded into `summary`, and `summary_embedding_source` is the summary text the stored
+-- embedding was computed from, so near-identical rewrites can keep the existing embedding.
+ALTER TABLE conversation
+    ADD COLUMN IF NOT EXISTS summary_message_index INTEGER NOT NULL DEFAULT -1,
+    ADD COLUMN IF NOT EXISTS summary_embedding_source TEXT;
+
+-- Existing summaries were rebuilt from the whole conversation; start folding after its latest roundtrip.
+UPDATE conversation c
+SET summary_message_index = latest.message_index
+FROM (
+    SELECT conversation_id, MAX(message_index) AS message_index
+    FROM conversation_roundtrip
+    GROUP BY conversation_id
+) latest
+WHERE latest.conversation_id = c.id
+  AND BTRIM(COALESCE(c.summary, '')) <> ''
+  AND c.summary_message_index = -1;
+
+UPDATE conversation
+SET summary_embedding_source = summary
+WHERE summary_embedding IS NOT NULL
+  AND summary_embedding_source IS NULL;
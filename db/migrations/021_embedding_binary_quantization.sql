@@ -0,0 +1,8 @@
+-- Sign-bit codes of the catalog and file-chunk embeddings for candidate generation (requires pgvector 0.7+).
+-- Searches re-rank the candidates on the stored vectors; see PRODUCT_SEARCH_BINARY_QUANTIZATION.
+-- scripts/convert_embedding_storage.py rebuilds these when the embedding type or dimensions change.
+CREATE INDEX IF NOT EXISTS products_embedding_bq_idx
+    ON products USING hnsw ((binary_quantize(embedding)::bit(1536)) bit_hamming_ops);
+
+CREATE INDEX IF NOT EXISTS file_chunks_embedding_bq_idx
+    ON file_chunks USING hnsw ((binary_quantize(embedding)::bit(1536)) bit_hamming_ops);
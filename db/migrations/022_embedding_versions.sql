@@ -0,0 +1,47 @@
+-- Every embedding gets a second slot (`<column>_alt`) and a per-row model version for each slot
+-- (`<slot>_model`, e.g. 'text-embedding-3-small@1536'). A re-embedding run fills the inactive slot in
+-- batches while the active one keeps serving, then switches slots by updating `embedding_migration`.
+-- The alt slots start untyped; starting a migration recreates the target slot with its dimensions.
+-- Vectors stored before this migration have no recorded version and count as the active model.
+ALTER TABLE products
+    ADD COLUMN IF NOT EXISTS embedding_model TEXT,
+    ADD COLUMN IF NOT EXISTS embedding_alt vector,
+    ADD COLUMN IF NOT EXISTS embedding_alt_model TEXT;
+
+ALTER TABLE file_chunks
+    ADD COLUMN IF NOT EXISTS embedding_model TEXT,
+    ADD COLUMN IF NOT EXISTS embedding_alt vector,
+    ADD COLUMN IF NOT EXISTS embedding_alt_model TEXT;
+
+ALTER TABLE conversation
+    ADD COLUMN IF NOT EXISTS summary_embedding_model TEXT,
+    ADD COLUMN IF NOT EXISTS summary_embedding_alt vector,
+    ADD COLUMN IF NOT EXISTS summary_embedding_alt_model TEXT;
+
+ALTER TABLE conversation_roundtrip
+    ADD COLUMN IF NOT EXISTS roundtrip_summary_embedding_model TEXT,
+    ADD COLUMN IF NOT EXISTS roundtrip_summary_embedding_alt vector,
+    ADD COLUMN IF NOT EXISTS roundtrip_summary_embedding_alt_model TEXT;
+
+ALTER TABLE user_attributes
+    ADD COLUMN IF NOT EXISTS attribute_embedding_model TEXT,
+    ADD COLUMN IF NOT EXISTS attribute_embedding_alt vector,
+    ADD COLUMN IF NOT EXISTS attribute_embedding_alt_model TEXT;
+
+-- One row per embedding column once it has been migrated. `active_slot` serves reads and writes for
+-- `active_model`; during a run the other slot is filled with `target_model`, and after the switch it
+-- keeps `previous_model` so processes still configured with the old model can read until they restart.
+CREATE TABLE IF NOT EXISTS embedding_migration (
+    table_name TEXT NOT NULL,
+    column_name TEXT NOT NULL,
+    active_slot TEXT NOT NULL,
+    active_model TEXT NOT NULL,
+    target_model TEXT,
+    previous_model TEXT,
+    -- Primary key of the last row re-embedded; a restarted run continues after it.
+    checkpoint TEXT,
+    rows_done BIGINT NOT NULL DEFAULT 0,
+    started_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (table_name, column_name)
+);
@@ -0,0 +1,14 @@
+-- Fingerprint of the source fields a catalog load wrote, so a re-run only rewrites products that changed.
+ALTER TABLE products
+    ADD COLUMN IF NOT EXISTS source_hash TEXT;
+
+-- Progress of a bulk catalog load (scripts/seed_products.py), one row per source while it runs.
+-- rows_done counts source rows committed; deferred_indexes holds the definitions of the indexes dropped
+-- for the load, recreated when it finishes.
+CREATE TABLE IF NOT EXISTS product_catalog_load (
+    source TEXT PRIMARY KEY,
+    rows_done BIGINT NOT NULL DEFAULT 0,
+    deferred_indexes TEXT[] NOT NULL DEFAULT '{}',
+    started_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
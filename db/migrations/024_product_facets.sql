@@ -0,0 +1,38 @@
+-- Filterable values of the catalog with their product counts and price range, and a price histogram.
+-- Read by list_product_categories and the planner prompt instead of scanning products per call.
+-- Refreshed at the end of every catalog load (scripts/seed_products.py).
+CREATE MATERIALIZED VIEW IF NOT EXISTS product_facet_values AS
+SELECT facets.facet,
+       facets.value,
+       COUNT(*) AS product_count,
+       MIN(products.price) AS price_min,
+       MAX(products.price) AS price_max
+FROM products
+CROSS JOIN LATERAL (
+    VALUES ('category', products.category),
+           ('color', products.color),
+           ('style', products.style),
+           ('gender', products.gender),
+           ('season', products.season)
+) AS facets (facet, value)
+WHERE BTRIM(COALESCE(facets.value, '')) <> ''
+GROUP BY facets.facet, facets.value;
+
+-- REFRESH ... CONCURRENTLY needs a unique index.
+CREATE UNIQUE INDEX IF NOT EXISTS product_facet_values_key ON product_facet_values (facet, value);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS product_price_histogram AS
+WITH bounds AS (
+    SELECT MIN(price) AS low, MAX(price) AS high
+    FROM products
+    WHERE price IS NOT NULL
+)
+SELECT CASE WHEN bounds.high > bounds.low THEN LEAST(width_bucket(products.price, bounds.low, bounds.high, 10), 10) ELSE 1 END AS bucket,
+       MIN(products.price) AS price_min,
+       MAX(products.price) AS price_max,
+       COUNT(*) AS product_count
+FROM products, bounds
+WHERE products.price IS NOT NULL
+GROUP BY 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS product_price_histogram_key ON product_price_histogram (bucket);
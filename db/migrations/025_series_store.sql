@@ -0,0 +1,12 @@
+-- Full-resolution series behind summarized finance and weather tool output, read by get_series_points.
+-- Shared so a series_id from a cached tool result or a stored payload resolves in every worker.
+CREATE TABLE IF NOT EXISTS series_store (
+    series_id TEXT PRIMARY KEY,
+    label TEXT NOT NULL,
+    xs TEXT[] NOT NULL,
+    ys DOUBLE PRECISION[] NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_series_store_expires_at ON series_store (expires_at);
@@ -0,0 +1,11 @@
+-- Per-month archive totals (see integrations/open_meteo/archive.py) for months the archive has finished
+-- backfilling. They never change, so rows are kept permanently and shared by every worker.
+CREATE TABLE IF NOT EXISTS weather_month_totals (
+    latitude DOUBLE PRECISION NOT NULL,
+    longitude DOUBLE PRECISION NOT NULL,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    totals DOUBLE PRECISION[] NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (latitude, longitude, year, month)
+);
@@ -12,10 +12,37 @@ CREATE TABLE products (
   year INT,
   price NUMERIC,
   image_url TEXT,
-  embedding vector(1536)
+  embedding vector(1536),
+  search_tsv tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', COALESCE(name, '')), 'A')
+    || setweight(to_tsvector('english', COALESCE(category, '')), 'B')
+    || setweight(to_tsvector('english', COALESCE(description, '')), 'C')
+  ) STORED
 );
 
 CREATE INDEX products_category_idx ON products (category);
 CREATE INDEX products_color_idx ON products (color);
 CREATE INDEX products_price_idx ON products (price);
 CREATE INDEX IF NOT EXISTS products_embedding_idx ON products USING ivfflat (embedding vector_l2_ops) WITH (lists = 100);
+CREATE INDEX IF NOT EXISTS products_search_tsv_idx ON products USING GIN (search_tsv);
+CREATE INDEX IF NOT EXISTS products_name_trgm_idx ON products USING GIN (LOWER(name) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS products_style_trgm_idx ON products USING GIN (LOWER(style) gin_trgm_ops);
+
+CREATE TABLE IF NOT EXISTS product_catalog_version (
+  singleton BOOLEAN PRIMARY KEY DEFAULT TRUE,
+  version BIGINT NOT NULL DEFAULT 1,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  CONSTRAINT product_catalog_version_singleton CHECK (singleton)
+);
+INSERT INTO product_catalog_version (singleton) VALUES (TRUE) ON CONFLICT (singleton) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_product_catalog_version() RETURNS trigger AS $$
+BEGIN
+  UPDATE product_catalog_version SET version = version + 1, updated_at = now();
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER products_catalog_version_trigger
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON products
+FOR EACH STATEMENT EXECUTE FUNCTION bump_product_catalog_version();
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Hashable, Sequence
+
+from common.config import EMBEDDING_DIMENSIONS, get_env_bool, get_env_int
+
+EMBEDDING_STORAGE_VECTOR = "vector"
+EMBEDDING_STORAGE_HALFVEC = "halfvec"
+EMBEDDING_STORAGE_TYPES = (EMBEDDING_STORAGE_VECTOR, EMBEDDING_STORAGE_HALFVEC)
+
+# Column type of every embedding column; `scripts/convert_embedding_storage.py` switches an existing
+# database between full-precision `vector` and half-precision `halfvec` and changes the dimensions.
+EMBEDDING_STORAGE = os.getenv("EMBEDDING_STORAGE", EMBEDDING_STORAGE_VECTOR).strip().lower()
+if EMBEDDING_STORAGE not in EMBEDDING_STORAGE_TYPES:
+    EMBEDDING_STORAGE = EMBEDDING_STORAGE_VECTOR
+
+# Query vectors are cast to the column type, so distance operators and ANN indexes match the column.
+EMBEDDING_SQL_TYPE = f"{EMBEDDING_STORAGE}({EMBEDDING_DIMENSIONS})"
+
+# Product searches take candidates from the binary-quantized index and re-rank them on the stored vectors.
+PRODUCT_SEARCH_BINARY_QUANTIZATION = get_env_bool("PRODUCT_SEARCH_BINARY_QUANTIZATION", False)
+BINARY_QUANTIZATION_OVERSAMPLE = max(1, get_env_int("BINARY_QUANTIZATION_OVERSAMPLE", 4))
+
+
+def binary_quantized_sql(expression: str) -> str:
+    """SQL for the sign-bit code of an embedding expression, matching the `bit_hamming_ops` indexes."""
+    return f"binary_quantize({expression})::bit({EMBEDDING_DIMENSIONS})"
+
+
+def recall_at_k(expected: Sequence[Hashable], actual: Sequence[Hashable], k: int) -> float:
+    """Share of the exact top-k that an approximate top-k found."""
+    relevant = set(expected[:k])
+    if not relevant:
+        return 1.0
+    return len(relevant.intersection(actual[:k])) / len(relevant)
+
+
+@dataclass(frozen=True)
+class EmbeddingColumn:
+    """An embedding column and what it is computed from.
+
+    Every embedding has two physical slots: `column` and `<column>_alt`. Re-embedding with a new model
+    fills the inactive slot while the active one keeps serving, and `<slot>_model` records the model
+    version of each stored vector (see db/embedding_migration.py).
+    """
+
+    table: str
+    column: str
+    ann_index: str | None
+    distance_ops: str = "l2"
+    quantized_index: str | None = None
+    # Text the embedding is computed from, as a SQL expression over the table's columns.
+    source_sql: str = ""
+    pk_type: str = "uuid"
+
+    @property
+    def key(self) -> str:
+        return f"{self.table}.{self.column}"
+
+    @property
+    def alt_column(self) -> str:
+        return f"{self.column}_alt"
+
+    @property
+    def slots(self) -> tuple[str, str]:
+        return self.column, self.alt_column
+
+    def other_slot(self, slot: str) -> str:
+        return self.alt_column if slot == self.column else self.column
+
+    @staticmethod
+    def model_column(slot: str) -> str:
+        return f"{slot}_model"
+
+    def slot_index(self, index: str, slot: str) -> str:
+        if slot == self.column:
+            return index
+        return f"{index.removesuffix('_idx')}_alt_idx"
+
+
+PRODUCT_EMBEDDING = EmbeddingColumn(
+    "products",
+    "embedding",
+    "products_embedding_idx",
+    quantized_index="products_embedding_bq_idx",
+    source_sql="COALESCE(NULLIF(BTRIM(description), ''), name)",
+    pk_type="text",
+)
+FILE_CHUNK_EMBEDDING = EmbeddingColumn(
+    "file_chunks",
+    "embedding",
+    None,
+    distance_ops="cosine",
+    quantized_index="file_chunks_embedding_bq_idx",
+    source_sql="content",
+)
+CONVERSATION_SUMMARY_EMBEDDING = EmbeddingColumn(
+    "conversation",
+    "summary_embedding",
+    "conversation_summary_embedding_idx",
+    source_sql="COALESCE(summary_embedding_source, summary)",
+)
+ROUNDTRIP_SUMMARY_EMBEDDING = EmbeddingColumn(
+    "conversation_roundtrip",
+    "roundtrip_summary_embedding",
+    "conversation_roundtrip_summary_embedding_idx",
+    source_sql="roundtrip_summary",
+)
+USER_ATTRIBUTE_EMBEDDING = EmbeddingColumn(
+    "user_attributes",
+    "attribute_embedding",
+    "user_attributes_attribute_embedding_idx",
+    source_sql="array_to_string(value, '; ')",
+)
+
+EMBEDDING_COLUMNS = (
+    PRODUCT_EMBEDDING,
+    FILE_CHUNK_EMBEDDING,
+    CONVERSATION_SUMMARY_EMBEDDING,
+    ROUNDTRIP_SUMMARY_EMBEDDING,
+    USER_ATTRIBUTE_EMBEDDING,
+)
+
+
+def embedding_index_sql(
+    column: EmbeddingColumn,
+    *,
+    slot: str | None = None,
+    storage: str,
+    dimensions: int,
+    concurrently: bool = False,
+) -> list[str]:
+    """CREATE INDEX statements for the vector indexes of one slot of an embedding column."""
+    slot = slot or column.column
+    create = "CREATE INDEX CONCURRENTLY IF NOT EXISTS" if concurrently else "CREATE INDEX"
+    statements: list[str] = []
+    if column.ann_index:
+        statements.append(
+            f"{create} {column.slot_index(column.ann_index, slot)} ON {column.table} "
+            f"USING ivfflat ({slot} {storage}_{column.distance_ops}_ops) WITH (lists = 100)"
+        )
+    if column.quantized_index:
+        statements.append(
+            f"{create} {column.slot_index(column.quantized_index, slot)} ON {column.table} "
+            f"USING hnsw ((binary_quantize({slot})::bit({dimensions})) bit_hamming_ops)"
+        )
+    return statements
+
+
+def embedding_column_conversion_sql(
+    column: EmbeddingColumn,
+    *,
+    storage: str,
+    dimensions: int,
+    truncate: bool,
+    slot: str | None = None,
+) -> list[str]:
+    """Statements that retype an embedding column and rebuild its vector indexes.
+
+    With `truncate`, stored vectors are cut to their first `dimensions` values and re-normalized,
+    which is how Matryoshka embeddings are shortened; their model versions are relabelled to match.
+    """
+    if storage not in EMBEDDING_STORAGE_TYPES:
+        raise ValueError(f"Unsupported embedding storage: {storage}")
+    slot = slot or column.column
+    target_type = f"{storage}({dimensions})"
+    source = f"{slot}::vector"
+    if truncate:
+        source = f"l2_normalize(subvector({source}, 1, {dimensions}))"
+    statements = [
+        f"DROP INDEX IF EXISTS {column.slot_index(index, slot)}"
+        for index in (column.ann_index, column.quantized_index)
+        if index
+    ]
+    statements.append(f"ALTER TABLE {column.table} ALTER COLUMN {slot} TYPE {target_type} USING ({source})::{target_type}")
+    if truncate:
+        model_column = column.model_column(slot)
+        statements.append(
+            f"UPDATE {column.table} SET {model_column} = split_part({model_column}, '@', 1) || '@{dimensions}' "
+            f"WHERE {model_column} IS NOT NULL"
+        )
+    statements.extend(embedding_index_sql(column, slot=slot, storage=storage, dimensions=dimensions))
+    return statements
@@ -7,6 +7,8 @@ from uuid import UUID
 from common.config import IMAGE_MIME_PREFIX
 from files.models import FileChunkResult
 from db.connection import get_connection
+from db.embedding_migration import resolve_embedding_slot
+from db.vector import EMBEDDING_SQL_TYPE, FILE_CHUNK_EMBEDDING
 
 
 class FileTypeFilter(str, Enum):
@@ -23,14 +25,18 @@ class FileChunkRepository:
         self._conn = get_connection()
 
     def save_chunks(self, file_id: UUID, chunks: list[tuple[int, str, list[float]]]) -> None:
+        embedding_slot = resolve_embedding_slot(FILE_CHUNK_EMBEDDING)
         with self._conn.cursor() as cur:
             cur.executemany(
-                """
-                INSERT INTO file_chunks (file_id, chunk_index, content, embedding)
-                VALUES (%s, %s, %s, (%s)::vector)
+                f"""
+                INSERT INTO file_chunks (file_id, chunk_index, content, {embedding_slot.name}, {embedding_slot.model_column})
+                VALUES (%s, %s, %s, (%s)::{EMBEDDING_SQL_TYPE}, %s)
                 ON CONFLICT (file_id, chunk_index) DO NOTHING
                 """,
-                [(file_id, idx, content, embedding) for idx, content, embedding in chunks],
+                [
+                    (file_id, idx, content, embedding, embedding_slot.model_for(embedding))
+                    for idx, content, embedding in chunks
+                ],
             )
             self._conn.commit()
 
@@ -43,8 +49,9 @@ class FileChunkRepository:
         limit: int = TOP_K,
     ) -> list[FileChunkResult]:
         distinct = "DISTINCT ON (cf.id)" if not file_id else ""
+        embedding_column = f"cfc.{resolve_embedding_slot(FILE_CHUNK_EMBEDDING).name}"
 
-        conditions = ["cfc.embedding <=> (%s)::vector <= %s", "(CAST(%s AS text) IS NULL OR cf.user_id = %s)"]
+        conditions = [f"{embedding_column} <=> (%s)::{EMBEDDING_SQL_TYPE} <= %s", "(CAST(%s AS text) IS NULL OR cf.user_id = %s)"]
         params: list = [query_embedding, query_embedding, MAX_CHUNK_DISTANCE, user_id, user_id]
         if file_id:
             conditions.append("cfc.file_id = %s")
@@ -57,7 +64,7 @@ class FileChunkRepository:
         order_by = "cf.id, distance ASC" if not file_id else "distance ASC"
         sql = f"""
             SELECT {distinct} cf.id AS file_id, cf.file_name, cf.file_path, cfc.content,
-                cfc.embedding <=> (%s)::vector AS distance
+                {embedding_column} <=> (%s)::{EMBEDDING_SQL_TYPE} AS distance
             FROM file_chunks cfc
             JOIN files cf ON cf.id = cfc.file_id
             WHERE {" AND ".join(conditions)}
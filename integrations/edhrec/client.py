@@ -4,7 +4,7 @@ from datetime import timedelta
 import re
 import unicodedata
 
-from common.http import DEFAULT_TTL, HttpClient, HttpClientError
+from common.http import DEFAULT_CIRCUIT_BREAKER_POLICY, DEFAULT_TTL, HttpClient, HttpClientError
 from integrations.edhrec.models import EdhrecCommanderPage
 
 EDHREC_API_BASE_URL = "https://json.edhrec.com"
@@ -35,7 +35,13 @@ class EdhrecClient:
         ttl: timedelta = DEFAULT_TTL,
     ):
         self.base_url = base_url.rstrip("/")
-        self._http = HttpClient(timeout_s=timeout_s, ttl=ttl)
+        self._http = HttpClient(
+            timeout_s=timeout_s,
+            ttl=ttl,
+            circuit_breaker_key="edhrec",
+            circuit_breaker_policy=DEFAULT_CIRCUIT_BREAKER_POLICY,
+            hedge_requests=True,
+        )
 
     def get_commander_page(self, commander_name: str) -> tuple[str, EdhrecCommanderPage]:
         slug = slugify_commander_name(commander_name)
@@ -1,9 +1,12 @@
 from integrations.frankfurter.client import FrankfurterClient, FrankfurterClientError
 from integrations.frankfurter.models import ExchangeRatesSeries, ExchangeRatesSnapshot
+from integrations.frankfurter.rate_store import ExchangeRateStore, get_exchange_rate_store
 
 __all__ = [
     "ExchangeRatesSeries",
     "ExchangeRatesSnapshot",
+    "ExchangeRateStore",
     "FrankfurterClient",
     "FrankfurterClientError",
+    "get_exchange_rate_store",
 ]
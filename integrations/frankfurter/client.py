@@ -1,10 +1,19 @@
 from __future__ import annotations
 
-from datetime import timedelta
-from typing import Any
+from datetime import date, datetime, timedelta, timezone
+from threading import Thread
+from typing import Any, TypeVar
 
 from common.http import HttpClient, HttpClientError, DEFAULT_TTL
 from integrations.frankfurter.models import ExchangeRatesSnapshot, ExchangeRatesSeries
+from integrations.frankfurter.rate_store import (
+    FRANKFURTER_INLINE_REFRESH_MAX_DAYS,
+    STORE_BASE_CURRENCY,
+    ExchangeRateStore,
+    get_exchange_rate_store,
+)
+
+_StoredResult = TypeVar("_StoredResult", ExchangeRatesSnapshot, ExchangeRatesSeries)
 
 
 class FrankfurterClientError(RuntimeError):
@@ -17,12 +26,48 @@ class FrankfurterClient:
         base_url: str = "https://api.frankfurter.dev/v1",
         timeout_s: float = 20.0,
         ttl: timedelta = DEFAULT_TTL,
+        rate_store: ExchangeRateStore | None = None,
     ):
         self.base_url = base_url.rstrip("/")
         self._http = HttpClient(
             timeout_s=timeout_s,    
             ttl=ttl,
         )
+        self._rate_store = rate_store
+
+    def _local_store(self) -> ExchangeRateStore | None:
+        store = self._rate_store if self._rate_store is not None else get_exchange_rate_store()
+        if store is None:
+            return None
+        today = datetime.now(timezone.utc).date()
+        if store.claim_refresh(today):
+            # Only a short gap is fetched inside the caller's tool call; the first backfill (from 1999) and
+            # long gaps run in the background while requests go to the API or use what is stored.
+            if (today - store.next_missing_date()).days <= FRANKFURTER_INLINE_REFRESH_MAX_DAYS:
+                self._refresh_store(store)
+            else:
+                Thread(target=self._refresh_store, args=(store,), name="frankfurter-rate-backfill", daemon=True).start()
+        return store if store.last_date is not None else None
+
+    def _refresh_store(self, store: ExchangeRateStore) -> None:
+        # Only dates after the last stored row are requested.
+        try:
+            payload = self._get_json(
+                f"{store.next_missing_date().isoformat()}..",
+                params={"base": STORE_BASE_CURRENCY},
+            )
+            series = self._parse_series(payload, fallback_base=STORE_BASE_CURRENCY)
+        except FrankfurterClientError:
+            store.refresh_failed = True
+            return
+        store.refresh_failed = False
+        if store.append_series(series):
+            store.save()
+
+    def _from_store(self, store: ExchangeRateStore, result: _StoredResult | None) -> _StoredResult | None:
+        if result is None or store.last_date is None:
+            return result
+        return result.model_copy(update={"as_of": store.last_date.isoformat(), "stale": store.refresh_failed})
 
     def _get_json(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         url = f"{self.base_url}/{path.lstrip('/')}"
@@ -55,6 +100,10 @@ class FrankfurterClient:
         if not date_norm:
             raise ValueError("Date must be a non-empty string in YYYY-MM-DD format.")
 
+        local_snapshot = self._historical_rates_from_store(date_norm, base=base, symbols=symbols)
+        if local_snapshot is not None:
+            return local_snapshot
+
         payload = self._get_json(
             date_norm,
             params=self._build_rate_params(base=base, symbols=symbols),
@@ -73,6 +122,10 @@ class FrankfurterClient:
         if not start_norm:
             raise ValueError("Start date must be a non-empty string in YYYY-MM-DD format.")
 
+        local_series = self._time_series_from_store(start_norm, end_norm, base=base, symbols=symbols)
+        if local_series is not None:
+            return local_series
+
         path = f"{start_norm}..{end_norm}" if end_norm else f"{start_norm}.."
         payload = self._get_json(
             path,
@@ -80,6 +133,46 @@ class FrankfurterClient:
         )
         return self._parse_series(payload, fallback_base=base)
 
+    def _historical_rates_from_store(
+        self,
+        date_str: str,
+        *,
+        base: str,
+        symbols: list[str] | None,
+    ) -> ExchangeRatesSnapshot | None:
+        try:
+            on_date = date.fromisoformat(date_str)
+            params = self._build_rate_params(base=base, symbols=symbols)
+        except ValueError:
+            return None
+        store = self._local_store()
+        if store is None:
+            return None
+        return self._from_store(store, store.rates_on(on_date, base=params["base"], symbols=self._split_symbols(params)))
+
+    def _time_series_from_store(
+        self,
+        start_str: str,
+        end_str: str,
+        *,
+        base: str,
+        symbols: list[str] | None,
+    ) -> ExchangeRatesSeries | None:
+        try:
+            start = date.fromisoformat(start_str)
+            end = date.fromisoformat(end_str) if end_str else None
+            params = self._build_rate_params(base=base, symbols=symbols)
+        except ValueError:
+            return None
+        store = self._local_store()
+        if store is None:
+            return None
+        return self._from_store(store, store.time_series(start, end, base=params["base"], symbols=self._split_symbols(params)))
+
+    def _split_symbols(self, params: dict[str, str]) -> list[str] | None:
+        symbols = params.get("symbols")
+        return symbols.split(",") if symbols else None
+
     def get_currencies(self) -> dict[str, str]:
         payload = self._get_json("currencies")
         currencies: dict[str, str] = {}
@@ -7,6 +7,9 @@ class ExchangeRatesSnapshot(BaseModel):
     base: str
     date: str
     rates: dict[str, float] = {}
+    # Set when answered from the local rate store: its last stored date, and whether its last refresh failed.
+    as_of: str | None = None
+    stale: bool = False
 
 
 class ExchangeRatesSeries(BaseModel):
@@ -14,3 +17,5 @@ class ExchangeRatesSeries(BaseModel):
     start_date: str
     end_date: str
     rates: dict[str, dict[str, float]] = {}
+    as_of: str | None = None
+    stale: bool = False
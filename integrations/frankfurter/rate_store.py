@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+
+import numpy as np
+
+from common.config import get_env_bool, get_env_float, get_env_int
+from integrations.frankfurter.models import ExchangeRatesSeries, ExchangeRatesSnapshot
+
+STORE_BASE_CURRENCY = "EUR"
+# First ECB reference rate published by Frankfurter.
+FRANKFURTER_HISTORY_START_DATE = date(1999, 1, 4)
+FRANKFURTER_RATE_STORE_PATH = Path(os.getenv("FRANKFURTER_RATE_STORE_PATH", "data/frankfurter/eur_rates.npz"))
+FRANKFURTER_LOCAL_STORE_ENABLED = get_env_bool("FRANKFURTER_LOCAL_STORE_ENABLED", True)
+# ECB publishes once per business day; this bounds how often a process asks for new dates.
+FRANKFURTER_RATE_STORE_REFRESH_SECONDS = max(0.0, get_env_float("FRANKFURTER_RATE_STORE_REFRESH_SECONDS", 60 * 60))
+# Gaps up to this many days are fetched inside the request; longer ones (including the first backfill) in the background.
+FRANKFURTER_INLINE_REFRESH_MAX_DAYS = max(0, get_env_int("FRANKFURTER_INLINE_REFRESH_MAX_DAYS", 31))
+RATE_DECIMALS = 6
+
+
+def _to_day(value: date) -> np.datetime64:
+    return np.datetime64(value.isoformat(), "D")
+
+
+@dataclass
+class ExchangeRateStore:
+    """Append-only date x currency matrix of EUR reference rates.
+
+    Historical ECB rates never change, so rows are only ever appended. Any base/symbol pair is
+    derived as a cross rate of two EUR columns; missing quotes are stored as NaN.
+    """
+
+    path: Path | None = None
+    dates: np.ndarray = field(default_factory=lambda: np.empty(0, dtype="datetime64[D]"))
+    currencies: list[str] = field(default_factory=lambda: [STORE_BASE_CURRENCY])
+    rates: np.ndarray = field(default_factory=lambda: np.empty((0, 1), dtype=np.float64))
+    _checked_at: float | None = field(default=None, repr=False)
+    refresh_failed: bool = field(default=False, repr=False)
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+    @classmethod
+    def load(cls, path: Path) -> "ExchangeRateStore":
+        if not path.exists():
+            return cls(path=path)
+        with np.load(path, allow_pickle=False) as payload:
+            return cls(
+                path=path,
+                dates=payload["dates"].astype("datetime64[D]"),
+                currencies=[str(code) for code in payload["currencies"]],
+                rates=payload["rates"].astype(np.float64),
+            )
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            dates, currencies, rates = self.dates, np.array(self.currencies), self.rates
+        with tempfile.NamedTemporaryFile("wb", dir=self.path.parent, suffix=".tmp", delete=False) as handle:
+            temp_path = Path(handle.name)
+            np.savez_compressed(handle, dates=dates, currencies=currencies, rates=rates)
+        os.replace(temp_path, self.path)
+
+    @property
+    def first_date(self) -> date | None:
+        return None if not len(self.dates) else self.dates[0].astype(date)
+
+    @property
+    def last_date(self) -> date | None:
+        return None if not len(self.dates) else self.dates[-1].astype(date)
+
+    def next_missing_date(self) -> date:
+        last_date = self.last_date
+        return FRANKFURTER_HISTORY_START_DATE if last_date is None else last_date + timedelta(days=1)
+
+    def claim_refresh(self, today: date | None = None) -> bool:
+        """Return True at most once per refresh interval while dates up to today are missing."""
+        resolved_today = today or datetime.now(timezone.utc).date()
+        with self._lock:
+            last_date = None if not len(self.dates) else self.dates[-1].astype(date)
+            if last_date is not None and last_date >= resolved_today:
+                return False
+            now = monotonic()
+            if self._checked_at is not None and now - self._checked_at < FRANKFURTER_RATE_STORE_REFRESH_SECONDS:
+                return False
+            self._checked_at = now
+            return True
+
+    def append_series(self, series: ExchangeRatesSeries) -> int:
+        if series.base != STORE_BASE_CURRENCY:
+            raise ValueError(f"Rate store rows must be {STORE_BASE_CURRENCY}-based.")
+        with self._lock:
+            last_day = self.dates[-1] if len(self.dates) else None
+            new_dates = sorted(
+                date_key
+                for date_key in series.rates
+                if last_day is None or np.datetime64(date_key, "D") > last_day
+            )
+            if not new_dates:
+                return 0
+            currencies = list(self.currencies)
+            column_by_currency = {code: index for index, code in enumerate(currencies)}
+            for date_key in new_dates:
+                for code in series.rates[date_key]:
+                    if code not in column_by_currency:
+                        column_by_currency[code] = len(currencies)
+                        currencies.append(code)
+
+            existing = np.full((len(self.dates), len(currencies)), np.nan)
+            existing[:, : self.rates.shape[1]] = self.rates
+            appended = np.full((len(new_dates), len(currencies)), np.nan)
+            appended[:, column_by_currency[STORE_BASE_CURRENCY]] = 1.0
+            for row, date_key in enumerate(new_dates):
+                for code, rate in series.rates[date_key].items():
+                    appended[row, column_by_currency[code]] = rate
+
+            self.dates = np.concatenate([self.dates, np.array(new_dates, dtype="datetime64[D]")])
+            self.currencies = currencies
+            self.rates = np.vstack([existing, appended])
+            return len(new_dates)
+
+    def _columns(self, base: str, symbols: list[str] | None) -> tuple[int, list[str], list[int]] | None:
+        column_by_currency = {code: index for index, code in enumerate(self.currencies)}
+        if base not in column_by_currency:
+            return None
+        codes = list(dict.fromkeys(symbols)) if symbols else [code for code in self.currencies if code != base]
+        if any(code not in column_by_currency for code in codes):
+            return None
+        codes = [code for code in codes if code != base]
+        return column_by_currency[base], codes, [column_by_currency[code] for code in codes]
+
+    def _cross_rates(self, rows: np.ndarray, base_column: int, columns: list[int]) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.round(rows[:, columns] / rows[:, [base_column]], RATE_DECIMALS)
+
+    def time_series(
+        self,
+        start_date: date,
+        end_date: date | None,
+        *,
+        base: str,
+        symbols: list[str] | None,
+    ) -> ExchangeRatesSeries | None:
+        with self._lock:
+            dates, rates = self.dates, self.rates
+            resolved = self._columns(base, symbols)
+        if resolved is None or not len(dates):
+            return None
+        base_column, codes, columns = resolved
+        start_row = int(np.searchsorted(dates, _to_day(start_date), side="left"))
+        end_row = len(dates) if end_date is None else int(np.searchsorted(dates, _to_day(end_date), side="right"))
+        if start_row >= end_row:
+            return None
+
+        cross_rates = self._cross_rates(rates[start_row:end_row], base_column, columns)
+        quoted = ~np.isnan(cross_rates)
+        date_keys = [str(day) for day in dates[start_row:end_row]]
+        series_rates = {
+            date_key: {code: value for code, value, is_quoted in zip(codes, row, row_quoted) if is_quoted}
+            for date_key, row, row_quoted in zip(date_keys, cross_rates.tolist(), quoted.tolist())
+        }
+        return ExchangeRatesSeries(base=base, start_date=date_keys[0], end_date=date_keys[-1], rates=series_rates)
+
+    def rates_on(self, on_date: date, *, base: str, symbols: list[str] | None) -> ExchangeRatesSnapshot | None:
+        with self._lock:
+            dates, rates = self.dates, self.rates
+            resolved = self._columns(base, symbols)
+        if resolved is None or not len(dates) or _to_day(on_date) < dates[0]:
+            return None
+        base_column, codes, columns = resolved
+        # Weekends and holidays resolve to the previous published business day, as the API does.
+        row = int(np.searchsorted(dates, _to_day(on_date), side="right")) - 1
+        cross_rates = self._cross_rates(rates[row : row + 1], base_column, columns)[0]
+        return ExchangeRatesSnapshot(
+            base=base,
+            date=str(dates[row]),
+            rates={code: value for code, value in zip(codes, cross_rates.tolist()) if not np.isnan(value)},
+        )
+
+
+_RATE_STORE: ExchangeRateStore | None = None
+_RATE_STORE_LOCK = Lock()
+
+
+def get_exchange_rate_store(path: Path = FRANKFURTER_RATE_STORE_PATH) -> ExchangeRateStore | None:
+    global _RATE_STORE
+    if not FRANKFURTER_LOCAL_STORE_ENABLED:
+        return None
+    with _RATE_STORE_LOCK:
+        if _RATE_STORE is None:
+            try:
+                _RATE_STORE = ExchangeRateStore.load(path)
+            except (OSError, ValueError, KeyError):
+                _RATE_STORE = ExchangeRateStore(path=path)
+        return _RATE_STORE
@@ -2,9 +2,17 @@ from __future__ import annotations
 
 from datetime import timedelta
 
-from common.http import HttpClient, HttpClientError, DEFAULT_TTL
+from common.config import get_env_float, get_env_int
+from common.http import HttpClient, HttpClientError, DEFAULT_TTL, RateLimitPolicy
 from integrations.ip_api.models import IpLocation
 
+# The free ip-api endpoint allows 45 requests per minute per source IP.
+IP_API_RATE_LIMIT_KEY = "ip_api"
+IP_API_RATE_LIMIT_POLICY = RateLimitPolicy(
+    max_requests=max(1, get_env_int("IP_API_RATE_LIMIT_MAX_REQUESTS", 45)),
+    window_seconds=max(0.0, get_env_float("IP_API_RATE_LIMIT_WINDOW_SECONDS", 60.0)),
+)
+
 
 class IpApiClientError(RuntimeError):
     pass
@@ -18,7 +26,12 @@ class IpApiClient:
         ttl: timedelta = DEFAULT_TTL,
     ):
         self.base_url = base_url.rstrip("/")
-        self._http = HttpClient(timeout_s=timeout_s, ttl=ttl)
+        self._http = HttpClient(
+            timeout_s=timeout_s,
+            ttl=ttl,
+            rate_limit_key=IP_API_RATE_LIMIT_KEY,
+            rate_limit_policy=IP_API_RATE_LIMIT_POLICY,
+        )
 
     def get_location(self, ip: str | None = None) -> IpLocation:
         url = f"{self.base_url}/{ip}" if ip else self.base_url
@@ -3,7 +3,8 @@ from __future__ import annotations
 from datetime import timedelta
 from typing import Any
 
-from common.http import HttpClient, HttpClientError, DEFAULT_TTL
+from common.config import get_env_float, get_env_int
+from common.http import DEFAULT_CIRCUIT_BREAKER_POLICY, HttpClient, HttpClientError, DEFAULT_TTL, RateLimitPolicy
 from integrations.open_library.models import BookSearchResult
 from request_orchestrator.shared.tool_adapter.books.constants import DEFAULT_BOOK_SEARCH_LIMIT
 
@@ -11,6 +12,13 @@ OPEN_LIBRARY_BASE_URL = "https://openlibrary.org"
 OPEN_LIBRARY_WORK_URL_TEMPLATE = "https://openlibrary.org{work_key}"
 OPEN_LIBRARY_COVER_IMAGE_URL_TEMPLATE = "https://covers.openlibrary.org/b/id/{cover_id}-L.jpg"
 
+# Open Library is a volunteer-run public API and asks for roughly one request per second.
+OPEN_LIBRARY_RATE_LIMIT_KEY = "open_library"
+OPEN_LIBRARY_RATE_LIMIT_POLICY = RateLimitPolicy(
+    max_requests=max(1, get_env_int("OPEN_LIBRARY_RATE_LIMIT_MAX_REQUESTS", 1)),
+    window_seconds=max(0.0, get_env_float("OPEN_LIBRARY_RATE_LIMIT_WINDOW_SECONDS", 1.0)),
+)
+
 
 class OpenLibraryClientError(RuntimeError):
     pass
@@ -27,6 +35,10 @@ class OpenLibraryClient:
         self._http = HttpClient(
             timeout_s=timeout_s,
             ttl=ttl,
+            rate_limit_key=OPEN_LIBRARY_RATE_LIMIT_KEY,
+            rate_limit_policy=OPEN_LIBRARY_RATE_LIMIT_POLICY,
+            circuit_breaker_policy=DEFAULT_CIRCUIT_BREAKER_POLICY,
+            hedge_requests=True,
         )
 
     def search(
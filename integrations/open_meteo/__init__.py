@@ -4,7 +4,14 @@ from integrations.open_meteo.errors import (
     WeatherGeocodingError,
     WeatherNotFoundError,
 )
-from integrations.open_meteo.models import CurrentWeather, DailyWeather, GeocodedLocation, MonthlyWeatherSummary
+from integrations.open_meteo.models import (
+    CurrentWeather,
+    DailyWeather,
+    GeocodedLocation,
+    MonthlyWeatherSummary,
+    WeatherArchiveRange,
+    WeatherPeriodAggregate,
+)
 
 __all__ = [
     "CurrentWeather",
@@ -14,6 +21,8 @@ __all__ = [
     "OpenMeteoClient",
     "OPEN_METEO_WEBSITE_URL",
     "WeatherArchiveError",
+    "WeatherArchiveRange",
     "WeatherGeocodingError",
     "WeatherNotFoundError",
+    "WeatherPeriodAggregate",
 ]
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+import numpy as np
+import psycopg
+
+from common.config import get_env_int
+from integrations.open_meteo.models import DailyWeather, WeatherPeriodAggregate
+from integrations.open_meteo.month_cache_repository import WeatherMonthTotalsRepository
+
+MONTH_CACHE_BACKEND_MEMORY = "memory"
+MONTH_CACHE_BACKEND_POSTGRES = "postgres"
+# Completed months never change: the shared tier keeps them for good and the in-process tier only evicts for space.
+OPEN_METEO_MONTH_CACHE_MAX_ENTRIES = max(1, get_env_int("OPEN_METEO_MONTH_CACHE_MAX_ENTRIES", 50_000))
+# After a database error the shared tier is skipped for this long instead of reconnecting on every lookup.
+MONTH_CACHE_DB_RETRY_SECONDS = 60.0
+# A day with at least this much precipitation counts as a rainy day.
+RAINY_DAY_THRESHOLD_MM = 1.0
+AGGREGATE_DECIMALS = 2
+
+# Columns of a month totals row.
+DAYS = 0
+TEMP_MAX_SUM, TEMP_MAX_COUNT = 1, 2
+TEMP_MIN_SUM, TEMP_MIN_COUNT = 3, 4
+PRECIP_SUM, PRECIP_COUNT = 5, 6
+WIND_MAX_SUM, WIND_MAX_COUNT = 7, 8
+RAINY_DAYS = 9
+TOTALS_WIDTH = 10
+
+
+def _values(values: list[float | None]) -> np.ndarray:
+    return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+
+
+def month_totals(daily: DailyWeather) -> tuple[list[tuple[int, int]], np.ndarray]:
+    """Group daily archive rows into per-month (sum, count) totals.
+
+    Sums and counts rather than means are kept so months can be re-aggregated into years,
+    or served from the month cache, without losing day weighting.
+    """
+    if not daily.date:
+        return [], np.empty((0, TOTALS_WIDTH))
+    month_keys = np.array(daily.date, dtype="datetime64[D]").astype("datetime64[M]")
+    unique_months, group = np.unique(month_keys, return_inverse=True)
+    totals = np.zeros((len(unique_months), TOTALS_WIDTH))
+    totals[:, DAYS] = np.bincount(group, minlength=len(unique_months))
+    for values, sum_column, count_column in (
+        (daily.temperature_2m_max, TEMP_MAX_SUM, TEMP_MAX_COUNT),
+        (daily.temperature_2m_min, TEMP_MIN_SUM, TEMP_MIN_COUNT),
+        (daily.precipitation_sum, PRECIP_SUM, PRECIP_COUNT),
+        (daily.windspeed_10m_max, WIND_MAX_SUM, WIND_MAX_COUNT),
+    ):
+        array = _values(values)
+        present = ~np.isnan(array)
+        totals[:, sum_column] = np.bincount(group, weights=np.where(present, array, 0.0), minlength=len(unique_months))
+        totals[:, count_column] = np.bincount(group, weights=present, minlength=len(unique_months))
+        if sum_column == PRECIP_SUM:
+            rainy = present & (np.nan_to_num(array) >= RAINY_DAY_THRESHOLD_MM)
+            totals[:, RAINY_DAYS] = np.bincount(group, weights=rainy, minlength=len(unique_months))
+
+    months = [(int(year), int(month)) for year, month in (str(key).split("-") for key in unique_months)]
+    return months, totals
+
+
+def _mean(total: np.ndarray, count: np.ndarray) -> list[float | None]:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        means = np.round(total / count, AGGREGATE_DECIMALS)
+    return [None if not counted else float(mean) for mean, counted in zip(means.tolist(), count.tolist())]
+
+
+def _total(total: np.ndarray, count: np.ndarray) -> list[float | None]:
+    rounded = np.round(total, AGGREGATE_DECIMALS)
+    return [None if not counted else float(value) for value, counted in zip(rounded.tolist(), count.tolist())]
+
+
+def aggregate_periods(months: list[tuple[int, int]], totals: np.ndarray, *, granularity: str) -> list[WeatherPeriodAggregate]:
+    """Collapse month totals into per-month or per-year aggregates, ordered by period."""
+    if not months:
+        return []
+    if granularity == "year":
+        years = np.array([year for year, _ in months])
+        unique_years, group = np.unique(years, return_inverse=True)
+        grouped = np.zeros((len(unique_years), TOTALS_WIDTH))
+        np.add.at(grouped, group, totals)
+        keys: list[tuple[int, int | None]] = [(int(year), None) for year in unique_years]
+        month_counts = np.bincount(group).tolist()
+    else:
+        order = sorted(range(len(months)), key=months.__getitem__)
+        grouped = totals[order]
+        keys = [months[index] for index in order]
+        month_counts = [1] * len(keys)
+
+    avg_temp_max = _mean(grouped[:, TEMP_MAX_SUM], grouped[:, TEMP_MAX_COUNT])
+    avg_temp_min = _mean(grouped[:, TEMP_MIN_SUM], grouped[:, TEMP_MIN_COUNT])
+    total_precip = _total(grouped[:, PRECIP_SUM], grouped[:, PRECIP_COUNT])
+    avg_wind = _mean(grouped[:, WIND_MAX_SUM], grouped[:, WIND_MAX_COUNT])
+    return [
+        WeatherPeriodAggregate(
+            period=str(year) if month is None else f"{year}-{month:02d}",
+            year=year,
+            month=month,
+            months_count=month_count,
+            days_count=int(row[DAYS]),
+            avg_temp_max_c=avg_temp_max[index],
+            avg_temp_min_c=avg_temp_min[index],
+            total_precip_mm=total_precip[index],
+            rainy_days=int(row[RAINY_DAYS]) if row[PRECIP_COUNT] else None,
+            avg_wind_max_kmh=avg_wind[index],
+        )
+        for index, ((year, month), month_count, row) in enumerate(zip(keys, month_counts, grouped))
+    ]
+
+
+class WeatherMonthCache:
+    """Month totals for completed months, keyed by rounded coordinates.
+
+    An in-process LRU sits in front of an optional shared Postgres tier, which keeps months
+    permanently and across workers; when it is unavailable the cache degrades to in-process only.
+    """
+
+    def __init__(
+        self,
+        backend: str = MONTH_CACHE_BACKEND_MEMORY,
+        *,
+        repository: WeatherMonthTotalsRepository | None = None,
+        max_entries: int = OPEN_METEO_MONTH_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self._backend = backend
+        self._repository_instance = repository
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[tuple[float, float, int, int], np.ndarray] = OrderedDict()
+        self._lock = Lock()
+        self._db_disabled_until = 0.0
+
+    @staticmethod
+    def _key(latitude: float, longitude: float, year: int, month: int) -> tuple[float, float, int, int]:
+        return round(latitude, 4), round(longitude, 4), year, month
+
+    def _repository(self) -> WeatherMonthTotalsRepository | None:
+        if self._backend != MONTH_CACHE_BACKEND_POSTGRES or monotonic() < self._db_disabled_until:
+            return None
+        if self._repository_instance is None:
+            self._repository_instance = WeatherMonthTotalsRepository()
+        return self._repository_instance
+
+    def _disable_db(self) -> None:
+        self._db_disabled_until = monotonic() + MONTH_CACHE_DB_RETRY_SECONDS
+
+    def _remember(self, key: tuple[float, float, int, int], row: np.ndarray) -> None:
+        with self._lock:
+            self._entries[key] = row.copy()
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def get_many(self, latitude: float, longitude: float, months: list[tuple[int, int]]) -> dict[tuple[int, int], np.ndarray]:
+        """Cached totals for whichever of `months` are known; the shared tier is read in one query."""
+        rows: dict[tuple[int, int], np.ndarray] = {}
+        with self._lock:
+            for year, month in months:
+                key = self._key(latitude, longitude, year, month)
+                row = self._entries.get(key)
+                if row is not None:
+                    self._entries.move_to_end(key)
+                    rows[(year, month)] = row
+        missing = [month_key for month_key in months if month_key not in rows]
+        if not missing:
+            return rows
+
+        try:
+            repository = self._repository()
+            stored = {} if repository is None else repository.get_many(round(latitude, 4), round(longitude, 4), missing)
+        except psycopg.Error:
+            self._disable_db()
+            return rows
+        for (year, month), totals in stored.items():
+            row = np.array(totals, dtype=np.float64)
+            self._remember(self._key(latitude, longitude, year, month), row)
+            rows[(year, month)] = row
+        return rows
+
+    def put_many(self, latitude: float, longitude: float, rows: dict[tuple[int, int], np.ndarray]) -> None:
+        for (year, month), row in rows.items():
+            self._remember(self._key(latitude, longitude, year, month), row)
+        try:
+            repository = self._repository()
+            if repository is not None:
+                repository.put_many(
+                    round(latitude, 4),
+                    round(longitude, 4),
+                    {month_key: row.tolist() for month_key, row in rows.items()},
+                )
+        except psycopg.Error:
+            self._disable_db()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_MONTH_CACHE: WeatherMonthCache | None = None
+_MONTH_CACHE_LOCK = Lock()
+
+
+def build_weather_month_cache(backend: str | None = None) -> WeatherMonthCache:
+    resolved_backend = (backend or os.getenv("OPEN_METEO_MONTH_CACHE_BACKEND", MONTH_CACHE_BACKEND_POSTGRES)).strip().lower()
+    if resolved_backend == MONTH_CACHE_BACKEND_POSTGRES:
+        return WeatherMonthCache(MONTH_CACHE_BACKEND_POSTGRES)
+    return WeatherMonthCache(MONTH_CACHE_BACKEND_MEMORY)
+
+
+def get_weather_month_cache() -> WeatherMonthCache:
+    global _MONTH_CACHE
+    with _MONTH_CACHE_LOCK:
+        if _MONTH_CACHE is None:
+            _MONTH_CACHE = build_weather_month_cache()
+        return _MONTH_CACHE
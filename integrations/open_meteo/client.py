@@ -1,23 +1,39 @@
 from __future__ import annotations
 
 import calendar
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from typing import Any
 
 from datetime import timedelta
 
+import numpy as np
+
 from common.http import HttpClient, HttpClientError, DEFAULT_TTL
+from integrations.open_meteo.archive import aggregate_periods, get_weather_month_cache, month_totals
+from integrations.open_meteo.gazetteer import Gazetteer, get_gazetteer
+from integrations.open_meteo.geocode_cache import GeocodeCache, get_geocode_cache, normalize_place_name
 from integrations.open_meteo.errors import (
     WeatherArchiveError,
     WeatherGeocodingError,
     WeatherNotFoundError,
 )
-from integrations.open_meteo.models import CurrentWeather, DailyWeather, GeocodedLocation, MonthlyWeatherSummary
+from integrations.open_meteo.models import (
+    CurrentWeather,
+    DailyWeather,
+    GeocodedLocation,
+    MonthlyWeatherSummary,
+    WeatherArchiveRange,
+)
 
 OPEN_METEO_WEBSITE_URL = "https://open-meteo.com/"
 OPEN_METEO_ARCHIVE_API_BASE_URL = "https://archive-api.open-meteo.com/v1"
 OPEN_METEO_FORECAST_API_BASE_URL = "https://api.open-meteo.com/v1"
 OPEN_METEO_GEOCODING_API_BASE_URL = "https://geocoding-api.open-meteo.com/v1"
+OPEN_METEO_ARCHIVE_FIRST_YEAR = 1940
+# The archive trails real time by several days; months are only cached once fully backfilled.
+OPEN_METEO_ARCHIVE_DELAY_DAYS = 7
+OPEN_METEO_MAX_RANGE_YEARS = 30
+WEATHER_RANGE_GRANULARITIES = ("month", "year")
 
 
 class OpenMeteoClient:
@@ -28,11 +44,16 @@ class OpenMeteoClient:
         base_url_geo: str = OPEN_METEO_GEOCODING_API_BASE_URL,
         timeout_s: float = 20.0,
         ttl: timedelta = DEFAULT_TTL,
+        geocode_cache: GeocodeCache | None = None,
+        gazetteer: Gazetteer | None = None,
     ):
         self.base_url_weather = base_url_weather.rstrip("/")
         self.base_url_forecast = base_url_forecast.rstrip("/")
         self.base_url_geo = base_url_geo.rstrip("/")
         self._http = HttpClient(timeout_s=timeout_s, ttl=ttl)
+        # Shared process-wide by default: each tool adapter owns its own OpenMeteoClient.
+        self._geocode_cache = geocode_cache or get_geocode_cache()
+        self._gazetteer = gazetteer
 
     def _get_json(self, url: str, params: dict[str, Any], error_cls: type[Exception]) -> dict[str, Any]:
         try:
@@ -43,16 +64,15 @@ class OpenMeteoClient:
             raise error_cls(f"Unexpected non-object response from {url}")
         return payload
 
-    def geocode_city(self, city: str) -> GeocodedLocation:
-        city_norm = (city or "").strip()
-        if not city_norm:
-            raise WeatherGeocodingError("City must be a non-empty string.")
+    def _gazetteer_or_default(self) -> Gazetteer | None:
+        return self._gazetteer if self._gazetteer is not None else get_gazetteer()
 
+    def _geocode_upstream(self, query: str) -> GeocodedLocation:
         url = f"{self.base_url_geo}/search"
         payload = self._get_json(
             url,
             params={
-                "name": city_norm,
+                "name": query,
                 "count": 1,
                 "language": "en",
                 "format": "json",
@@ -61,51 +81,76 @@ class OpenMeteoClient:
         )
         results = payload.get("results")
         if not isinstance(results, list) or not results:
-            raise WeatherNotFoundError(f"No geocoding result found for city '{city_norm}'.")
+            raise WeatherNotFoundError(f"No geocoding result found for city '{query}'.")
 
         first = results[0] if isinstance(results[0], dict) else None
         if not first:
             raise WeatherGeocodingError("Malformed geocoding response (first result is not an object).")
 
-        first.setdefault("name", city_norm)
+        first.setdefault("name", query)
         try:
             return GeocodedLocation.model_validate(first)
         except Exception as exc:
             raise WeatherGeocodingError(f"Malformed geocoding result payload: {exc}") from exc
 
-    def get_historical_month(self, city: str, year: int, month: int) -> MonthlyWeatherSummary:
+    def geocode_city(self, city: str) -> GeocodedLocation:
+        """Resolve a city through the geocode cache, then the gazetteer, then the upstream geocoder.
+
+        Names the upstream geocoder does not know fall back to a fuzzy or prefix gazetteer match
+        before being cached as not found.
+        """
         city_norm = (city or "").strip()
         if not city_norm:
-            raise WeatherArchiveError("City must be a non-empty string.")
+            raise WeatherGeocodingError("City must be a non-empty string.")
+        name_key = normalize_place_name(city_norm)
+        if not name_key:
+            raise WeatherGeocodingError("City must contain letters or digits.")
+
+        cached = self._geocode_cache.get(name_key)
+        if cached is not None:
+            if cached.location is None:
+                raise WeatherNotFoundError(f"No geocoding result found for city '{city_norm}'.")
+            return cached.location
+
+        gazetteer = self._gazetteer_or_default()
+        places = gazetteer.lookup(city_norm) if gazetteer is not None else []
+        if places:
+            location = places[0].to_location()
+            self._geocode_cache.put(name_key, location)
+            return location
+
+        # Aliases such as "NYC" are sent upstream as the name they stand for.
+        is_alias = name_key != normalize_place_name(city_norm, apply_aliases=False)
+        try:
+            location = self._geocode_upstream(name_key if is_alias else city_norm)
+        except WeatherNotFoundError:
+            fallback = (gazetteer.fuzzy(city_norm, limit=1) or gazetteer.complete(city_norm, limit=1)) if gazetteer is not None else []
+            if not fallback:
+                self._geocode_cache.put(name_key, None)
+                raise
+            location = fallback[0].to_location()
+        self._geocode_cache.put(name_key, location)
+        return location
+
+    def _validate_month(self, year: int, month: int, today: date) -> None:
         if month < 1 or month > 12:
             raise WeatherArchiveError("Month must be between 1 and 12.")
-
-        today = datetime.utcnow().date()
-        current_year = today.year
-        if year < 1940 or year > current_year:
-            raise WeatherArchiveError(f"Year must be between 1940 and {current_year}.")
-        if year == current_year and month > today.month:
+        if year < OPEN_METEO_ARCHIVE_FIRST_YEAR or year > today.year:
+            raise WeatherArchiveError(f"Year must be between {OPEN_METEO_ARCHIVE_FIRST_YEAR} and {today.year}.")
+        if year == today.year and month > today.month:
             raise WeatherArchiveError(
                 f"Month must not be in the future. Today is {today.isoformat()}."
             )
 
-        geocoded = self.geocode_city(city_norm)
-        last_day = calendar.monthrange(year, month)[1]
-        start = date(year, month, 1)
-        end = date(year, month, last_day)
-        if year == today.year and month == today.month:
-            end = today
-        start_date = start.isoformat()
-        end_date = end.isoformat()
-
+    def _get_archive_daily(self, geocoded: GeocodedLocation, start: date, end: date) -> DailyWeather:
         url = f"{self.base_url_weather}/archive"
         payload = self._get_json(
             url,
             params={
                 "latitude": geocoded.latitude,
                 "longitude": geocoded.longitude,
-                "start_date": start_date,
-                "end_date": end_date,
+                "start_date": start.isoformat(),
+                "end_date": end.isoformat(),
                 "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,windspeed_10m_max",
                 "timezone": "auto",
             },
@@ -129,7 +174,7 @@ class OpenMeteoClient:
         if not all(len(v) == length for v in [temp_max, temp_min, precip, wind]):
             raise WeatherArchiveError("Malformed archive response: daily array lengths do not match.")
 
-        daily = DailyWeather(
+        return DailyWeather(
             date=[str(v) for v in dates],
             temperature_2m_max=[_to_float_or_none(v) for v in temp_max],
             temperature_2m_min=[_to_float_or_none(v) for v in temp_min],
@@ -137,24 +182,126 @@ class OpenMeteoClient:
             windspeed_10m_max=[_to_float_or_none(v) for v in wind],
         )
 
-        avg_temp_max = _avg(daily.temperature_2m_max)
-        avg_temp_min = _avg(daily.temperature_2m_min)
-        total_precip = _sum(daily.precipitation_sum)
-        avg_wind = _avg(daily.windspeed_10m_max)
+    def _cache_settled_months(
+        self,
+        geocoded: GeocodedLocation,
+        months: list[tuple[int, int]],
+        totals: np.ndarray,
+        today: date,
+    ) -> None:
+        settled = {(year, month): row for (year, month), row in zip(months, totals) if _is_settled_month(year, month, today)}
+        if settled:
+            get_weather_month_cache().put_many(geocoded.latitude, geocoded.longitude, settled)
+
+    def get_historical_month(self, city: str, year: int, month: int) -> MonthlyWeatherSummary:
+        city_norm = (city or "").strip()
+        if not city_norm:
+            raise WeatherArchiveError("City must be a non-empty string.")
+        today = datetime.now(timezone.utc).date()
+        self._validate_month(year, month, today)
+
+        geocoded = self.geocode_city(city_norm)
+        start = date(year, month, 1)
+        end = min(date(year, month, calendar.monthrange(year, month)[1]), today)
+        daily = self._get_archive_daily(geocoded, start, end)
+        months, totals = month_totals(daily)
+        self._cache_settled_months(geocoded, months, totals, today)
+        aggregates = aggregate_periods(months, totals, granularity="month")
+        aggregate = aggregates[0] if aggregates else None
 
         return MonthlyWeatherSummary(
             city=geocoded.name,
             country=geocoded.country,
             year=year,
             month=month,
-            days_count=length,
-            avg_temp_max_c=avg_temp_max,
-            avg_temp_min_c=avg_temp_min,
-            total_precip_mm=total_precip,
-            avg_wind_max_kmh=avg_wind,
+            days_count=len(daily.date),
+            avg_temp_max_c=None if aggregate is None else aggregate.avg_temp_max_c,
+            avg_temp_min_c=None if aggregate is None else aggregate.avg_temp_min_c,
+            total_precip_mm=None if aggregate is None else aggregate.total_precip_mm,
+            avg_wind_max_kmh=None if aggregate is None else aggregate.avg_wind_max_kmh,
             daily=daily,
         )
 
+    def get_historical_range(
+        self,
+        city: str,
+        start_year: int,
+        end_year: int,
+        *,
+        start_month: int = 1,
+        end_month: int = 12,
+        months: list[int] | None = None,
+        granularity: str = "month",
+    ) -> WeatherArchiveRange:
+        """Aggregate the archive over a span of months in a single upstream request.
+
+        Settled months are served from the shared month cache; only the span covering
+        months still missing from it is fetched. `months` restricts the span to calendar months
+        (e.g. [3] for every March), and `granularity` is "month" or "year".
+        """
+        city_norm = (city or "").strip()
+        if not city_norm:
+            raise WeatherArchiveError("City must be a non-empty string.")
+        if granularity not in WEATHER_RANGE_GRANULARITIES:
+            raise WeatherArchiveError(f"Granularity must be one of {', '.join(WEATHER_RANGE_GRANULARITIES)}.")
+        month_filter = sorted(set(months or []))
+        if any(month < 1 or month > 12 for month in month_filter):
+            raise WeatherArchiveError("Months must be between 1 and 12.")
+
+        today = datetime.now(timezone.utc).date()
+        self._validate_month(start_year, start_month, today)
+        if (end_year, end_month) > (today.year, today.month):
+            end_year, end_month = today.year, today.month
+        self._validate_month(end_year, end_month, today)
+        if (start_year, start_month) > (end_year, end_month):
+            raise WeatherArchiveError("The start month must not be after the end month.")
+        if end_year - start_year + 1 > OPEN_METEO_MAX_RANGE_YEARS:
+            raise WeatherArchiveError(f"Ranges are limited to {OPEN_METEO_MAX_RANGE_YEARS} years.")
+
+        wanted = [
+            (year, month)
+            for year, month in _month_span(start_year, start_month, end_year, end_month)
+            if not month_filter or month in month_filter
+        ]
+        if not wanted:
+            raise WeatherArchiveError("No months in the requested range match the month filter.")
+
+        geocoded = self.geocode_city(city_norm)
+        rows = get_weather_month_cache().get_many(
+            geocoded.latitude,
+            geocoded.longitude,
+            [(year, month) for year, month in wanted if _is_settled_month(year, month, today)],
+        )
+
+        missing = [key for key in wanted if key not in rows]
+        if missing:
+            first_year, first_month = missing[0]
+            last_year, last_month = missing[-1]
+            daily = self._get_archive_daily(
+                geocoded,
+                date(first_year, first_month, 1),
+                min(date(last_year, last_month, calendar.monthrange(last_year, last_month)[1]), today),
+            )
+            fetched_months, fetched_totals = month_totals(daily)
+            self._cache_settled_months(geocoded, fetched_months, fetched_totals, today)
+            for key, row in zip(fetched_months, fetched_totals):
+                if key in missing:
+                    rows[key] = row
+
+        covered = [key for key in wanted if key in rows]
+        totals = np.array([rows[key] for key in covered]) if covered else np.empty((0, 0))
+        end_day = min(date(end_year, end_month, calendar.monthrange(end_year, end_month)[1]), today)
+        return WeatherArchiveRange(
+            city=geocoded.name,
+            country=geocoded.country,
+            latitude=geocoded.latitude,
+            longitude=geocoded.longitude,
+            start_date=date(start_year, start_month, 1).isoformat(),
+            end_date=end_day.isoformat(),
+            months=month_filter,
+            granularity=granularity,
+            periods=aggregate_periods(covered, totals, granularity=granularity),
+        )
 
     def get_current(self, latitude: float, longitude: float, timezone: str = "auto") -> CurrentWeather:
         data = self._get_json(
@@ -192,15 +339,14 @@ def _to_float_or_none(value: Any) -> float | None:
         return None
 
 
-def _avg(values: list[float | None]) -> float | None:
-    present = [v for v in values if v is not None]
-    if not present:
-        return None
-    return round(sum(present) / len(present), 2)
 
+def _month_span(start_year: int, start_month: int, end_year: int, end_month: int) -> list[tuple[int, int]]:
+    first = start_year * 12 + start_month - 1
+    last = end_year * 12 + end_month - 1
+    return [(index // 12, index % 12 + 1) for index in range(first, last + 1)]
 
-def _sum(values: list[float | None]) -> float | None:
-    present = [v for v in values if v is not None]
-    if not present:
-        return None
-    return round(sum(present), 2)
+
+def _is_settled_month(year: int, month: int, today: date) -> bool:
+    """True once a month is over and the archive has had time to backfill its last days."""
+    month_end = date(year, month, calendar.monthrange(year, month)[1])
+    return month_end + timedelta(days=OPEN_METEO_ARCHIVE_DELAY_DAYS) < today
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import os
+import zipfile
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Iterable
+
+import pycountry
+import requests
+
+from common.config import get_env_bool
+from integrations.open_meteo.geocode_cache import normalize_place_name
+from integrations.open_meteo.models import GeocodedLocation
+
+OPEN_METEO_GAZETTEER_PATH = Path(os.getenv("OPEN_METEO_GAZETTEER_PATH", "data/geonames/cities.tsv.gz"))
+OPEN_METEO_GAZETTEER_ENABLED = get_env_bool("OPEN_METEO_GAZETTEER_ENABLED", True)
+GEONAMES_CITIES_URL = "https://download.geonames.org/export/dump/cities15000.zip"
+GEONAMES_CITIES_MEMBER = "cities15000.txt"
+GAZETTEER_DEFAULT_SIZE = 50_000
+GAZETTEER_COLUMNS = ("name", "country", "latitude", "longitude", "timezone", "population")
+# Names shorter than this are too ambiguous to complete from a prefix.
+MIN_PREFIX_LENGTH = 4
+_PREFIX_END = "\U0010ffff"
+
+
+@dataclass(frozen=True)
+class GazetteerPlace:
+    name: str
+    country: str
+    latitude: float
+    longitude: float
+    timezone: str | None
+    population: int
+
+    def to_location(self) -> GeocodedLocation:
+        return GeocodedLocation(
+            name=self.name,
+            country=self.country,
+            latitude=self.latitude,
+            longitude=self.longitude,
+            timezone=self.timezone,
+        )
+
+
+def _max_distance(query: str) -> int:
+    return 1 if len(query) <= 5 else 2
+
+
+class Gazetteer:
+    """Sorted-key trie over normalized city names.
+
+    Keys live in one sorted list and each key's places in a flat postings array, which keeps
+    ~50k cities to a few MB. Prefix lookups are a bisect; fuzzy lookups walk the keys in order,
+    reusing Levenshtein rows for shared prefixes and skipping whole prefix ranges once every
+    cell in a row is over budget, i.e. a trie traversal without per-node objects.
+    """
+
+    def __init__(self, places: list[GazetteerPlace]) -> None:
+        # Most populous first, so postings and ties favour the place people usually mean.
+        self.places = sorted(places, key=lambda place: -place.population)
+        positions_by_key: dict[str, list[int]] = {}
+        for position, place in enumerate(self.places):
+            key = normalize_place_name(place.name, apply_aliases=False)
+            if key:
+                positions_by_key.setdefault(key, []).append(position)
+        self.keys = sorted(positions_by_key)
+        self._offsets = array("I", [0])
+        self._postings = array("I")
+        for key in self.keys:
+            self._postings.extend(positions_by_key[key])
+            self._offsets.append(len(self._postings))
+
+    def __len__(self) -> int:
+        return len(self.places)
+
+    def _places_for_key(self, key_index: int) -> list[GazetteerPlace]:
+        start, end = self._offsets[key_index], self._offsets[key_index + 1]
+        return [self.places[position] for position in self._postings[start:end]]
+
+    def lookup(self, name: str) -> list[GazetteerPlace]:
+        key = normalize_place_name(name)
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            return self._places_for_key(index)
+        return []
+
+    def complete(self, prefix: str, limit: int = 5) -> list[GazetteerPlace]:
+        key = normalize_place_name(prefix, apply_aliases=False)
+        if len(key) < MIN_PREFIX_LENGTH:
+            return []
+        start = bisect_left(self.keys, key)
+        end = bisect_left(self.keys, key + _PREFIX_END, lo=start)
+        matches = [place for index in range(start, end) for place in self._places_for_key(index)]
+        return sorted(matches, key=lambda place: -place.population)[:limit]
+
+    def fuzzy(self, name: str, limit: int = 5, max_distance: int | None = None) -> list[GazetteerPlace]:
+        query = normalize_place_name(name)
+        if not query:
+            return []
+        budget = _max_distance(query) if max_distance is None else max_distance
+        matches: list[tuple[int, int, GazetteerPlace]] = []
+        rows = [list(range(len(query) + 1))]
+        previous = ""
+        index = 0
+        while index < len(self.keys):
+            key = self.keys[index]
+            shared = 0
+            limit_shared = min(len(previous), len(key))
+            while shared < limit_shared and previous[shared] == key[shared]:
+                shared += 1
+            del rows[shared + 1 :]
+
+            pruned = False
+            for depth in range(shared, len(key)):
+                character = key[depth]
+                above = rows[-1]
+                row = [above[0] + 1]
+                for column in range(1, len(query) + 1):
+                    row.append(
+                        min(
+                            row[column - 1] + 1,
+                            above[column] + 1,
+                            above[column - 1] + (query[column - 1] != character),
+                        )
+                    )
+                rows.append(row)
+                if min(row) > budget:
+                    prefix = key[: depth + 1]
+                    previous = prefix
+                    index = bisect_left(self.keys, prefix + _PREFIX_END, lo=index + 1)
+                    pruned = True
+                    break
+            if pruned:
+                continue
+
+            distance = rows[-1][-1]
+            if distance <= budget:
+                for place in self._places_for_key(index):
+                    matches.append((distance, -place.population, place))
+            previous = key
+            index += 1
+
+        matches.sort(key=lambda match: (match[0], match[1]))
+        return [place for _, _, place in matches[:limit]]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict[str, str]]) -> "Gazetteer":
+        places: list[GazetteerPlace] = []
+        for row in rows:
+            try:
+                places.append(
+                    GazetteerPlace(
+                        name=row["name"],
+                        country=row["country"],
+                        latitude=float(row["latitude"]),
+                        longitude=float(row["longitude"]),
+                        timezone=row.get("timezone") or None,
+                        population=int(row.get("population") or 0),
+                    )
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+        return cls(places)
+
+
+def read_gazetteer(path: Path) -> Gazetteer:
+    with gzip.open(path, "rt", encoding="utf-8", newline="") as handle:
+        return Gazetteer.from_rows(csv.DictReader(handle, fieldnames=GAZETTEER_COLUMNS, delimiter="\t", quoting=csv.QUOTE_NONE))
+
+
+def write_gazetteer(rows: Iterable[dict[str, str | int | float]], path: Path) -> int:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=GAZETTEER_COLUMNS, delimiter="\t", quoting=csv.QUOTE_NONE, extrasaction="ignore")
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    with gzip.open(temp_path, "wt", encoding="utf-8", newline="") as handle:
+        handle.write(buffer.getvalue())
+    os.replace(temp_path, path)
+    return count
+
+
+def _country_name(country_code: str) -> str:
+    country = pycountry.countries.get(alpha_2=country_code) if country_code else None
+    return getattr(country, "common_name", None) or getattr(country, "name", None) or country_code
+
+
+def build_gazetteer(path: Path = OPEN_METEO_GAZETTEER_PATH, *, size: int = GAZETTEER_DEFAULT_SIZE, timeout_s: float = 120.0) -> int:
+    """Download the GeoNames cities dump and write its `size` most populous places to `path`."""
+    response = requests.get(GEONAMES_CITIES_URL, timeout=timeout_s)
+    response.raise_for_status()
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        text = archive.read(GEONAMES_CITIES_MEMBER).decode("utf-8")
+
+    rows: list[dict[str, str | int | float]] = []
+    for line in text.splitlines():
+        fields = line.split("\t")
+        if len(fields) < 18:
+            continue
+        # GeoNames columns: 1 name, 4 latitude, 5 longitude, 8 country code, 14 population, 17 timezone.
+        rows.append(
+            {
+                "name": fields[1],
+                "country": _country_name(fields[8]),
+                "latitude": fields[4],
+                "longitude": fields[5],
+                "timezone": fields[17],
+                "population": int(fields[14] or 0),
+            }
+        )
+    rows.sort(key=lambda row: -int(row["population"]))
+    return write_gazetteer(rows[:size], path)
+
+
+_GAZETTEER: Gazetteer | None = None
+_GAZETTEER_LOADED = False
+_GAZETTEER_LOCK = Lock()
+
+
+def get_gazetteer(path: Path = OPEN_METEO_GAZETTEER_PATH) -> Gazetteer | None:
+    """The bundled gazetteer, or None when it is disabled or has not been built."""
+    global _GAZETTEER, _GAZETTEER_LOADED
+    if not OPEN_METEO_GAZETTEER_ENABLED:
+        return None
+    with _GAZETTEER_LOCK:
+        if not _GAZETTEER_LOADED:
+            _GAZETTEER_LOADED = True
+            try:
+                _GAZETTEER = read_gazetteer(path) if path.exists() else None
+            except (OSError, csv.Error):
+                _GAZETTEER = None
+        return _GAZETTEER
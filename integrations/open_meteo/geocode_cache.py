@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import os
+import re
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from threading import Lock
+from time import monotonic
+
+import psycopg
+
+from common.config import get_env_float, get_env_int
+from db.connection import get_connection
+from integrations.open_meteo.geocode_cache_repository import GeocodeCacheRepository
+from integrations.open_meteo.models import GeocodedLocation
+
+GEOCODE_CACHE_BACKEND_MEMORY = "memory"
+GEOCODE_CACHE_BACKEND_POSTGRES = "postgres"
+OPEN_METEO_GEOCODE_CACHE_MAX_ENTRIES = max(1, get_env_int("OPEN_METEO_GEOCODE_CACHE_MAX_ENTRIES", 4096))
+OPEN_METEO_GEOCODE_CACHE_TTL_SECONDS = max(0.0, get_env_float("OPEN_METEO_GEOCODE_CACHE_TTL_SECONDS", 30 * 24 * 60 * 60))
+# Unknown names are retried sooner: the upstream index does gain places, and typos are cheap to re-check.
+OPEN_METEO_GEOCODE_NEGATIVE_TTL_SECONDS = max(0.0, get_env_float("OPEN_METEO_GEOCODE_NEGATIVE_TTL_SECONDS", 24 * 60 * 60))
+# After a database error the shared tier is skipped for this long instead of reconnecting on every lookup.
+GEOCODE_CACHE_DB_RETRY_SECONDS = 60.0
+
+# Common abbreviations and former names, keyed and valued by normalized name.
+PLACE_NAME_ALIASES = {
+    "nyc": "new york",
+    "new york city": "new york",
+    "la": "los angeles",
+    "sf": "san francisco",
+    "dc": "washington",
+    "washington dc": "washington",
+    "philly": "philadelphia",
+    "vegas": "las vegas",
+    "st louis": "saint louis",
+    "st petersburg": "saint petersburg",
+    "st paul": "saint paul",
+    "st john s": "saint john s",
+    "bombay": "mumbai",
+    "calcutta": "kolkata",
+    "madras": "chennai",
+    "peking": "beijing",
+    "canton": "guangzhou",
+    "saigon": "ho chi minh city",
+    "kiev": "kyiv",
+    "rangoon": "yangon",
+    "constantinople": "istanbul",
+}
+
+_NON_ALPHANUMERIC = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_place_name(name: str, *, apply_aliases: bool = True) -> str:
+    """Casefold, strip accents and punctuation, collapse whitespace, then apply the alias table."""
+    normalized = unicodedata.normalize("NFKD", name or "").encode("ascii", "ignore").decode("ascii")
+    normalized = _NON_ALPHANUMERIC.sub(" ", normalized.casefold()).strip()
+    if not apply_aliases:
+        return normalized
+    return PLACE_NAME_ALIASES.get(normalized, normalized)
+
+
+@dataclass(frozen=True)
+class GeocodeCacheEntry:
+    """A cached lookup; `location` is None for a name the geocoder could not resolve."""
+
+    location: GeocodedLocation | None
+    expires_at: float
+
+
+class GeocodeCache:
+    """In-process LRU in front of an optional shared Postgres tier.
+
+    The Postgres tier is what makes results survive restarts and be shared across workers;
+    when it is unavailable lookups degrade to the in-process tier only.
+    """
+
+    def __init__(
+        self,
+        backend: str = GEOCODE_CACHE_BACKEND_MEMORY,
+        *,
+        conn: psycopg.Connection | None = None,
+        max_entries: int = OPEN_METEO_GEOCODE_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = OPEN_METEO_GEOCODE_CACHE_TTL_SECONDS,
+        negative_ttl_seconds: float = OPEN_METEO_GEOCODE_NEGATIVE_TTL_SECONDS,
+    ) -> None:
+        self._backend = backend
+        self._conn = conn
+        self._max_entries = max(1, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._entries: OrderedDict[str, GeocodeCacheEntry] = OrderedDict()
+        self._lock = Lock()
+        self._conn_lock = Lock()
+        self._db_disabled_until = 0.0
+
+    def _repository(self) -> GeocodeCacheRepository | None:
+        if self._backend != GEOCODE_CACHE_BACKEND_POSTGRES or monotonic() < self._db_disabled_until:
+            return None
+        if self._conn is None:
+            self._conn = get_connection()
+        return GeocodeCacheRepository(self._conn)
+
+    def _disable_db(self) -> None:
+        self._conn = None
+        self._db_disabled_until = monotonic() + GEOCODE_CACHE_DB_RETRY_SECONDS
+
+    def _remember(self, name_key: str, location: GeocodedLocation | None, ttl_seconds: float) -> GeocodeCacheEntry:
+        entry = GeocodeCacheEntry(location=location, expires_at=monotonic() + ttl_seconds)
+        with self._lock:
+            self._entries[name_key] = entry
+            self._entries.move_to_end(name_key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def get(self, name_key: str) -> GeocodeCacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(name_key)
+            if entry is not None and entry.expires_at > monotonic():
+                self._entries.move_to_end(name_key)
+                return entry
+            if entry is not None:
+                del self._entries[name_key]
+
+        try:
+            with self._conn_lock:
+                repository = self._repository()
+                if repository is None:
+                    return None
+                hit, payload = repository.get(name_key)
+        except psycopg.Error:
+            self._disable_db()
+            return None
+        if not hit:
+            return None
+        location = None if payload is None else GeocodedLocation.model_validate(payload)
+        ttl_seconds = self._negative_ttl_seconds if location is None else self._ttl_seconds
+        return self._remember(name_key, location, ttl_seconds)
+
+    def put(self, name_key: str, location: GeocodedLocation | None) -> None:
+        ttl_seconds = self._negative_ttl_seconds if location is None else self._ttl_seconds
+        self._remember(name_key, location, ttl_seconds)
+        try:
+            with self._conn_lock:
+                repository = self._repository()
+                if repository is not None:
+                    repository.put(
+                        name_key,
+                        None if location is None else location.model_dump(),
+                        timedelta(seconds=ttl_seconds),
+                    )
+        except psycopg.Error:
+            self._disable_db()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_GEOCODE_CACHE: GeocodeCache | None = None
+_GEOCODE_CACHE_LOCK = Lock()
+
+
+def build_geocode_cache(backend: str | None = None) -> GeocodeCache:
+    resolved_backend = (backend or os.getenv("OPEN_METEO_GEOCODE_CACHE_BACKEND", GEOCODE_CACHE_BACKEND_POSTGRES)).strip().lower()
+    if resolved_backend == GEOCODE_CACHE_BACKEND_POSTGRES:
+        return GeocodeCache(GEOCODE_CACHE_BACKEND_POSTGRES)
+    return GeocodeCache(GEOCODE_CACHE_BACKEND_MEMORY)
+
+
+def get_geocode_cache() -> GeocodeCache:
+    global _GEOCODE_CACHE
+    with _GEOCODE_CACHE_LOCK:
+        if _GEOCODE_CACHE is None:
+            _GEOCODE_CACHE = build_geocode_cache()
+        return _GEOCODE_CACHE
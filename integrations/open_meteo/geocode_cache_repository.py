@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+import psycopg
+from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb
+
+
+class GeocodeCacheRepository:
+    def __init__(self, conn: psycopg.Connection):
+        self._conn = conn
+
+    def get(self, name_key: str) -> tuple[bool, dict[str, Any] | None]:
+        """Return (hit, payload); a hit with a None payload is a cached "not found"."""
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                """
+                SELECT location_payload FROM geocode_cache
+                WHERE name_key = %s AND expires_at > now()
+                """,
+                (name_key,),
+            )
+            row = cur.fetchone()
+        if row is None:
+            return False, None
+        return True, row["location_payload"]
+
+    def put(self, name_key: str, payload: dict[str, Any] | None, ttl: timedelta) -> None:
+        with self._conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO geocode_cache (name_key, location_payload, expires_at)
+                VALUES (%s, %s, now() + %s)
+                ON CONFLICT (name_key) DO UPDATE
+                    SET location_payload = EXCLUDED.location_payload,
+                        created_at = now(),
+                        expires_at = EXCLUDED.expires_at
+                """,
+                (name_key, None if payload is None else Jsonb(payload), ttl),
+            )
@@ -34,6 +34,31 @@ class MonthlyWeatherSummary(BaseModel):
     daily: Optional[DailyWeather] = None
 
 
+class WeatherPeriodAggregate(BaseModel):
+    period: str
+    year: int
+    month: Optional[int] = None
+    months_count: int = 1
+    days_count: int
+    avg_temp_max_c: Optional[float] = None
+    avg_temp_min_c: Optional[float] = None
+    total_precip_mm: Optional[float] = None
+    rainy_days: Optional[int] = None
+    avg_wind_max_kmh: Optional[float] = None
+
+
+class WeatherArchiveRange(BaseModel):
+    city: str
+    country: str
+    latitude: float
+    longitude: float
+    start_date: str
+    end_date: str
+    months: list[int] = []
+    granularity: str = "month"
+    periods: list[WeatherPeriodAggregate] = []
+
+
 class CurrentWeather(BaseModel):
     latitude: float
     longitude: float
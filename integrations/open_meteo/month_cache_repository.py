@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from psycopg.rows import dict_row
+
+from db.connection import PooledConnection
+
+
+class WeatherMonthTotalsRepository:
+    def __init__(self, conn: PooledConnection | None = None):
+        self._conn = conn or PooledConnection()
+
+    def get_many(self, latitude: float, longitude: float, months: list[tuple[int, int]]) -> dict[tuple[int, int], list[float]]:
+        if not months:
+            return {}
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                """
+                SELECT year, month, totals FROM weather_month_totals
+                WHERE latitude = %s
+                  AND longitude = %s
+                  AND (year, month) IN (SELECT * FROM unnest(%s::int[], %s::int[]))
+                """,
+                (latitude, longitude, [year for year, _ in months], [month for _, month in months]),
+            )
+            rows = cur.fetchall()
+        return {(row["year"], row["month"]): [float(value) for value in row["totals"]] for row in rows}
+
+    def put_many(self, latitude: float, longitude: float, rows: dict[tuple[int, int], list[float]]) -> None:
+        if not rows:
+            return
+        with self._conn.cursor() as cur:
+            cur.executemany(
+                """
+                INSERT INTO weather_month_totals (latitude, longitude, year, month, totals)
+                VALUES (%s, %s, %s, %s, %s)
+                ON CONFLICT (latitude, longitude, year, month) DO NOTHING
+                """,
+                [(latitude, longitude, year, month, totals) for (year, month), totals in rows.items()],
+            )
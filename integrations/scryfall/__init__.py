@@ -1,3 +1,5 @@
+from integrations.scryfall.card_index import ScryfallCardIndex, get_scryfall_card_index, refresh_card_snapshot
+from integrations.scryfall.card_query import UnsupportedCardQueryError, parse_card_query
 from integrations.scryfall.client import ScryfallClient, ScryfallClientError
 from integrations.scryfall.models import (
     MagicCardPriceEntry,
@@ -17,10 +19,15 @@ __all__ = [
     "MagicCardPriceResult",
     "ScryfallCard",
     "ScryfallCardFace",
+    "ScryfallCardIndex",
     "ScryfallCardSearchResult",
     "ScryfallClient",
     "ScryfallClientError",
     "ScryfallImageUris",
     "ScryfallRuling",
     "ScryfallRulingList",
+    "UnsupportedCardQueryError",
+    "get_scryfall_card_index",
+    "parse_card_query",
+    "refresh_card_snapshot",
 ]
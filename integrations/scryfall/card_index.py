@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import difflib
+import gzip
+import json
+import os
+import re
+import tempfile
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+from typing import Any, Iterable
+
+import requests
+
+from common.config import get_env_bool, get_env_float
+from common.http import build_headers
+from integrations.scryfall.models import ScryfallCard
+
+SCRYFALL_BULK_DATA_TYPE = "oracle_cards"
+SCRYFALL_CARD_INDEX_PATH = Path(os.getenv("SCRYFALL_CARD_INDEX_PATH", "data/scryfall/oracle_cards.json.gz"))
+SCRYFALL_LOCAL_INDEX_ENABLED = get_env_bool("SCRYFALL_LOCAL_INDEX_ENABLED", True)
+# How often a running process checks whether the snapshot on disk was refreshed.
+SCRYFALL_CARD_INDEX_RELOAD_CHECK_SECONDS = max(0.0, get_env_float("SCRYFALL_CARD_INDEX_RELOAD_CHECK_SECONDS", 300.0))
+
+COLOR_BITS = {"W": 1, "U": 2, "B": 4, "R": 8, "G": 16}
+
+# Only the fields ScryfallCard reads are kept; the bulk file carries roughly ten times more.
+_CARD_FIELDS = (
+    "id",
+    "name",
+    "lang",
+    "mana_cost",
+    "cmc",
+    "type_line",
+    "oracle_text",
+    "colors",
+    "color_identity",
+    "image_uris",
+    "card_faces",
+    "scryfall_uri",
+    "set_name",
+    "rarity",
+    "prices",
+    "legalities",
+    "games",
+    "layout",
+)
+# Layouts Scryfall's default search leaves out (they are not cards you play with); the API fallback
+# never returns them, so the local index skips them too.
+EXTRA_CARD_LAYOUTS = frozenset({"token", "double_faced_token", "emblem", "art_series", "vanguard", "planar", "scheme"})
+_CARD_FACE_FIELDS = ("name", "mana_cost", "type_line", "oracle_text", "image_uris", "colors")
+_IMAGE_URI_FIELDS = ("small", "normal", "large", "png", "art_crop", "border_crop")
+_NAME_NORMALIZE_PATTERN = re.compile(r"[^a-z0-9 ]+")
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_FUZZY_NAME_CUTOFF = 0.8
+
+
+def normalize_card_name(value: str) -> str:
+    return " ".join(_NAME_NORMALIZE_PATTERN.sub(" ", (value or "").casefold()).split())
+
+
+def color_mask(colors: Iterable[str] | None) -> int:
+    mask = 0
+    for color in colors or []:
+        mask |= COLOR_BITS.get(str(color).upper(), 0)
+    return mask
+
+
+def _compact_image_uris(image_uris: Any) -> dict[str, str] | None:
+    if not isinstance(image_uris, dict):
+        return None
+    return {key: image_uris[key] for key in _IMAGE_URI_FIELDS if image_uris.get(key)}
+
+
+def compact_card_record(card: dict[str, Any]) -> dict[str, Any]:
+    record = {key: card[key] for key in _CARD_FIELDS if card.get(key) is not None}
+    if "image_uris" in record:
+        record["image_uris"] = _compact_image_uris(record["image_uris"])
+    if "card_faces" in record:
+        record["card_faces"] = [
+            {
+                **{key: face[key] for key in _CARD_FACE_FIELDS if face.get(key) is not None},
+                **({"image_uris": _compact_image_uris(face.get("image_uris"))} if face.get("image_uris") else {}),
+            }
+            for face in record["card_faces"]
+            if isinstance(face, dict)
+        ]
+    return record
+
+
+def _is_indexed_card(record: dict[str, Any]) -> bool:
+    return (
+        bool(record.get("id") and record.get("name"))
+        and record.get("lang", "en") == "en"
+        and record.get("layout") not in EXTRA_CARD_LAYOUTS
+    )
+
+
+def _joined_face_text(card: dict[str, Any], key: str) -> str:
+    value = card.get(key)
+    if value:
+        return str(value)
+    faces = card.get("card_faces") or []
+    return "\n".join(str(face.get(key) or "") for face in faces if face.get(key))
+
+
+@dataclass
+class ScryfallCardIndex:
+    """Columnar in-memory index over Scryfall oracle cards.
+
+    Each column is a plain list aligned by card position; the dicts are postings used to
+    narrow a search before falling back to a scan of the relevant column.
+    """
+
+    updated_at: str = ""
+    records: list[dict[str, Any]] = field(default_factory=list)
+    names: list[str] = field(default_factory=list)
+    normalized_names: list[str] = field(default_factory=list)
+    type_lines: list[str] = field(default_factory=list)
+    oracle_texts: list[str] = field(default_factory=list)
+    cmcs: list[float] = field(default_factory=list)
+    color_masks: list[int] = field(default_factory=list)
+    identity_masks: list[int] = field(default_factory=list)
+    position_by_name: dict[str, int] = field(default_factory=dict)
+    sorted_names: list[tuple[str, int]] = field(default_factory=list)
+    type_postings: dict[str, set[int]] = field(default_factory=dict)
+    oracle_postings: dict[str, set[int]] = field(default_factory=dict)
+    identity_postings: dict[int, set[int]] = field(default_factory=dict)
+    legal_postings: dict[tuple[str, str], set[int]] = field(default_factory=dict)
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]], *, updated_at: str = "") -> "ScryfallCardIndex":
+        index = cls(updated_at=updated_at)
+        for record in records:
+            if _is_indexed_card(record):
+                index._add(compact_card_record(record))
+        index.sorted_names = sorted((name, position) for name, position in index.position_by_name.items())
+        return index
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _add(self, record: dict[str, Any]) -> None:
+        position = len(self.records)
+        name = str(record["name"])
+        type_line = _joined_face_text(record, "type_line").casefold()
+        oracle_text = _joined_face_text(record, "oracle_text").casefold()
+        colors = record.get("colors")
+        if colors is None:
+            colors = [color for face in record.get("card_faces") or [] for color in face.get("colors") or []]
+        identity_mask = color_mask(record.get("color_identity"))
+
+        self.records.append(record)
+        self.names.append(name)
+        self.normalized_names.append(normalize_card_name(name))
+        self.type_lines.append(type_line)
+        self.oracle_texts.append(oracle_text)
+        self.cmcs.append(float(record.get("cmc") or 0.0))
+        self.color_masks.append(color_mask(colors))
+        self.identity_masks.append(identity_mask)
+        self.identity_postings.setdefault(identity_mask, set()).add(position)
+
+        for lookup_name in {name, *(face.get("name", "") for face in record.get("card_faces") or [])}:
+            normalized = normalize_card_name(lookup_name)
+            if normalized:
+                self.position_by_name.setdefault(normalized, position)
+        for token in set(_TOKEN_PATTERN.findall(type_line)):
+            self.type_postings.setdefault(token, set()).add(position)
+        for token in set(_TOKEN_PATTERN.findall(oracle_text)):
+            self.oracle_postings.setdefault(token, set()).add(position)
+        for format_name, status in (record.get("legalities") or {}).items():
+            self.legal_postings.setdefault((format_name.casefold(), status), set()).add(position)
+
+    def all_positions(self) -> set[int]:
+        return set(range(len(self.records)))
+
+    def card_at(self, position: int) -> ScryfallCard:
+        return ScryfallCard.model_validate(self.records[position])
+
+    def cards_at(self, positions: Iterable[int]) -> list[ScryfallCard]:
+        return [self.card_at(position) for position in positions]
+
+    def find_exact(self, name: str) -> int | None:
+        return self.position_by_name.get(normalize_card_name(name))
+
+    def find_fuzzy(self, name: str) -> int | None:
+        """Resolve a name the way Scryfall's fuzzy lookup does, returning None when ambiguous."""
+        normalized = normalize_card_name(name)
+        if not normalized:
+            return None
+        position = self.position_by_name.get(normalized)
+        if position is not None:
+            return position
+
+        start = bisect_left(self.sorted_names, (normalized, -1))
+        prefix_matches = {
+            candidate_position
+            for candidate_name, candidate_position in self.sorted_names[start : start + 2]
+            if candidate_name.startswith(normalized)
+        }
+        if len(prefix_matches) == 1:
+            return prefix_matches.pop()
+        if prefix_matches:
+            return None
+
+        words = normalized.split()
+        word_matches = {
+            candidate_position
+            for candidate_name, candidate_position in self.position_by_name.items()
+            if all(word in candidate_name for word in words)
+        }
+        if len(word_matches) == 1:
+            return word_matches.pop()
+        if word_matches:
+            return None
+
+        close_matches = difflib.get_close_matches(normalized, self.position_by_name.keys(), n=1, cutoff=_FUZZY_NAME_CUTOFF)
+        return self.position_by_name[close_matches[0]] if close_matches else None
+
+    def name_contains(self, value: str) -> set[int]:
+        normalized = normalize_card_name(value)
+        return {position for position, name in enumerate(self.normalized_names) if normalized in name}
+
+    def type_contains(self, value: str) -> set[int]:
+        normalized = value.casefold().strip()
+        if _TOKEN_PATTERN.fullmatch(normalized) and normalized in self.type_postings:
+            return set(self.type_postings[normalized])
+        return {position for position, type_line in enumerate(self.type_lines) if normalized in type_line}
+
+    def oracle_contains(self, value: str) -> set[int]:
+        normalized = value.casefold().strip()
+        tokens = _TOKEN_PATTERN.findall(normalized)
+        candidates: set[int] | None = None
+        # Only whole-word tokens narrow the scan; the first and last tokens may be partial words.
+        for token in tokens[1:-1]:
+            postings = self.oracle_postings.get(token, set())
+            candidates = set(postings) if candidates is None else candidates & postings
+        if candidates is None:
+            candidates = self.all_positions()
+        matches: set[int] = set()
+        for position in candidates:
+            needle = normalized.replace("~", self.names[position].casefold()) if "~" in normalized else normalized
+            if needle in self.oracle_texts[position]:
+                matches.add(position)
+        return matches
+
+    def legal_in(self, format_name: str, statuses: tuple[str, ...]) -> set[int]:
+        matches: set[int] = set()
+        for status in statuses:
+            matches |= self.legal_postings.get((format_name.casefold(), status), set())
+        return matches
+
+    def identity_within(self, mask: int) -> set[int]:
+        matches: set[int] = set()
+        for identity_mask, positions in self.identity_postings.items():
+            if identity_mask & ~mask == 0:
+                matches |= positions
+        return matches
+
+    def sort_positions(self, positions: Iterable[int], *, order: str = "name", descending: bool = False) -> list[int]:
+        if order == "cmc":
+            key = lambda position: (self.cmcs[position], self.normalized_names[position])
+        else:
+            key = lambda position: self.normalized_names[position]
+        return sorted(positions, key=key, reverse=descending)
+
+
+def read_card_snapshot(path: Path = SCRYFALL_CARD_INDEX_PATH) -> ScryfallCardIndex:
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    return ScryfallCardIndex.from_records(payload.get("cards") or [], updated_at=str(payload.get("updated_at") or ""))
+
+
+def read_card_snapshot_updated_at(path: Path = SCRYFALL_CARD_INDEX_PATH) -> str:
+    if not path.exists():
+        return ""
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    return str(payload.get("updated_at") or "")
+
+
+def write_card_snapshot(records: Iterable[dict[str, Any]], *, updated_at: str, path: Path = SCRYFALL_CARD_INDEX_PATH) -> int:
+    compact_records = [compact_card_record(record) for record in records if _is_indexed_card(record)]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a sibling temp file and swap it in so readers never see a partial snapshot.
+    with tempfile.NamedTemporaryFile("wb", dir=path.parent, suffix=".tmp", delete=False) as handle:
+        temp_path = Path(handle.name)
+        with gzip.GzipFile(fileobj=handle, mode="wb") as gzip_handle:
+            gzip_handle.write(
+                json.dumps({"updated_at": updated_at, "cards": compact_records}, separators=(",", ":")).encode("utf-8")
+            )
+    os.replace(temp_path, path)
+    return len(compact_records)
+
+
+def refresh_card_snapshot(
+    *,
+    path: Path = SCRYFALL_CARD_INDEX_PATH,
+    base_url: str = "https://api.scryfall.com",
+    timeout_s: float = 120.0,
+    force: bool = False,
+) -> bool:
+    """Download Scryfall's oracle-cards bulk file when it is newer than the local snapshot."""
+    headers = build_headers()
+    metadata_response = requests.get(f"{base_url.rstrip('/')}/bulk-data/{SCRYFALL_BULK_DATA_TYPE}", headers=headers, timeout=timeout_s)
+    metadata_response.raise_for_status()
+    metadata = metadata_response.json()
+    updated_at = str(metadata.get("updated_at") or "")
+    if not force and updated_at and updated_at == read_card_snapshot_updated_at(path):
+        return False
+
+    bulk_response = requests.get(metadata["download_uri"], headers=headers, timeout=timeout_s)
+    bulk_response.raise_for_status()
+    write_card_snapshot(bulk_response.json(), updated_at=updated_at, path=path)
+    return True
+
+
+_CARD_INDEX: ScryfallCardIndex | None = None
+_CARD_INDEX_MTIME: float | None = None
+_CARD_INDEX_CHECKED_AT: float | None = None
+_CARD_INDEX_LOCK = Lock()
+
+
+def get_scryfall_card_index(path: Path = SCRYFALL_CARD_INDEX_PATH) -> ScryfallCardIndex | None:
+    """Return the process-wide card index, reloading it when the snapshot file changes."""
+    global _CARD_INDEX, _CARD_INDEX_MTIME, _CARD_INDEX_CHECKED_AT
+    if not SCRYFALL_LOCAL_INDEX_ENABLED:
+        return None
+    with _CARD_INDEX_LOCK:
+        now = monotonic()
+        if _CARD_INDEX_CHECKED_AT is not None and now - _CARD_INDEX_CHECKED_AT < SCRYFALL_CARD_INDEX_RELOAD_CHECK_SECONDS:
+            return _CARD_INDEX
+        _CARD_INDEX_CHECKED_AT = now
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            _CARD_INDEX = None
+            _CARD_INDEX_MTIME = None
+            return None
+        if _CARD_INDEX is None or mtime != _CARD_INDEX_MTIME:
+            try:
+                _CARD_INDEX = read_card_snapshot(path)
+                _CARD_INDEX_MTIME = mtime
+            except (OSError, ValueError):
+                _CARD_INDEX = None
+                _CARD_INDEX_MTIME = None
+        return _CARD_INDEX
@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from integrations.scryfall.card_index import COLOR_BITS, ScryfallCardIndex
+
+_TOKEN_PATTERN = re.compile(
+    r"""\s*(?:
+        (?P<lparen>\()
+        |(?P<rparen>\))
+        |(?P<negate>-)(?=[^\s)])
+        |(?P<term>!?(?:[a-zA-Z]+(?:<=|>=|!=|:|=|<|>))?(?:"[^"]*"|[^\s()"]+))
+    )""",
+    re.VERBOSE,
+)
+_KEYED_TERM_PATTERN = re.compile(r"^(?P<key>[a-zA-Z]+)(?P<op><=|>=|!=|:|=|<|>)(?P<value>.*)$")
+_COLOR_NAMES = {
+    "colorless": "",
+    "c": "",
+    "white": "w",
+    "blue": "u",
+    "black": "b",
+    "red": "r",
+    "green": "g",
+    "multicolor": None,
+    "m": None,
+}
+_IDENTITY_KEYS = {"id", "identity", "ci"}
+_COLOR_KEYS = {"c", "color", "colors"}
+_TYPE_KEYS = {"t", "type"}
+_ORACLE_KEYS = {"o", "oracle"}
+_MANA_VALUE_KEYS = {"cmc", "mv", "manavalue"}
+_FORMAT_KEYS = {"f", "format", "legal"}
+_BANNED_KEYS = {"banned"}
+_RESTRICTED_KEYS = {"restricted"}
+_LEGAL_STATUSES = ("legal", "restricted")
+ALL_COLORS_MASK = sum(COLOR_BITS.values())
+
+
+class UnsupportedCardQueryError(ValueError):
+    """Raised for search syntax the local index does not evaluate; callers fall back to the API."""
+
+
+class CardQueryNode(ABC):
+    @abstractmethod
+    def evaluate(self, index: ScryfallCardIndex) -> set[int]:
+        """Positions in `index` of the cards this node matches."""
+
+
+@dataclass(frozen=True)
+class AndNode(CardQueryNode):
+    children: tuple[CardQueryNode, ...]
+
+    def evaluate(self, index: ScryfallCardIndex) -> set[int]:
+        matches: set[int] | None = None
+        for child in self.children:
+            child_matches = child.evaluate(index)
+            matches = child_matches if matches is None else matches & child_matches
+            if not matches:
+                return set()
+        return index.all_positions() if matches is None else matches
+
+
+@dataclass(frozen=True)
+class OrNode(CardQueryNode):
+    children: tuple[CardQueryNode, ...]
+
+    def evaluate(self, index: ScryfallCardIndex) -> set[int]:
+        matches: set[int] = set()
+        for child in self.children:
+            matches |= child.evaluate(index)
+        return matches
+
+
+@dataclass(frozen=True)
+class NotNode(CardQueryNode):
+    child: CardQueryNode
+
+    def evaluate(self, index: ScryfallCardIndex) -> set[int]:
+        return index.all_positions() - self.child.evaluate(index)
+
+
+@dataclass(frozen=True)
+class ExactNameNode(CardQueryNode):
+    name: str
+
+    def evaluate(self, index: ScryfallCardIndex) -> set[int]:
+        position = index.find_exact(self.name)
+        return set() if position is None else {position}
+
+
+@dataclass(frozen=True)
+class NameContainsNode(CardQueryNode):
+    value: str
+
+    def evaluate(self, index: ScryfallCardIndex) -> set[int]:
+        return index.name_contains(self.value)
+
+
+@dataclass(frozen=True)
+class TypeNode(CardQueryNode):
+    value: str
+
+    def evaluate(self, index: ScryfallCardIndex) -> set[int]:
+        return index.type_contains(self.value)
+
+
+@dataclass(frozen=True)
+class OracleNode(CardQueryNode):
+    value: str
+
+    def evaluate(self, index: ScryfallCardIndex) -> set[int]:
+        return index.oracle_contains(self.value)
+
+
+@dataclass(frozen=True)
+class LegalityNode(CardQueryNode):
+    format_name: str
+    statuses: tuple[str, ...]
+
+    def evaluate(self, index: ScryfallCardIndex) -> set[int]:
+        return index.legal_in(self.format_name, self.statuses)
+
+
+@dataclass(frozen=True)
+class ManaValueNode(CardQueryNode):
+    op: str
+    value: float
+
+    def evaluate(self, index: ScryfallCardIndex) -> set[int]:
+        return {position for position, cmc in enumerate(index.cmcs) if _compare_number(cmc, self.op, self.value)}
+
+
+@dataclass(frozen=True)
+class ColorNode(CardQueryNode):
+    op: str
+    mask: int | None
+    identity: bool
+
+    def evaluate(self, index: ScryfallCardIndex) -> set[int]:
+        if self.identity and self.op == "<=" and self.mask is not None:
+            return index.identity_within(self.mask)
+        masks = index.identity_masks if self.identity else index.color_masks
+        if self.mask is None:
+            return {position for position, mask in enumerate(masks) if mask.bit_count() >= 2}
+        return {position for position, mask in enumerate(masks) if _compare_colors(mask, self.op, self.mask)}
+
+
+def _compare_number(left: float, op: str, right: float) -> bool:
+    if op == "<":
+        return left < right
+    if op == "<=":
+        return left <= right
+    if op == ">":
+        return left > right
+    if op == ">=":
+        return left >= right
+    if op == "!=":
+        return left != right
+    return left == right
+
+
+def _compare_colors(card_mask: int, op: str, query_mask: int) -> bool:
+    is_subset = card_mask & ~query_mask == 0
+    is_superset = query_mask & ~card_mask == 0
+    if op == "<=":
+        return is_subset
+    if op == "<":
+        return is_subset and card_mask != query_mask
+    if op == ">=":
+        return is_superset
+    if op == ">":
+        return is_superset and card_mask != query_mask
+    if op == "!=":
+        return card_mask != query_mask
+    return card_mask == query_mask
+
+
+def _parse_color_mask(value: str) -> int | None:
+    normalized = value.casefold().strip()
+    if normalized in _COLOR_NAMES:
+        letters = _COLOR_NAMES[normalized]
+        if letters is None:
+            return None
+    elif normalized and all(letter.upper() in COLOR_BITS for letter in normalized):
+        letters = normalized
+    else:
+        raise UnsupportedCardQueryError(f"Unsupported color value '{value}'.")
+    mask = 0
+    for letter in letters:
+        mask |= COLOR_BITS[letter.upper()]
+    return mask
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value.startswith('"') and value.endswith('"'):
+        return value[1:-1]
+    return value
+
+
+def _parse_term(term: str) -> CardQueryNode:
+    if term.startswith("!"):
+        return ExactNameNode(_unquote(term[1:]))
+    keyed = _KEYED_TERM_PATTERN.match(term) if not term.startswith('"') else None
+    if keyed is None:
+        return NameContainsNode(_unquote(term))
+
+    key = keyed.group("key").casefold()
+    op = keyed.group("op")
+    value = _unquote(keyed.group("value"))
+    if not value:
+        raise UnsupportedCardQueryError(f"Missing value for '{key}'.")
+    if key in _IDENTITY_KEYS:
+        mask = _parse_color_mask(value)
+        # For identity, ':' means "fits within", which is how commander decks filter.
+        return ColorNode(op="<=" if op == ":" else op, mask=mask, identity=True)
+    if key in _COLOR_KEYS:
+        mask = _parse_color_mask(value)
+        resolved_op = op
+        if op == ":":
+            resolved_op = "=" if mask == 0 else ">="
+        return ColorNode(op=resolved_op, mask=mask, identity=False)
+    if key in _MANA_VALUE_KEYS:
+        try:
+            return ManaValueNode(op="=" if op == ":" else op, value=float(value))
+        except ValueError as exc:
+            raise UnsupportedCardQueryError(f"Unsupported mana value '{value}'.") from exc
+    if op != ":" and op != "=":
+        raise UnsupportedCardQueryError(f"Unsupported operator '{op}' for '{key}'.")
+    if key in _TYPE_KEYS:
+        return TypeNode(value)
+    if key in _ORACLE_KEYS:
+        return OracleNode(value)
+    if key in _FORMAT_KEYS:
+        return LegalityNode(value, _LEGAL_STATUSES)
+    if key in _BANNED_KEYS:
+        return LegalityNode(value, ("banned",))
+    if key in _RESTRICTED_KEYS:
+        return LegalityNode(value, ("restricted",))
+    raise UnsupportedCardQueryError(f"Unsupported search keyword '{key}'.")
+
+
+def _tokenize(query: str) -> list[tuple[str, str]]:
+    tokens: list[tuple[str, str]] = []
+    position = 0
+    stripped = query.rstrip()
+    while position < len(stripped):
+        match = _TOKEN_PATTERN.match(stripped, position)
+        if match is None or match.end() == position:
+            raise UnsupportedCardQueryError(f"Could not parse query near '{stripped[position:]}'.")
+        kind = match.lastgroup or ""
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    def __init__(self, tokens: list[tuple[str, str]]) -> None:
+        self._tokens = tokens
+        self._position = 0
+
+    def _peek(self) -> tuple[str, str] | None:
+        return self._tokens[self._position] if self._position < len(self._tokens) else None
+
+    def _is_keyword(self, token: tuple[str, str] | None, keyword: str) -> bool:
+        return token is not None and token[0] == "term" and token[1].casefold() == keyword
+
+    def parse(self) -> CardQueryNode:
+        node = self._parse_or()
+        if self._peek() is not None:
+            raise UnsupportedCardQueryError("Unbalanced parentheses in query.")
+        return node
+
+    def _parse_or(self) -> CardQueryNode:
+        children = [self._parse_and()]
+        while self._is_keyword(self._peek(), "or"):
+            self._position += 1
+            children.append(self._parse_and())
+        return children[0] if len(children) == 1 else OrNode(tuple(children))
+
+    def _parse_and(self) -> CardQueryNode:
+        children: list[CardQueryNode] = []
+        while True:
+            token = self._peek()
+            if token is None or token[0] == "rparen" or self._is_keyword(token, "or"):
+                break
+            if self._is_keyword(token, "and"):
+                self._position += 1
+                continue
+            children.append(self._parse_unary())
+        if not children:
+            raise UnsupportedCardQueryError("Empty query group.")
+        return children[0] if len(children) == 1 else AndNode(tuple(children))
+
+    def _parse_unary(self) -> CardQueryNode:
+        token = self._peek()
+        if token is None:
+            raise UnsupportedCardQueryError("Unexpected end of query.")
+        self._position += 1
+        kind, value = token
+        if kind == "negate":
+            return NotNode(self._parse_unary())
+        if kind == "lparen":
+            node = self._parse_or()
+            closing = self._peek()
+            if closing is None or closing[0] != "rparen":
+                raise UnsupportedCardQueryError("Unbalanced parentheses in query.")
+            self._position += 1
+            return node
+        if kind == "rparen":
+            raise UnsupportedCardQueryError("Unbalanced parentheses in query.")
+        return _parse_term(value)
+
+
+def parse_card_query(query: str) -> CardQueryNode:
+    """Parse the subset of Scryfall search syntax the local index can answer.
+
+    Supported: bare and quoted name words, `!name`, `t:`, `o:`, `c:`, `id:`/`id<=`, `cmc`/`mv`
+    comparisons, `f:`/`banned:`/`restricted:`, negation, `or` and parentheses.
+    """
+    tokens = _tokenize(query)
+    if not tokens:
+        raise UnsupportedCardQueryError("Search query must not be empty.")
+    return _Parser(tokens).parse()
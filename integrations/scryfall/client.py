@@ -3,25 +3,73 @@ from __future__ import annotations
 from datetime import timedelta
 from typing import Any
 
-from common.http import DEFAULT_TTL, HttpClient, HttpClientError
+from common.config import get_env_float, get_env_int
+from common.http import DEFAULT_CIRCUIT_BREAKER_POLICY, DEFAULT_TTL, HttpClient, HttpClientError, RateLimitPolicy
+from integrations.scryfall.card_index import ScryfallCardIndex, get_scryfall_card_index
+from integrations.scryfall.card_query import UnsupportedCardQueryError, parse_card_query
 from integrations.scryfall.models import ScryfallCard, ScryfallCardSearchResult, ScryfallRulingList
 
+# Scryfall asks clients to stay at or below 10 requests per second.
+SCRYFALL_RATE_LIMIT_KEY = "scryfall"
+SCRYFALL_RATE_LIMIT_POLICY = RateLimitPolicy(
+    max_requests=max(1, get_env_int("SCRYFALL_RATE_LIMIT_MAX_REQUESTS", 10)),
+    window_seconds=max(0.0, get_env_float("SCRYFALL_RATE_LIMIT_WINDOW_SECONDS", 1.0)),
+)
+SCRYFALL_SEARCH_PAGE_SIZE = 175
+SCRYFALL_COLLECTION_BATCH_SIZE = 75
+_LOCAL_SEARCH_ORDERS = {"name", "cmc"}
+
 
 class ScryfallClientError(RuntimeError):
     pass
 
 
+def _card_name_keys(card: ScryfallCard) -> list[str]:
+    """Names a collection lookup may have used for `card`: the full name and each face of a multi-face card."""
+    name = card.name.casefold()
+    return [name, *(face.strip() for face in name.split("//"))] if "//" in name else [name]
+
+
 class ScryfallClient:
     def __init__(
         self,
         base_url: str = "https://api.scryfall.com",
         timeout_s: float = 20.0,
         ttl: timedelta = DEFAULT_TTL,
+        card_index: ScryfallCardIndex | None = None,
     ):
         self.base_url = base_url.rstrip("/")
+        self._card_index = card_index
         self._http = HttpClient(
             timeout_s=timeout_s,
             ttl=ttl,
+            rate_limit_key=SCRYFALL_RATE_LIMIT_KEY,
+            rate_limit_policy=SCRYFALL_RATE_LIMIT_POLICY,
+            circuit_breaker_policy=DEFAULT_CIRCUIT_BREAKER_POLICY,
+        )
+
+    def _local_index(self) -> ScryfallCardIndex | None:
+        if self._card_index is not None:
+            return self._card_index
+        return get_scryfall_card_index()
+
+    def _search_local(self, query: str, *, unique: str, order: str, dir: str) -> ScryfallCardSearchResult | None:
+        index = self._local_index()
+        # The oracle snapshot holds one printing per card, so per-print searches still go upstream.
+        if index is None or unique != "cards" or order not in _LOCAL_SEARCH_ORDERS:
+            return None
+        try:
+            positions = parse_card_query(query).evaluate(index)
+        except UnsupportedCardQueryError:
+            return None
+        if not positions:
+            # Cards printed after the snapshot was taken can only be found upstream.
+            return None
+        ordered_positions = index.sort_positions(positions, order=order, descending=dir == "desc")
+        return ScryfallCardSearchResult(
+            total_cards=len(ordered_positions),
+            has_more=len(ordered_positions) > SCRYFALL_SEARCH_PAGE_SIZE,
+            data=index.cards_at(ordered_positions[:SCRYFALL_SEARCH_PAGE_SIZE]),
         )
 
     def search_cards(
@@ -36,6 +84,10 @@ class ScryfallClient:
         if not normalized_query:
             raise ValueError("Search query must not be empty.")
 
+        local_result = self._search_local(normalized_query, unique=unique, order=order, dir=dir)
+        if local_result is not None:
+            return local_result
+
         params: dict[str, Any] = {
             "q": normalized_query,
             "unique": unique,
@@ -56,6 +108,12 @@ class ScryfallClient:
         if not normalized_name:
             raise ValueError("Card name must not be empty.")
 
+        index = self._local_index()
+        if index is not None:
+            position = index.find_fuzzy(normalized_name) if fuzzy else index.find_exact(normalized_name)
+            if position is not None:
+                return index.card_at(position)
+
         params = {"fuzzy": normalized_name} if fuzzy else {"exact": normalized_name}
         url = f"{self.base_url}/cards/named"
         try:
@@ -70,11 +128,39 @@ class ScryfallClient:
         normalized_names = list(dict.fromkeys(name.strip() for name in names if name and name.strip()))
         if not normalized_names:
             return []
-        if len(normalized_names) > 75:
-            raise ValueError("Scryfall collection lookups support at most 75 cards.")
 
+        index = self._local_index()
+        cards_by_name: dict[str, ScryfallCard] = {}
+        missing_names: list[str] = []
+        for name in normalized_names:
+            position = None if index is None else index.find_exact(name)
+            if position is None:
+                missing_names.append(name)
+            else:
+                cards_by_name[name] = index.card_at(position)
+
+        # Scryfall caps collection lookups at 75 identifiers per request.
+        fetched_cards: list[ScryfallCard] = []
+        for start in range(0, len(missing_names), SCRYFALL_COLLECTION_BATCH_SIZE):
+            fetched_cards.extend(self._get_collection(missing_names[start : start + SCRYFALL_COLLECTION_BATCH_SIZE]))
+        fetched_by_key: dict[str, ScryfallCard] = {}
+        for card in fetched_cards:
+            for key in _card_name_keys(card):
+                fetched_by_key.setdefault(key, card)
+        for name in missing_names:
+            card = fetched_by_key.get(name.casefold())
+            if card is not None:
+                cards_by_name[name] = card
+
+        # Keep the caller's order, as a single collection request would; anything Scryfall matched
+        # under a name we cannot map back goes last rather than being dropped.
+        cards = [cards_by_name[name] for name in normalized_names if name in cards_by_name]
+        placed = {id(card) for card in cards}
+        return cards + [card for card in fetched_cards if id(card) not in placed]
+
+    def _get_collection(self, names: list[str]) -> list[ScryfallCard]:
         url = f"{self.base_url}/cards/collection"
-        request_payload = {"identifiers": [{"name": name} for name in normalized_names]}
+        request_payload = {"identifiers": [{"name": name} for name in names]}
         try:
             payload = self._http.post(url, request_payload)
         except HttpClientError as e:
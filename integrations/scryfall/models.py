@@ -70,6 +70,7 @@ class ScryfallCard(BaseModel):
     prices: dict[str, str | None] = {}
     legalities: dict[str, str] = {}
     games: list[str] = []
+    layout: str | None = None
 
     def image_url(self) -> str | None:
         return _resolve_card_image_url(self)
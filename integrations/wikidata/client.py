@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import timedelta
 from typing import Any
 
-from common.http import HttpClient, HttpClientError, DEFAULT_TTL, build_headers
+from common.http import DEFAULT_CIRCUIT_BREAKER_POLICY, HttpClient, HttpClientError, DEFAULT_TTL, build_headers
 from integrations.wikidata.models import SparqlResult
 
 
@@ -23,6 +23,8 @@ class WikidataSparqlClient:
             timeout_s=timeout_s,
             headers=build_headers(Accept="application/sparql-results+json"),
             ttl=ttl,
+            circuit_breaker_key="wikidata_sparql",
+            circuit_breaker_policy=DEFAULT_CIRCUIT_BREAKER_POLICY,
         )
 
     def query(self, sparql: str) -> SparqlResult:
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import timedelta
+from threading import Lock
+from time import monotonic
 from typing import Any
 from urllib.parse import quote
 
-from common.http import HttpClient, HttpClientError, DEFAULT_TTL
+from common.config import get_env_float, get_env_int
+from common.http import DEFAULT_CIRCUIT_BREAKER_POLICY, HttpClient, HttpClientError, DEFAULT_TTL
+from common.utils.batching import RequestCoalescer
 from integrations.wikipedia.models import WikipediaPageSummary, WikipediaSearchResult
 
+# The query API accepts 50 titles per request, but TextExtracts returns at most 20 intro extracts.
+WIKIPEDIA_MAX_TITLES_PER_QUERY = 50
+WIKIPEDIA_MAX_EXTRACTS_PER_QUERY = 20
+WIKIPEDIA_THUMBNAIL_SIZE = 320
+# Concurrent summary lookups arriving within this window share one query request.
+WIKIPEDIA_SUMMARY_BATCH_WINDOW_SECONDS = max(0.0, get_env_float("WIKIPEDIA_SUMMARY_BATCH_WINDOW_SECONDS", 0.02))
+WIKIPEDIA_EXTRACT_CACHE_MAX_ENTRIES = max(1, get_env_int("WIKIPEDIA_EXTRACT_CACHE_MAX_ENTRIES", 2048))
+# Cached extracts are trusted this long before their page revision is checked again.
+WIKIPEDIA_REVISION_CHECK_SECONDS = max(0.0, get_env_float("WIKIPEDIA_REVISION_CHECK_SECONDS", 10 * 60))
+
 
 class WikipediaClientError(RuntimeError):
     pass
@@ -16,18 +32,35 @@ class WikipediaNotFoundError(WikipediaClientError):
     pass
 
 
+@dataclass(frozen=True)
+class _CachedExtract:
+    summary: WikipediaPageSummary
+    checked_at: float
+
+
 class WikipediaClient:
     def __init__(
         self,
         base_url: str = "https://en.wikipedia.org",
         timeout_s: float = 20.0,
         ttl: timedelta = DEFAULT_TTL,
+        extract_cache_max_entries: int = WIKIPEDIA_EXTRACT_CACHE_MAX_ENTRIES,
     ):
         self.base_url = base_url.rstrip("/")
         self._http = HttpClient(
             timeout_s=timeout_s,
-            
             ttl=ttl,
+            circuit_breaker_key="wikipedia",
+            circuit_breaker_policy=DEFAULT_CIRCUIT_BREAKER_POLICY,
+            hedge_requests=True,
+        )
+        self._extracts: OrderedDict[tuple[str, int], _CachedExtract] = OrderedDict()
+        self._extract_cache_max_entries = max(1, extract_cache_max_entries)
+        self._extract_lock = Lock()
+        self._summary_batcher: RequestCoalescer[tuple[str, int], WikipediaPageSummary] = RequestCoalescer(
+            self._fetch_summaries,
+            window_seconds=WIKIPEDIA_SUMMARY_BATCH_WINDOW_SECONDS,
+            max_batch_size=WIKIPEDIA_MAX_TITLES_PER_QUERY,
         )
 
     @property
@@ -73,6 +106,153 @@ class WikipediaClient:
             results.append(WikipediaSearchResult(title=title, description=description if isinstance(description, str) else "", url=url))
         return results
 
+    def _query_pages(self, titles: list[str], params: dict[str, Any], chunk_size: int) -> dict[str, dict[str, Any]]:
+        """Pages for `titles` keyed by the requested title, following title normalization and redirects."""
+        pages_by_title: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(titles), chunk_size):
+            chunk = titles[start : start + chunk_size]
+            payload = self._get_json(
+                {
+                    "action": "query",
+                    "redirects": 1,
+                    "titles": "|".join(chunk),
+                    "format": "json",
+                    **params,
+                }
+            )
+            if not isinstance(payload, dict):
+                raise WikipediaClientError("Malformed Wikipedia query response.")
+            query_payload = payload.get("query")
+            pages = query_payload.get("pages") if isinstance(query_payload, dict) else None
+            if not isinstance(pages, dict) or not pages:
+                raise WikipediaClientError("Malformed Wikipedia query response: missing pages.")
+
+            renames: dict[str, str] = {}
+            for key in ("normalized", "redirects"):
+                for rename in query_payload.get(key) or []:
+                    if isinstance(rename, dict) and isinstance(rename.get("from"), str) and isinstance(rename.get("to"), str):
+                        renames[rename["from"]] = rename["to"]
+            pages_by_resolved_title = {
+                page["title"]: page
+                for page in pages.values()
+                if isinstance(page, dict) and isinstance(page.get("title"), str) and "missing" not in page and "invalid" not in page
+            }
+            for title in chunk:
+                resolved = title
+                # Normalization ("foo bar" -> "Foo bar") comes before redirects, and each applies at most once.
+                for _ in range(2):
+                    resolved = renames.get(resolved, resolved)
+                page = pages_by_resolved_title.get(resolved)
+                if page is not None:
+                    pages_by_title[title] = page
+        return pages_by_title
+
+    def _page_summary(self, page: dict[str, Any]) -> WikipediaPageSummary:
+        resolved_title = str(page.get("title") or "")
+        page_id = page.get("pageid")
+        revision_id = page.get("lastrevid")
+        url = page.get("canonicalurl") or page.get("fullurl")
+        if not isinstance(url, str) or not url.strip():
+            page_slug = quote(resolved_title.replace(" ", "_"), safe="()")
+            url = f"{self.base_url}/wiki/{page_slug}"
+        thumbnail = page.get("thumbnail")
+        thumbnail_url = thumbnail.get("source") if isinstance(thumbnail, dict) else None
+        return WikipediaPageSummary(
+            title=resolved_title,
+            summary=str(page.get("extract") or "").strip(),
+            url=url,
+            page_id=int(page_id) if isinstance(page_id, int) else None,
+            revision_id=int(revision_id) if isinstance(revision_id, int) else None,
+            thumbnail_url=thumbnail_url if isinstance(thumbnail_url, str) else None,
+        )
+
+    def _cached_summary(self, key: tuple[str, int]) -> _CachedExtract | None:
+        with self._extract_lock:
+            entry = self._extracts.get(key)
+            if entry is not None:
+                self._extracts.move_to_end(key)
+            return entry
+
+    def _cache_summary(self, key: tuple[str, int], summary: WikipediaPageSummary) -> None:
+        with self._extract_lock:
+            self._extracts[key] = _CachedExtract(summary=summary, checked_at=monotonic())
+            self._extracts.move_to_end(key)
+            while len(self._extracts) > self._extract_cache_max_entries:
+                self._extracts.popitem(last=False)
+
+    def get_page_summaries(self, titles: list[str], sentences: int = 2) -> dict[str, WikipediaPageSummary]:
+        """Intro summaries for several pages, keyed by the requested title; missing pages are omitted.
+
+        Extracts are cached per page revision. A cached extract is served as-is for a short while,
+        then revalidated with one `prop=info` request per 50 titles and only re-extracted when the
+        page has a newer revision.
+        """
+        if sentences < 1:
+            raise ValueError("Sentences must be at least 1.")
+        requested = list(dict.fromkeys(title.strip() for title in titles if title and title.strip()))
+        summaries: dict[str, WikipediaPageSummary] = {}
+        to_revalidate: dict[str, WikipediaPageSummary] = {}
+        now = monotonic()
+        for title in requested:
+            entry = self._cached_summary((title, sentences))
+            if entry is None:
+                continue
+            if now - entry.checked_at < WIKIPEDIA_REVISION_CHECK_SECONDS:
+                summaries[title] = entry.summary
+            else:
+                to_revalidate[title] = entry.summary
+
+        if to_revalidate:
+            pages = self._query_pages(list(to_revalidate), {"prop": "info"}, WIKIPEDIA_MAX_TITLES_PER_QUERY)
+            for title, cached in to_revalidate.items():
+                page = pages.get(title)
+                if page is not None and cached.revision_id is not None and page.get("lastrevid") == cached.revision_id:
+                    summaries[title] = cached
+                    self._cache_summary((title, sentences), cached)
+
+        to_fetch = [title for title in requested if title not in summaries]
+        if to_fetch:
+            pages = self._query_pages(
+                to_fetch,
+                {
+                    "prop": "extracts|pageimages|info",
+                    "exintro": 1,
+                    "explaintext": 1,
+                    "exsentences": sentences,
+                    "exlimit": "max",
+                    "inprop": "url",
+                    "piprop": "thumbnail",
+                    "pithumbsize": WIKIPEDIA_THUMBNAIL_SIZE,
+                },
+                WIKIPEDIA_MAX_EXTRACTS_PER_QUERY,
+            )
+            for title in to_fetch:
+                page = pages.get(title)
+                if page is None:
+                    continue
+                summary = self._page_summary(page)
+                summaries[title] = summary
+                self._cache_summary((title, sentences), summary)
+        return {title: summaries[title] for title in requested if title in summaries}
+
+    def _fetch_summaries(self, keys: list[tuple[str, int]]) -> dict[tuple[str, int], WikipediaPageSummary]:
+        titles_by_sentences: dict[int, list[str]] = {}
+        for title, sentences in keys:
+            titles_by_sentences.setdefault(sentences, []).append(title)
+        summaries: dict[tuple[str, int], WikipediaPageSummary] = {}
+        for sentences, titles in titles_by_sentences.items():
+            for title, summary in self.get_page_summaries(titles, sentences=sentences).items():
+                summaries[(title, sentences)] = summary
+        return summaries
+
+    def get_page_summaries_coalesced(self, titles: list[str], sentences: int = 2) -> dict[str, WikipediaPageSummary]:
+        """Like `get_page_summaries`, but shares one request with concurrent callers, e.g. parallel plan steps."""
+        if sentences < 1:
+            raise ValueError("Sentences must be at least 1.")
+        requested = list(dict.fromkeys(title.strip() for title in titles if title and title.strip()))
+        summaries = self._summary_batcher.get_many([(title, sentences) for title in requested])
+        return {title: summaries[(title, sentences)] for title in requested if (title, sentences) in summaries}
+
     def get_page_summary(self, title: str, sentences: int = 2) -> WikipediaPageSummary:
         title_norm = (title or "").strip()
         if not title_norm:
@@ -80,40 +260,7 @@ class WikipediaClient:
         if sentences < 1:
             raise ValueError("Sentences must be at least 1.")
 
-        payload = self._get_json(
-            {
-                "action": "query",
-                "prop": "extracts|info",
-                "exintro": 1,
-                "explaintext": 1,
-                "exsentences": sentences,
-                "inprop": "url",
-                "redirects": 1,
-                "titles": title_norm,
-                "format": "json",
-            }
-        )
-        if not isinstance(payload, dict):
-            raise WikipediaClientError("Malformed Wikipedia summary response.")
-
-        query_payload = payload.get("query")
-        pages = query_payload.get("pages") if isinstance(query_payload, dict) else None
-        if not isinstance(pages, dict) or not pages:
-            raise WikipediaClientError("Malformed Wikipedia summary response: missing pages.")
-
-        first_page = next(iter(pages.values()))
-        if not isinstance(first_page, dict):
-            raise WikipediaClientError("Malformed Wikipedia summary response: page is not an object.")
-        if "missing" in first_page:
+        summary = self._summary_batcher.get((title_norm, sentences))
+        if summary is None:
             raise WikipediaNotFoundError(f"No page found for title '{title_norm}'.")
-
-        resolved_title = str(first_page.get("title") or title_norm)
-        summary = str(first_page.get("extract") or "").strip()
-        page_id = first_page.get("pageid")
-        page_id_value = int(page_id) if isinstance(page_id, int) else None
-        url = first_page.get("canonicalurl") or first_page.get("fullurl")
-        if not isinstance(url, str) or not url.strip():
-            page_slug = quote(resolved_title.replace(" ", "_"), safe="()")
-            url = f"{self.base_url}/wiki/{page_slug}"
-
-        return WikipediaPageSummary(title=resolved_title, summary=summary, url=url, page_id=page_id_value)
+        return summary
@@ -16,3 +16,5 @@ class WikipediaPageSummary(BaseModel):
     summary: str = ""
     url: str
     page_id: Optional[int] = None
+    revision_id: Optional[int] = None
+    thumbnail_url: Optional[str] = None
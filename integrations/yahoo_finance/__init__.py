@@ -1,3 +1,12 @@
+from integrations.yahoo_finance.client import YahooFinanceClient, YahooFinanceError, get_yahoo_finance_client
 from integrations.yahoo_finance.constants import YAHOO_FINANCE_QUOTE_URL_TEMPLATE
+from integrations.yahoo_finance.models import StockCloseHistory, StockQuote
 
-__all__ = ["YAHOO_FINANCE_QUOTE_URL_TEMPLATE"]
+__all__ = [
+    "StockCloseHistory",
+    "StockQuote",
+    "YAHOO_FINANCE_QUOTE_URL_TEMPLATE",
+    "YahooFinanceClient",
+    "YahooFinanceError",
+    "get_yahoo_finance_client",
+]
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable
+
+import numpy as np
+import yfinance as yf
+
+from common.config import get_env_float, get_env_int
+from common.utils.batching import RequestCoalescer
+from integrations.yahoo_finance.market_hours import quote_ttl_seconds
+from integrations.yahoo_finance.models import StockCloseHistory, StockQuote
+from integrations.yahoo_finance.ohlc_store import OHLC_FIELDS, OhlcStore, get_ohlc_store
+
+# Concurrent single-ticker lookups arriving within this window share one download call.
+STOCK_QUOTE_BATCH_WINDOW_SECONDS = max(0.0, get_env_float("STOCK_QUOTE_BATCH_WINDOW_SECONDS", 0.05))
+STOCK_QUOTE_MAX_BATCH_SIZE = max(1, get_env_int("STOCK_QUOTE_MAX_BATCH_SIZE", 50))
+# Share counts move on corporate actions, not intraday; market cap is derived from them and the quote.
+STOCK_SHARES_TTL_SECONDS = max(0.0, get_env_float("STOCK_SHARES_TTL_SECONDS", 24 * 60 * 60))
+STOCK_MAX_TICKERS = 25
+_DOWNLOAD_FIELDS = ("Open", "High", "Low", "Close", "Volume")
+_SHARES_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="yfinance-shares")
+
+
+class YahooFinanceError(RuntimeError):
+    pass
+
+
+def normalize_tickers(tickers: list[str]) -> list[str]:
+    normalized = list(dict.fromkeys(ticker.strip().upper() for ticker in tickers if ticker and ticker.strip()))
+    if not normalized:
+        raise YahooFinanceError("At least one ticker symbol is required.")
+    if len(normalized) > STOCK_MAX_TICKERS:
+        raise YahooFinanceError(f"At most {STOCK_MAX_TICKERS} tickers can be requested at once.")
+    return normalized
+
+
+def _to_float(value: Any) -> float | None:
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if np.isnan(result) else result
+
+
+def _ticker_frame(frame: Any, ticker: str) -> Any | None:
+    """The per-ticker OHLC columns of a `yf.download(..., group_by="ticker")` frame."""
+    if frame is None or getattr(frame, "empty", True):
+        return None
+    columns = frame.columns
+    if getattr(columns, "nlevels", 1) > 1:
+        if ticker in columns.get_level_values(0):
+            frame = frame[ticker]
+        elif ticker in columns.get_level_values(1):
+            frame = frame.xs(ticker, axis=1, level=1)
+        else:
+            return None
+    if "Close" not in frame.columns:
+        return None
+    frame = frame.dropna(subset=["Close"])
+    return None if frame.empty else frame
+
+
+def _frame_arrays(frame: Any) -> tuple[np.ndarray, np.ndarray]:
+    dates = np.array([index.date().isoformat() for index in frame.index], dtype="datetime64[D]")
+    values = np.column_stack(
+        [frame[field].to_numpy(dtype=np.float64) if field in frame.columns else np.full(len(frame), np.nan) for field in _DOWNLOAD_FIELDS]
+    )
+    return dates, values
+
+
+class QuoteBatcher(RequestCoalescer[str, StockQuote]):
+    """Coalesces concurrent single-ticker lookups into one batched quote download."""
+
+    def __init__(
+        self,
+        fetch: Callable[[list[str]], dict[str, StockQuote]],
+        *,
+        window_seconds: float = STOCK_QUOTE_BATCH_WINDOW_SECONDS,
+        max_batch_size: int = STOCK_QUOTE_MAX_BATCH_SIZE,
+    ) -> None:
+        super().__init__(fetch, window_seconds=window_seconds, max_batch_size=max_batch_size)
+
+
+class YahooFinanceClient:
+    def __init__(self, ohlc_store: OhlcStore | None = None) -> None:
+        self._ohlc_store = ohlc_store
+        self._quotes: dict[str, tuple[StockQuote, float]] = {}
+        self._shares: dict[str, tuple[float | None, float]] = {}
+        self._cache_lock = Lock()
+        self._batcher = QuoteBatcher(self._fetch_quotes)
+
+    def _store(self) -> OhlcStore:
+        return self._ohlc_store if self._ohlc_store is not None else get_ohlc_store()
+
+    def _download(self, tickers: list[str], **kwargs: Any) -> Any:
+        try:
+            return yf.download(
+                tickers,
+                group_by="ticker",
+                auto_adjust=False,
+                progress=False,
+                threads=True,
+                **kwargs,
+            )
+        except Exception as exc:
+            raise YahooFinanceError(f"Could not download market data for {', '.join(tickers)}: {exc}") from exc
+
+    def _shares_outstanding(self, tickers: list[str]) -> dict[str, float | None]:
+        now = monotonic()
+        with self._cache_lock:
+            shares = {ticker: entry[0] for ticker, entry in self._shares.items() if ticker in tickers and entry[1] > now}
+        missing = [ticker for ticker in tickers if ticker not in shares]
+
+        def lookup(ticker: str) -> float | None:
+            try:
+                return _to_float(yf.Ticker(ticker).fast_info.shares)
+            except Exception:
+                return None
+
+        for ticker, value in zip(missing, _SHARES_EXECUTOR.map(lookup, missing)):
+            shares[ticker] = value
+            with self._cache_lock:
+                self._shares[ticker] = (value, monotonic() + STOCK_SHARES_TTL_SECONDS)
+        return shares
+
+    def _fetch_quotes(self, tickers: list[str]) -> dict[str, StockQuote]:
+        # Five sessions always include the previous close, even after a long weekend.
+        frame = self._download(tickers, period="5d", interval="1d")
+        shares = self._shares_outstanding(tickers)
+        today = datetime.now(timezone.utc).date()
+        quotes: dict[str, StockQuote] = {}
+        for ticker in tickers:
+            ticker_frame = _ticker_frame(frame, ticker)
+            if ticker_frame is None:
+                continue
+            dates, values = _frame_arrays(ticker_frame)
+            closes = values[:, OHLC_FIELDS.index("close")]
+            current_price = _to_float(closes[-1])
+            ticker_shares = shares.get(ticker)
+            quotes[ticker] = StockQuote(
+                ticker=ticker,
+                current_price=current_price,
+                previous_close=_to_float(closes[-2]) if len(closes) >= 2 else None,
+                day_high=_to_float(values[-1, OHLC_FIELDS.index("high")]),
+                day_low=_to_float(values[-1, OHLC_FIELDS.index("low")]),
+                market_cap=None if current_price is None or ticker_shares is None else round(current_price * ticker_shares, 0),
+                as_of=str(dates[-1]),
+            )
+            completed = dates < np.datetime64(today.isoformat(), "D")
+            if completed.any():
+                # Adjacent completed bars also feed the OHLC store's coverage when it already reaches them.
+                self._merge_adjacent_bars(ticker, dates[completed], values[completed])
+        with self._cache_lock:
+            for ticker, quote in quotes.items():
+                self._quotes[ticker] = (quote, monotonic() + quote_ttl_seconds(ticker))
+        return quotes
+
+    def _merge_adjacent_bars(self, ticker: str, dates: np.ndarray, values: np.ndarray) -> None:
+        store = self._store()
+        series = store.get(ticker)
+        if series is None:
+            return
+        first_day = dates[0].astype(date)
+        if first_day > series.covered_through + timedelta(days=1):
+            return
+        store.merge(ticker, dates, values, covered_from=first_day, covered_through=dates[-1].astype(date))
+
+    def _cached_quote(self, ticker: str) -> StockQuote | None:
+        with self._cache_lock:
+            entry = self._quotes.get(ticker)
+        if entry is None or entry[1] <= monotonic():
+            return None
+        return entry[0]
+
+    def get_quote(self, ticker: str) -> StockQuote | None:
+        """One ticker's quote; concurrent callers are batched into a single download."""
+        normalized = normalize_tickers([ticker])[0]
+        return self._cached_quote(normalized) or self._batcher.get(normalized)
+
+    def get_quotes(self, tickers: list[str]) -> dict[str, StockQuote]:
+        normalized = normalize_tickers(tickers)
+        quotes = {ticker: quote for ticker in normalized if (quote := self._cached_quote(ticker)) is not None}
+        missing = [ticker for ticker in normalized if ticker not in quotes]
+        if missing:
+            quotes.update(self._fetch_quotes(missing))
+        return {ticker: quotes[ticker] for ticker in normalized if ticker in quotes}
+
+    def get_close_history(self, tickers: list[str], start: date, end: date | None = None) -> dict[str, StockCloseHistory]:
+        """Daily closes from the local OHLC store, downloading only the ranges it has not covered."""
+        normalized = normalize_tickers(tickers)
+        # Today's bar is still moving, so the store only ever holds completed sessions.
+        last_completed = datetime.now(timezone.utc).date() - timedelta(days=1)
+        resolved_end = min(end or last_completed, last_completed)
+        if start > resolved_end:
+            raise YahooFinanceError("The history start date must be before today.")
+
+        store = self._store()
+        missing_by_range: dict[tuple[date, date], list[str]] = {}
+        for ticker in normalized:
+            for missing_range in store.missing_ranges(ticker, start, resolved_end):
+                missing_by_range.setdefault(missing_range, []).append(ticker)
+        for (range_start, range_end), range_tickers in missing_by_range.items():
+            frame = self._download(
+                range_tickers,
+                start=range_start.isoformat(),
+                end=(range_end + timedelta(days=1)).isoformat(),
+                interval="1d",
+            )
+            for ticker in range_tickers:
+                ticker_frame = _ticker_frame(frame, ticker)
+                dates, values = (
+                    _frame_arrays(ticker_frame)
+                    if ticker_frame is not None
+                    else (np.empty(0, dtype="datetime64[D]"), np.empty((0, len(OHLC_FIELDS))))
+                )
+                store.merge(ticker, dates, values, covered_from=range_start, covered_through=range_end)
+
+        histories: dict[str, StockCloseHistory] = {}
+        for ticker in normalized:
+            series = store.get(ticker)
+            if series is None:
+                continue
+            window = series.between(start, resolved_end)
+            histories[ticker] = StockCloseHistory(
+                ticker=ticker,
+                dates=[str(day) for day in window.dates],
+                closes=[_to_float(value) for value in window.column("close")],
+            )
+        return histories
+
+
+_YAHOO_FINANCE_CLIENT: YahooFinanceClient | None = None
+_YAHOO_FINANCE_CLIENT_LOCK = Lock()
+
+
+def get_yahoo_finance_client() -> YahooFinanceClient:
+    """Shared client, so every finance tool batches into and reads from the same quote cache."""
+    global _YAHOO_FINANCE_CLIENT
+    with _YAHOO_FINANCE_CLIENT_LOCK:
+        if _YAHOO_FINANCE_CLIENT is None:
+            _YAHOO_FINANCE_CLIENT = YahooFinanceClient()
+        return _YAHOO_FINANCE_CLIENT
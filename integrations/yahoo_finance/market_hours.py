@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from common.config import get_env_float
+
+US_MARKET_TIMEZONE = ZoneInfo("America/New_York")
+US_MARKET_OPEN = time(9, 30)
+US_MARKET_CLOSE = time(16, 0)
+STOCK_QUOTE_TTL_OPEN_SECONDS = max(0.0, get_env_float("STOCK_QUOTE_TTL_OPEN_SECONDS", 60))
+# Outside the session a quote only moves again at the next open; this caps how long that is trusted.
+STOCK_QUOTE_TTL_CLOSED_MAX_SECONDS = max(0.0, get_env_float("STOCK_QUOTE_TTL_CLOSED_MAX_SECONDS", 6 * 60 * 60))
+
+
+def is_us_market_open(now: datetime | None = None) -> bool:
+    """Regular NYSE/Nasdaq session check; exchange holidays are treated as trading days."""
+    local = (now or datetime.now(timezone.utc)).astimezone(US_MARKET_TIMEZONE)
+    return local.weekday() < 5 and US_MARKET_OPEN <= local.time() < US_MARKET_CLOSE
+
+
+def seconds_until_us_market_open(now: datetime | None = None) -> float:
+    local = (now or datetime.now(timezone.utc)).astimezone(US_MARKET_TIMEZONE)
+    candidate = local.replace(hour=US_MARKET_OPEN.hour, minute=US_MARKET_OPEN.minute, second=0, microsecond=0)
+    if candidate <= local:
+        candidate += timedelta(days=1)
+    while candidate.weekday() >= 5:
+        candidate += timedelta(days=1)
+    return max(0.0, (candidate - local).total_seconds())
+
+
+def trades_on_us_session(ticker: str) -> bool:
+    """Futures (GC=F), FX (EURUSD=X), indices (^GSPC) and non-US listings (7203.T) keep other hours."""
+    return not any(marker in ticker for marker in ("=", "^", "."))
+
+
+def quote_ttl_seconds(ticker: str, now: datetime | None = None) -> float:
+    if not trades_on_us_session(ticker) or is_us_market_open(now):
+        return STOCK_QUOTE_TTL_OPEN_SECONDS
+    return min(STOCK_QUOTE_TTL_CLOSED_MAX_SECONDS, max(STOCK_QUOTE_TTL_OPEN_SECONDS, seconds_until_us_market_open(now)))
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class StockQuote(BaseModel):
+    ticker: str
+    current_price: Optional[float] = None
+    previous_close: Optional[float] = None
+    day_high: Optional[float] = None
+    day_low: Optional[float] = None
+    market_cap: Optional[float] = None
+    as_of: Optional[str] = None
+
+
+class StockCloseHistory(BaseModel):
+    ticker: str
+    dates: list[str] = []
+    closes: list[Optional[float]] = []
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from threading import Lock
+
+import numpy as np
+
+from common.config import get_env_bool
+
+YAHOO_FINANCE_OHLC_STORE_PATH = Path(os.getenv("YAHOO_FINANCE_OHLC_STORE_PATH", "data/yahoo_finance/ohlc"))
+YAHOO_FINANCE_OHLC_STORE_ENABLED = get_env_bool("YAHOO_FINANCE_OHLC_STORE_ENABLED", True)
+OHLC_FIELDS = ("open", "high", "low", "close", "volume")
+_UNSAFE_FILENAME_CHARACTERS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def _to_day(value: date) -> np.datetime64:
+    return np.datetime64(value.isoformat(), "D")
+
+
+@dataclass
+class OhlcSeries:
+    """Daily bars for one ticker; `values` columns follow OHLC_FIELDS and gaps are NaN.
+
+    `covered_from`/`covered_through` is the calendar range already fetched, which can extend
+    past the first and last bar over weekends and holidays.
+    """
+
+    dates: np.ndarray
+    values: np.ndarray
+    covered_from: date
+    covered_through: date
+
+    def between(self, start: date, end: date) -> "OhlcSeries":
+        start_row = int(np.searchsorted(self.dates, _to_day(start), side="left"))
+        end_row = int(np.searchsorted(self.dates, _to_day(end), side="right"))
+        return OhlcSeries(
+            dates=self.dates[start_row:end_row],
+            values=self.values[start_row:end_row],
+            covered_from=max(start, self.covered_from),
+            covered_through=min(end, self.covered_through),
+        )
+
+    def column(self, field_name: str) -> np.ndarray:
+        return self.values[:, OHLC_FIELDS.index(field_name)]
+
+
+class OhlcStore:
+    """Per-ticker columnar store of completed daily bars, one compressed npz file per ticker.
+
+    Completed sessions never change, so stored bars are never rewritten; a request that reaches
+    past either end of the stored range only adds the missing dates.
+    """
+
+    def __init__(self, root: Path | None = None) -> None:
+        self._root = root
+        self._series: dict[str, OhlcSeries] = {}
+        self._lock = Lock()
+
+    def _path(self, ticker: str) -> Path | None:
+        if self._root is None:
+            return None
+        return self._root / f"{_UNSAFE_FILENAME_CHARACTERS.sub('_', ticker)}.npz"
+
+    def get(self, ticker: str) -> OhlcSeries | None:
+        with self._lock:
+            series = self._series.get(ticker)
+            if series is not None:
+                return series
+            path = self._path(ticker)
+            if path is None or not path.exists():
+                return None
+            try:
+                with np.load(path, allow_pickle=False) as payload:
+                    series = OhlcSeries(
+                        dates=payload["dates"].astype("datetime64[D]"),
+                        values=payload["values"].astype(np.float64),
+                        covered_from=payload["coverage"][0].astype(date),
+                        covered_through=payload["coverage"][1].astype(date),
+                    )
+            except (OSError, ValueError, KeyError):
+                return None
+            self._series[ticker] = series
+            return series
+
+    def _save(self, ticker: str, series: OhlcSeries) -> None:
+        path = self._path(ticker)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=path.parent, suffix=".tmp", delete=False) as handle:
+            temp_path = Path(handle.name)
+            np.savez_compressed(
+                handle,
+                dates=series.dates,
+                values=series.values,
+                coverage=np.array([_to_day(series.covered_from), _to_day(series.covered_through)]),
+            )
+        os.replace(temp_path, path)
+
+    def missing_ranges(self, ticker: str, start: date, end: date) -> list[tuple[date, date]]:
+        """Calendar ranges within [start, end] that have not been fetched for `ticker` yet."""
+        series = self.get(ticker)
+        if series is None:
+            return [(start, end)]
+        ranges: list[tuple[date, date]] = []
+        if start < series.covered_from:
+            ranges.append((start, min(end, series.covered_from - timedelta(days=1))))
+        if end > series.covered_through:
+            ranges.append((max(start, series.covered_through + timedelta(days=1)), end))
+        return ranges
+
+    def merge(self, ticker: str, dates: np.ndarray, values: np.ndarray, *, covered_from: date, covered_through: date) -> int:
+        """Record a fetched range adjacent to (or overlapping) the stored one.
+
+        Only bars for dates not stored yet are inserted; stored bars are kept as they are.
+        """
+        order = np.argsort(dates)
+        dates, values = dates[order].astype("datetime64[D]"), values[order].reshape(len(dates), len(OHLC_FIELDS))
+        existing = self.get(ticker)
+        with self._lock:
+            existing = self._series.get(ticker, existing)
+            if existing is None:
+                merged = OhlcSeries(dates=dates, values=values, covered_from=covered_from, covered_through=covered_through)
+                added = len(dates)
+            else:
+                is_new = ~np.isin(dates, existing.dates)
+                added = int(is_new.sum())
+                all_dates = np.concatenate([existing.dates, dates[is_new]])
+                all_values = np.vstack([existing.values, values[is_new]])
+                merge_order = np.argsort(all_dates, kind="stable")
+                merged = OhlcSeries(
+                    dates=all_dates[merge_order],
+                    values=all_values[merge_order],
+                    covered_from=min(existing.covered_from, covered_from),
+                    covered_through=max(existing.covered_through, covered_through),
+                )
+            self._series[ticker] = merged
+        self._save(ticker, merged)
+        return added
+
+
+_OHLC_STORE: OhlcStore | None = None
+_OHLC_STORE_LOCK = Lock()
+
+
+def get_ohlc_store(root: Path = YAHOO_FINANCE_OHLC_STORE_PATH) -> OhlcStore:
+    """The process-wide store; kept in memory only when the on-disk store is disabled."""
+    global _OHLC_STORE
+    with _OHLC_STORE_LOCK:
+        if _OHLC_STORE is None:
+            _OHLC_STORE = OhlcStore(root if YAHOO_FINANCE_OHLC_STORE_ENABLED else None)
+        return _OHLC_STORE
@@ -0,0 +1,19 @@
+from common.config import get_env_bool, get_env_float, get_env_int
+
+JOB_TYPE_CONVERSATION_SUMMARY = "conversation_summary"
+JOB_TYPE_CONVERSATION_TITLE = "conversation_title"
+JOB_TYPE_TOOL_CALL_SUMMARY = "tool_call_summary"
+JOB_TYPE_ROUNDTRIP_EMBEDDING = "roundtrip_embedding"
+JOB_TYPE_EMBEDDING_MIGRATION = "embedding_migration"
+
+JOB_MAX_ATTEMPTS = max(1, get_env_int("JOB_MAX_ATTEMPTS", 5))
+# Failed attempts wait base * 2^(attempt - 1) seconds, capped, before they become claimable again.
+JOB_RETRY_BASE_SECONDS = max(0.0, get_env_float("JOB_RETRY_BASE_SECONDS", 5.0))
+JOB_RETRY_MAX_SECONDS = max(0.0, get_env_float("JOB_RETRY_MAX_SECONDS", 600.0))
+JOB_WORKER_POLL_SECONDS = max(0.05, get_env_float("JOB_WORKER_POLL_SECONDS", 1.0))
+# Running jobs whose worker has not finished within the lease are assumed lost and requeued.
+JOB_LEASE_SECONDS = max(1.0, get_env_float("JOB_LEASE_SECONDS", 600.0))
+JOB_MAINTENANCE_INTERVAL_SECONDS = max(1.0, get_env_float("JOB_MAINTENANCE_INTERVAL_SECONDS", 60.0))
+JOB_RETENTION_DAYS = max(0, get_env_int("JOB_RETENTION_DAYS", 7))
+# Run a worker thread inside the Streamlit process; disable when running scripts/run_job_worker.py instead.
+JOB_WORKER_IN_PROCESS = get_env_bool("JOB_WORKER_IN_PROCESS", True)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from typing import Callable, Sequence
+
+from common.config import get_env_float, get_env_int
+from common.http import RateLimitPolicy, RateLimiter, get_rate_limiter
+from db.embedding_migration import (
+    EmbeddingMigrationRepository,
+    embedding_version_dimensions,
+    embedding_version_model,
+    get_embedding_migration_repo,
+)
+from db.vector import EmbeddingColumn
+from llm.clients.embeddings import embed_texts
+
+EMBEDDING_MIGRATION_BATCH_SIZE = max(1, get_env_int("EMBEDDING_MIGRATION_BATCH_SIZE", 100))
+# A queued run embeds this many batches, then re-queues itself so other jobs get a turn.
+EMBEDDING_MIGRATION_BATCHES_PER_JOB = max(1, get_env_int("EMBEDDING_MIGRATION_BATCHES_PER_JOB", 20))
+# Embedding requests (one per batch) shared by every worker re-embedding; live traffic is not counted.
+EMBEDDING_MIGRATION_RATE_LIMIT_KEY = "embedding_migration"
+EMBEDDING_MIGRATION_RATE_LIMIT_POLICY = RateLimitPolicy(
+    max_requests=max(1, get_env_int("EMBEDDING_MIGRATION_RATE_LIMIT_MAX_REQUESTS", 60)),
+    window_seconds=max(0.0, get_env_float("EMBEDDING_MIGRATION_RATE_LIMIT_WINDOW_SECONDS", 60.0)),
+)
+
+EmbedFn = Callable[..., list[list[float]]]
+
+
+class EmbeddingMigrationRunner:
+    """Re-embeds one column batch by batch from the checkpoint stored in `embedding_migration`.
+
+    Rows are visited in primary-key order. Once the pass reaches the end it starts one more sweep
+    from the beginning, because rows edited meanwhile had their new-model vector cleared; the run is
+    finished when a sweep from the start finds nothing left to embed. Without a run in progress it
+    repairs the active slot instead, re-embedding rows whose vector was cleared or is stale.
+    """
+
+    def __init__(
+        self,
+        column: EmbeddingColumn,
+        *,
+        repository: EmbeddingMigrationRepository | None = None,
+        embed: EmbedFn = embed_texts,
+        rate_limiter: RateLimiter | None = None,
+        batch_size: int = EMBEDDING_MIGRATION_BATCH_SIZE,
+    ) -> None:
+        self.column = column
+        self._repository = repository or get_embedding_migration_repo()
+        self._embed = embed
+        self._rate_limiter = rate_limiter or get_rate_limiter()
+        self._batch_size = max(1, batch_size)
+
+    def run_batch(self) -> int | None:
+        """Embed the next batch; returns the rows written, or None when nothing is left."""
+        state = self._repository.get_state(self.column)
+        if state is None:
+            return None
+        rows = self._repository.pending_rows(self.column, state, limit=self._batch_size)
+        if not rows:
+            if state.checkpoint is None:
+                return None
+            self._repository.restart_sweep(self.column)
+            return 0
+        self._rate_limiter.acquire(EMBEDDING_MIGRATION_RATE_LIMIT_KEY, EMBEDDING_MIGRATION_RATE_LIMIT_POLICY)
+        embeddings: Sequence[Sequence[float]] = self._embed(
+            [source_text for _, source_text in rows],
+            model=embedding_version_model(state.fill_model),
+            dimensions=embedding_version_dimensions(state.fill_model),
+        )
+        return self._repository.store_embeddings(self.column, state, rows, embeddings)
+
+    def run(self, max_batches: int | None = None) -> bool:
+        """Run batches until the column is done or `max_batches` ran; returns whether it is done."""
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            if self.run_batch() is None:
+                return True
+            batches += 1
+        return False
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Any
+from uuid import UUID
+
+from jobs.constants import (
+    JOB_TYPE_CONVERSATION_SUMMARY,
+    JOB_TYPE_CONVERSATION_TITLE,
+    JOB_TYPE_EMBEDDING_MIGRATION,
+    JOB_TYPE_ROUNDTRIP_EMBEDDING,
+    JOB_TYPE_TOOL_CALL_SUMMARY,
+)
+from jobs.repository.job_repository import get_job_repository
+
+
+def _enqueue(job_type: str, job_key: str, payload: dict[str, Any]) -> bool:
+    # Follow-up work must never fail the turn that queued it.
+    try:
+        get_job_repository().enqueue(job_type, job_key, payload)
+    except Exception:
+        return False
+    return True
+
+
+def enqueue_conversation_summary(conversation_id: str | UUID) -> bool:
+    """Queue a summary rebuild; rebuilds requested while one is queued collapse into it."""
+    return _enqueue(JOB_TYPE_CONVERSATION_SUMMARY, str(conversation_id), {"conversation_id": str(conversation_id)})
+
+
+def enqueue_conversation_title(conversation_id: str | UUID, prompt: str) -> bool:
+    return _enqueue(
+        JOB_TYPE_CONVERSATION_TITLE,
+        str(conversation_id),
+        {"conversation_id": str(conversation_id), "prompt": prompt},
+    )
+
+
+def enqueue_tool_call_summaries(roundtrip_id: str | UUID) -> bool:
+    return _enqueue(JOB_TYPE_TOOL_CALL_SUMMARY, str(roundtrip_id), {"roundtrip_id": str(roundtrip_id)})
+
+
+def enqueue_roundtrip_embedding(roundtrip_id: str | UUID) -> bool:
+    return _enqueue(JOB_TYPE_ROUNDTRIP_EMBEDDING, str(roundtrip_id), {"roundtrip_id": str(roundtrip_id)})
+
+
+def enqueue_embedding_migration(column_key: str, *, switch_slots: bool = False) -> bool:
+    """Queue (or continue) re-embedding one `table.column`; with `switch_slots` it goes live when done."""
+    return _enqueue(
+        JOB_TYPE_EMBEDDING_MIGRATION,
+        column_key,
+        {"column": column_key, "switch_slots": switch_slots},
+    )
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+from uuid import UUID
+
+from common.config import SUMMARY_BATCH_SIZE, SUMMARY_TRIGGER_SIZE
+from conversation.conversation import generate_conversation_title
+from conversation.models.conversation_models import RoundtripProjection
+from conversation.repository.repo_factory import get_conversation_repo
+from conversation.summary_service import rebuild_conversation_summaries
+from db.embedding_migration import get_embedding_column, get_embedding_migration_repo
+from jobs.constants import (
+    JOB_TYPE_CONVERSATION_SUMMARY,
+    JOB_TYPE_CONVERSATION_TITLE,
+    JOB_TYPE_EMBEDDING_MIGRATION,
+    JOB_TYPE_ROUNDTRIP_EMBEDDING,
+    JOB_TYPE_TOOL_CALL_SUMMARY,
+)
+from jobs.embedding_migration import EMBEDDING_MIGRATION_BATCHES_PER_JOB, EmbeddingMigrationRunner
+from jobs.enqueue import enqueue_embedding_migration
+from llm.clients.embeddings import embed_text
+from tool.summarize_tool_call import summarize_tool_calls
+
+JobHandler = Callable[[dict[str, Any]], None]
+
+
+def run_conversation_summary_job(payload: dict[str, Any]) -> None:
+    rebuild_conversation_summaries(
+        str(payload["conversation_id"]),
+        summary_batch_size=SUMMARY_BATCH_SIZE,
+        summary_trigger_size=SUMMARY_TRIGGER_SIZE,
+    )
+
+
+def run_conversation_title_job(payload: dict[str, Any]) -> None:
+    get_conversation_repo().set_conversation_title(
+        str(payload["conversation_id"]),
+        generate_conversation_title(str(payload.get("prompt") or "")),
+    )
+
+
+def run_tool_call_summary_job(payload: dict[str, Any]) -> None:
+    summarize_tool_calls(UUID(str(payload["roundtrip_id"])))
+
+
+def run_roundtrip_embedding_job(payload: dict[str, Any]) -> None:
+    repo = get_conversation_repo()
+    roundtrip_id = UUID(str(payload["roundtrip_id"]))
+    roundtrip = repo.get_roundtrip(roundtrip_id, projection=RoundtripProjection.CONTEXT)
+    roundtrip_summary = (roundtrip.roundtrip_summary or "").strip() if roundtrip is not None else ""
+    if not roundtrip_summary:
+        return
+    repo.update_roundtrip_summary_embedding(roundtrip_id, embed_text(roundtrip_summary))
+
+
+def run_embedding_migration_job(payload: dict[str, Any]) -> None:
+    column = get_embedding_column(str(payload["column"]))
+    switch_slots = bool(payload.get("switch_slots"))
+    if not EmbeddingMigrationRunner(column).run(max_batches=EMBEDDING_MIGRATION_BATCHES_PER_JOB):
+        # The checkpoint is stored, so the follow-up job picks up where this one stopped.
+        enqueue_embedding_migration(column.key, switch_slots=switch_slots)
+        return
+    repository = get_embedding_migration_repo()
+    state = repository.get_state(column)
+    if switch_slots and state is not None and state.in_progress:
+        repository.build_indexes(column, state)
+        repository.switch_slots(column)
+
+
+JOB_HANDLERS: dict[str, JobHandler] = {
+    JOB_TYPE_CONVERSATION_SUMMARY: run_conversation_summary_job,
+    JOB_TYPE_CONVERSATION_TITLE: run_conversation_title_job,
+    JOB_TYPE_TOOL_CALL_SUMMARY: run_tool_call_summary_job,
+    JOB_TYPE_ROUNDTRIP_EMBEDDING: run_roundtrip_embedding_job,
+    JOB_TYPE_EMBEDDING_MIGRATION: run_embedding_migration_job,
+}
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, Optional
+
+
+class JobStatus(StrEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass(frozen=False)
+class BackgroundJob:
+    id: int
+    job_type: str
+    job_key: str
+    payload: dict[str, Any]
+    status: str
+    attempts: int
+    max_attempts: int
+    run_after: str
+    last_error: Optional[str] = None
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any, Optional, Sequence
+
+import psycopg
+from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb
+
+from db.connection import PooledConnection
+from jobs.constants import JOB_MAX_ATTEMPTS
+from jobs.models import BackgroundJob
+
+_JOB_COLUMNS = "id, job_type, job_key, payload, status, attempts, max_attempts, run_after, last_error"
+
+# A failed or abandoned job is retried unless it is out of attempts or a newer job for the same key is
+# already queued; that job redoes the same work, so the older one is closed instead.
+_RETRY_STATUS_SQL = """
+    CASE
+        WHEN job.attempts >= job.max_attempts THEN 'failed'
+        WHEN EXISTS (
+            SELECT 1
+            FROM background_job queued
+            WHERE queued.job_type = job.job_type
+              AND queued.job_key = job.job_key
+              AND queued.status = 'pending'
+        ) THEN 'failed'
+        ELSE 'pending'
+    END
+"""
+
+
+def _row_to_job(row: dict[str, Any]) -> BackgroundJob:
+    return BackgroundJob(
+        id=row["id"],
+        job_type=row["job_type"],
+        job_key=row["job_key"],
+        payload=row["payload"] or {},
+        status=row["status"],
+        attempts=row["attempts"],
+        max_attempts=row["max_attempts"],
+        run_after=str(row["run_after"]),
+        last_error=row.get("last_error"),
+    )
+
+
+class JobRepository:
+    """Postgres-backed job queue; workers claim jobs with `FOR UPDATE SKIP LOCKED`."""
+
+    def __init__(self, conn: psycopg.Connection | None = None):
+        self._conn = conn or PooledConnection()
+
+    def enqueue(
+        self,
+        job_type: str,
+        job_key: str,
+        payload: Optional[dict[str, Any]] = None,
+        *,
+        delay_seconds: float = 0.0,
+        max_attempts: int = JOB_MAX_ATTEMPTS,
+    ) -> int:
+        """Queue a job, or fold it into the job already queued under the same key.
+
+        Folding merges the payloads (newer keys win) and keeps the queued job's place in line.
+        """
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                """
+                INSERT INTO background_job (job_type, job_key, payload, max_attempts, run_after)
+                VALUES (%s, %s, %s, %s, now() + make_interval(secs => %s))
+                ON CONFLICT (job_type, job_key) WHERE status = 'pending'
+                DO UPDATE SET
+                    payload = background_job.payload || EXCLUDED.payload,
+                    updated_at = now()
+                RETURNING id
+                """,
+                (job_type, job_key, Jsonb(payload or {}), max_attempts, delay_seconds),
+            )
+            row = cur.fetchone()
+            assert row is not None
+            return int(row["id"])
+
+    def claim(self, worker_id: str, job_types: Sequence[str]) -> Optional[BackgroundJob]:
+        """Mark the oldest ready job as running for `worker_id`; keys with a running job are skipped."""
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                f"""
+                UPDATE background_job AS job
+                SET status = 'running',
+                    attempts = job.attempts + 1,
+                    locked_at = now(),
+                    locked_by = %s,
+                    updated_at = now()
+                WHERE job.id = (
+                    SELECT candidate.id
+                    FROM background_job candidate
+                    WHERE candidate.status = 'pending'
+                      AND candidate.run_after <= now()
+                      AND candidate.job_type = ANY(%s)
+                      AND NOT EXISTS (
+                          SELECT 1
+                          FROM background_job running
+                          WHERE running.job_type = candidate.job_type
+                            AND running.job_key = candidate.job_key
+                            AND running.status = 'running'
+                      )
+                    ORDER BY candidate.run_after, candidate.id
+                    LIMIT 1
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING {_JOB_COLUMNS}
+                """,
+                (worker_id, list(job_types)),
+            )
+            row = cur.fetchone()
+            return _row_to_job(row) if row else None
+
+    def complete(self, job_id: int) -> None:
+        with self._conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE background_job
+                SET status = 'completed',
+                    locked_at = NULL,
+                    locked_by = NULL,
+                    last_error = NULL,
+                    updated_at = now()
+                WHERE id = %s
+                """,
+                (job_id,),
+            )
+
+    def fail(self, job_id: int, error: str, *, retry_in_seconds: float) -> None:
+        try:
+            self._release(job_id, error, status_sql=_RETRY_STATUS_SQL, retry_in_seconds=retry_in_seconds)
+        except psycopg.errors.UniqueViolation:
+            # A job for the same key was queued after the CASE looked; that job redoes this work.
+            self._release(job_id, error, status_sql="'failed'", retry_in_seconds=retry_in_seconds)
+
+    def _release(self, job_id: int, error: str, *, status_sql: str, retry_in_seconds: float) -> None:
+        with self._conn.cursor() as cur:
+            cur.execute(
+                f"""
+                UPDATE background_job AS job
+                SET status = {status_sql},
+                    run_after = now() + make_interval(secs => %s),
+                    locked_at = NULL,
+                    locked_by = NULL,
+                    last_error = %s,
+                    updated_at = now()
+                WHERE job.id = %s
+                """,
+                (retry_in_seconds, error, job_id),
+            )
+
+    def requeue_expired(self, lease_seconds: float) -> int:
+        """Release running jobs whose worker stopped before finishing them."""
+        try:
+            return self._requeue_expired(lease_seconds)
+        except psycopg.errors.UniqueViolation:
+            # Lost the same race as `fail`; the retried statement sees the newly queued job and closes this one.
+            return self._requeue_expired(lease_seconds)
+
+    def _requeue_expired(self, lease_seconds: float) -> int:
+        with self._conn.cursor() as cur:
+            cur.execute(
+                f"""
+                UPDATE background_job AS job
+                SET status = {_RETRY_STATUS_SQL},
+                    locked_at = NULL,
+                    locked_by = NULL,
+                    last_error = COALESCE(job.last_error, 'Worker lease expired.'),
+                    updated_at = now()
+                WHERE job.status = 'running'
+                  AND job.locked_at < now() - make_interval(secs => %s)
+                """,
+                (lease_seconds,),
+            )
+            return cur.rowcount
+
+    def purge_completed(self, older_than_days: int) -> int:
+        with self._conn.cursor() as cur:
+            cur.execute(
+                """
+                DELETE FROM background_job
+                WHERE status = 'completed'
+                  AND updated_at < now() - make_interval(days => %s)
+                """,
+                (older_than_days,),
+            )
+            return cur.rowcount
+
+
+_JOB_REPOSITORY: JobRepository | None = None
+_JOB_REPOSITORY_LOCK = Lock()
+
+
+def get_job_repository() -> JobRepository:
+    global _JOB_REPOSITORY
+    with _JOB_REPOSITORY_LOCK:
+        if _JOB_REPOSITORY is None:
+            _JOB_REPOSITORY = JobRepository()
+        return _JOB_REPOSITORY
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+import socket
+from threading import Event
+from time import monotonic
+from typing import Mapping
+from uuid import uuid4
+
+from jobs.constants import (
+    JOB_LEASE_SECONDS,
+    JOB_MAINTENANCE_INTERVAL_SECONDS,
+    JOB_RETENTION_DAYS,
+    JOB_RETRY_BASE_SECONDS,
+    JOB_RETRY_MAX_SECONDS,
+    JOB_WORKER_POLL_SECONDS,
+)
+from jobs.handlers import JOB_HANDLERS, JobHandler
+from jobs.models import BackgroundJob
+from jobs.repository.job_repository import JobRepository, get_job_repository
+
+
+def retry_delay_seconds(attempts: int) -> float:
+    return min(JOB_RETRY_MAX_SECONDS, JOB_RETRY_BASE_SECONDS * (2 ** max(0, attempts - 1)))
+
+
+class JobWorker:
+    """Claims and runs queued jobs one at a time; several workers can share the queue safely."""
+
+    def __init__(
+        self,
+        repository: JobRepository | None = None,
+        handlers: Mapping[str, JobHandler] | None = None,
+        *,
+        worker_id: str | None = None,
+        poll_seconds: float = JOB_WORKER_POLL_SECONDS,
+    ) -> None:
+        self._repository = repository or get_job_repository()
+        self._handlers = dict(JOB_HANDLERS if handlers is None else handlers)
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._poll_seconds = poll_seconds
+        self._next_maintenance_at = 0.0
+
+    def run_once(self) -> BackgroundJob | None:
+        """Run the next ready job, if any, and return it."""
+        job = self._repository.claim(self.worker_id, list(self._handlers))
+        if job is None:
+            return None
+        try:
+            self._handlers[job.job_type](job.payload)
+        except Exception as exc:
+            self._repository.fail(
+                job.id,
+                f"{type(exc).__name__}: {exc}"[:2000],
+                retry_in_seconds=retry_delay_seconds(job.attempts),
+            )
+        else:
+            self._repository.complete(job.id)
+        return job
+
+    def run_maintenance(self) -> None:
+        self._repository.requeue_expired(JOB_LEASE_SECONDS)
+        self._repository.purge_completed(JOB_RETENTION_DAYS)
+
+    def run_forever(self, stop_event: Event | None = None) -> None:
+        stop_event = stop_event or Event()
+        while not stop_event.is_set():
+            try:
+                if monotonic() >= self._next_maintenance_at:
+                    self._next_maintenance_at = monotonic() + JOB_MAINTENANCE_INTERVAL_SECONDS
+                    self.run_maintenance()
+                if self.run_once() is not None:
+                    continue
+            except Exception:
+                # The database may be briefly unavailable; keep polling rather than dying.
+                pass
+            stop_event.wait(self._poll_seconds)
@@ -1,8 +1,44 @@
-from common.config import EMBEDDING_MODEL
+from functools import lru_cache
+
+from common.config import EMBEDDING_DIMENSIONS, EMBEDDING_MODEL, get_env_int
 from llm.clients.llm_client import get_openai_client
 
+EMBEDDING_QUERY_CACHE_SIZE = max(0, get_env_int("EMBEDDING_QUERY_CACHE_SIZE", 256))
+
+
+def embedding_request_options(model: str = EMBEDDING_MODEL, dimensions: int = EMBEDDING_DIMENSIONS) -> dict[str, int]:
+    """Extra `embeddings.create` arguments; only text-embedding-3-* models accept `dimensions`."""
+    if model.startswith("text-embedding-3"):
+        return {"dimensions": dimensions}
+    return {}
+
 
 def embed_text(text: str) -> list[float]:
     text = (text or "").strip() or " "
-    resp = get_openai_client().embeddings.create(model=EMBEDDING_MODEL, input=text)
+    resp = get_openai_client().embeddings.create(model=EMBEDDING_MODEL, input=text, **embedding_request_options())
     return resp.data[0].embedding
+
+
+def embed_texts(texts: list[str], *, model: str = EMBEDDING_MODEL, dimensions: int = EMBEDDING_DIMENSIONS) -> list[list[float]]:
+    """Embed several texts in one request; vectors come back in input order."""
+    if not texts:
+        return []
+    resp = get_openai_client().embeddings.create(
+        model=model,
+        input=[(text or "").strip() or " " for text in texts],
+        **embedding_request_options(model, dimensions),
+    )
+    return [item.embedding for item in sorted(resp.data, key=lambda item: item.index)]
+
+
+@lru_cache(maxsize=EMBEDDING_QUERY_CACHE_SIZE)
+def _cached_query_embedding(text: str) -> tuple[float, ...]:
+    return tuple(embed_text(text))
+
+
+def embed_query(text: str) -> list[float]:
+    """Embed a search query, reusing the vector when the same query was embedded recently.
+
+    Tools that search different stores for one phrase share a single embedding call.
+    """
+    return list(_cached_query_embedding((text or "").strip()))
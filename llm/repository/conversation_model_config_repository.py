@@ -5,7 +5,7 @@ from uuid import UUID
 import psycopg
 from psycopg.rows import dict_row
 
-from db.connection import get_connection
+from db.connection import PooledConnection
 from llm.conversation_model_config import (
     CONVERSATION_MODEL_CONFIG_SPECS,
     ConversationModelConfig,
@@ -16,7 +16,7 @@ from llm.model_config_resolver import resolve_conversation_model_config
 
 class ConversationModelConfigRepository:
     def __init__(self, conn: psycopg.Connection | None = None):
-        self._conn = conn or get_connection()
+        self._conn = conn or PooledConnection()
 
     def ensure_defaults(
         self,
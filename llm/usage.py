@@ -6,7 +6,7 @@ from uuid import UUID
 
 from common.data import sanitize_for_json_storage
 from common.logging import create_conversation_event
-from conversation.models.conversation_models import LlmCallRecord, LlmUsage
+from conversation.models.conversation_models import LlmCallRecord, LlmUsage, LlmUsageAggregate
 from conversation.repository.repo_factory import get_conversation_repo
 from llm.conversation_model_config import ConversationModelConfig
 from request_orchestrator.shared.runtime_context import get_current_agent_name
@@ -237,33 +237,62 @@ def serialize_llm_call_record(record: LlmCallRecord | dict[str, Any]) -> dict[st
     }
 
 
+def _usage_summary(
+    *,
+    input_tokens: int,
+    cached_input_tokens: int,
+    output_tokens: int,
+    total_tokens: int,
+    total_latency_ms: int,
+    input_cost: Decimal,
+    output_cost: Decimal,
+) -> dict[str, Any]:
+    return {
+        "input_tokens": input_tokens,
+        "cached_input_tokens": cached_input_tokens,
+        "output_tokens": output_tokens,
+        "total_tokens": total_tokens,
+        "total_latency_ms": total_latency_ms,
+        "computed_input_cost": _decimal_to_str(input_cost),
+        "computed_output_cost": _decimal_to_str(output_cost),
+        "computed_total_cost": _decimal_to_str(input_cost + output_cost),
+    }
+
+
 def build_llm_usage_payload(records: Iterable[LlmCallRecord]) -> dict[str, Any]:
     serialized_calls = [serialize_llm_call_record(record) for record in records]
-    total_input_tokens = sum(int(call.get("input_tokens") or 0) for call in serialized_calls)
-    total_cached_input_tokens = sum(int(call.get("cached_input_tokens") or 0) for call in serialized_calls)
-    total_output_tokens = sum(int(call.get("output_tokens") or 0) for call in serialized_calls)
-    total_tokens = sum(int(call.get("total_tokens") or 0) for call in serialized_calls)
-    total_latency_ms = sum(int(call.get("latency_ms") or 0) for call in serialized_calls)
-    total_input_cost = sum(Decimal(str(call.get("computed_input_cost") or "0")) for call in serialized_calls)
-    total_output_cost = sum(Decimal(str(call.get("computed_output_cost") or "0")) for call in serialized_calls)
-    total_cost = total_input_cost + total_output_cost
-
     return {
         "retrieved_call_count": len(serialized_calls),
-        "summary": {
-            "input_tokens": total_input_tokens,
-            "cached_input_tokens": total_cached_input_tokens,
-            "output_tokens": total_output_tokens,
-            "total_tokens": total_tokens,
-            "total_latency_ms": total_latency_ms,
-            "computed_input_cost": _decimal_to_str(total_input_cost),
-            "computed_output_cost": _decimal_to_str(total_output_cost),
-            "computed_total_cost": _decimal_to_str(total_cost),
-        },
+        "summary": _usage_summary(
+            input_tokens=sum(int(call.get("input_tokens") or 0) for call in serialized_calls),
+            cached_input_tokens=sum(int(call.get("cached_input_tokens") or 0) for call in serialized_calls),
+            output_tokens=sum(int(call.get("output_tokens") or 0) for call in serialized_calls),
+            total_tokens=sum(int(call.get("total_tokens") or 0) for call in serialized_calls),
+            total_latency_ms=sum(int(call.get("latency_ms") or 0) for call in serialized_calls),
+            input_cost=sum(Decimal(str(call.get("computed_input_cost") or "0")) for call in serialized_calls),
+            output_cost=sum(Decimal(str(call.get("computed_output_cost") or "0")) for call in serialized_calls),
+        ),
         "calls": serialized_calls,
     }
 
 
+def build_llm_usage_summary_payload(aggregate: LlmUsageAggregate) -> dict[str, Any]:
+    """The `build_llm_usage_payload` shape without per-call details, from a grouped `llm_call` row."""
+    return {
+        "retrieved_call_count": aggregate.call_count,
+        "summary": _usage_summary(
+            input_tokens=aggregate.input_tokens,
+            cached_input_tokens=aggregate.cached_input_tokens,
+            output_tokens=aggregate.output_tokens,
+            total_tokens=aggregate.total_tokens,
+            total_latency_ms=aggregate.total_latency_ms,
+            input_cost=aggregate.computed_input_cost,
+            output_cost=aggregate.computed_output_cost,
+        ),
+        "calls": [],
+    }
+
+
 def record_llm_call(
     *,
     raw_response: Any,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from threading import Event, Thread
 from uuid import UUID
 
 from dotenv import load_dotenv
@@ -11,6 +12,8 @@ from common.config import CONTENT_KEY, ROLE_KEY, ROLE_USER
 from conversation.models.replay_models import PreparedReplayConversation
 from conversation.repository.repo_factory import get_conversation_repo
 from conversation.replay import execute_replay, prepare_replay
+from jobs.constants import JOB_WORKER_IN_PROCESS
+from jobs.worker import JobWorker
 from personalization.profile.repository.repo_factory import get_user_profile_repo
 from rendering.feedback import FEEDBACK_TARGET_KEY, clear_feedback_state, render_feedback_dialog
 from rendering.replay import clear_replay_state, pop_replay_target
@@ -22,6 +25,15 @@ from rendering.sidebar import clear_conversation_model_config_dialog, render_sid
 
 load_dotenv()
 
+
+@st.cache_resource
+def start_in_process_job_worker() -> Event:
+    """One daemon worker thread per Streamlit server process; set the returned event to stop it."""
+    stop_event = Event()
+    Thread(target=JobWorker().run_forever, args=(stop_event,), name="job-worker", daemon=True).start()
+    return stop_event
+
+
 st.set_page_config(
     page_title="LLM Agentic Chat",
     page_icon=":robot_face:",
@@ -46,6 +58,9 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
+if JOB_WORKER_IN_PROCESS:
+    start_in_process_job_worker()
+
 conversation_repository = get_conversation_repo()
 user_profile_repository = get_user_profile_repo()
 qp = st.query_params
@@ -8,7 +8,9 @@ from pgvector.psycopg import register_vector
 from psycopg.rows import dict_row
 
 from common.data import normalize_string_list
-from db.connection import get_connection
+from db.connection import PooledConnection
+from db.embedding_migration import resolve_embedding_slot
+from db.vector import EMBEDDING_SQL_TYPE, USER_ATTRIBUTE_EMBEDDING
 from personalization.user_attributes.models.user_attribute_models import UserAttribute, UserAttributeSearchResult
 from personalization.user_attributes.models.user_attribute_types import ATTRIBUTE_TYPE_VALUES
 from personalization.profile.repository.repo_factory import get_user_profile_repo
@@ -25,8 +27,12 @@ ATTRIBUTE_TYPES = set(ATTRIBUTE_TYPE_VALUES)
 
 class UserAttributeRepository:
     def __init__(self, conn: psycopg.Connection | None = None):
-        self._conn = conn or get_connection()
-        register_vector(self._conn)
+        if conn is None:
+            # Pooled connections get pgvector types registered when the pool opens them.
+            self._conn: psycopg.Connection | PooledConnection = PooledConnection()
+        else:
+            self._conn = conn
+            register_vector(self._conn)
 
     def _normalize_attribute_row(self, row: dict[str, Any]) -> dict[str, Any]:
         normalized = dict(row)
@@ -109,9 +115,10 @@ class UserAttributeRepository:
         distance_threshold: float = ATTRIBUTE_DUPLICATE_DISTANCE_THRESHOLD,
     ) -> Optional[UserAttributeSearchResult]:
         self._validate_attribute_type(attribute_type)
+        embedding_column = resolve_embedding_slot(USER_ATTRIBUTE_EMBEDDING).name
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
+                f"""
                 SELECT
                     id,
                     user_id,
@@ -124,14 +131,14 @@ class UserAttributeRepository:
                     updated_at,
                     confidence,
                     importance,
-                    (attribute_embedding <-> (%s)::vector) AS relevance_score
+                    ({embedding_column} <-> (%s)::{EMBEDDING_SQL_TYPE}) AS relevance_score
                 FROM user_attributes
-                WHERE attribute_embedding IS NOT NULL
+                WHERE {embedding_column} IS NOT NULL
                   AND (CAST(%s AS text) IS NULL OR user_id = %s)
                   AND (CAST(%s AS text) IS NULL OR attribute_type = %s)
                   AND group_key IS NOT DISTINCT FROM CAST(%s AS text)
                   AND (CAST(%s AS uuid) IS NULL OR id <> %s)
-                ORDER BY attribute_embedding <-> (%s)::vector ASC
+                ORDER BY {embedding_column} <-> (%s)::{EMBEDDING_SQL_TYPE} ASC
                 LIMIT 1
                 """,
                 (
@@ -168,12 +175,19 @@ class UserAttributeRepository:
     ) -> Optional[UserAttribute]:
         self._validate_attribute_type(attribute_type)
         normalized_value = normalize_string_list(value) if value is not None else None
+        # Without a new embedding the stored one, and its model version, are kept.
+        embedding_sql = ""
+        embedding_params: tuple[Any, ...] = ()
+        if attribute_embedding is not None:
+            embedding_slot = resolve_embedding_slot(USER_ATTRIBUTE_EMBEDDING)
+            embedding_sql = f"{embedding_slot.assignment_sql()},"
+            embedding_params = (attribute_embedding, embedding_slot.version)
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
+                f"""
                 UPDATE user_attributes
                 SET value = COALESCE(%s, value),
-                    attribute_embedding = COALESCE((%s)::vector, attribute_embedding),
+                    {embedding_sql}
                     attribute_type = COALESCE(%s, attribute_type),
                     group_key = COALESCE(%s, group_key),
                     source = COALESCE(%s, source),
@@ -199,7 +213,7 @@ class UserAttributeRepository:
                 """,
                 (
                     normalized_value,
-                    attribute_embedding,
+                    *embedding_params,
                     attribute_type,
                     group_key,
                     source,
@@ -288,13 +302,15 @@ class UserAttributeRepository:
                 assert updated_attribute is not None
                 return updated_attribute
 
+        embedding_slot = resolve_embedding_slot(USER_ATTRIBUTE_EMBEDDING)
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
+                f"""
                 INSERT INTO user_attributes (
                     user_id,
                     value,
-                    attribute_embedding,
+                    {embedding_slot.name},
+                    {embedding_slot.model_column},
                     attribute_type,
                     group_key,
                     source,
@@ -302,7 +318,7 @@ class UserAttributeRepository:
                     confidence,
                     importance
                 )
-                VALUES (%s, %s, (%s)::vector, %s, %s, %s, %s, %s, %s)
+                VALUES (%s, %s, (%s)::{EMBEDDING_SQL_TYPE}, %s, %s, %s, %s, %s, %s, %s)
                 RETURNING
                     id,
                     user_id,
@@ -321,6 +337,7 @@ class UserAttributeRepository:
                     user_id,
                     normalized_value,
                     attribute_embedding,
+                    embedding_slot.model_for(attribute_embedding),
                     attribute_type,
                     group_key,
                     source,
@@ -545,9 +562,10 @@ class UserAttributeRepository:
         source: Optional[str] = None,
     ) -> list[UserAttributeSearchResult]:
         self._validate_attribute_type(attribute_type)
+        embedding_column = resolve_embedding_slot(USER_ATTRIBUTE_EMBEDDING).name
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
+                f"""
                 SELECT
                     id,
                     user_id,
@@ -560,15 +578,15 @@ class UserAttributeRepository:
                     updated_at,
                     confidence,
                     importance,
-                    (attribute_embedding <-> (%s)::vector) AS relevance_score
+                    ({embedding_column} <-> (%s)::{EMBEDDING_SQL_TYPE}) AS relevance_score
                 FROM user_attributes
-                WHERE attribute_embedding IS NOT NULL
+                WHERE {embedding_column} IS NOT NULL
                   AND (CAST(%s AS text) IS NULL OR user_id = %s)
                   AND (CAST(%s AS boolean) IS NULL OR is_active = %s)
                   AND (CAST(%s AS text) IS NULL OR attribute_type = %s)
                   AND (CAST(%s AS text) IS NULL OR group_key = %s)
                   AND (CAST(%s AS text) IS NULL OR source = %s)
-                ORDER BY attribute_embedding <-> (%s)::vector ASC
+                ORDER BY {embedding_column} <-> (%s)::{EMBEDDING_SQL_TYPE} ASC
                 LIMIT %s
                 """,
                 (
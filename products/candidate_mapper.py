@@ -13,6 +13,12 @@ def product_result_to_candidate(product: ProductResult) -> Candidate:
     }
     if product.score is not None:
         metadata["retrieval_distance"] = product.score
+    if product.fused_score is not None:
+        metadata["fused_score"] = round(product.fused_score, 6)
+        metadata["vector_rank"] = product.vector_rank
+        metadata["lexical_rank"] = product.lexical_rank
+    if product.exact_name_match:
+        metadata["exact_name_match"] = True
 
     return Candidate(
         id=product.id,
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from time import sleep
+from typing import Callable, Iterable, Iterator, Optional, Sequence
+
+from common.config import get_env_float, get_env_int
+from db.embedding_migration import (
+    EmbeddingSlot,
+    embedding_version_dimensions,
+    embedding_version_model,
+    resolve_embedding_slot,
+)
+from db.vector import PRODUCT_EMBEDDING
+from llm.clients.embeddings import embed_texts
+from products.models.catalog_product import CatalogProduct
+from products.repository.catalog_load_repository import ProductCatalogLoadRepository, StoredProduct
+
+# Source rows per COPY batch and checkpoint.
+PRODUCT_LOAD_BATCH_SIZE = max(1, get_env_int("PRODUCT_LOAD_BATCH_SIZE", 2000))
+# Texts per embeddings request.
+PRODUCT_LOAD_EMBED_BATCH_SIZE = max(1, get_env_int("EMBED_BATCH_SIZE", 512))
+# Embeddings requests in flight at once; batches are still written in source order.
+PRODUCT_LOAD_EMBED_CONCURRENCY = max(1, get_env_int("PRODUCT_LOAD_EMBED_CONCURRENCY", 4))
+PRODUCT_LOAD_EMBED_MAX_ATTEMPTS = max(1, get_env_int("PRODUCT_LOAD_EMBED_MAX_ATTEMPTS", 5))
+PRODUCT_LOAD_EMBED_RETRY_BACKOFF_SECONDS = max(0.0, get_env_float("PRODUCT_LOAD_EMBED_RETRY_BACKOFF_SECONDS", 2.0))
+# Session memory for rebuilding the deferred indexes; vector indexes build much faster with more.
+PRODUCT_LOAD_MAINTENANCE_WORK_MEM = os.getenv("PRODUCT_LOAD_MAINTENANCE_WORK_MEM", "1GB")
+_MAX_RETRY_BACKOFF_SECONDS = 60.0
+
+EmbedFn = Callable[..., list[list[float]]]
+ProductReader = Callable[[int], Iterable[CatalogProduct]]
+
+
+@dataclass
+class CatalogLoadStats:
+    rows_read: int = 0
+    rows_written: int = 0
+    rows_embedded: int = 0
+    rows_unchanged: int = 0
+
+
+@dataclass
+class _PendingBatch:
+    rows_read: int
+    products: list[CatalogProduct]
+    # Product ids and the embeddings request covering them, in request order.
+    embeddings: list[tuple[list[str], Future]]
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _md5(text: str) -> str:
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+class ProductCatalogLoader:
+    """Bulk-loads a catalog source into `products`, resumable and incremental.
+
+    The source is read in batches. Products whose fields are unchanged since the last load are
+    skipped, and only products whose embedding text changed are embedded again; embeddings requests
+    for the next batches run concurrently while earlier batches are written in source order. Loading
+    into an empty catalog drops its secondary indexes first and rebuilds them once at the end.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        *,
+        repository: ProductCatalogLoadRepository | None = None,
+        embed: EmbedFn = embed_texts,
+        embedding_slot: EmbeddingSlot | None = None,
+        batch_size: int = PRODUCT_LOAD_BATCH_SIZE,
+        embed_batch_size: int = PRODUCT_LOAD_EMBED_BATCH_SIZE,
+        concurrency: int = PRODUCT_LOAD_EMBED_CONCURRENCY,
+        max_attempts: int = PRODUCT_LOAD_EMBED_MAX_ATTEMPTS,
+        retry_backoff_seconds: float = PRODUCT_LOAD_EMBED_RETRY_BACKOFF_SECONDS,
+        sleep_fn: Callable[[float], None] = sleep,
+    ) -> None:
+        self.source = source
+        self._repository = repository or ProductCatalogLoadRepository()
+        self._embed = embed
+        self._slot = embedding_slot or resolve_embedding_slot(PRODUCT_EMBEDDING)
+        self._batch_size = max(1, batch_size)
+        self._embed_batch_size = max(1, embed_batch_size)
+        self._concurrency = max(1, concurrency)
+        self._max_attempts = max(1, max_attempts)
+        self._retry_backoff_seconds = max(0.0, retry_backoff_seconds)
+        self._sleep = sleep_fn
+
+    def load(
+        self,
+        read_products: ProductReader,
+        *,
+        restart: bool = False,
+        progress: Optional[Callable[[CatalogLoadStats], None]] = None,
+    ) -> CatalogLoadStats:
+        """Load the products `read_products(offset)` yields after the first `offset` source rows.
+
+        `offset` is the number of source rows an interrupted load already committed.
+        """
+        state = self._repository.start(self.source, restart=restart)
+        if state.rows_done == 0 and not state.deferred_indexes and self._repository.catalog_is_empty():
+            state = self._repository.defer_indexes(self.source)
+
+        stats = CatalogLoadStats(rows_read=state.rows_done)
+        pending: deque[_PendingBatch] = deque()
+        with ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="catalog-embed") as executor:
+            for batch in _chunks(read_products(state.rows_done), self._batch_size):
+                pending.append(self._prepare(batch, executor, stats))
+                if len(pending) > self._concurrency:
+                    self._write(pending.popleft(), stats, progress)
+            while pending:
+                self._write(pending.popleft(), stats, progress)
+
+        self._repository.finish(self.source, maintenance_work_mem=PRODUCT_LOAD_MAINTENANCE_WORK_MEM)
+        return stats
+
+    def _prepare(self, batch: list[CatalogProduct], executor: ThreadPoolExecutor, stats: CatalogLoadStats) -> _PendingBatch:
+        # One upsert cannot touch a row twice, so a product repeated within the batch keeps its last version.
+        products = list({product.id: product for product in batch}.values())
+        stored = self._repository.stored_products([product.id for product in products], self._slot)
+        changed = [product for product in products if self._is_changed(product, stored.get(product.id))]
+        stats.rows_unchanged += len(batch) - len(changed)
+
+        texts: dict[str, str] = {}
+        for product in changed:
+            previous = stored.get(product.id)
+            if previous is None or not previous.embedding_current or previous.embedding_source_hash != _md5(product.embedding_text):
+                texts[product.id] = product.embedding_text
+        embeddings = [
+            (ids, executor.submit(self._embed_with_retry, [texts[product_id] for product_id in ids]))
+            for ids in _chunks(list(texts), self._embed_batch_size)
+        ]
+        return _PendingBatch(rows_read=len(batch), products=changed, embeddings=embeddings)
+
+    @staticmethod
+    def _is_changed(product: CatalogProduct, stored: Optional[StoredProduct]) -> bool:
+        return stored is None or not stored.embedding_current or stored.source_hash != product.source_hash
+
+    def _write(
+        self,
+        batch: _PendingBatch,
+        stats: CatalogLoadStats,
+        progress: Optional[Callable[[CatalogLoadStats], None]],
+    ) -> None:
+        vectors: dict[str, Sequence[float]] = {}
+        for ids, future in batch.embeddings:
+            vectors.update(zip(ids, future.result()))
+        rows = [(product, vectors.get(product.id)) for product in batch.products]
+        stats.rows_written += self._repository.write_batch(self.source, rows, self._slot, rows_done=batch.rows_read)
+        stats.rows_embedded += len(vectors)
+        stats.rows_read += batch.rows_read
+        if progress is not None:
+            progress(stats)
+
+    def _embed_with_retry(self, texts: list[str]) -> list[list[float]]:
+        attempt = 1
+        while True:
+            try:
+                return self._embed(
+                    texts,
+                    model=embedding_version_model(self._slot.version),
+                    dimensions=embedding_version_dimensions(self._slot.version),
+                )
+            except Exception:
+                if attempt >= self._max_attempts:
+                    raise
+                delay = min(_MAX_RETRY_BACKOFF_SECONDS, self._retry_backoff_seconds * 2 ** (attempt - 1))
+                self._sleep(random.uniform(delay / 2, delay))
+                attempt += 1
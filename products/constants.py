@@ -1 +1,16 @@
+from common.config import get_env_bool, get_env_float, get_env_int
+
 DEFAULT_PRODUCT_SEARCH_CANDIDATE_LIMIT = 20
+# Each retriever contributes this many candidates before fusion.
+PRODUCT_SEARCH_RETRIEVER_LIMIT = max(1, get_env_int("PRODUCT_SEARCH_RETRIEVER_LIMIT", 40))
+# Reciprocal rank fusion constant; 60 is the value from the original RRF paper.
+PRODUCT_SEARCH_RRF_K = max(1, get_env_int("PRODUCT_SEARCH_RRF_K", 60))
+# Minimum pg_trgm similarity for a product name to count as a lexical match without a full-text hit.
+PRODUCT_NAME_SIMILARITY_THRESHOLD = get_env_float("PRODUCT_NAME_SIMILARITY_THRESHOLD", 0.45)
+PRODUCT_RERANK_SKIP_ENABLED = get_env_bool("PRODUCT_RERANK_SKIP_ENABLED", True)
+# Skip the LLM rerank when the top product is closer to the query than every other candidate by this vector distance.
+PRODUCT_RERANK_SKIP_DISTANCE_GAP = max(0.0, get_env_float("PRODUCT_RERANK_SKIP_DISTANCE_GAP", 0.15))
+# When no product matches every filter, style, then color, then the price band are relaxed in that order.
+PRODUCT_FILTER_RELAXATION_ENABLED = get_env_bool("PRODUCT_FILTER_RELAXATION_ENABLED", True)
+# The last relaxation widens the price band by this fraction on each side.
+PRODUCT_PRICE_RELAXATION = max(0.0, get_env_float("PRODUCT_PRICE_RELAXATION", 0.25))
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from threading import Lock
+from time import monotonic
+
+from common.config import get_env_float, get_env_int
+from products.models.product_facets import PRODUCT_FACETS, ProductFacets
+from products.repository.product_repository import get_product_repository
+
+# The views only change when a catalog load refreshes them, so processes re-read them rarely.
+PRODUCT_FACETS_CACHE_SECONDS = max(0.0, get_env_float("PRODUCT_FACETS_CACHE_SECONDS", 300.0))
+# Most common values listed per facet in the planner summary.
+PRODUCT_FACET_SUMMARY_MAX_VALUES = max(1, get_env_int("PRODUCT_FACET_SUMMARY_MAX_VALUES", 15))
+
+_FACETS: ProductFacets | None = None
+_FACETS_EXPIRE_AT = 0.0
+_FACETS_LOCK = Lock()
+
+
+def get_product_facets() -> ProductFacets:
+    """The catalog's facet values, cached in process; the last known copy is kept while the database is unreachable."""
+    global _FACETS, _FACETS_EXPIRE_AT
+    with _FACETS_LOCK:
+        if _FACETS is not None and monotonic() < _FACETS_EXPIRE_AT:
+            return _FACETS
+        _FACETS_EXPIRE_AT = monotonic() + PRODUCT_FACETS_CACHE_SECONDS
+        try:
+            _FACETS = get_product_repository().get_facets()
+        except Exception:
+            if _FACETS is None:
+                raise
+        return _FACETS
+
+
+def invalidate_product_facets() -> None:
+    global _FACETS_EXPIRE_AT
+    with _FACETS_LOCK:
+        _FACETS_EXPIRE_AT = 0.0
+
+
+def _format_price(price: float) -> str:
+    return f"${price:,.0f}"
+
+
+def format_product_facet_summary(facets: ProductFacets, max_values: int = PRODUCT_FACET_SUMMARY_MAX_VALUES) -> list[str]:
+    """One line per facet with its most common values and product counts, plus the price distribution."""
+    lines: list[str] = []
+    for name in PRODUCT_FACETS:
+        values = facets.facet(name)
+        if not values:
+            continue
+        listed = []
+        for value in values[:max_values]:
+            text = f"{value.value} ({value.product_count}"
+            if name == "category" and value.price_min is not None and value.price_max is not None:
+                text += f", {_format_price(value.price_min)}-{_format_price(value.price_max)}"
+            listed.append(text + ")")
+        more = f" and {len(values) - max_values} more" if len(values) > max_values else ""
+        lines.append(f"{name}: {', '.join(listed)}{more}")
+    if facets.price_histogram:
+        median = facets.price_percentile(0.5)
+        upper = facets.price_percentile(0.9)
+        lines.append(
+            f"price: {_format_price(facets.price_histogram[0].price_min)}-{_format_price(facets.price_histogram[-1].price_max)}, "
+            f"half under {_format_price(median)}, 90% under {_format_price(upper)}"
+        )
+    return lines
+
+
+def product_facet_planner_rules() -> list[str]:
+    """Catalog filter values for the planner, so product filters name values that exist."""
+    try:
+        summary = format_product_facet_summary(get_product_facets())
+    except Exception:
+        return []
+    if not summary:
+        return []
+    return [
+        "Catalog filter values (product counts): " + "; ".join(summary) + ".",
+        "Prefer find_products filter values listed above; facets ending in 'and N more' have other, less common values, so use the user's value when it is not listed. Leave a filter out rather than inventing one.",
+    ]
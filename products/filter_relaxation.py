@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from products.constants import PRODUCT_FILTER_RELAXATION_ENABLED, PRODUCT_PRICE_RELAXATION
+from products.models.filter_relaxation import FilterRelaxation
+from products.models.product_query import ProductQuery
+
+
+def _widened_price_band(product_filters: ProductQuery, fraction: float) -> dict[str, Optional[float]]:
+    return {
+        "price_min": None if product_filters.price_min is None else round(product_filters.price_min * (1 - fraction), 2),
+        "price_max": None if product_filters.price_max is None else round(product_filters.price_max * (1 + fraction), 2),
+    }
+
+
+def relax_product_filters(
+    product_filters: Optional[ProductQuery],
+    *,
+    price_relaxation: float = PRODUCT_PRICE_RELAXATION,
+) -> list[FilterRelaxation]:
+    """Search tiers from the original filters down to the most relaxed ones.
+
+    Style is dropped first, then color, then the price band is widened; category and gender are
+    never relaxed, since results outside them do not answer the request. Steps that would not
+    change the filters are left out, so unfiltered searches get a single tier.
+    """
+    tiers = [FilterRelaxation(product_filters)]
+    if product_filters is None or not PRODUCT_FILTER_RELAXATION_ENABLED:
+        return tiers
+    steps = (
+        ("style", {"style": None} if product_filters.style else None),
+        ("color", {"color": None} if product_filters.color else None),
+        (
+            "price",
+            _widened_price_band(product_filters, price_relaxation)
+            if price_relaxation > 0 and (product_filters.price_min is not None or product_filters.price_max is not None)
+            else None,
+        ),
+    )
+    for name, update in steps:
+        if update is None:
+            continue
+        previous = tiers[-1]
+        tiers.append(FilterRelaxation(previous.filters.model_copy(update=update), (*previous.relaxed, name)))
+    return tiers
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+from products.constants import PRODUCT_RERANK_SKIP_DISTANCE_GAP, PRODUCT_RERANK_SKIP_ENABLED, PRODUCT_SEARCH_RRF_K
+from products.models.product_result import ProductResult
+
+
+def fuse_product_rankings(
+    vector_results: list[ProductResult],
+    lexical_results: list[ProductResult],
+    *,
+    limit: int,
+    k: int = PRODUCT_SEARCH_RRF_K,
+) -> list[ProductResult]:
+    """Merge vector and lexical candidates with reciprocal rank fusion.
+
+    Each product scores `sum(1 / (k + rank))` over the retrievers that returned it, so agreement
+    between retrievers beats a high rank in only one. Exact name matches are pinned first.
+    """
+    fused: dict[str, ProductResult] = {}
+    for rank, product in enumerate(vector_results, start=1):
+        fused[product.id] = replace(product, vector_rank=rank, fused_score=1.0 / (k + rank))
+    for rank, product in enumerate(lexical_results, start=1):
+        existing = fused.get(product.id)
+        if existing is None:
+            fused[product.id] = replace(product, lexical_rank=rank, fused_score=1.0 / (k + rank))
+            continue
+        fused[product.id] = replace(
+            existing,
+            lexical_rank=rank,
+            fused_score=(existing.fused_score or 0.0) + 1.0 / (k + rank),
+            exact_name_match=existing.exact_name_match or product.exact_name_match,
+        )
+    ranked = sorted(fused.values(), key=lambda product: (not product.exact_name_match, -(product.fused_score or 0.0)))
+    return ranked[:limit]
+
+
+def has_decisive_distance_gap(products: list[ProductResult], gap: float = PRODUCT_RERANK_SKIP_DISTANCE_GAP) -> bool:
+    """Whether the top product is closer to the query than every other candidate by at least `gap`."""
+    if not products or products[0].score is None:
+        return False
+    others = [product.score for product in products[1:] if product.score is not None]
+    return bool(others) and min(others) - products[0].score >= gap
+
+
+def is_confident_ranking(products: list[ProductResult]) -> bool:
+    """Whether the fused order can be used as-is instead of asking the LLM reranker.
+
+    That is the case when the top product is the only exact name match, when both retrievers
+    independently ranked it first, or when its vector distance clearly beats every other candidate.
+    """
+    if not PRODUCT_RERANK_SKIP_ENABLED or not products:
+        return False
+    top = products[0]
+    if not top.exact_name_match and has_decisive_distance_gap(products):
+        return True
+    if top.fused_score is None:
+        return False
+    if top.exact_name_match:
+        return not any(product.exact_name_match for product in products[1:])
+    return top.vector_rank == 1 and top.lexical_rank == 1
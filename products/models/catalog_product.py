@@ -0,0 +1,33 @@
+import hashlib
+import json
+from dataclasses import astuple, dataclass
+from typing import Any, Optional
+
+
+@dataclass(frozen=True)
+class CatalogProduct:
+    """One product as read from a catalog source, in the column order of the `products` table."""
+
+    id: str
+    name: str
+    description: Optional[str]
+    category: Optional[str]
+    color: Optional[str]
+    style: Optional[str]
+    gender: Optional[str]
+    season: Optional[str]
+    year: Optional[int]
+    price: Optional[float]
+    image_url: Optional[str]
+
+    @property
+    def embedding_text(self) -> str:
+        """The text the catalog embedding is made from; mirrors `PRODUCT_EMBEDDING.source_sql`."""
+        return (self.description or "").strip() or self.name
+
+    @property
+    def source_hash(self) -> str:
+        return hashlib.md5(json.dumps(self.values(), default=str).encode("utf-8")).hexdigest()
+
+    def values(self) -> tuple[Any, ...]:
+        return astuple(self)
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from products.models.product_query import ProductQuery
+
+
+@dataclass(frozen=True)
+class FilterRelaxation:
+    """Filters for one search tier and the filters relaxed to get them, in relaxation order."""
+
+    filters: Optional[ProductQuery]
+    relaxed: tuple[str, ...] = ()
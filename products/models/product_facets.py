@@ -0,0 +1,49 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+PRODUCT_FACETS = ("category", "color", "style", "gender", "season")
+# Materialized views holding the facets (migration 024), refreshed after each catalog load.
+PRODUCT_FACET_VIEWS = ("product_facet_values", "product_price_histogram")
+
+
+@dataclass(frozen=True)
+class ProductFacetValue:
+    value: str
+    product_count: int
+    price_min: Optional[float] = None
+    price_max: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class PriceBucket:
+    price_min: float
+    price_max: float
+    product_count: int
+
+
+@dataclass(frozen=True)
+class ProductFacets:
+    """Filterable values of the catalog, most common first, and its price histogram."""
+
+    values: dict[str, tuple[ProductFacetValue, ...]] = field(default_factory=dict)
+    price_histogram: tuple[PriceBucket, ...] = ()
+
+    def facet(self, name: str) -> tuple[ProductFacetValue, ...]:
+        return self.values.get(name, ())
+
+    def categories(self, limit: Optional[int] = None) -> list[str]:
+        """Category names in alphabetical order."""
+        names = sorted(value.value for value in self.facet("category"))
+        return names if limit is None else names[:limit]
+
+    def price_percentile(self, fraction: float) -> Optional[float]:
+        """Upper price of the histogram bucket holding the `fraction` quantile of priced products."""
+        total = sum(bucket.product_count for bucket in self.price_histogram)
+        if not total:
+            return None
+        seen = 0
+        for bucket in self.price_histogram:
+            seen += bucket.product_count
+            if seen >= fraction * total:
+                return bucket.price_max
+        return self.price_histogram[-1].price_max
@@ -22,3 +22,9 @@ class ProductResult:
     # Ranking/debug fields (DB vector distance, RAG similarity, etc.)
     score: Optional[float] = None
     source: ProductSource = ProductSource.DB
+
+    # Hybrid retrieval: reciprocal rank fusion score and the 1-based rank from each retriever.
+    fused_score: Optional[float] = None
+    vector_rank: Optional[int] = None
+    lexical_rank: Optional[int] = None
+    exact_name_match: bool = False
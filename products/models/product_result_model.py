@@ -22,3 +22,7 @@ class ProductResultModel(BaseModel):
     image_url: Optional[str] = None
     score: Optional[float] = None
     source: ProductSource = ProductSource.DB
+    fused_score: Optional[float] = None
+    vector_rank: Optional[int] = None
+    lexical_rank: Optional[int] = None
+    exact_name_match: bool = False
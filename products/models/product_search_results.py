@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Tuple
 
 from products.models.product_result import ProductResult
 
@@ -10,3 +10,5 @@ class ProductSearchResults:
     external_results: List[ProductResult]
     retrieved_count: int = 0
     reranked: bool = False
+    # Filters dropped or widened because nothing matched all of them, in relaxation order.
+    relaxed_filters: Tuple[str, ...] = ()
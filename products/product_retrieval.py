@@ -3,14 +3,18 @@ from typing import Optional
 
 from llm.clients.embeddings import embed_text
 from products.candidate_mapper import rerank_product_results
-from products.constants import DEFAULT_PRODUCT_SEARCH_CANDIDATE_LIMIT
+from products.constants import DEFAULT_PRODUCT_SEARCH_CANDIDATE_LIMIT, PRODUCT_SEARCH_RETRIEVER_LIMIT
+from products.filter_relaxation import relax_product_filters
+from products.hybrid_search import is_confident_ranking
 from products.models.product_query import ProductQuery
 from products.models.product_result import ProductResult
 from products.models.product_search_results import ProductSearchResults
 from products.models.product_source import ProductSource
-from products.repository.product_repository import ProductRepository
+from products.repository.product_repository import MAX_VECTOR_DISTANCE, get_product_repository
+from products.vector_index import get_product_index
 from integrations.brave.client import BraveSearchClient, BraveSearchError
 from integrations.brave.models import ShoppingSearchResult
+from reranker.constants import DEFAULT_TOP_K
 
 
 def _extract_price(text: str) -> Optional[float]:
@@ -73,24 +77,57 @@ def _is_high_confidence_product_detail_url(url: Optional[str]) -> bool:
     return False
 
 
+def _search_catalog(
+    query_text: str,
+    query_embedding: list[float],
+    product_filters: Optional[ProductQuery],
+) -> tuple[list[ProductResult], tuple[str, ...]]:
+    """Catalog candidates for the first filter tier that matches anything, and the filters relaxed to get them."""
+    tiers = relax_product_filters(product_filters)
+    product_index = get_product_index()
+    if product_index is None:
+        results, tier = get_product_repository().search_products_relaxed(
+            query_embedding=query_embedding,
+            filter_tiers=[relaxation.filters for relaxation in tiers],
+            limit=DEFAULT_PRODUCT_SEARCH_CANDIDATE_LIMIT,
+            query_text=query_text,
+        )
+        return results, tiers[tier].relaxed if results else ()
+    # The in-process index has no round trips to save, so its tiers are simply tried in turn.
+    for relaxation in tiers:
+        results = product_index.search_products(
+            query_embedding=query_embedding,
+            product_filters=relaxation.filters,
+            limit=DEFAULT_PRODUCT_SEARCH_CANDIDATE_LIMIT,
+            query_text=query_text,
+            retriever_limit=PRODUCT_SEARCH_RETRIEVER_LIMIT,
+            max_distance=MAX_VECTOR_DISTANCE,
+        )
+        if results:
+            return results, relaxation.relaxed
+    return [], ()
+
+
 def find_products(
     query_text: str,
     product_filters: Optional[ProductQuery] = None,
 ) -> ProductSearchResults:
-    repo = ProductRepository()
     query_embedding = embed_text(query_text or "")
-    internal_results = repo.search_products(
-        query_embedding=query_embedding,
-        product_filters=product_filters,
-        limit=DEFAULT_PRODUCT_SEARCH_CANDIDATE_LIMIT,
-    )
+    internal_results, relaxed_filters = _search_catalog(query_text, query_embedding, product_filters)
     retrieved_count = len(internal_results)
-    internal_results = rerank_product_results(internal_results, goal=query_text)
+    # A confident ranking (exact name hit, both retrievers agreeing on the top product, or a decisive
+    # distance gap) is used as-is.
+    reranked = not is_confident_ranking(internal_results)
+    if reranked:
+        internal_results = rerank_product_results(internal_results, goal=query_text)
+    else:
+        internal_results = internal_results[:DEFAULT_TOP_K]
     return ProductSearchResults(
         internal_results=internal_results,
         external_results=[],
         retrieved_count=retrieved_count,
-        reranked=True,
+        reranked=reranked,
+        relaxed_filters=relaxed_filters,
     )
 
 
@@ -0,0 +1,238 @@
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+import psycopg
+from pgvector.psycopg import register_vector
+from psycopg.rows import dict_row
+
+from db.connection import get_connection
+from db.embedding_migration import EmbeddingSlot
+from db.vector import EMBEDDING_STORAGE, PRODUCT_EMBEDDING
+from products.models.catalog_product import CatalogProduct
+from products.models.product_facets import PRODUCT_FACET_VIEWS
+
+_PRODUCT_COLUMNS = ("id", "name", "description", "category", "color", "style", "gender", "season", "year", "price", "image_url")
+# Binary COPY needs the exact wire type of every staged column.
+_PRODUCT_COPY_TYPES = ("text",) * 8 + ("int4", "float8", "text")
+_STAGE_TABLE = "product_catalog_stage"
+
+
+@dataclass(frozen=True)
+class CatalogLoadState:
+    source: str
+    rows_done: int = 0
+    deferred_indexes: tuple[str, ...] = field(default_factory=tuple)
+
+
+@dataclass(frozen=True)
+class StoredProduct:
+    """What a load needs to know about a product already in the catalog."""
+
+    source_hash: Optional[str]
+    embedding_source_hash: Optional[str]
+    # The slot already holds a vector of this process' model.
+    embedding_current: bool
+
+
+class ProductCatalogLoadRepository:
+    """Checkpointed batch writes of catalog products through binary COPY.
+
+    Each batch is copied into a temporary staging table and merged into `products` with an upsert,
+    in the same transaction that advances the load's checkpoint, so an interrupted load resumes
+    exactly after the last committed batch.
+    """
+
+    def __init__(self, conn: psycopg.Connection | None = None):
+        if conn is None:
+            conn = get_connection()
+            register_vector(conn)
+        self._conn = conn
+
+    def start(self, source: str, *, restart: bool = False) -> CatalogLoadState:
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                """
+                INSERT INTO product_catalog_load (source)
+                VALUES (%s)
+                ON CONFLICT (source) DO UPDATE
+                SET rows_done = CASE WHEN %s THEN 0 ELSE product_catalog_load.rows_done END,
+                    updated_at = now()
+                RETURNING source, rows_done, deferred_indexes
+                """,
+                (source, restart),
+            )
+            return self._row_to_state(cur.fetchone())
+
+    def get_state(self, source: str) -> Optional[CatalogLoadState]:
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                "SELECT source, rows_done, deferred_indexes FROM product_catalog_load WHERE source = %s",
+                (source,),
+            )
+            row = cur.fetchone()
+            return self._row_to_state(row) if row else None
+
+    def catalog_is_empty(self) -> bool:
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute("SELECT NOT EXISTS (SELECT 1 FROM products) AS empty")
+            return bool(cur.fetchone()["empty"])
+
+    def defer_indexes(self, source: str) -> CatalogLoadState:
+        """Drop the secondary indexes of `products`, remembering their definitions on the load.
+
+        Primary-key and unique indexes stay, since the upsert relies on them.
+        """
+        with self._conn.transaction(), self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                """
+                SELECT indexrelid::regclass::text AS name, pg_get_indexdef(indexrelid) AS definition
+                FROM pg_index
+                WHERE indrelid = 'products'::regclass AND NOT indisprimary AND NOT indisunique
+                ORDER BY name
+                """
+            )
+            indexes = cur.fetchall()
+            cur.execute(
+                """
+                UPDATE product_catalog_load
+                SET deferred_indexes = deferred_indexes || %s::text[],
+                    updated_at = now()
+                WHERE source = %s
+                RETURNING source, rows_done, deferred_indexes
+                """,
+                ([index["definition"] for index in indexes], source),
+            )
+            state = self._row_to_state(cur.fetchone())
+            for index in indexes:
+                cur.execute(f"DROP INDEX {index['name']}")
+        return state
+
+    def stored_products(self, ids: Sequence[str], slot: EmbeddingSlot) -> dict[str, StoredProduct]:
+        if not ids:
+            return {}
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                f"""
+                SELECT id,
+                       source_hash,
+                       md5({PRODUCT_EMBEDDING.source_sql}) AS embedding_source_hash,
+                       ({slot.name} IS NOT NULL AND COALESCE({slot.model_column}, %s) = %s) AS embedding_current
+                FROM products
+                WHERE id = ANY(%s)
+                """,
+                (slot.version, slot.version, list(ids)),
+            )
+            return {
+                row["id"]: StoredProduct(
+                    source_hash=row["source_hash"],
+                    embedding_source_hash=row["embedding_source_hash"],
+                    embedding_current=bool(row["embedding_current"]),
+                )
+                for row in cur.fetchall()
+            }
+
+    def write_batch(
+        self,
+        source: str,
+        rows: Sequence[tuple[CatalogProduct, Optional[Sequence[float]]]],
+        slot: EmbeddingSlot,
+        *,
+        rows_done: int,
+        storage: str = EMBEDDING_STORAGE,
+    ) -> int:
+        """Upsert `(product, embedding)` pairs and advance the checkpoint by `rows_done` source rows.
+
+        A missing embedding keeps the stored vector; the product's text did not change.
+        """
+        written = 0
+        with self._conn.transaction(), self._conn.cursor() as cur:
+            if rows:
+                self._create_stage_table(cur, storage)
+                with cur.copy(
+                    f"COPY {_STAGE_TABLE} ({', '.join(_PRODUCT_COLUMNS)}, source_hash, embedding) FROM STDIN WITH (FORMAT BINARY)"
+                ) as copy:
+                    copy.set_types([*_PRODUCT_COPY_TYPES, "text", storage])
+                    for product, embedding in rows:
+                        copy.write_row((*product.values(), product.source_hash, embedding))
+                cur.execute(self._merge_sql(slot), (slot.version,))
+                written = max(0, cur.rowcount)
+            cur.execute(
+                """
+                UPDATE product_catalog_load
+                SET rows_done = rows_done + %s,
+                    updated_at = now()
+                WHERE source = %s
+                """,
+                (rows_done, source),
+            )
+        return written
+
+    @staticmethod
+    def _create_stage_table(cur: psycopg.Cursor, storage: str) -> None:
+        cur.execute(
+            f"""
+            CREATE TEMP TABLE IF NOT EXISTS {_STAGE_TABLE} (
+                id TEXT,
+                name TEXT,
+                description TEXT,
+                category TEXT,
+                color TEXT,
+                style TEXT,
+                gender TEXT,
+                season TEXT,
+                year INT,
+                price DOUBLE PRECISION,
+                image_url TEXT,
+                source_hash TEXT,
+                embedding {storage}
+            ) ON COMMIT DELETE ROWS
+            """
+        )
+
+    @staticmethod
+    def _merge_sql(slot: EmbeddingSlot) -> str:
+        columns = ", ".join(_PRODUCT_COLUMNS)
+        updates = [f"{column} = EXCLUDED.{column}" for column in _PRODUCT_COLUMNS[1:]]
+        updates += [
+            "source_hash = EXCLUDED.source_hash",
+            f"{slot.name} = COALESCE(EXCLUDED.{slot.name}, products.{slot.name})",
+            f"{slot.model_column} = COALESCE(EXCLUDED.{slot.model_column}, products.{slot.model_column})",
+        ]
+        if slot.clears_other:
+            other = PRODUCT_EMBEDDING.other_slot(slot.name)
+            other_model = PRODUCT_EMBEDDING.model_column(other)
+            updates += [
+                f"{other} = CASE WHEN EXCLUDED.{slot.name} IS NULL THEN products.{other} END",
+                f"{other_model} = CASE WHEN EXCLUDED.{slot.name} IS NULL THEN products.{other_model} END",
+            ]
+        return f"""
+            INSERT INTO products ({columns}, source_hash, {slot.name}, {slot.model_column})
+            SELECT {columns}, source_hash, embedding, CASE WHEN embedding IS NULL THEN NULL ELSE %s END
+            FROM {_STAGE_TABLE}
+            ON CONFLICT (id) DO UPDATE
+            SET {", ".join(updates)}
+            WHERE products.source_hash IS DISTINCT FROM EXCLUDED.source_hash OR EXCLUDED.{slot.name} IS NOT NULL
+        """
+
+    def finish(self, source: str, *, maintenance_work_mem: Optional[str] = None) -> None:
+        """Recreate the indexes deferred for the load, refresh statistics and facets, and drop the checkpoint."""
+        state = self.get_state(source)
+        deferred_indexes = state.deferred_indexes if state else ()
+        with self._conn.transaction(), self._conn.cursor() as cur:
+            if maintenance_work_mem:
+                cur.execute("SELECT set_config('maintenance_work_mem', %s, true)", (maintenance_work_mem,))
+            for definition in deferred_indexes:
+                # A restarted load can list an index twice; pg_get_indexdef never says IF NOT EXISTS.
+                cur.execute(definition.replace("CREATE INDEX ", "CREATE INDEX IF NOT EXISTS ", 1))
+            cur.execute("ANALYZE products")
+            for view in PRODUCT_FACET_VIEWS:
+                cur.execute(f"REFRESH MATERIALIZED VIEW {view}")
+            cur.execute("DELETE FROM product_catalog_load WHERE source = %s", (source,))
+
+    @staticmethod
+    def _row_to_state(row: dict) -> CatalogLoadState:
+        return CatalogLoadState(
+            source=row["source"],
+            rows_done=int(row["rows_done"] or 0),
+            deferred_indexes=tuple(row["deferred_indexes"] or ()),
+        )
@@ -1,9 +1,21 @@
 import os
-from typing import Any, Optional, Sequence
+from threading import Lock
+from typing import Any, Iterator, Optional, Sequence
 
 from psycopg.rows import dict_row
 
-from db.connection import get_connection
+from db.connection import PooledConnection, get_connection
+from db.embedding_migration import resolve_embedding_slot
+from db.vector import (
+    BINARY_QUANTIZATION_OVERSAMPLE,
+    EMBEDDING_SQL_TYPE,
+    PRODUCT_EMBEDDING,
+    PRODUCT_SEARCH_BINARY_QUANTIZATION,
+    binary_quantized_sql,
+)
+from products.constants import PRODUCT_NAME_SIMILARITY_THRESHOLD, PRODUCT_SEARCH_RETRIEVER_LIMIT
+from products.hybrid_search import fuse_product_rankings
+from products.models.product_facets import PriceBucket, ProductFacetValue, ProductFacets
 from products.models.product_query import ProductQuery
 from products.models.product_result import ProductResult
 from products.models.product_result_model import ProductResultModel
@@ -12,26 +24,118 @@ from pgvector.psycopg import register_vector
 
 MAX_VECTOR_DISTANCE = float(os.getenv("MAX_VECTOR_DISTANCE", "1.05"))
 
+# Bodies of the product_facet_values and product_price_histogram views (migration 024).
+_FACET_VALUES_SQL = """
+    SELECT facets.facet, facets.value, COUNT(*) AS product_count, MIN(products.price) AS price_min, MAX(products.price) AS price_max
+    FROM products
+    CROSS JOIN LATERAL (
+        VALUES ('category', products.category), ('color', products.color), ('style', products.style),
+               ('gender', products.gender), ('season', products.season)
+    ) AS facets (facet, value)
+    WHERE BTRIM(COALESCE(facets.value, '')) <> ''
+    GROUP BY facets.facet, facets.value
+"""
+_PRICE_HISTOGRAM_SQL = """
+    WITH bounds AS (SELECT MIN(price) AS low, MAX(price) AS high FROM products WHERE price IS NOT NULL)
+    SELECT CASE WHEN bounds.high > bounds.low THEN LEAST(width_bucket(products.price, bounds.low, bounds.high, 10), 10) ELSE 1 END AS bucket,
+           MIN(products.price) AS price_min, MAX(products.price) AS price_max, COUNT(*) AS product_count
+    FROM products, bounds
+    WHERE products.price IS NOT NULL
+    GROUP BY 1
+"""
+
 
 class ProductRepository:
-    def __init__(self):
-        conn = get_connection()
-        register_vector(conn)
-        self._conn = conn
-        self._has_description_column = self._detect_description_column()
+    def __init__(self, conn: PooledConnection | None = None):
+        # Each search borrows a pooled connection (pgvector types registered by the pool), so
+        # concurrent searches do not queue on one connection and a dropped connection is replaced.
+        self._conn = conn or PooledConnection()
+        columns = self._detect_columns()
+        self._has_description_column = "description" in columns
+        self._has_search_text_column = "search_tsv" in columns
 
     def search_products(
             self,
             query_embedding: Sequence[float],
             product_filters: Optional[ProductQuery] = None,
             limit: int = 20,
+            query_text: Optional[str] = None,
     ) -> list[ProductResult]:
-        sql, params = self._build_search_sql(query_embedding, product_filters, limit)
+        """Nearest products by embedding, fused with a full-text/trigram search when `query_text` is given.
 
-        with self._conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(sql, params)
+        Both candidate queries are sent in one pipeline, so the lexical leg adds no extra round trip.
+        """
+        if not (query_text or "").strip() or not self._has_search_text_column:
+            sql, params = self._build_search_sql(query_embedding, product_filters, limit)
+            with self._conn.cursor(row_factory=dict_row) as cur:
+                cur.execute(sql, params)
+                return self._rows_to_results(cur.fetchall())
+
+        retriever_limit = max(limit, PRODUCT_SEARCH_RETRIEVER_LIMIT)
+        vector_sql, vector_params = self._build_search_sql(query_embedding, product_filters, retriever_limit)
+        lexical_sql, lexical_params = self._build_lexical_sql(query_text.strip(), product_filters, retriever_limit)
+        with self._conn.connection() as conn, conn.cursor(row_factory=dict_row) as vector_cur, conn.cursor(row_factory=dict_row) as lexical_cur:
+            with conn.transaction(), conn.pipeline():
+                # `%` matches above this setting and, unlike comparing similarity(), can use the trigram index.
+                # It is transaction-local so it does not stay on the pooled connection for the next borrower.
+                conn.execute(
+                    "SELECT set_config('pg_trgm.similarity_threshold', %s, true)",
+                    [str(PRODUCT_NAME_SIMILARITY_THRESHOLD)],
+                )
+                vector_cur.execute(vector_sql, vector_params)
+                lexical_cur.execute(lexical_sql, lexical_params)
+            vector_rows = vector_cur.fetchall()
+            lexical_rows = lexical_cur.fetchall()
+        return fuse_product_rankings(
+            self._rows_to_results(vector_rows),
+            self._rows_to_results(lexical_rows),
+            limit=limit,
+        )
+
+    def search_products_relaxed(
+            self,
+            query_embedding: Sequence[float],
+            filter_tiers: Sequence[Optional[ProductQuery]],
+            limit: int = 20,
+            query_text: Optional[str] = None,
+    ) -> tuple[list[ProductResult], int]:
+        """`search_products` over progressively relaxed filters, answered in one round trip.
+
+        Returns the results of the first tier that matched anything, with that tier's index.
+        """
+        if len(filter_tiers) <= 1:
+            return self.search_products(query_embedding, filter_tiers[0] if filter_tiers else None, limit, query_text), 0
+
+        lexical = bool((query_text or "").strip()) and self._has_search_text_column
+        retriever_limit = max(limit, PRODUCT_SEARCH_RETRIEVER_LIMIT) if lexical else limit
+        sql, params = self._build_relaxed_search_sql(
+            query_embedding,
+            filter_tiers,
+            retriever_limit,
+            query_text.strip() if lexical else None,
+        )
+        with self._conn.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+            if lexical:
+                with conn.transaction(), conn.pipeline():
+                    conn.execute(
+                        "SELECT set_config('pg_trgm.similarity_threshold', %s, true)",
+                        [str(PRODUCT_NAME_SIMILARITY_THRESHOLD)],
+                    )
+                    cur.execute(sql, params)
+            else:
+                cur.execute(sql, params)
             rows = cur.fetchall()
+        if not rows:
+            return [], 0
 
+        tier = min(int(r["tier"]) for r in rows)
+        vector_results = self._rows_to_results([r for r in rows if r["tier"] == tier and r["retriever"] == "vector"])
+        if not lexical:
+            return vector_results, tier
+        lexical_results = self._rows_to_results([r for r in rows if r["tier"] == tier and r["retriever"] == "lexical"])
+        return fuse_product_rankings(vector_results, lexical_results, limit=limit), tier
+
+    def _rows_to_results(self, rows: list[dict[str, Any]]) -> list[ProductResult]:
         results: list[ProductResult] = []
         for r in rows:
             data = {
@@ -49,49 +153,116 @@ class ProductRepository:
                 "image_url": r.get("image_url"),
                 "score": float(r["distance"]) if r.get("distance") is not None else None,
                 "source": ProductSource.DB,
+                "exact_name_match": bool(r.get("exact_name_match")),
             }
             validated = ProductResultModel.model_validate(data).model_dump()
             results.append(ProductResult(**validated))
         return results
 
     def list_categories(self, limit: int = 200) -> list[str]:
+        return self.get_facets().categories(limit)
+
+    def get_facets(self) -> ProductFacets:
+        """Facet values and price histogram from the views refreshed on each catalog load.
+
+        Before migration 024 they are aggregated from `products` directly.
+        """
         with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute("SELECT to_regclass('product_facet_values') IS NOT NULL AS present")
+            row = cur.fetchone()
+            materialized = bool(row and row["present"])
             cur.execute(
+                f"""
+                SELECT facet, value, product_count, price_min, price_max
+                FROM {"product_facet_values" if materialized else f"({_FACET_VALUES_SQL}) AS facet_values"}
+                ORDER BY facet, product_count DESC, value
                 """
-                SELECT DISTINCT category
-                FROM products
-                WHERE category IS NOT NULL AND BTRIM(category) <> ''
-                ORDER BY category
-                LIMIT %s
-                """,
-                [limit],
             )
-            rows = cur.fetchall()
-        return [str(r["category"]) for r in rows if r.get("category")]
+            value_rows = cur.fetchall()
+            cur.execute(
+                f"""
+                SELECT price_min, price_max, product_count
+                FROM {"product_price_histogram" if materialized else f"({_PRICE_HISTOGRAM_SQL}) AS price_histogram"}
+                ORDER BY bucket
+                """
+            )
+            bucket_rows = cur.fetchall()
 
-    def _detect_description_column(self) -> bool:
+        values: dict[str, list[ProductFacetValue]] = {}
+        for r in value_rows:
+            values.setdefault(str(r["facet"]), []).append(
+                ProductFacetValue(
+                    value=str(r["value"]),
+                    product_count=int(r["product_count"]),
+                    price_min=float(r["price_min"]) if r["price_min"] is not None else None,
+                    price_max=float(r["price_max"]) if r["price_max"] is not None else None,
+                )
+            )
+        return ProductFacets(
+            values={facet: tuple(facet_values) for facet, facet_values in values.items()},
+            price_histogram=tuple(
+                PriceBucket(
+                    price_min=float(r["price_min"]),
+                    price_max=float(r["price_max"]),
+                    product_count=int(r["product_count"]),
+                )
+                for r in bucket_rows
+            ),
+        )
+
+    def get_catalog_version(self) -> int | None:
+        """Bumped by a trigger on every write to `products`; None before migration 018."""
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute("SELECT to_regclass('product_catalog_version') IS NOT NULL AS present")
+            row = cur.fetchone()
+            if not row or not row["present"]:
+                return None
+            cur.execute("SELECT version FROM product_catalog_version")
+            row = cur.fetchone()
+        return int(row["version"]) if row else None
+
+    def iter_catalog(self, batch_size: int = 2000) -> Iterator[dict[str, Any]]:
+        """Every product row with its embedding, streamed through a server-side cursor.
+
+        The scan runs on its own connection, so searches are not held up while the catalog streams.
+        """
+        description_select = "description" if self._has_description_column else "NULL AS description"
+        embedding_column = resolve_embedding_slot(PRODUCT_EMBEDDING).name
+        with get_connection() as conn:
+            register_vector(conn)
+            with conn.transaction(), conn.cursor(name="product_catalog", row_factory=dict_row) as cur:
+                cur.itersize = batch_size
+                cur.execute(
+                    f"""
+                    SELECT id, name, {description_select}, category, color, style, gender, season, year, price, image_url, {embedding_column}::vector AS embedding
+                    FROM products
+                    WHERE {embedding_column} IS NOT NULL
+                    ORDER BY id
+                    """
+                )
+                yield from cur
+
+    def _detect_columns(self) -> set[str]:
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
                 """
-                SELECT 1
+                SELECT column_name
                 FROM information_schema.columns
                 WHERE table_name = 'products'
-                  AND column_name = 'description'
-                LIMIT 1
+                  AND column_name IN ('description', 'search_tsv')
                 """
             )
-            return cur.fetchone() is not None
+            return {str(r["column_name"]) for r in cur.fetchall()}
 
-    def _build_search_sql(
-        self,
-        query_embedding: Sequence[float],
-        product_filters: Optional["ProductQuery"],
-        limit: int,
-    ) -> tuple[str, list[Any]]:
+    def _filter_clauses(self, product_filters: Optional["ProductQuery"]) -> tuple[list[str], list[Any]]:
         where: list[str] = []
         params: list[Any] = []
 
         if product_filters:
+            if product_filters.category:
+                where.append("LOWER(category) = ANY(%s)")
+                params.append([category.lower() for category in product_filters.category])
+
             if product_filters.color:
                 where.append("LOWER(color) = LOWER(%s)")
                 params.append(product_filters.color)
@@ -112,19 +283,172 @@ class ProductRepository:
                 where.append("LOWER(style) LIKE LOWER(%s)")
                 params.append(f"%{product_filters.style}%")
 
-        where.append("(embedding <-> (%s)::vector) <= %s")
-        where_sql = ("WHERE " + " AND ".join(where)) if where else ""
+        return where, params
+
+    def _select_columns(self) -> str:
         description_select = "description," if self._has_description_column else "NULL AS description,"
+        return f"id, name, {description_select} category, color, style, gender, season, year, price, image_url"
+
+    def _build_search_sql(
+        self,
+        query_embedding: Sequence[float],
+        product_filters: Optional["ProductQuery"],
+        limit: int,
+    ) -> tuple[str, list[Any]]:
+        where, params = self._filter_clauses(product_filters)
+        if PRODUCT_SEARCH_BINARY_QUANTIZATION:
+            return self._build_quantized_search_sql(query_embedding, where, params, limit)
+        embedding_column = f"products.{resolve_embedding_slot(PRODUCT_EMBEDDING).name}"
+        where.append(f"({embedding_column} <-> query.embedding) <= %s")
+        where_sql = "WHERE " + " AND ".join(where)
 
+        # The query vector is sent once; the one-row subquery is pulled up, so the vector index still applies.
         sql = f"""
             SELECT
-              id, name, {description_select} category, color, style, gender, season, year, price, image_url,
-              (embedding <-> (%s)::vector) AS distance
+              {self._select_columns()},
+              ({embedding_column} <-> query.embedding) AS distance
+            FROM products, (SELECT (%s)::{EMBEDDING_SQL_TYPE} AS embedding) AS query
+            {where_sql}
+            ORDER BY {embedding_column} <-> query.embedding
+            LIMIT %s
+        """
+
+        final_params = [list(query_embedding), *params, MAX_VECTOR_DISTANCE, limit]
+        return sql, final_params
+
+    def _build_quantized_search_sql(
+        self,
+        query_embedding: Sequence[float],
+        where: list[str],
+        params: list[Any],
+        limit: int,
+    ) -> tuple[str, list[Any]]:
+        """Hamming-distance candidates from the binary-quantized index, re-ranked on the stored vectors.
+
+        The candidate pass reads one bit per dimension; only `limit * BINARY_QUANTIZATION_OVERSAMPLE`
+        rows are compared at full precision.
+        """
+        where_sql = ("WHERE " + " AND ".join(where)) if where else ""
+        embedding_column = resolve_embedding_slot(PRODUCT_EMBEDDING).name
+        sql = f"""
+            WITH query AS (
+              SELECT (%s)::{EMBEDDING_SQL_TYPE} AS embedding
+            ),
+            candidates AS (
+              SELECT products.*
+              FROM products, query
+              {where_sql}
+              ORDER BY {binary_quantized_sql(f"products.{embedding_column}")} <~> {binary_quantized_sql("query.embedding")}
+              LIMIT %s
+            )
+            SELECT
+              {self._select_columns()},
+              (candidates.{embedding_column} <-> query.embedding) AS distance
+            FROM candidates, query
+            WHERE (candidates.{embedding_column} <-> query.embedding) <= %s
+            ORDER BY candidates.{embedding_column} <-> query.embedding
+            LIMIT %s
+        """
+
+        final_params = [
+            list(query_embedding),
+            *params,
+            limit * BINARY_QUANTIZATION_OVERSAMPLE,
+            MAX_VECTOR_DISTANCE,
+            limit,
+        ]
+        return sql, final_params
+
+    def _build_relaxed_search_sql(
+        self,
+        query_embedding: Sequence[float],
+        filter_tiers: Sequence[Optional["ProductQuery"]],
+        limit: int,
+        query_text: Optional[str] = None,
+    ) -> tuple[str, list[Any]]:
+        """The vector (and lexical) search of every filter tier, combined with UNION ALL.
+
+        Each tier's candidates are a materialized CTE, and a tier's branch is gated on every earlier
+        CTE being empty. The uncorrelated NOT EXISTS is planned as a one-time filter, so a later tier
+        is only searched when the tiers before it found nothing.
+        """
+        ctes: list[str] = []
+        branches: list[str] = []
+        params: list[Any] = []
+        earlier: list[str] = []
+        for tier, tier_filters in enumerate(filter_tiers):
+            legs = [("vector", *self._build_search_sql(query_embedding, tier_filters, limit))]
+            if query_text:
+                legs.append(("lexical", *self._build_lexical_sql(query_text, tier_filters, limit)))
+            gate = " AND ".join(f"NOT EXISTS (SELECT 1 FROM {name})" for name in earlier)
+            names: list[str] = []
+            for retriever, leg_sql, leg_params in legs:
+                name = f"tier_{tier}_{retriever}"
+                ctes.append(f"{name} AS MATERIALIZED ({leg_sql})")
+                params.extend(leg_params)
+                # Lexical rows already carry exact_name_match; vector rows get a constant so the branches line up.
+                exact_name_match = "" if retriever == "lexical" else ", FALSE AS exact_name_match"
+                branches.append(
+                    f"SELECT {name}.*{exact_name_match}, {tier} AS tier, '{retriever}' AS retriever FROM {name}"
+                    + (f" WHERE {gate}" if gate else "")
+                )
+                names.append(name)
+            earlier.extend(names)
+
+        # Branches are appended in order and each CTE keeps its ORDER BY, so rows arrive ranked per retriever.
+        sql = "WITH " + ",\n".join(ctes) + "\n" + "\nUNION ALL\n".join(branches)
+        return sql, params
+
+    def _build_lexical_sql(
+        self,
+        query_text: str,
+        product_filters: Optional["ProductQuery"],
+        limit: int,
+    ) -> tuple[str, list[Any]]:
+        """Full-text matches over name/category/description plus fuzzy product-name matches.
+
+        Ranking favours exact names, then `ts_rank_cd` on the weighted tsvector plus name trigram
+        similarity, which covers product names the English stemmer mangles.
+        """
+        where, params = self._filter_clauses(product_filters)
+        where.append("(search_tsv @@ websearch_to_tsquery('english', %s) OR LOWER(name) %% LOWER(%s))")
+        where_sql = "WHERE " + " AND ".join(where)
+
+        sql = f"""
+            SELECT
+              {self._select_columns()},
+              NULL::float8 AS distance,
+              LOWER(name) = LOWER(%s) AS exact_name_match
             FROM products
             {where_sql}
-            ORDER BY embedding <-> (%s)::vector
+            ORDER BY
+              LOWER(name) = LOWER(%s) DESC,
+              ts_rank_cd(search_tsv, websearch_to_tsquery('english', %s)) + similarity(LOWER(name), LOWER(%s)) DESC,
+              id
             LIMIT %s
         """
 
-        final_params = [list(query_embedding), *params, list(query_embedding), MAX_VECTOR_DISTANCE, list(query_embedding), limit]
+        final_params = [
+            query_text,
+            *params,
+            query_text,
+            query_text,
+            query_text,
+            query_text,
+            query_text,
+            limit,
+        ]
         return sql, final_params
+
+
+_PRODUCT_REPOSITORY: ProductRepository | None = None
+_PRODUCT_REPOSITORY_LOCK = Lock()
+
+
+def get_product_repository() -> ProductRepository:
+    """Shared repository, so catalog searches borrow pooled connections instead of opening one per call."""
+    global _PRODUCT_REPOSITORY
+    with _PRODUCT_REPOSITORY_LOCK:
+        if _PRODUCT_REPOSITORY is None:
+            _PRODUCT_REPOSITORY = ProductRepository()
+        return _PRODUCT_REPOSITORY
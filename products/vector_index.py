@@ -0,0 +1,489 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from threading import Lock, Thread
+from time import monotonic
+from typing import Any, Iterable, Optional, Sequence
+
+import numpy as np
+import psycopg
+
+from common.config import get_env_bool, get_env_float, get_env_int
+from products.hybrid_search import fuse_product_rankings
+from products.models.product_query import ProductQuery
+from products.models.product_result import ProductResult
+from products.models.product_source import ProductSource
+
+PRODUCT_INDEX_ENABLED = get_env_bool("PRODUCT_INDEX_ENABLED", False)
+PRODUCT_INDEX_PATH = Path(os.getenv("PRODUCT_INDEX_PATH", "data/products/index"))
+PRODUCT_INDEX_AUTO_REBUILD = get_env_bool("PRODUCT_INDEX_AUTO_REBUILD", True)
+# The catalog version is re-read from Postgres at most this often.
+PRODUCT_INDEX_VERSION_CHECK_SECONDS = max(0.0, get_env_float("PRODUCT_INDEX_VERSION_CHECK_SECONDS", 30.0))
+# A rebuild waits until the catalog version has stopped changing for this long, so a catalog load
+# (which bumps the version on every batch) is indexed once it finishes rather than half-way through.
+PRODUCT_INDEX_REBUILD_DEBOUNCE_SECONDS = max(0.0, get_env_float("PRODUCT_INDEX_REBUILD_DEBOUNCE_SECONDS", 120.0))
+# Lists scanned per query; more lists trade latency for recall.
+PRODUCT_INDEX_PROBE_LISTS = max(1, get_env_int("PRODUCT_INDEX_PROBE_LISTS", 24))
+# Filters that leave at most this many products are scanned in full instead of through the lists.
+PRODUCT_INDEX_EXACT_MAX_ROWS = max(1, get_env_int("PRODUCT_INDEX_EXACT_MAX_ROWS", 8192))
+# Candidates kept by the binary-code pass, per requested result, for rescoring with int8 vectors.
+PRODUCT_INDEX_RESCORE_FACTOR = max(1, get_env_int("PRODUCT_INDEX_RESCORE_FACTOR", 16))
+PRODUCT_INDEX_FORMAT_VERSION = 2
+FILTER_FIELDS = ("category", "color", "gender", "season", "style")
+PRODUCT_FIELDS = ("id", "name", "description", "category", "color", "style", "gender", "season", "year", "price", "image_url")
+_KMEANS_TRAINING_ROWS = 20_000
+_KMEANS_ITERATIONS = 8
+_TOKEN = re.compile(r"[0-9a-z]+")
+
+
+def _tokens(text: str | None) -> list[str]:
+    return _TOKEN.findall((text or "").lower())
+
+
+def _nearest_centroids(vectors: np.ndarray, centroids: np.ndarray, chunk_size: int = 4096) -> np.ndarray:
+    centroid_norms = np.einsum("ij,ij->i", centroids, centroids)
+    assignments = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), chunk_size):
+        chunk = vectors[start : start + chunk_size]
+        # ||x - c||^2 without the ||x||^2 term, which is constant per row.
+        assignments[start : start + chunk_size] = np.argmin(centroid_norms - 2.0 * chunk @ centroids.T, axis=1)
+    return assignments
+
+
+def _sign_codes(vectors: np.ndarray) -> np.ndarray:
+    """One bit per dimension (set when positive), packed into uint64 words per row."""
+    packed = np.packbits(vectors > 0, axis=1)
+    padding = (-packed.shape[1]) % 8
+    if padding:
+        packed = np.pad(packed, ((0, 0), (0, padding)))
+    return packed.view(np.uint64)
+
+
+def _hamming_distances(codes: np.ndarray, query_code: np.ndarray) -> np.ndarray:
+    """Differing bits between each row of `codes` and `query_code`."""
+    differing = np.asarray(codes) ^ query_code
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(differing).sum(axis=1, dtype=np.int32)
+    # NumPy 1.x has no popcount ufunc.
+    return np.unpackbits(differing.view(np.uint8), axis=1).sum(axis=1, dtype=np.int32)
+
+
+def train_lists(vectors: np.ndarray, n_lists: int, *, seed: int = 0) -> np.ndarray:
+    """k-means centroids over a sample of `vectors`, used to partition the index into lists."""
+    rng = np.random.default_rng(seed)
+    sample = vectors[rng.choice(len(vectors), size=min(len(vectors), _KMEANS_TRAINING_ROWS), replace=False)]
+    centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)].copy()
+    for _ in range(_KMEANS_ITERATIONS):
+        assignments = _nearest_centroids(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, sample)
+        counts = np.bincount(assignments, minlength=n_lists)
+        filled = counts > 0
+        centroids[filled] = sums[filled] / counts[filled, None]
+    return centroids
+
+
+class ProductVectorIndex:
+    """Read-only, in-process copy of the product catalog for vector search.
+
+    Rows are grouped by k-means list, so probing a list reads one contiguous block of the
+    memory-mapped arrays. Each row has an int8 embedding with a per-row scale and a packed sign
+    code of the centred embedding: candidates are ranked by Hamming distance on the codes
+    (popcount over a few hundred bytes per row) and only the best few are rescored with the
+    int8 vectors. Filters resolve to packed per-value bitmaps plus a price-sorted row order;
+    when a filter narrows the catalog enough, all remaining rows are scanned instead of lists.
+    """
+
+    def __init__(
+        self,
+        *,
+        catalog_version: int | None,
+        products: list[dict[str, Any]],
+        embeddings: np.ndarray,
+        scales: np.ndarray,
+        codes: np.ndarray,
+        code_center: np.ndarray,
+        centroids: np.ndarray,
+        list_offsets: np.ndarray,
+    ) -> None:
+        self.catalog_version = catalog_version
+        self.products = products
+        self.embeddings = embeddings
+        self.scales = scales.astype(np.float32, copy=False)
+        self.codes = codes
+        self.code_center = code_center.astype(np.float32, copy=False)
+        self.centroids = centroids.astype(np.float32, copy=False)
+        self.list_offsets = list_offsets.astype(np.int64, copy=False)
+        self._row_count = len(products)
+        self._norms = np.empty(self._row_count, dtype=np.float32)
+        for start in range(0, self._row_count, 8192):
+            block = np.asarray(embeddings[start : start + 8192], dtype=np.float32)
+            self._norms[start : start + 8192] = np.einsum("ij,ij->i", block, block) * self.scales[start : start + 8192] ** 2
+
+        prices = np.array([np.nan if product.get("price") is None else float(product["price"]) for product in products], dtype=np.float64)
+        self._price_order = np.argsort(prices, kind="stable")
+        self._sorted_prices = prices[self._price_order]
+
+        self._bitmaps: dict[str, dict[str, np.ndarray]] = {}
+        for field in FILTER_FIELDS:
+            rows_by_value: dict[str, list[int]] = {}
+            for row, product in enumerate(products):
+                value = str(product.get(field) or "").strip().lower()
+                if value:
+                    rows_by_value.setdefault(value, []).append(row)
+            self._bitmaps[field] = {value: self._bitmap(rows) for value, rows in rows_by_value.items()}
+
+        self._rows_by_name: dict[str, np.ndarray] = {}
+        rows_by_token: dict[str, list[int]] = {}
+        for row, product in enumerate(products):
+            name = str(product.get("name") or "").strip().lower()
+            if name:
+                self._rows_by_name[name] = np.append(self._rows_by_name.get(name, np.empty(0, dtype=np.int64)), row)
+            for token in set(_tokens(name)):
+                rows_by_token.setdefault(token, []).append(row)
+        self._rows_by_token = {token: np.array(rows, dtype=np.int64) for token, rows in rows_by_token.items()}
+        self._name_lengths = np.array([len(_tokens(product.get("name"))) for product in products], dtype=np.int32)
+
+    def __len__(self) -> int:
+        return self._row_count
+
+    def _bitmap(self, rows: Iterable[int]) -> np.ndarray:
+        mask = np.zeros(self._row_count, dtype=bool)
+        mask[list(rows)] = True
+        return np.packbits(mask)
+
+    def _filter_mask(self, product_filters: Optional[ProductQuery]) -> np.ndarray | None:
+        """Rows matching `product_filters` (same semantics as the SQL filters), or None for no filter."""
+        if product_filters is None:
+            return None
+        packed: list[np.ndarray] = []
+
+        def any_of(field: str, values: Iterable[str]) -> None:
+            bitmaps = [self._bitmaps[field][value] for value in values if value in self._bitmaps[field]]
+            packed.append(np.bitwise_or.reduce(bitmaps) if bitmaps else np.zeros((self._row_count + 7) // 8, dtype=np.uint8))
+
+        if product_filters.category:
+            any_of("category", [category.strip().lower() for category in product_filters.category])
+        if product_filters.color:
+            any_of("color", [product_filters.color.strip().lower()])
+        if product_filters.gender is not None:
+            any_of("gender", [product_filters.gender.strip().lower()])
+        if product_filters.style:
+            style = product_filters.style.strip().lower()
+            any_of("style", [value for value in self._bitmaps["style"] if style in value])
+
+        mask = None
+        if packed:
+            mask = np.unpackbits(np.bitwise_and.reduce(packed), count=self._row_count).astype(bool)
+        if product_filters.price_min is not None or product_filters.price_max is not None:
+            low = 0 if product_filters.price_min is None else int(np.searchsorted(self._sorted_prices, product_filters.price_min, side="left"))
+            high = (
+                int(np.searchsorted(self._sorted_prices, np.inf, side="right"))
+                if product_filters.price_max is None
+                else int(np.searchsorted(self._sorted_prices, product_filters.price_max, side="right"))
+            )
+            price_mask = np.zeros(self._row_count, dtype=bool)
+            price_mask[self._price_order[low:high]] = True
+            mask = price_mask if mask is None else mask & price_mask
+        return mask
+
+    def _candidate_rows(self, query: np.ndarray, mask: np.ndarray | None) -> np.ndarray:
+        if mask is not None:
+            filtered = np.flatnonzero(mask)
+            if len(filtered) <= PRODUCT_INDEX_EXACT_MAX_ROWS:
+                return filtered
+        centroid_distances = np.einsum("ij,ij->i", self.centroids, self.centroids) - 2.0 * self.centroids @ query
+        probe = min(PRODUCT_INDEX_PROBE_LISTS, len(self.centroids))
+        lists = np.sort(np.argpartition(centroid_distances, probe - 1)[:probe])
+        rows = np.concatenate([np.arange(self.list_offsets[index], self.list_offsets[index + 1]) for index in lists])
+        return rows if mask is None else rows[mask[rows]]
+
+    def _result(self, row: int, *, distance: float | None = None, exact_name_match: bool = False) -> ProductResult:
+        product = self.products[row]
+        return ProductResult(
+            id=str(product["id"]),
+            name=product["name"],
+            description=product.get("description"),
+            category=product.get("category"),
+            color=product.get("color"),
+            style=product.get("style"),
+            gender=product.get("gender"),
+            season=product.get("season"),
+            year=product.get("year"),
+            price=product.get("price"),
+            image_url=product.get("image_url"),
+            score=distance,
+            source=ProductSource.DB,
+            exact_name_match=exact_name_match,
+        )
+
+    def vector_search(
+        self,
+        query_embedding: Sequence[float],
+        product_filters: Optional[ProductQuery] = None,
+        limit: int = 20,
+        max_distance: float | None = None,
+    ) -> list[ProductResult]:
+        query = np.asarray(query_embedding, dtype=np.float32)
+        rows = self._candidate_rows(query, self._filter_mask(product_filters))
+        if len(rows) == 0:
+            return []
+        shortlist = max(limit * PRODUCT_INDEX_RESCORE_FACTOR, 64)
+        if len(rows) > shortlist:
+            query_code = _sign_codes((query - self.code_center)[None, :])[0]
+            hamming = _hamming_distances(self.codes[rows], query_code)
+            rows = np.sort(rows[np.argpartition(hamming, shortlist - 1)[:shortlist]])
+        vectors = np.asarray(self.embeddings[rows], dtype=np.float32)
+        dots = (vectors @ query) * self.scales[rows]
+        distances = np.sqrt(np.maximum(self._norms[rows] + float(query @ query) - 2.0 * dots, 0.0))
+        if max_distance is not None:
+            within = distances <= max_distance
+            rows, distances = rows[within], distances[within]
+        if len(rows) > limit:
+            top = np.argpartition(distances, limit - 1)[:limit]
+            rows, distances = rows[top], distances[top]
+        order = np.argsort(distances, kind="stable")
+        return [self._result(int(rows[i]), distance=float(distances[i])) for i in order]
+
+    def lexical_search(self, query_text: str, product_filters: Optional[ProductQuery] = None, limit: int = 20) -> list[ProductResult]:
+        """Exact product names first, then products whose name contains every query token, shortest first."""
+        mask = self._filter_mask(product_filters)
+        exact = self._rows_by_name.get(query_text.strip().lower(), np.empty(0, dtype=np.int64))
+        postings = [self._rows_by_token.get(token) for token in dict.fromkeys(_tokens(query_text))]
+        if not postings or any(rows is None for rows in postings):
+            matching = np.empty(0, dtype=np.int64)
+        else:
+            matching = postings[0]
+            for rows in postings[1:]:
+                matching = np.intersect1d(matching, rows, assume_unique=True)
+            matching = np.setdiff1d(matching, exact, assume_unique=True)
+            matching = matching[np.argsort(self._name_lengths[matching], kind="stable")]
+        if mask is not None:
+            exact, matching = exact[mask[exact]], matching[mask[matching]]
+        results = [self._result(int(row), exact_name_match=True) for row in exact[:limit]]
+        results.extend(self._result(int(row)) for row in matching[: max(0, limit - len(results))])
+        return results
+
+    def search_products(
+        self,
+        query_embedding: Sequence[float],
+        product_filters: Optional[ProductQuery] = None,
+        limit: int = 20,
+        query_text: Optional[str] = None,
+        *,
+        retriever_limit: int | None = None,
+        max_distance: float | None = None,
+    ) -> list[ProductResult]:
+        """Same contract as ProductRepository.search_products, answered from memory."""
+        if not (query_text or "").strip():
+            return self.vector_search(query_embedding, product_filters, limit, max_distance)
+        candidates = max(limit, retriever_limit or limit)
+        return fuse_product_rankings(
+            self.vector_search(query_embedding, product_filters, candidates, max_distance),
+            self.lexical_search(query_text, product_filters, candidates),
+            limit=limit,
+        )
+
+    def save(self, path: Path) -> None:
+        temp_path = path.with_name(path.name + ".tmp")
+        shutil.rmtree(temp_path, ignore_errors=True)
+        temp_path.mkdir(parents=True)
+        np.save(temp_path / "embeddings.npy", np.asarray(self.embeddings, dtype=np.int8))
+        np.save(temp_path / "scales.npy", self.scales)
+        np.save(temp_path / "codes.npy", np.asarray(self.codes))
+        np.save(temp_path / "code_center.npy", self.code_center)
+        np.save(temp_path / "centroids.npy", self.centroids)
+        np.save(temp_path / "list_offsets.npy", self.list_offsets)
+        (temp_path / "products.json").write_text(json.dumps(self.products, default=str), encoding="utf-8")
+        (temp_path / "manifest.json").write_text(
+            json.dumps(
+                {
+                    "format_version": PRODUCT_INDEX_FORMAT_VERSION,
+                    "catalog_version": self.catalog_version,
+                    "count": self._row_count,
+                    "dimensions": int(self.embeddings.shape[1]) if self.embeddings.ndim == 2 else 0,
+                    "lists": len(self.centroids),
+                }
+            ),
+            encoding="utf-8",
+        )
+        old_path = path.with_name(path.name + ".old")
+        shutil.rmtree(old_path, ignore_errors=True)
+        if path.exists():
+            os.replace(path, old_path)
+        os.replace(temp_path, path)
+        shutil.rmtree(old_path, ignore_errors=True)
+
+
+def build_product_index(
+    products: list[dict[str, Any]],
+    embeddings: np.ndarray,
+    *,
+    catalog_version: int | None,
+    n_lists: int | None = None,
+    seed: int = 0,
+) -> ProductVectorIndex:
+    """Partition the catalog into ~sqrt(n) k-means lists and store rows grouped by list."""
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    resolved_lists = max(1, min(len(vectors), n_lists or int(np.sqrt(len(vectors)))))
+    if len(vectors) == 0:
+        centroids = np.zeros((1, vectors.shape[1] if vectors.ndim == 2 else 0), dtype=np.float32)
+        assignments = np.zeros(0, dtype=np.int32)
+    else:
+        centroids = train_lists(vectors, resolved_lists, seed=seed)
+        assignments = _nearest_centroids(vectors, centroids)
+    order = np.argsort(assignments, kind="stable")
+    list_offsets = np.concatenate([[0], np.cumsum(np.bincount(assignments, minlength=len(centroids)))])
+    vectors = vectors[order]
+    # Symmetric per-row int8 quantization: each row is stored as round(v / scale) with scale = max|v| / 127.
+    scales = np.maximum(np.abs(vectors).max(axis=1, initial=0.0), 1e-12) / 127.0
+    quantized = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+    code_center = vectors.mean(axis=0) if len(vectors) else np.zeros(vectors.shape[1] if vectors.ndim == 2 else 0, dtype=np.float32)
+    return ProductVectorIndex(
+        catalog_version=catalog_version,
+        products=[{field: products[row].get(field) for field in PRODUCT_FIELDS} for row in order],
+        embeddings=quantized,
+        scales=scales.astype(np.float32),
+        codes=_sign_codes(vectors - code_center),
+        code_center=code_center,
+        centroids=centroids,
+        list_offsets=list_offsets,
+    )
+
+
+def load_product_index(path: Path = PRODUCT_INDEX_PATH) -> ProductVectorIndex | None:
+    try:
+        manifest = json.loads((path / "manifest.json").read_text(encoding="utf-8"))
+        if manifest.get("format_version") != PRODUCT_INDEX_FORMAT_VERSION:
+            return None
+        return ProductVectorIndex(
+            catalog_version=manifest.get("catalog_version"),
+            products=json.loads((path / "products.json").read_text(encoding="utf-8")),
+            embeddings=np.load(path / "embeddings.npy", mmap_mode="r"),
+            scales=np.load(path / "scales.npy"),
+            codes=np.load(path / "codes.npy", mmap_mode="r"),
+            code_center=np.load(path / "code_center.npy"),
+            centroids=np.load(path / "centroids.npy"),
+            list_offsets=np.load(path / "list_offsets.npy"),
+        )
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def build_product_index_from_db(path: Path = PRODUCT_INDEX_PATH) -> ProductVectorIndex:
+    """Snapshot the products table into a new on-disk index at `path`."""
+    from products.repository.product_repository import get_product_repository
+
+    repository = get_product_repository()
+    catalog_version = repository.get_catalog_version()
+    products: list[dict[str, Any]] = []
+    embeddings: list[np.ndarray] = []
+    for row in repository.iter_catalog():
+        products.append(
+            {
+                **{field: row.get(field) for field in PRODUCT_FIELDS},
+                "id": str(row["id"]),
+                "price": None if row.get("price") is None else float(row["price"]),
+            }
+        )
+        embeddings.append(np.asarray(row["embedding"], dtype=np.float32))
+    matrix = np.vstack(embeddings) if embeddings else np.zeros((0, 0), dtype=np.float32)
+    index = build_product_index(products, matrix, catalog_version=catalog_version)
+    index.save(path)
+    return load_product_index(path) or index
+
+
+class ProductIndexProvider:
+    """Hands out the loaded index only while it matches the catalog version in Postgres.
+
+    A stale or missing index makes callers fall back to Postgres; with auto-rebuild on, a fresh
+    index is built in the background once the catalog has settled and picked up once it is written.
+    A failed rebuild is retried after PRODUCT_INDEX_VERSION_CHECK_SECONDS rather than on every call.
+    """
+
+    def __init__(self, path: Path = PRODUCT_INDEX_PATH, *, auto_rebuild: bool = PRODUCT_INDEX_AUTO_REBUILD) -> None:
+        self._path = path
+        self._auto_rebuild = auto_rebuild
+        self._index: ProductVectorIndex | None = None
+        self._loaded = False
+        self._checked_at = float("-inf")
+        self._stale = False
+        self._rebuilding = False
+        self._failed_at = float("-inf")
+        self._seen_version: int | None = None
+        self._version_changed_at = float("-inf")
+        self._lock = Lock()
+
+    def _catalog_version(self) -> int | None:
+        from products.repository.product_repository import get_product_repository
+
+        return get_product_repository().get_catalog_version()
+
+    def _rebuild(self) -> None:
+        try:
+            index = build_product_index_from_db(self._path)
+        except Exception:
+            index = None
+        with self._lock:
+            self._rebuilding = False
+            if index is None:
+                self._failed_at = monotonic()
+            else:
+                self._index, self._stale, self._checked_at = index, False, monotonic()
+
+    def _rebuild_due(self) -> bool:
+        now = monotonic()
+        return (
+            now - self._failed_at >= PRODUCT_INDEX_VERSION_CHECK_SECONDS
+            and now - self._version_changed_at >= PRODUCT_INDEX_REBUILD_DEBOUNCE_SECONDS
+        )
+
+    def get(self) -> ProductVectorIndex | None:
+        with self._lock:
+            if not self._loaded:
+                self._loaded = True
+                self._index = load_product_index(self._path)
+                self._stale = self._index is None
+                self._seen_version = None if self._index is None else self._index.catalog_version
+            index = self._index
+            check_due = monotonic() - self._checked_at >= PRODUCT_INDEX_VERSION_CHECK_SECONDS
+            if check_due:
+                self._checked_at = monotonic()
+        if check_due:
+            try:
+                version = self._catalog_version()
+            except psycopg.Error:
+                # Postgres being unreachable is exactly when the static local copy is most useful.
+                version = None
+            with self._lock:
+                if version is not None and version != self._seen_version:
+                    if self._seen_version is not None:
+                        self._version_changed_at = monotonic()
+                    self._seen_version = version
+                # Without a version (no migration 018, or Postgres down) the index cannot be shown stale.
+                self._stale = index is None or (version is not None and version != index.catalog_version)
+        with self._lock:
+            if self._stale and self._auto_rebuild and not self._rebuilding and self._rebuild_due():
+                self._rebuilding = True
+                Thread(target=self._rebuild, name="product-index-rebuild", daemon=True).start()
+            return None if self._stale else self._index
+
+
+_PRODUCT_INDEX_PROVIDER: ProductIndexProvider | None = None
+_PRODUCT_INDEX_PROVIDER_LOCK = Lock()
+
+
+def get_product_index() -> ProductVectorIndex | None:
+    """The in-process product index when enabled and current, otherwise None (search Postgres)."""
+    global _PRODUCT_INDEX_PROVIDER
+    if not PRODUCT_INDEX_ENABLED:
+        return None
+    with _PRODUCT_INDEX_PROVIDER_LOCK:
+        if _PRODUCT_INDEX_PROVIDER is None:
+            _PRODUCT_INDEX_PROVIDER = ProductIndexProvider()
+        provider = _PRODUCT_INDEX_PROVIDER
+    return provider.get()
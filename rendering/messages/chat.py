@@ -6,24 +6,26 @@ from uuid import UUID
 import streamlit as st
 
 from common.data import sanitize_for_json_storage
-from conversation.conversation import generate_conversation_title
-from conversation.models.conversation_models import ConversationRoundtrip
+from conversation.models.conversation_models import ConversationRoundtrip, RoundtripProjection
 from conversation.repository.repo_factory import get_conversation_repo
-from conversation.summary_service import rebuild_conversation_summaries
+from jobs.enqueue import enqueue_conversation_summary, enqueue_conversation_title
 from request_orchestrator.models.orchestrator_result import OrchestratorResult
 from rendering.feedback import render_feedback_controls
-from rendering.rendering import render_assistant_content, format_timestamp, _format_roundtrip_usage_summary, fetch_llm_usage_for_roundtrip
+from rendering.render_cache import get_render_cache
+from rendering.rendering import render_assistant_content, format_timestamp, _format_roundtrip_usage_summary
 from common.config import (
     CONTENT_KEY,
     ROLE_ASSISTANT,
     ROLE_KEY,
     ROLE_USER,
-    SUMMARY_BATCH_SIZE,
-    SUMMARY_TRIGGER_SIZE,
 )
 
 
 MESSAGE_HISTORY_LIMIT = 10
+PENDING_TITLE_KEY = "pending_conversation_title"
+TITLE_POLL_SECONDS = 2
+TITLE_POLL_LIMIT = 30
+UNNAMED_CONVERSATION_TITLE = "Unnamed"
 
 
 def _build_answer_payload(answer: OrchestratorResult) -> dict:
@@ -35,6 +37,7 @@ def ensure_messages_loaded(conversation_repository, conversation_id: str, limit:
             UUID(conversation_id),
             limit=limit,
             newest_first=True,
+            projection=RoundtripProjection.RENDER,
         )
         st.session_state.messages = []
         for rt in roundtrips:
@@ -57,6 +60,10 @@ def ensure_messages_loaded(conversation_repository, conversation_id: str, limit:
 
 def render_messages(conversation_repository, conversation_id: str, render_message, limit: int = MESSAGE_HISTORY_LIMIT) -> None:
     ensure_messages_loaded(conversation_repository, conversation_id, limit=limit)
+    # One grouped usage query for every visible turn instead of one per rendered message.
+    get_render_cache().preload(
+        [msg["roundtrip_id"] for msg in st.session_state.messages if msg.get(ROLE_KEY) == ROLE_ASSISTANT and msg.get("roundtrip_id")]
+    )
     for msg in st.session_state.messages:
         render_message(msg)
 
@@ -66,11 +73,24 @@ def _update_conversation_summary(conversation_id: str, roundtrip: ConversationRo
     if roundtrip.message_index < 1:
         return
 
-    rebuild_conversation_summaries(
-        conversation_id,
-        summary_batch_size=SUMMARY_BATCH_SIZE,
-        summary_trigger_size=SUMMARY_TRIGGER_SIZE,
-    )
+    # Rebuilt by the job worker; turns arriving while a rebuild is queued share it.
+    enqueue_conversation_summary(conversation_id)
+
+
+@st.fragment(run_every=TITLE_POLL_SECONDS)
+def render_pending_title_refresh() -> None:
+    # The title job lands after the turn has rendered; rerun the app once it does so the sidebar picks it up.
+    pending = st.session_state.get(PENDING_TITLE_KEY)
+    if not pending:
+        return
+    pending["polls"] += 1
+    conversation = get_conversation_repo().get_conversation(UUID(pending["conversation_id"]))
+    title = conversation.title if conversation is not None else None
+    if title and title != UNNAMED_CONVERSATION_TITLE:
+        st.session_state.pop(PENDING_TITLE_KEY, None)
+        st.rerun(scope="app")
+    if pending["polls"] >= TITLE_POLL_LIMIT:
+        st.session_state.pop(PENDING_TITLE_KEY, None)
 
 
 def append_assistant_response(
@@ -79,8 +99,6 @@ def append_assistant_response(
     answer: OrchestratorResult,
     roundtrip: ConversationRoundtrip,
 ) -> None:
-    conversation_repository = get_conversation_repo()
-
     payload = _build_answer_payload(answer)
     rendered_response = str(answer.raw_response or roundtrip.generated_response or "")
 
@@ -95,6 +113,8 @@ def append_assistant_response(
         "feedback_id": None,
     }
     st.session_state.messages.append(assistant_message)
+    render_cache = get_render_cache()
+    render_cache.invalidate(str(roundtrip.id))
     with st.chat_message(ROLE_ASSISTANT):
         render_assistant_content(
             rendered_response,
@@ -107,14 +127,11 @@ def append_assistant_response(
             sources_payload=payload,
             feedback_id=None,
             timestamp=format_timestamp(now),
-            usage_summary=_format_roundtrip_usage_summary(fetch_llm_usage_for_roundtrip(str(roundtrip.id))),
+            usage_summary=_format_roundtrip_usage_summary(render_cache.llm_usage_summary(str(roundtrip.id))),
         )
 
     _update_conversation_summary(conversation_id, roundtrip)
 
-    if roundtrip.message_index == 0:
-        conversation_repository.set_conversation_title(
-            conversation_id,
-            generate_conversation_title(user_query),
-        )
-        st.rerun()
+    if roundtrip.message_index == 0 and enqueue_conversation_title(conversation_id, user_query):
+        st.session_state[PENDING_TITLE_KEY] = {"conversation_id": conversation_id, "polls": 0}
+        render_pending_title_refresh()
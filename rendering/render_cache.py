@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence
+from uuid import UUID
+
+import streamlit as st
+
+from common.logging import fetch_agent_logs_for_roundtrip
+from conversation.repository.repo_factory import get_conversation_repo
+from llm.usage import build_llm_usage_summary_payload
+
+RENDER_CACHE_SESSION_KEY = "render_cache"
+
+
+@dataclass
+class _ContentEntry:
+    content: str
+    payload: dict | None
+    value: Any
+
+
+@dataclass
+class RenderCache:
+    """Per-roundtrip render inputs kept across Streamlit reruns.
+
+    Parsed evidence and result blocks are reused until the message's content or payload changes.
+    Usage summaries are loaded for every visible roundtrip in one grouped query and, like agent
+    logs, are dropped whenever the set of visible roundtrips changes (a new turn or conversation).
+    """
+
+    visible_roundtrip_ids: tuple[str, ...] = ()
+    contents: dict[str, _ContentEntry] = field(default_factory=dict)
+    llm_usage: dict[str, dict[str, Any] | None] = field(default_factory=dict)
+    agent_logs: dict[str, dict[str, list[dict[str, Any]]]] = field(default_factory=dict)
+
+    def preload(self, roundtrip_ids: Sequence[str]) -> None:
+        visible = tuple(dict.fromkeys(roundtrip_id for roundtrip_id in roundtrip_ids if roundtrip_id))
+        if visible != self.visible_roundtrip_ids:
+            self.visible_roundtrip_ids = visible
+            self.contents = {key: entry for key, entry in self.contents.items() if key in visible}
+            self.llm_usage = {}
+            self.agent_logs = {}
+        self._load_llm_usage([roundtrip_id for roundtrip_id in visible if roundtrip_id not in self.llm_usage])
+
+    def invalidate(self, roundtrip_id: str) -> None:
+        self.contents.pop(roundtrip_id, None)
+        self.llm_usage.pop(roundtrip_id, None)
+        self.agent_logs.pop(roundtrip_id, None)
+
+    def rendered_content(
+        self,
+        roundtrip_id: str | None,
+        content: str,
+        payload: dict | None,
+        build: Callable[[str, dict | None], Any],
+    ) -> Any:
+        if not roundtrip_id:
+            return build(content, payload)
+        entry = self.contents.get(roundtrip_id)
+        if entry is None or entry.payload is not payload or entry.content != content:
+            entry = _ContentEntry(content=content, payload=payload, value=build(content, payload))
+            self.contents[roundtrip_id] = entry
+        return entry.value
+
+    def llm_usage_summary(self, roundtrip_id: str | None) -> dict[str, Any] | None:
+        if not roundtrip_id:
+            return None
+        if roundtrip_id not in self.llm_usage:
+            self._load_llm_usage([roundtrip_id])
+        return self.llm_usage.get(roundtrip_id)
+
+    def roundtrip_agent_logs(self, roundtrip_id: str | None) -> dict[str, list[dict[str, Any]]]:
+        if not roundtrip_id:
+            return {}
+        if roundtrip_id not in self.agent_logs:
+            self.agent_logs[roundtrip_id] = fetch_agent_logs_for_roundtrip(roundtrip_id)
+        return self.agent_logs[roundtrip_id]
+
+    def _load_llm_usage(self, roundtrip_ids: list[str]) -> None:
+        if not roundtrip_ids:
+            return
+        summaries = fetch_llm_usage_summaries_for_roundtrips(roundtrip_ids)
+        for roundtrip_id in roundtrip_ids:
+            self.llm_usage[roundtrip_id] = summaries.get(roundtrip_id)
+
+
+def fetch_llm_usage_summaries_for_roundtrips(roundtrip_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
+    """Usage summaries keyed by roundtrip id; roundtrips without recorded calls are left out."""
+    parsed_ids: list[UUID] = []
+    for roundtrip_id in roundtrip_ids:
+        try:
+            parsed_ids.append(UUID(str(roundtrip_id)))
+        except ValueError:
+            continue
+    if not parsed_ids:
+        return {}
+    try:
+        aggregates = get_conversation_repo().summarize_llm_calls_for_roundtrips(parsed_ids)
+    except Exception:
+        return {}
+    return {str(roundtrip_id): build_llm_usage_summary_payload(aggregate) for roundtrip_id, aggregate in aggregates.items()}
+
+
+def get_render_cache() -> RenderCache:
+    cache = st.session_state.get(RENDER_CACHE_SESSION_KEY)
+    if not isinstance(cache, RenderCache):
+        cache = RenderCache()
+        st.session_state[RENDER_CACHE_SESSION_KEY] = cache
+    return cache
@@ -7,11 +7,12 @@ from typing import Any
 import streamlit as st
 
 from common.config import CONTENT_KEY, FILES_DIR, IMAGE_MIME_PREFIX, ROLE_ASSISTANT, ROLE_DEBUG, ROLE_KEY
-from common.logging import fetch_agent_logs_for_roundtrip, fetch_llm_call_payloads_for_roundtrip
+from common.logging import fetch_llm_call_payloads_for_roundtrip
 from llm.usage import build_llm_usage_payload
 from rendering.cards import render_cards, render_magic_card_evidence_cards, render_magic_card_rulings
 from rendering.debug import debug_render_message, render_agent_logs
 from rendering.feedback import render_feedback_controls
+from rendering.render_cache import get_render_cache
 from rendering.replay import render_replay_control
 from request_orchestrator.models.evidence import EvidenceUrl, HydratedEvidence
 from request_orchestrator.models.synthesized_result import SynthesisResultBlock
@@ -126,7 +127,7 @@ def _format_roundtrip_duration(payload: dict | None) -> str | None:
     return None
 
 
-def _render_roundtrip_llm_usage(llm_usage: dict | None) -> None:
+def _render_roundtrip_llm_usage(llm_usage: dict | None, *, roundtrip_id: str | None = None) -> None:
     if not isinstance(llm_usage, dict):
         return
     summary = llm_usage.get("summary") if isinstance(llm_usage.get("summary"), dict) else {}
@@ -138,6 +139,10 @@ def _render_roundtrip_llm_usage(llm_usage: dict | None) -> None:
     with st.expander(title):
         if summary:
             st.json(summary, expanded=False)
+        # Preloaded summaries carry no per-call rows; those are only queried when asked for.
+        if not calls and roundtrip_id and st.toggle("Show calls", key=f"llm_usage_calls_{roundtrip_id}"):
+            detailed_usage = fetch_llm_usage_for_roundtrip(roundtrip_id) or {}
+            calls = detailed_usage.get("calls") or []
         if calls:
             st.json(calls, expanded=False)
 
@@ -193,8 +198,13 @@ def _normalize_block_evidence_ids(
     return normalized_ids
 
 
-def get_renderable_result_blocks(content: str, payload: dict | None) -> list[SynthesisResultBlock]:
-    hydrated_evidence_by_id = _get_hydrated_evidence_by_id(payload)
+def get_renderable_result_blocks(
+    content: str,
+    payload: dict | None,
+    hydrated_evidence_by_id: dict[str, HydratedEvidence] | None = None,
+) -> list[SynthesisResultBlock]:
+    if hydrated_evidence_by_id is None:
+        hydrated_evidence_by_id = _get_hydrated_evidence_by_id(payload)
     if isinstance(payload, dict):
         raw_blocks = payload.get("result")
         if isinstance(raw_blocks, list):
@@ -357,15 +367,28 @@ def _render_result_block(
     return block_cards
 
 
+def _build_renderable_content(
+    content: str,
+    payload: dict | None,
+) -> tuple[dict[str, HydratedEvidence], list[SynthesisResultBlock]]:
+    hydrated_evidence_by_id = _get_hydrated_evidence_by_id(payload)
+    return hydrated_evidence_by_id, get_renderable_result_blocks(content, payload, hydrated_evidence_by_id)
+
+
 def render_assistant_content(content: str, payload: dict | None, *, roundtrip_id: str | None = None) -> None:
     next_question = None
     if isinstance(payload, dict):
         next_question = payload.get("next_question")
-    hydrated_evidence_by_id = _get_hydrated_evidence_by_id(payload)
-    result_blocks = get_renderable_result_blocks(content, payload)
+    render_cache = get_render_cache()
+    hydrated_evidence_by_id, result_blocks = render_cache.rendered_content(
+        roundtrip_id,
+        content,
+        payload,
+        _build_renderable_content,
+    )
     has_next_question = isinstance(next_question, str) and bool(next_question)
     all_block_cards: list[EvidenceCard] = []
-    llm_usage = fetch_llm_usage_for_roundtrip(roundtrip_id)
+    llm_usage = render_cache.llm_usage_summary(roundtrip_id)
 
     for block in result_blocks:
         all_block_cards.extend(_render_result_block(block, hydrated_evidence_by_id))
@@ -389,8 +412,8 @@ def render_assistant_content(content: str, payload: dict | None, *, roundtrip_id
     if has_next_question:
         st.markdown(next_question)
 
-    _render_roundtrip_llm_usage(llm_usage)
-    render_agent_logs(fetch_agent_logs_for_roundtrip(roundtrip_id))
+    _render_roundtrip_llm_usage(llm_usage, roundtrip_id=roundtrip_id)
+    render_agent_logs(render_cache.roundtrip_agent_logs(roundtrip_id))
 
 
 def _render_file_preview(attached_file: dict) -> None:
@@ -435,7 +458,7 @@ def render_message(msg: dict) -> None:
                     feedback_id=msg.get("feedback_id"),
                     timestamp=footer_timestamp,
                     usage_summary=_format_roundtrip_usage_summary(
-                        fetch_llm_usage_for_roundtrip(msg.get("roundtrip_id"))
+                        get_render_cache().llm_usage_summary(msg.get("roundtrip_id"))
                     ),
                 )
             else:
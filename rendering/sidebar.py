@@ -14,6 +14,7 @@ from request_orchestrator.agent_runner.models.agent_profile import AgentExecutio
 from request_orchestrator.agents.models.user_agent import UserAgentModelConfig
 from request_orchestrator.agents.repository.repo_factory import get_user_agent_repo
 from rendering.feedback import clear_feedback_state
+from rendering.messages.chat import PENDING_TITLE_KEY, render_pending_title_refresh
 from rendering.replay import clear_replay_state
 from rendering.sources import clear_sources_panel
 from tool.tools import TOOL_CATEGORIES
@@ -817,6 +818,9 @@ def render_sidebar(conversation_repository) -> None:
             st.session_state.debug_turns = []
             st.rerun()
 
+    if st.session_state.get(PENDING_TITLE_KEY):
+        render_pending_title_refresh()
+
     conversations = conversation_repository.list_conversations(user_id=selected_user_id, limit=50)
 
     for c in conversations:
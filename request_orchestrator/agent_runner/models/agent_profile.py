@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
 
+from common.config import get_env_bool, get_env_float
 from llm.conversation_model_config import EVALUATOR_STAGE, ModelSelection, OPENAI_PROVIDER, PLANNER_STAGE
 from tool.tools import TOOL_CATEGORIES
 
@@ -16,6 +17,10 @@ DEFAULT_SYNTHESIS_INSTRUCTION = (
 )
 DEFAULT_REQUEST_ANALYSIS_GOAL = ""
 DEFAULT_MAX_TURNS = 10
+# Latency budgets for one executor iteration. A value <= 0 disables the budget.
+DEFAULT_TOOL_TIMEOUT_SECONDS = get_env_float("AGENT_TOOL_TIMEOUT_SECONDS", 30.0)
+DEFAULT_ITERATION_TIMEOUT_SECONDS = get_env_float("AGENT_ITERATION_TIMEOUT_SECONDS", 60.0)
+DEFAULT_ATTACH_LATE_TOOL_RESULTS = get_env_bool("AGENT_ATTACH_LATE_TOOL_RESULTS", True)
 
 
 class AgentKind(StrEnum):
@@ -51,6 +56,10 @@ class AgentProfile:
     planner_instruction: str = DEFAULT_PLANNER_PROMPT_INSTRUCTION
     planner_rules: str = DEFAULT_PLANNER_RULES
     synthesis_instruction: str = DEFAULT_SYNTHESIS_INSTRUCTION
+    tool_timeout_seconds: float | None = DEFAULT_TOOL_TIMEOUT_SECONDS
+    tool_timeout_overrides: dict[str, float] = field(default_factory=dict)
+    iteration_timeout_seconds: float | None = DEFAULT_ITERATION_TIMEOUT_SECONDS
+    attach_late_tool_results: bool = DEFAULT_ATTACH_LATE_TOOL_RESULTS
 
     def __post_init__(self) -> None:
         resolved_categories = {
@@ -80,6 +89,17 @@ class AgentProfile:
             return None
         return ModelSelection(provider=OPENAI_PROVIDER, model=default_model)
 
+    def timeout_seconds_for_tool(self, tool_name: str) -> float | None:
+        """Profile override first, then the tool definition's budget, then the profile default; 0 means unbounded."""
+        timeout_seconds = self.tool_timeout_overrides.get(tool_name)
+        if timeout_seconds is None:
+            timeout_seconds = getattr(self.tools_by_name.get(tool_name), "timeout_seconds", None)
+        if timeout_seconds is None:
+            timeout_seconds = self.tool_timeout_seconds
+        if timeout_seconds is None or timeout_seconds <= 0:
+            return None
+        return float(timeout_seconds)
+
     def allowed_category_names(self) -> set[str]:
         if self.allowed_categories:
             return set(self.allowed_categories)
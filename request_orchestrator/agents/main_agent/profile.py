@@ -8,12 +8,14 @@ from llm.conversation_model_config import (
 )
 from request_orchestrator.agent_runner.models.agent_profile import AgentProfile
 from request_orchestrator.shared.tool_adapter.memories.get_memory_detail import get_memory_detail
+from request_orchestrator.shared.tool_adapter.memories.recall_memories import recall_memories
 from request_orchestrator.shared.tool_adapter.memories.search_memories import search_memories
 from request_orchestrator.shared.tool_adapter.memories.search_roundtrip_memories import search_roundtrip_memories
 from tool.tools import TOOL_CATEGORIES
 
 READ_ONLY_PROFILE_AND_MEMORY_TOOLS = [
     get_memory_detail,
+    recall_memories,
     search_memories,
     search_roundtrip_memories,
 ]
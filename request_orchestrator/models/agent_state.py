@@ -11,6 +11,7 @@ from request_orchestrator.models.plan import Plan
 from .agent_execution_context import AgentExecutionContext
 from .agent_result import AgentResult
 from .evidence import ToolResult
+from request_orchestrator.shared.evidence import EvidenceIndex
 from request_orchestrator.shared.node_state import AgentNodeStates
 
 @dataclass
@@ -20,6 +21,8 @@ class AgentState:
     execution_context: AgentExecutionContext = field(default_factory=AgentExecutionContext)
     node_states: AgentNodeStates = field(default_factory=AgentNodeStates)
     result: AgentResult = field(default_factory=AgentResult)
+    evidence_index: EvidenceIndex = field(default_factory=EvidenceIndex, repr=False)
+    pending_step_executions: list[Any] = field(default_factory=list, repr=False)
     llm: Any = field(
         default_factory=lambda: build_chat_model(
             provider=ConversationModelConfig.build_default().main_agent.planner.provider,
@@ -86,6 +89,13 @@ class AgentState:
     def gather_tool_results(self) -> list[ToolResult]:
         return [tool_result.model_copy(deep=True) for tool_result in self.result.tool_results]
 
+    def record_tool_result(self, tool_result: ToolResult) -> None:
+        self.result = self.result.with_recorded_tool_result(tool_result)
+        self.evidence_index.record(tool_result)
+
+    def gather_evidence_index(self) -> EvidenceIndex:
+        return self.evidence_index.sync(self.result.tool_results)
+
     def gather_used_tools(self) -> list[str]:
         used_tools: list[str] = []
         seen: set[str] = set()
@@ -67,6 +67,7 @@ class ToolResult(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
     evidence_views: list[EvidenceView] = Field(default_factory=list)
     hydrated_evidence: list[HydratedEvidence] = Field(default_factory=list)
+    cache_hit: bool = Field(default=False, exclude=True)
 
     @classmethod
     def error(cls, error: str, **extra_result: Any) -> "ToolResult":
@@ -10,6 +10,7 @@ from request_orchestrator.models.agent_execution_context import AgentExecutionCo
 from request_orchestrator.models.agent_state import AgentState
 from request_orchestrator.models.orchestrator_result import OrchestratorResult
 from request_orchestrator.models.request_analysis import RequestAnalysis, RequestAnalysisGoal
+from request_orchestrator.shared.evidence import EvidenceIndex
 
 @dataclass
 class MainState:
@@ -92,6 +93,12 @@ class MainState:
             gathered.extend(agent_state.gather_tool_results())
         return gathered
 
+    def gather_evidence_index(self) -> EvidenceIndex:
+        gathered = EvidenceIndex()
+        for agent_state in self.agent_states.values():
+            gathered.extend(agent_state.gather_evidence_index())
+        return gathered
+
     def gather_used_tools(self) -> list[str]:
         used_tools: list[str] = []
         seen: set[str] = set()
@@ -1,9 +1,7 @@
-import threading
 from time import perf_counter
 from uuid import UUID
 
 from common.data import sanitize_for_json_storage
-from llm.clients.embeddings import embed_text
 from llm.repository.repo_factory import get_conversation_model_config_repo
 from personalization.profile.models import GeoMetadata
 from personalization.profile.service import build_user_profile
@@ -14,10 +12,11 @@ from request_orchestrator.models.main_state import MainState
 from request_orchestrator.models.orchestrator_result import OrchestratorResult
 from request_orchestrator.orchestrator import run_agent
 from request_orchestrator.shared.runtime_context import bind_runtime_context
-from tool.summarize_tool_call import summarize_tool_calls
 from conversation.context_builder import build_roundtrip_context
 from conversation.models.conversation_models import ConversationRoundtrip
 from conversation.repository.repo_factory import get_conversation_repo
+from conversation.repository.unit_of_work import roundtrip_unit_of_work
+from jobs.enqueue import enqueue_roundtrip_embedding, enqueue_tool_call_summaries
 
 
 def run_request_orchestrator_for_query(
@@ -81,7 +80,7 @@ def run_request_orchestrator_for_query(
         conversation_model_config=resolved_model_config,
         roundtrip_id=str(roundtrip.id),
         user_id=user_profile.user_id,
-    ):
+    ), roundtrip_unit_of_work(repo):
         orchestrator_result = run_agent(main_state)
 
     roundtrip_latency_ms = int((perf_counter() - started_at) * 1000)
@@ -89,14 +88,14 @@ def run_request_orchestrator_for_query(
     payload = sanitize_for_json_storage(orchestrator_result.to_payload_model().model_dump(exclude_none=True))
     roundtrip_summary = orchestrator_result.roundtrip_summary
 
-    roundtrip_summary_embedding = embed_text(roundtrip_summary) if roundtrip_summary else None
     roundtrip = repo.update_roundtrip(
         roundtrip.id,
         orchestrator_result.raw_response,
         payload,
         roundtrip_summary=roundtrip_summary,
-        roundtrip_summary_embedding=roundtrip_summary_embedding,
     )
-    #TODO: enable this once we improve summarization.
-    #threading.Thread(target=summarize_tool_calls, args=(roundtrip.id,), daemon=True).start()
+    # Embedding the summary and summarizing tool calls happen in the job worker, off the request path.
+    if roundtrip_summary:
+        enqueue_roundtrip_embedding(roundtrip.id)
+    enqueue_tool_call_summaries(roundtrip.id)
     return orchestrator_result, roundtrip
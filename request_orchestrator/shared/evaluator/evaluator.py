@@ -17,11 +17,8 @@ from request_orchestrator.models.evaluation_result import (
     TERMINAL_EVALUATION_STATUSES,
 )
 from request_orchestrator.models.plan_step_ids import namespace_evidence_id
-from request_orchestrator.shared.evidence import (
-    build_evidence_bundle_from_tool_results,
-    build_evidence_steps_from_tool_results,
-)
 from request_orchestrator.shared.evaluator.prompts import build_evaluator_prompt
+from request_orchestrator.shared.executor.executor import attach_late_tool_results
 from llm.chat_models import build_llm_for_stage, resolve_stage_model_name, resolve_stage_provider_name
 
 EVALUATOR_KIND = "evaluator"
@@ -49,12 +46,8 @@ def _namespace_relevant_evidence_ids(agent_name: str, evidence_ids: list[str]) -
 @traceable(name="Evaluator Node")
 def run_evaluator(state: AgentState) -> AgentState:
     execution_context = state.execution_context
-    tool_results = state.gather_tool_results()
-    evidence_bundle = build_evidence_bundle_from_tool_results(tool_results)
-    evidence_steps = build_evidence_steps_from_tool_results(
-        tool_results,
-        evidence_bundle.evidence_views_by_step_id,
-    )
+    attach_late_tool_results(state)
+    evidence_steps = state.gather_evidence_index().evidence_steps()
     prompt = build_evaluator_prompt(state=state, evidence=evidence_steps)
     prompt_text = prompt.build()
     prompt_input_object = prompt.to_log_input_object()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+
 from request_orchestrator.models.agent_prompt import EvidenceStep
 from request_orchestrator.models.evidence import EvidenceBundle, EvidenceView, HydratedEvidence, ToolResult
 from tool.tools import get_tool_result_type
@@ -28,6 +30,92 @@ def _resolve_tool_name(
     return fallback_tool_name
 
 
+@dataclass
+class _IndexedToolResult:
+    step_type: str
+    metadata: dict[str, object]
+    hydrated_evidence: list[HydratedEvidence]
+    evidence_views: list[EvidenceView]
+
+
+@dataclass
+class EvidenceIndex:
+    """Rehydrated evidence keyed by step id, built once per recorded tool result."""
+
+    entries_by_step_id: dict[str, _IndexedToolResult] = field(default_factory=dict)
+
+    def record(self, tool_result: ToolResult) -> None:
+        resolved_step_id = _resolve_step_id(tool_result, fallback_step_id="")
+        if not resolved_step_id:
+            return
+        self.entries_by_step_id[resolved_step_id] = _index_tool_result(tool_result, step_id=resolved_step_id)
+
+    def sync(self, tool_results: list[ToolResult]) -> "EvidenceIndex":
+        synced_entries: dict[str, _IndexedToolResult] = {}
+        for tool_result in tool_results:
+            resolved_step_id = _resolve_step_id(tool_result, fallback_step_id="")
+            if not resolved_step_id:
+                continue
+            entry = self.entries_by_step_id.get(resolved_step_id)
+            if entry is None:
+                entry = _index_tool_result(tool_result, step_id=resolved_step_id)
+            synced_entries[resolved_step_id] = entry
+        self.entries_by_step_id = synced_entries
+        return self
+
+    def extend(self, other: "EvidenceIndex") -> "EvidenceIndex":
+        self.entries_by_step_id.update(other.entries_by_step_id)
+        return self
+
+    def to_bundle(self) -> EvidenceBundle:
+        hydrated_evidence_by_id: dict[str, HydratedEvidence] = {}
+        evidence_views_by_step_id: dict[str, list[EvidenceView]] = {}
+        for step_id, entry in self.entries_by_step_id.items():
+            if not entry.hydrated_evidence:
+                continue
+            evidence_views_by_step_id[step_id] = list(entry.evidence_views)
+            for evidence in entry.hydrated_evidence:
+                hydrated_evidence_by_id[evidence.evidence_id] = evidence
+        return EvidenceBundle(
+            hydrated_evidence_by_id=hydrated_evidence_by_id,
+            evidence_views_by_step_id=evidence_views_by_step_id,
+        )
+
+    def evidence_steps(self) -> list[EvidenceStep]:
+        evidence_steps: list[EvidenceStep] = []
+        evidence_step_by_type: dict[str, EvidenceStep] = {}
+        for entry in self.entries_by_step_id.values():
+            step_evidence = list(entry.evidence_views) if entry.hydrated_evidence else []
+            existing_step = evidence_step_by_type.get(entry.step_type)
+            if existing_step is None:
+                evidence_step = EvidenceStep(
+                    type=entry.step_type,
+                    metadata=dict(entry.metadata),
+                    evidence=step_evidence,
+                )
+                evidence_step_by_type[entry.step_type] = evidence_step
+                evidence_steps.append(evidence_step)
+                continue
+            existing_step.metadata = _merge_step_metadata(existing_step.metadata, entry.metadata)
+            existing_step.evidence.extend(step_evidence)
+        return evidence_steps
+
+
+def _index_tool_result(tool_result: ToolResult, *, step_id: str) -> _IndexedToolResult:
+    resolved_tool_name = _resolve_tool_name(tool_result, fallback_tool_name="")
+    hydrated_evidence, evidence_views = _rehydrate_tool_result_records(
+        tool_result,
+        step_id=step_id,
+        tool_name=resolved_tool_name,
+    )
+    return _IndexedToolResult(
+        step_type=get_tool_result_type(resolved_tool_name),
+        metadata=dict(tool_result.metadata),
+        hydrated_evidence=hydrated_evidence,
+        evidence_views=evidence_views,
+    )
+
+
 def build_evidence_bundle_from_tool_results(tool_results: list[ToolResult]) -> EvidenceBundle:
     hydrated_evidence_by_id: dict[str, HydratedEvidence] = {}
     evidence_views_by_step_id: dict[str, list[EvidenceView]] = {}
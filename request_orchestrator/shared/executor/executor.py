@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from contextvars import copy_context
 from dataclasses import dataclass
-from time import perf_counter
+from time import monotonic, perf_counter
 from typing import Any
 from uuid import UUID
 
@@ -31,6 +31,18 @@ class StepExecutionResult:
     output: Any
     error_text: str = ""
     latency_ms: int = 0
+    timed_out: bool = False
+
+
+@dataclass(frozen=True)
+class PendingStepExecution:
+    """A step that overran its budget but may still finish before synthesis."""
+
+    plan: Plan
+    step: PlanStep
+    args: dict[str, Any]
+    iteration_number: int
+    future: Future
 
 
 def _substitute_refs(obj, results: dict, *, iteration_number: int):
@@ -69,11 +81,9 @@ def _tool_results_by_local_step_id(agent_state: AgentState) -> dict[str, ToolRes
 def _execute_step(
     step: PlanStep,
     *,
-    tool_results_by_step_id: dict[str, ToolResult],
-    iteration_number: int,
+    args: dict[str, Any],
     allowed_tool_names: set[str] | None,
 ) -> StepExecutionResult:
-    args = _substitute_refs(step.args, tool_results_by_step_id, iteration_number=iteration_number)
     started_at = perf_counter()
     try:
         output = call_tool(name=step.tool, tool_input=args, allowed_tool_names=allowed_tool_names)
@@ -103,6 +113,81 @@ def _execute_step(
     )
 
 
+def _timed_out_step_result(step: PlanStep, *, args: dict[str, Any], timeout_seconds: float) -> StepExecutionResult:
+    error_text = f"Tool '{step.tool}' timed out after {timeout_seconds:g}s"
+    return StepExecutionResult(
+        step=step,
+        args=args,
+        output=ToolResult.error(error_text, tool=step.tool, timed_out=True),
+        error_text=error_text,
+        latency_ms=int(timeout_seconds * 1000),
+        timed_out=True,
+    )
+
+
+def _step_deadline(
+    agent_state: AgentState,
+    step: PlanStep,
+    *,
+    started_at: float,
+    iteration_deadline: float | None,
+) -> float | None:
+    timeout_seconds = agent_state.agent_profile.timeout_seconds_for_tool(step.tool)
+    step_deadline = None if timeout_seconds is None else started_at + timeout_seconds
+    if step_deadline is None or iteration_deadline is None:
+        return step_deadline if iteration_deadline is None else iteration_deadline
+    return min(step_deadline, iteration_deadline)
+
+
+def _await_step_results(
+    agent_state: AgentState,
+    *,
+    plan: Plan,
+    args_by_step_id: dict[str, dict[str, Any]],
+    futures_by_step_id: dict[str, Future],
+    iteration_number: int,
+    started_at: float,
+) -> list[StepExecutionResult]:
+    iteration_timeout_seconds = agent_state.agent_profile.iteration_timeout_seconds
+    iteration_deadline = (
+        started_at + iteration_timeout_seconds
+        if iteration_timeout_seconds is not None and iteration_timeout_seconds > 0
+        else None
+    )
+    execution_results: list[StepExecutionResult] = []
+    for step in plan.steps:
+        future = futures_by_step_id[step.id]
+        deadline = _step_deadline(agent_state, step, started_at=started_at, iteration_deadline=iteration_deadline)
+        try:
+            execution_results.append(
+                future.result(timeout=None if deadline is None else max(0.0, deadline - monotonic()))
+            )
+        except FutureTimeoutError:
+            execution_results.append(
+                _timed_out_step_result(step, args=args_by_step_id[step.id], timeout_seconds=deadline - started_at)
+            )
+            if agent_state.agent_profile.attach_late_tool_results:
+                agent_state.pending_step_executions.append(
+                    PendingStepExecution(
+                        plan=plan,
+                        step=step,
+                        args=args_by_step_id[step.id],
+                        iteration_number=iteration_number,
+                        future=future,
+                    )
+                )
+    return execution_results
+
+
+def _build_tool_repo(agent_state: AgentState) -> ToolCallRepository | None:
+    if (
+        isinstance(agent_state.execution_context.roundtrip_id, UUID)
+        and agent_state.agent_profile.name != PROFILE_MANAGEMENT_AGENT_NAME
+    ):
+        return ToolCallRepository()
+    return None
+
+
 def _record_step_result(
     agent_state: AgentState,
     *,
@@ -110,6 +195,7 @@ def _record_step_result(
     tool_repo: ToolCallRepository | None,
     iteration_number: int,
     execution_result: StepExecutionResult,
+    late: bool = False,
 ) -> None:
     execution_context = agent_state.execution_context
     step = execution_result.step
@@ -125,7 +211,7 @@ def _record_step_result(
             }
         )
     if isinstance(output, ToolResult):
-        agent_state.result = agent_state.result.with_recorded_tool_result(output)
+        agent_state.record_tool_result(output)
 
     payload = {
         "agent_name": agent_state.agent_profile.name,
@@ -138,6 +224,9 @@ def _record_step_result(
         "data": sanitize_for_json_storage({
             "step_plan": step.plan,
             "latency_ms": execution_result.latency_ms,
+            "cache_hit": isinstance(output, ToolResult) and output.cache_hit,
+            "timed_out": execution_result.timed_out,
+            "late": late,
         }),
     }
     if execution_result.error_text:
@@ -155,6 +244,14 @@ def _record_step_result(
     )
 
     if tool_repo and execution_context.roundtrip_id:
+        if late and tool_repo.update_tool_call_result(
+            execution_context.roundtrip_id,
+            step,
+            output_payload=output,
+            error_message=execution_result.error_text or None,
+            duration_ms=execution_result.latency_ms,
+        ):
+            return
         tool_repo.append_tool_call(
             execution_context.roundtrip_id,
             plan,
@@ -166,18 +263,46 @@ def _record_step_result(
         )
 
 
+def attach_late_tool_results(agent_state: AgentState) -> AgentState:
+    """Replace timed-out results with tool outputs that have finished since the executor gave up on them."""
+    if not agent_state.pending_step_executions:
+        return agent_state
+    still_pending: list[PendingStepExecution] = []
+    completed: list[PendingStepExecution] = []
+    for pending in agent_state.pending_step_executions:
+        (completed if pending.future.done() else still_pending).append(pending)
+    agent_state.pending_step_executions = still_pending
+    if not completed:
+        return agent_state
+    tool_repo = _build_tool_repo(agent_state)
+    with bind_runtime_context(
+        conversation_id=agent_state.execution_context.conversation_id,
+        conversation_model_config=agent_state.execution_context.model_config,
+        roundtrip_id=str(agent_state.execution_context.roundtrip_id) if agent_state.execution_context.roundtrip_id else None,
+        user_id=agent_state.execution_context.user_profile.user_id,
+    ):
+        with bind_agent_context(agent_name=agent_state.agent_profile.name):
+            for pending in completed:
+                if pending.future.cancelled() or pending.future.exception() is not None:
+                    continue
+                _record_step_result(
+                    agent_state,
+                    plan=pending.plan,
+                    tool_repo=tool_repo,
+                    iteration_number=pending.iteration_number,
+                    execution_result=pending.future.result(),
+                    late=True,
+                )
+    return agent_state
+
+
 @traceable(name="Executor Node")
 def run_executor(agent_state: AgentState) -> AgentState:
     planner_state = agent_state.node_states.planner
     plan = planner_state.plan
     if plan is None:
         return agent_state
-    tool_repo = (
-        ToolCallRepository()
-        if isinstance(agent_state.execution_context.roundtrip_id, UUID)
-        and agent_state.agent_profile.name != PROFILE_MANAGEMENT_AGENT_NAME
-        else None
-    )
+    tool_repo = _build_tool_repo(agent_state)
     allowed_tool_names = set(agent_state.agent_profile.tool_names)
     iteration_number = planner_state.plan_count
 
@@ -190,24 +315,37 @@ def run_executor(agent_state: AgentState) -> AgentState:
         with bind_agent_context(agent_name=agent_state.agent_profile.name):
             if plan is None or not plan.steps:
                 return agent_state
+            attach_late_tool_results(agent_state)
             tool_results_by_step_id = _tool_results_by_local_step_id(agent_state)
+            args_by_step_id = {
+                step.id: _substitute_refs(step.args, tool_results_by_step_id, iteration_number=iteration_number)
+                for step in plan.steps
+            }
 
-            with ThreadPoolExecutor(max_workers=len(plan.steps)) as executor:
+            # Not used as a context manager: exiting would block on steps that overran their budget.
+            executor = ThreadPoolExecutor(max_workers=len(plan.steps))
+            started_at = monotonic()
+            try:
                 futures_by_step_id = {
                     step.id: executor.submit(
                         copy_context().run,
                         _execute_step,
                         step,
-                        tool_results_by_step_id=tool_results_by_step_id,
-                        iteration_number=iteration_number,
+                        args=args_by_step_id[step.id],
                         allowed_tool_names=allowed_tool_names,
                     )
                     for step in plan.steps
                 }
-                execution_results = [
-                    futures_by_step_id[step.id].result()
-                    for step in plan.steps
-                ]
+                execution_results = _await_step_results(
+                    agent_state,
+                    plan=plan,
+                    args_by_step_id=args_by_step_id,
+                    futures_by_step_id=futures_by_step_id,
+                    iteration_number=iteration_number,
+                    started_at=started_at,
+                )
+            finally:
+                executor.shutdown(wait=False)
 
             for execution_result in execution_results:
                 _record_step_result(
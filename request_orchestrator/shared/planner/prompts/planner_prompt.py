@@ -63,15 +63,18 @@ def _compile_tools_rules_from_state(state: AgentState) -> CompiledPlannerContext
             if category is None:
                 continue
             tools.extend(category.tools)
-            if category.rules and not _is_profile_management_agent(state):
-                rules[category_name] = category.rules
+            if not _is_profile_management_agent(state):
+                category_rules = category.planner_rules()
+                if category_rules:
+                    rules[category_name] = category_rules
     else:
         for category in allowed_categories.values():
             tools.extend(category.tools)
-            if category.rules and not _is_profile_management_agent(state):
+            if not _is_profile_management_agent(state):
+                category_rules = category.planner_rules()
                 rules_name = next((name for name, candidate in allowed_categories.items() if candidate is category), None)
-                if rules_name is not None:
-                    rules[rules_name] = category.rules
+                if category_rules and rules_name is not None:
+                    rules[rules_name] = category_rules
 
     tools.extend(state.agent_profile.extra_tools)
 
@@ -11,11 +11,8 @@ from request_orchestrator.constants import SYNTHESIS_PROMPT_KIND
 from request_orchestrator.models.main_state import MainState
 from request_orchestrator.models.orchestrator_result import OrchestratorResult
 from request_orchestrator.models.synthesized_result import SynthesisResult
-from request_orchestrator.shared.evidence import (
-    build_evidence_bundle_from_tool_results,
-    build_evidence_steps_from_tool_results,
-    filter_evidence_steps,
-)
+from request_orchestrator.shared.evidence import filter_evidence_steps
+from request_orchestrator.shared.executor.executor import attach_late_tool_results
 from llm.chat_models import build_llm_for_stage, resolve_stage_model_name, resolve_stage_provider_name
 from request_orchestrator.shared.synthesis.prompts.synthesis_prompt import build_synthesis_prompt
 from rendering.debug import SYNTHESIS_KIND
@@ -43,13 +40,11 @@ def _resolve_synthesis_model_name(state: MainState) -> str:
 @traceable(name="Synthesis Node")
 def run_synthesis(state: MainState) -> MainState:
     execution_context = state.execution_context
+    for agent_state in state.agent_states.values():
+        attach_late_tool_results(agent_state)
     tool_results = state.gather_tool_results()
     relevant_evidence_ids = _resolve_relevant_evidence_ids(state)
-    evidence_bundle = build_evidence_bundle_from_tool_results(tool_results)
-    all_evidence_steps = build_evidence_steps_from_tool_results(
-        tool_results,
-        evidence_bundle.evidence_views_by_step_id,
-    )
+    all_evidence_steps = state.gather_evidence_index().evidence_steps()
     evidence_steps = filter_evidence_steps(all_evidence_steps, relevant_evidence_ids)
     if not evidence_steps:
         evidence_steps = all_evidence_steps
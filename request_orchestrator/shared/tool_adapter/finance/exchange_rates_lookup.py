@@ -32,6 +32,15 @@ class ExchangeRateLookupMetadata(BaseModel):
     currency: str
     rate: float
     date: str
+    as_of: str | None = None
+    stale: bool | None = None
+
+
+def describe_rate_staleness(as_of: str | None, stale: bool) -> str:
+    """Sentence appended to rate summaries served from a local store whose last refresh failed."""
+    if not stale:
+        return ""
+    return f" Stored rate history ends {as_of} and could not be refreshed, so later dates may be missing."
 
 
 def _tool_result(result: ExchangeRatesSnapshot) -> ToolResult:
@@ -43,12 +52,14 @@ def _tool_result(result: ExchangeRatesSnapshot) -> ToolResult:
             currency=currency_code,
             rate=rate,
             date=result.date,
+            as_of=result.as_of,
+            stale=result.stale or None,
         )
         hydrated = HydratedEvidence(
             item_id=currency_code,
             tool_name=TOOL_NAME_EXCHANGE_RATES_LOOKUP,
             title=f"{result.base} to {currency_code}",
-            summary=f"Exchange rate on {result.date}: 1 {result.base} = {rate} {currency_code}.",
+            summary=f"Exchange rate on {result.date}: 1 {result.base} = {rate} {currency_code}.{describe_rate_staleness(result.as_of, result.stale)}",
             published_at=result.date,
             source=TOOL_NAME_EXCHANGE_RATES_LOOKUP,
             entity_type=TOOL_RESULT_TYPE_FINANCE,
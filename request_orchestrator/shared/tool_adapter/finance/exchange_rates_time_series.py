@@ -4,6 +4,8 @@ from pydantic import BaseModel, Field
 from integrations.frankfurter import FrankfurterClient
 from integrations.frankfurter.models import ExchangeRatesSeries
 from request_orchestrator.models.evidence import EvidenceView, HydratedEvidence, ToolResult
+from request_orchestrator.shared.tool_adapter.finance.exchange_rates_lookup import describe_rate_staleness
+from request_orchestrator.shared.tool_adapter.series import SeriesSummary, describe_series, point_budget_for_tool, summarize_series
 from tool.constants import TOOL_NAME_EXCHANGE_RATES_TIME_SERIES
 from tool.constants import TOOL_RESULT_TYPE_FINANCE
 
@@ -31,50 +33,94 @@ class ExchangeRatesTimeSeriesArgs(BaseModel):
     )
 
 
+class ExchangeRatesSeriesSummary(BaseModel):
+    base: str
+    start_date: str
+    end_date: str
+    currencies: list[SeriesSummary] = []
+    as_of: str | None = None
+    stale: bool = False
+
+
 class ExchangeRateTimeSeriesMetadata(BaseModel):
     base: str
     currency: str
-    rate: float
-    date: str
+    start_date: str
+    end_date: str
+    min: float | None = None
+    max: float | None = None
+    mean: float | None = None
+    last: float | None = None
+    change_pct: float | None = None
+    series_id: str
+    as_of: str | None = None
+    stale: bool | None = None
+
+
+def _summarize(result: ExchangeRatesSeries) -> ExchangeRatesSeriesSummary:
+    date_keys = sorted(result.rates)
+    currency_codes = list(dict.fromkeys(code for date_key in date_keys for code in result.rates[date_key]))
+    point_budget = point_budget_for_tool(TOOL_NAME_EXCHANGE_RATES_TIME_SERIES)
+    return ExchangeRatesSeriesSummary(
+        base=result.base,
+        start_date=result.start_date,
+        end_date=result.end_date,
+        as_of=result.as_of,
+        stale=result.stale,
+        currencies=[
+            summarize_series(
+                currency_code,
+                date_keys,
+                [result.rates[date_key].get(currency_code) for date_key in date_keys],
+                tool_name=TOOL_NAME_EXCHANGE_RATES_TIME_SERIES,
+                point_budget=point_budget,
+            )
+            for currency_code in currency_codes
+        ],
+    )
 
 
 def _tool_result(result: ExchangeRatesSeries) -> ToolResult:
+    summary = _summarize(result)
     hydrated_evidence: list[HydratedEvidence] = []
     evidence_views: list[EvidenceView] = []
-    for date_key, day_rates in result.rates.items():
-        for currency_code, rate in day_rates.items():
-            metadata = ExchangeRateTimeSeriesMetadata(
-                base=result.base,
-                currency=currency_code,
-                rate=rate,
-                date=date_key,
-            )
-            hydrated = HydratedEvidence(
-                item_id=f"{date_key}:{currency_code}",
-                tool_name=TOOL_NAME_EXCHANGE_RATES_TIME_SERIES,
-                title=f"{result.base} to {currency_code}",
-                summary=f"Exchange rate on {date_key}: 1 {result.base} = {rate} {currency_code}.",
-                published_at=date_key,
-                source=TOOL_NAME_EXCHANGE_RATES_TIME_SERIES,
-                entity_type=TOOL_RESULT_TYPE_FINANCE,
-                metadata=metadata.model_dump(exclude_none=True),
-                raw_payload={
-                    "date": date_key,
-                    "currency": currency_code,
-                    "rate": rate,
-                    "series": result,
-                },
-            )
-            hydrated_evidence.append(hydrated)
-            evidence_views.append(
-                EvidenceView(
-                    item_id=hydrated.item_id,
-                    title=hydrated.title,
-                    summary=hydrated.summary,
-                    metadata=dict(hydrated.metadata),
-                )
+    for currency_summary in summary.currencies:
+        stats = currency_summary.stats
+        metadata = ExchangeRateTimeSeriesMetadata(
+            base=summary.base,
+            currency=currency_summary.label,
+            start_date=currency_summary.start,
+            end_date=currency_summary.end,
+            min=None if stats is None else stats.min,
+            max=None if stats is None else stats.max,
+            mean=None if stats is None else stats.mean,
+            last=None if stats is None else stats.last,
+            change_pct=None if stats is None else stats.change_pct,
+            series_id=currency_summary.series_id,
+            as_of=summary.as_of,
+            stale=summary.stale or None,
+        )
+        hydrated = HydratedEvidence(
+            item_id=f"{summary.base}:{currency_summary.label}:{summary.start_date}..{summary.end_date}",
+            tool_name=TOOL_NAME_EXCHANGE_RATES_TIME_SERIES,
+            title=f"{summary.base} to {currency_summary.label}",
+            summary=f"1 {summary.base} in {describe_series(currency_summary)}{describe_rate_staleness(summary.as_of, summary.stale)}",
+            published_at=currency_summary.end,
+            source=TOOL_NAME_EXCHANGE_RATES_TIME_SERIES,
+            entity_type=TOOL_RESULT_TYPE_FINANCE,
+            metadata=metadata.model_dump(exclude_none=True),
+            raw_payload=currency_summary,
+        )
+        hydrated_evidence.append(hydrated)
+        evidence_views.append(
+            EvidenceView(
+                item_id=hydrated.item_id,
+                title=hydrated.title,
+                summary=hydrated.summary,
+                metadata=dict(hydrated.metadata),
             )
-    return ToolResult(result=result, evidence_views=evidence_views, hydrated_evidence=hydrated_evidence)
+        )
+    return ToolResult(result=summary, evidence_views=evidence_views, hydrated_evidence=hydrated_evidence)
 
 
 @tool(
@@ -92,6 +138,7 @@ Optional fields:
 - symbols (list of 3-letter ISO currency codes)
 
 Use this when the user needs exchange-rate changes over time, not just a single-day snapshot.
+Each currency is returned as summary statistics (min, max, mean, percentiles, change, trend) plus a downsampled set of points.
 
 Example valid call:
 {
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import yfinance as yf
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
 
-from integrations.yahoo_finance import YAHOO_FINANCE_QUOTE_URL_TEMPLATE
+from integrations.yahoo_finance import YAHOO_FINANCE_QUOTE_URL_TEMPLATE, StockQuote, get_yahoo_finance_client
 from request_orchestrator.models.evidence import EvidenceUrl, EvidenceUrlType, EvidenceView, HydratedEvidence, ToolResult
 from tool.constants import TOOL_NAME_GET_STOCK_PRICE
 from tool.constants import TOOL_RESULT_TYPE_FINANCE
@@ -14,22 +13,13 @@ class GetStockPriceArgs(BaseModel):
     ticker: str = Field(description="The stock ticker symbol e.g. AAPL, TSLA, MSFT")
 
 
-class StockPrice(BaseModel):
-    ticker: str
-    current_price: float | None
-    previous_close: float | None
-    day_high: float | None
-    day_low: float | None
-    market_cap: float | None
-
-
 class StockPriceMetadata(BaseModel):
     current_price: float | None = None
     previous_close: float | None = None
     market_cap: float | None = None
 
 
-def _tool_result(result: StockPrice) -> ToolResult:
+def _tool_result(result: StockQuote) -> ToolResult:
     url = YAHOO_FINANCE_QUOTE_URL_TEMPLATE.format(ticker=result.ticker).strip()
     summary = (
         f"{result.ticker} last price {result.current_price}. Previous close {result.previous_close}."
@@ -73,6 +63,7 @@ def _tool_result(result: StockPrice) -> ToolResult:
     args_schema=GetStockPriceArgs,
     description="""
 Get the current stock price and basic market data for a given ticker symbol.
+To compare several tickers, make one get_stock_prices call instead.
 
 Example valid calls:
 {"ticker": "AAPL"}
@@ -82,15 +73,9 @@ Example valid calls:
 )
 def get_stock_price(ticker: str) -> ToolResult:
     try:
-        t = yf.Ticker(ticker.upper())
-        info = t.fast_info
-        return _tool_result(StockPrice(
-            ticker=ticker.upper(),
-            current_price=info.last_price,
-            previous_close=info.previous_close,
-            day_high=info.day_high,
-            day_low=info.day_low,
-            market_cap=info.market_cap,
-        ))
+        quote = get_yahoo_finance_client().get_quote(ticker)
     except Exception as e:
         return ToolResult.error(f"Could not retrieve stock price for {ticker}: {e}")
+    if quote is None:
+        return ToolResult.error(f"Could not retrieve stock price for {ticker}: no market data returned.")
+    return _tool_result(quote)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from langchain_core.tools import tool
+from pydantic import BaseModel, Field
+
+from integrations.yahoo_finance import YAHOO_FINANCE_QUOTE_URL_TEMPLATE, StockQuote, get_yahoo_finance_client
+from integrations.yahoo_finance.client import STOCK_MAX_TICKERS
+from request_orchestrator.models.evidence import EvidenceUrl, EvidenceUrlType, EvidenceView, HydratedEvidence, ToolResult
+from request_orchestrator.shared.tool_adapter.series import SeriesSummary, describe_series, point_budget_for_tool, summarize_series
+from tool.constants import TOOL_NAME_GET_STOCK_PRICES
+from tool.constants import TOOL_RESULT_TYPE_FINANCE
+
+STOCK_HISTORY_MAX_DAYS = 5 * 365
+
+
+class GetStockPricesArgs(BaseModel):
+    tickers: list[str] = Field(
+        ...,
+        description=f"Stock ticker symbols to look up together, e.g. ['AAPL', 'MSFT', 'NVDA']. At most {STOCK_MAX_TICKERS}.",
+        min_length=1,
+        max_length=STOCK_MAX_TICKERS,
+    )
+    history_days: int | None = Field(
+        default=None,
+        description="Optional number of past calendar days of daily closes to summarize per ticker, e.g. 30 or 365.",
+        ge=1,
+        le=STOCK_HISTORY_MAX_DAYS,
+    )
+
+
+class StockPricesResult(BaseModel):
+    quotes: list[StockQuote] = []
+    histories: list[SeriesSummary] = []
+    missing_tickers: list[str] = []
+
+
+class StockPricesMetadata(BaseModel):
+    current_price: float | None = None
+    previous_close: float | None = None
+    day_change_pct: float | None = None
+    market_cap: float | None = None
+    as_of: str | None = None
+    history_change_pct: float | None = None
+    history_series_id: str | None = None
+
+
+def _day_change_pct(quote: StockQuote) -> float | None:
+    if quote.current_price is None or not quote.previous_close:
+        return None
+    return round((quote.current_price - quote.previous_close) / quote.previous_close * 100, 2)
+
+
+def _tool_result(result: StockPricesResult) -> ToolResult:
+    histories = {history.label: history for history in result.histories}
+    hydrated_evidence: list[HydratedEvidence] = []
+    evidence_views: list[EvidenceView] = []
+    for quote in result.quotes:
+        history = histories.get(quote.ticker)
+        day_change_pct = _day_change_pct(quote)
+        summary = (
+            f"{quote.ticker} last price {quote.current_price}. Previous close {quote.previous_close}"
+            + (f" ({day_change_pct:+.2f}%)." if day_change_pct is not None else ".")
+            if quote.current_price is not None
+            else f"Stock price lookup for {quote.ticker}."
+        )
+        if history is not None and history.stats is not None:
+            summary = f"{summary} Daily close {describe_series(history)}"
+        metadata = StockPricesMetadata(
+            current_price=quote.current_price,
+            previous_close=quote.previous_close,
+            day_change_pct=day_change_pct,
+            market_cap=quote.market_cap,
+            as_of=quote.as_of,
+            history_change_pct=None if history is None or history.stats is None else history.stats.change_pct,
+            history_series_id=None if history is None else history.series_id,
+        )
+        url = YAHOO_FINANCE_QUOTE_URL_TEMPLATE.format(ticker=quote.ticker).strip()
+        hydrated = HydratedEvidence(
+            item_id=quote.ticker,
+            tool_name=TOOL_NAME_GET_STOCK_PRICES,
+            title=quote.ticker,
+            summary=summary,
+            urls=[EvidenceUrl(url=url, url_type=EvidenceUrlType.WEBSITE)] if url else [],
+            published_at=quote.as_of,
+            source=TOOL_NAME_GET_STOCK_PRICES,
+            entity_type=TOOL_RESULT_TYPE_FINANCE,
+            metadata=metadata.model_dump(exclude_none=True),
+            raw_payload=quote,
+        )
+        hydrated_evidence.append(hydrated)
+        evidence_views.append(
+            EvidenceView(
+                item_id=hydrated.item_id,
+                title=hydrated.title,
+                summary=hydrated.summary,
+                metadata=dict(hydrated.metadata),
+            )
+        )
+    return ToolResult(result=result, evidence_views=evidence_views, hydrated_evidence=hydrated_evidence)
+
+
+@tool(
+    TOOL_NAME_GET_STOCK_PRICES,
+    args_schema=GetStockPricesArgs,
+    description="""
+Get current prices and basic market data for several stock tickers in one call, optionally with a summary of their recent daily closes.
+Use this instead of repeated get_stock_price calls when comparing stocks.
+
+Required fields:
+- tickers (list of ticker symbols)
+
+Optional fields:
+- history_days (integer): summarize daily closes over this many past days (min, max, mean, change, trend).
+
+Example valid calls:
+{"tickers": ["AAPL", "MSFT", "GOOGL"]}
+{"tickers": ["NVDA", "AMD"], "history_days": 90}
+""",
+)
+def get_stock_prices(tickers: list[str], history_days: int | None = None) -> ToolResult:
+    client = get_yahoo_finance_client()
+    try:
+        quotes = client.get_quotes(tickers)
+        histories = []
+        if history_days:
+            start = datetime.now(timezone.utc).date() - timedelta(days=history_days)
+            point_budget = point_budget_for_tool(TOOL_NAME_GET_STOCK_PRICES)
+            histories = [
+                summarize_series(
+                    ticker,
+                    history.dates,
+                    history.closes,
+                    tool_name=TOOL_NAME_GET_STOCK_PRICES,
+                    point_budget=point_budget,
+                    decimals=4,
+                )
+                for ticker, history in client.get_close_history(list(quotes), start).items()
+            ]
+    except Exception as e:
+        return ToolResult.error(f"Could not retrieve stock prices for {', '.join(tickers)}: {e}")
+    requested = list(dict.fromkeys(ticker.strip().upper() for ticker in tickers if ticker.strip()))
+    return _tool_result(
+        StockPricesResult(
+            quotes=list(quotes.values()),
+            histories=histories,
+            missing_tickers=[ticker for ticker in requested if ticker not in quotes],
+        )
+    )
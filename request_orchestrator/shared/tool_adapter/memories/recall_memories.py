@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from langchain_core.tools import tool
+from pydantic import BaseModel, Field
+
+from conversation.repository.memory_index_repository import get_memory_index_repo
+from llm.clients.embeddings import embed_query
+from request_orchestrator.models.evidence import EvidenceView, HydratedEvidence, ToolResult
+from request_orchestrator.shared.runtime_context import get_current_user_id
+from request_orchestrator.shared.tool_adapter.memories.constants import DEFAULT_MEMORY_RESULT_LIMIT
+from tool.constants import TOOL_NAME_RECALL_MEMORIES
+from tool.constants import TOOL_RESULT_TYPE_MEMORY_RESULTS
+
+
+class RecallMemoriesArgs(BaseModel):
+    query: str = Field(..., description="Natural-language query describing what to recall about the user or prior conversations.")
+    limit: int = Field(default=DEFAULT_MEMORY_RESULT_LIMIT, ge=1, le=10, description=f"Maximum number of memories to return. Defaults to {DEFAULT_MEMORY_RESULT_LIMIT}.")
+    include_user_attributes: bool = Field(default=True, description="Whether stored user attributes are ranked alongside conversation memories.")
+
+
+class RecalledMemoryMetadata(BaseModel):
+    memory_type: str
+    conversation_id: str | None = None
+    roundtrip_id: str | None = None
+    message_index: int | None = None
+    importance: float | None = None
+    similarity: float
+    recency: float
+    relevance_score: float
+
+
+@tool(
+    TOOL_NAME_RECALL_MEMORIES,
+    args_schema=RecallMemoriesArgs,
+    description=f"""
+Recall memories for the current user in one call: prior conversations, the specific exchanges inside them, and stored user attributes, ranked together.
+
+Scores combine semantic similarity with recency and attribute importance; higher relevance_score is better.
+Roundtrip hits carry a roundtrip_id that get_memory_detail accepts.
+
+Required fields:
+- query (string): Natural-language description of what to recall.
+- limit (integer, optional): Maximum number of memories to return. Defaults to {DEFAULT_MEMORY_RESULT_LIMIT}.
+- include_user_attributes (boolean, optional): Rank stored user attributes alongside conversation memories. Defaults to true.
+""",
+)
+def recall_memories(query: str, limit: int = DEFAULT_MEMORY_RESULT_LIMIT, include_user_attributes: bool = True) -> ToolResult:
+    user_id = get_current_user_id()
+    if not user_id:
+        return ToolResult(result=[], evidence_views=[], hydrated_evidence=[])
+
+    memories = get_memory_index_repo().search(
+        embed_query(query),
+        user_id=user_id,
+        limit=limit,
+        include_attributes=include_user_attributes,
+    )
+    hydrated_evidence: list[HydratedEvidence] = []
+    evidence_views: list[EvidenceView] = []
+    for memory in memories:
+        metadata = RecalledMemoryMetadata(
+            memory_type=memory.memory_type,
+            conversation_id=str(memory.conversation_id) if memory.conversation_id else None,
+            roundtrip_id=str(memory.roundtrip_id) if memory.roundtrip_id else None,
+            message_index=memory.message_index,
+            importance=memory.importance,
+            similarity=round(memory.similarity, 4),
+            recency=round(memory.recency, 4),
+            relevance_score=round(memory.score, 4),
+        )
+        hydrated = HydratedEvidence(
+            item_id=memory.memory_id,
+            tool_name=TOOL_NAME_RECALL_MEMORIES,
+            title=memory.title,
+            summary=memory.summary or "Retrieved prior memory.",
+            published_at=memory.occurred_at,
+            source=TOOL_NAME_RECALL_MEMORIES,
+            entity_type=TOOL_RESULT_TYPE_MEMORY_RESULTS,
+            metadata=metadata.model_dump(exclude_none=True),
+            raw_payload=memory,
+        )
+        hydrated_evidence.append(hydrated)
+        evidence_views.append(
+            EvidenceView(
+                item_id=hydrated.item_id,
+                title=hydrated.title,
+                summary=hydrated.summary,
+                metadata=dict(hydrated.metadata),
+            )
+        )
+    return ToolResult(result=memories, evidence_views=evidence_views, hydrated_evidence=hydrated_evidence)
@@ -5,7 +5,7 @@ from pydantic import BaseModel, Field
 
 from conversation.models.conversation_models import ConversationMemory
 from conversation.repository.repo_factory import get_conversation_repo
-from llm.clients.embeddings import embed_text
+from llm.clients.embeddings import embed_query
 from request_orchestrator.models.evidence import EvidenceView, HydratedEvidence, ToolResult
 from request_orchestrator.shared.runtime_context import get_current_user_id
 from request_orchestrator.shared.tool_adapter.memories.constants import DEFAULT_MEMORY_RESULT_LIMIT
@@ -37,7 +37,7 @@ Each result includes conversation_id, summary, last_used_date, and relevance_sco
 """,
 )
 def search_memories(query: str) -> ToolResult:
-    query_embedding = embed_text(query)
+    query_embedding = embed_query(query)
     memories = get_conversation_repo().search_conversation_memories(
         query_embedding=query_embedding,
         limit=DEFAULT_MEMORY_RESULT_LIMIT,
@@ -7,7 +7,7 @@ from pydantic import BaseModel, Field
 
 from conversation.models.conversation_models import RoundtripMemory
 from conversation.repository.repo_factory import get_conversation_repo
-from llm.clients.embeddings import embed_text
+from llm.clients.embeddings import embed_query
 from request_orchestrator.models.evidence import EvidenceView, HydratedEvidence, ToolResult
 from request_orchestrator.shared.runtime_context import get_current_user_id
 from request_orchestrator.shared.tool_adapter.memories.constants import DEFAULT_MEMORY_RESULT_LIMIT
@@ -55,7 +55,7 @@ def search_roundtrip_memories(query: str, conversation_ids: list[str], limit: in
     if not parsed_ids:
         return ToolResult(result=[], evidence_views=[], hydrated_evidence=[])
 
-    query_embedding = embed_text(query)
+    query_embedding = embed_query(query)
     memories = get_conversation_repo().search_roundtrip_memories(
         query_embedding=query_embedding,
         conversation_ids=parsed_ids,
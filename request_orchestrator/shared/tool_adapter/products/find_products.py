@@ -47,9 +47,11 @@ class ProductEvidenceMetadata(BaseModel):
     year: int | None = None
     price: float | None = None
     score: float | None = None
+    fused_score: float | None = None
     product_source: str
     retrieved_count: int
     reranked: bool
+    relaxed_filters: list[str] | None = None
 
 
 def _product_summary(product: ProductResult) -> str:
@@ -75,9 +77,11 @@ def _tool_result(result: ProductSearchResults) -> ToolResult:
             year=product.year,
             price=product.price,
             score=product.score,
+            fused_score=None if product.fused_score is None else round(product.fused_score, 6),
             product_source=product.source.value,
             retrieved_count=result.retrieved_count,
             reranked=result.reranked,
+            relaxed_filters=list(result.relaxed_filters) or None,
         )
         hydrated = HydratedEvidence(
             item_id=product.id,
@@ -123,6 +127,7 @@ Important:
 - Remove generic quality words like 'good', 'best', 'top', 'nice'.
 - Keep explicit user constraints that change the product itself.
 - Do not expand query_text with guessed synonyms, categories, product variants, ingredients, or audiences.
+- When nothing matches every filter, style, then color, then the price band are relaxed; results list the relaxed filters in relaxed_filters.
 
 Examples:
 - 'good dumbbells for sale online' -> 'dumbbells'
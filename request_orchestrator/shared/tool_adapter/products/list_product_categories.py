@@ -1,7 +1,8 @@
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
 
-from products.repository.product_repository import ProductRepository
+from products.facets import get_product_facets
+from products.models.product_facets import ProductFacetValue
 from request_orchestrator.models.evidence import EvidenceView, HydratedEvidence, ToolResult
 from tool.constants import TOOL_NAME_LIST_PRODUCT_CATEGORIES
 from tool.constants import TOOL_RESULT_TYPE_PRODUCT_CATEGORIES
@@ -15,19 +16,33 @@ class ListProductCategoriesArgs(BaseModel):
     )
 
 
-def _tool_result(result: list[str]) -> ToolResult:
+def _category_metadata(facet_value: ProductFacetValue | None) -> dict[str, object]:
+    if facet_value is None:
+        return {}
+    metadata: dict[str, object] = {"product_count": facet_value.product_count}
+    if facet_value.price_min is not None and facet_value.price_max is not None:
+        metadata["price_min"] = facet_value.price_min
+        metadata["price_max"] = facet_value.price_max
+    return metadata
+
+
+def _tool_result(result: list[str], facet_values: dict[str, ProductFacetValue] | None = None) -> ToolResult:
     hydrated_evidence: list[HydratedEvidence] = []
     evidence_views: list[EvidenceView] = []
     for category in result:
         title = category.strip()
+        metadata = _category_metadata((facet_values or {}).get(category))
+        summary = f"Available product category: {title}."
+        if metadata:
+            summary = f"Available product category: {title} ({metadata['product_count']} products)."
         hydrated = HydratedEvidence(
             item_id=title,
             tool_name=TOOL_NAME_LIST_PRODUCT_CATEGORIES,
             title=title,
-            summary=f"Available product category: {title}.",
+            summary=summary,
             source=TOOL_NAME_LIST_PRODUCT_CATEGORIES,
             entity_type=TOOL_RESULT_TYPE_PRODUCT_CATEGORIES,
-            metadata={},
+            metadata=metadata,
             raw_payload=category,
         )
         hydrated_evidence.append(hydrated)
@@ -36,7 +51,7 @@ def _tool_result(result: list[str]) -> ToolResult:
                 item_id=hydrated.item_id,
                 title=hydrated.title,
                 summary=hydrated.summary,
-                metadata={},
+                metadata=dict(metadata),
             )
         )
     return ToolResult(result=result, evidence_views=evidence_views, hydrated_evidence=hydrated_evidence)
@@ -46,7 +61,7 @@ def _tool_result(result: list[str]) -> ToolResult:
     TOOL_NAME_LIST_PRODUCT_CATEGORIES,
     args_schema=ListProductCategoriesArgs,
     description="""
-Return available product categories from the internal catalog.
+Return available product categories from the internal catalog, with their product counts and price ranges.
 
 Optional fields:
 - limit (integer)
@@ -58,4 +73,8 @@ Example valid call:
 """,
 )
 def list_product_categories(limit: int = 200) -> ToolResult:
-    return _tool_result(ProductRepository().list_categories(limit=limit))
+    facets = get_product_facets()
+    return _tool_result(
+        facets.categories(limit),
+        {facet_value.value: facet_value for facet_value in facets.facet("category")},
+    )
@@ -26,7 +26,7 @@ class WikipediaSearchArgs(BaseModel):
     )
     summary_sentences: int = Field(
         default=2,
-        description="Number of sentences to include when fetching the top result summary.",
+        description="Number of sentences to include in each result summary.",
         ge=1,
     )
 
@@ -35,6 +35,8 @@ class WikipediaSearchResponse(BaseModel):
     query: str
     results: list[WikipediaSearchResult] = []
     top_result_summary: Optional[WikipediaPageSummary] = None
+    # Index-aligned with `results`; filled from one batched extracts query.
+    result_summaries: list[Optional[WikipediaPageSummary]] = []
 
 
 class WikipediaSearchMetadata(BaseModel):
@@ -75,8 +77,11 @@ def _tool_result(result: WikipediaSearchResponse) -> ToolResult:
 
     for index, item in enumerate(result.results):
         summary_text = item.description.strip()
-        if index == 0 and result.top_result_summary is not None and result.top_result_summary.summary.strip():
-            summary_text = result.top_result_summary.summary.strip()
+        page_summary = result.result_summaries[index] if index < len(result.result_summaries) else None
+        if index == 0 and result.top_result_summary is not None:
+            page_summary = result.top_result_summary
+        if page_summary is not None and page_summary.summary.strip():
+            summary_text = page_summary.summary.strip()
         url = item.url.strip()
         metadata = WikipediaSearchMetadata(
             top_result_summary=(
@@ -112,7 +117,7 @@ def _tool_result(result: WikipediaSearchResponse) -> ToolResult:
     TOOL_NAME_WIKIPEDIA_SEARCH,
     args_schema=WikipediaSearchArgs,
     description="""
-Search English Wikipedia and return matching pages plus a short summary of the top result.
+Search English Wikipedia and return matching pages with a short summary of each.
 
 Required fields:
 - query (string)
@@ -135,10 +140,21 @@ def wikipedia_search(
     summary_sentences: int = 2,
 ) -> ToolResult:
     results = _wikipedia_client.search(query, limit=limit)
-    summary: Optional[WikipediaPageSummary] = None
+    summaries: dict[str, WikipediaPageSummary] = {}
     if results:
         try:
-            summary = _wikipedia_client.get_page_summary(results[0].title, sentences=summary_sentences)
+            summaries = _wikipedia_client.get_page_summaries_coalesced(
+                [item.title for item in results],
+                sentences=summary_sentences,
+            )
         except Exception:
             pass
-    return _tool_result(WikipediaSearchResponse(query=query, results=results, top_result_summary=summary))
+    result_summaries = [summaries.get(item.title.strip()) for item in results]
+    return _tool_result(
+        WikipediaSearchResponse(
+            query=query,
+            results=results,
+            top_result_summary=result_summaries[0] if result_summaries else None,
+            result_summaries=result_summaries,
+        )
+    )
@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from threading import Lock
+from time import monotonic
+
+import numpy as np
+import psycopg
+from pydantic import BaseModel, Field
+
+from common.config import get_env_float, get_env_int
+from request_orchestrator.shared.tool_adapter.series_repository import SeriesRepository
+
+SERIES_STORE_BACKEND_MEMORY = "memory"
+SERIES_STORE_BACKEND_POSTGRES = "postgres"
+SERIES_DEFAULT_POINT_BUDGET = max(3, get_env_int("SERIES_DEFAULT_POINT_BUDGET", 24))
+SERIES_STORE_MAX_ENTRIES = max(1, get_env_int("SERIES_STORE_MAX_ENTRIES", 512))
+# Must outlive the longest tool-result cache of a summarizing tool (REFERENCE_CACHE_POLICY, 6h by default),
+# or a cached summary can name a series that is already gone.
+SERIES_STORE_TTL_SECONDS = max(0.0, get_env_float("SERIES_STORE_TTL_SECONDS", 7 * 24 * 60 * 60))
+# After a database error the shared tier is skipped for this long instead of reconnecting on every lookup.
+SERIES_STORE_DB_RETRY_SECONDS = 60.0
+# Points returned per get_series_points call, however long the stored window is.
+SERIES_READ_MAX_POINTS = max(3, get_env_int("SERIES_READ_MAX_POINTS", 200))
+SERIES_PERCENTILES = (10, 50, 90)
+
+
+class SeriesPoint(BaseModel):
+    x: str
+    y: float
+
+
+class SeriesStats(BaseModel):
+    count: int
+    min: float
+    max: float
+    mean: float
+    p10: float
+    p50: float
+    p90: float
+    first: float
+    last: float
+    change: float
+    change_pct: float | None = None
+    trend_per_step: float | None = None
+
+
+class SeriesSummary(BaseModel):
+    """Compact stand-in for a numeric series: stats plus a shape-preserving sample of points.
+
+    The full-resolution series stays in the series store under `series_id`, where
+    `read_series` (the get_series_points tool) can fetch a window of it.
+    """
+
+    series_id: str
+    label: str
+    start: str = ""
+    end: str = ""
+    stats: SeriesStats | None = None
+    points: list[SeriesPoint] = Field(default_factory=list)
+    downsampled: bool = False
+
+
+@dataclass(frozen=True)
+class StoredSeries:
+    label: str
+    xs: tuple[str, ...]
+    ys: tuple[float, ...]
+    expires_at: float
+
+
+class SeriesStore:
+    """In-process LRU in front of an optional shared Postgres tier for full-resolution series.
+
+    The Postgres tier keeps a series_id readable after a restart, from other workers, and for as
+    long as the global tool-result cache can hand the summary that names it back to the planner;
+    when it is unavailable the store degrades to the in-process tier only.
+    """
+
+    def __init__(
+        self,
+        backend: str = SERIES_STORE_BACKEND_MEMORY,
+        *,
+        repository: SeriesRepository | None = None,
+        max_entries: int = SERIES_STORE_MAX_ENTRIES,
+        ttl_seconds: float = SERIES_STORE_TTL_SECONDS,
+    ) -> None:
+        self._backend = backend
+        self._repository_instance = repository
+        self._max_entries = max(1, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, StoredSeries] = OrderedDict()
+        self._lock = Lock()
+        self._db_disabled_until = 0.0
+
+    def _repository(self) -> SeriesRepository | None:
+        if self._backend != SERIES_STORE_BACKEND_POSTGRES or monotonic() < self._db_disabled_until:
+            return None
+        if self._repository_instance is None:
+            self._repository_instance = SeriesRepository()
+        return self._repository_instance
+
+    def _disable_db(self) -> None:
+        self._db_disabled_until = monotonic() + SERIES_STORE_DB_RETRY_SECONDS
+
+    def _remember(self, series_id: str, label: str, xs: list[str], ys: list[float]) -> StoredSeries:
+        entry = StoredSeries(label=label, xs=tuple(xs), ys=tuple(ys), expires_at=monotonic() + self._ttl_seconds)
+        with self._lock:
+            self._entries[series_id] = entry
+            self._entries.move_to_end(series_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def put(self, series_id: str, label: str, xs: list[str], ys: list[float]) -> None:
+        self._remember(series_id, label, xs, ys)
+        try:
+            repository = self._repository()
+            if repository is not None:
+                repository.put(series_id, label, xs, ys, timedelta(seconds=self._ttl_seconds))
+        except psycopg.Error:
+            self._disable_db()
+
+    def get(self, series_id: str) -> StoredSeries | None:
+        with self._lock:
+            entry = self._entries.get(series_id)
+            if entry is not None and entry.expires_at > monotonic():
+                self._entries.move_to_end(series_id)
+                return entry
+            if entry is not None:
+                del self._entries[series_id]
+
+        try:
+            repository = self._repository()
+            stored = None if repository is None else repository.get(series_id)
+        except psycopg.Error:
+            self._disable_db()
+            return None
+        if stored is None:
+            return None
+        return self._remember(series_id, *stored)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_SERIES_STORE: SeriesStore | None = None
+_SERIES_STORE_LOCK = Lock()
+
+
+def build_series_store(backend: str | None = None) -> SeriesStore:
+    resolved_backend = (backend or os.getenv("SERIES_STORE_BACKEND", SERIES_STORE_BACKEND_POSTGRES)).strip().lower()
+    if resolved_backend == SERIES_STORE_BACKEND_POSTGRES:
+        return SeriesStore(SERIES_STORE_BACKEND_POSTGRES)
+    return SeriesStore(SERIES_STORE_BACKEND_MEMORY)
+
+
+def get_series_store() -> SeriesStore:
+    global _SERIES_STORE
+    with _SERIES_STORE_LOCK:
+        if _SERIES_STORE is None:
+            _SERIES_STORE = build_series_store()
+        return _SERIES_STORE
+
+
+def point_budget_for_tool(tool_name: str, default: int = SERIES_DEFAULT_POINT_BUDGET) -> int:
+    """Per-tool point budget, overridable with SERIES_POINT_BUDGET_<TOOL_NAME>."""
+    return max(3, get_env_int(f"SERIES_POINT_BUDGET_{tool_name.upper()}", default))
+
+
+def lttb_indices(values: np.ndarray, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets sample of `values`, returned as sorted indices."""
+    count = len(values)
+    if threshold >= count or count <= 2:
+        return np.arange(count)
+    if threshold < 3:
+        return np.array([0, count - 1])
+
+    positions = np.arange(count, dtype=np.float64)
+    bucket_size = (count - 2) / (threshold - 2)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    anchor = 0
+    for bucket in range(threshold - 2):
+        range_start = int(bucket * bucket_size) + 1
+        range_end = int((bucket + 1) * bucket_size) + 1
+        next_start = range_end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+        average_x = positions[next_start:next_end].mean()
+        average_y = values[next_start:next_end].mean()
+        areas = np.abs(
+            (positions[anchor] - average_x) * (values[range_start:range_end] - values[anchor])
+            - (positions[anchor] - positions[range_start:range_end]) * (average_y - values[anchor])
+        )
+        anchor = range_start + int(np.argmax(areas))
+        selected[bucket + 1] = anchor
+    selected[-1] = count - 1
+    return selected
+
+
+def _series_id(tool_name: str, label: str, xs: list[str], ys: list[float]) -> str:
+    canonical = json.dumps([tool_name, label, xs, ys], separators=(",", ":"))
+    return f"series_{hashlib.sha256(canonical.encode()).hexdigest()[:16]}"
+
+
+def _series_stats(values: np.ndarray, *, decimals: int) -> SeriesStats:
+    first = float(values[0])
+    last = float(values[-1])
+    percentiles = np.percentile(values, SERIES_PERCENTILES)
+    trend = float(np.polyfit(np.arange(len(values), dtype=np.float64), values, 1)[0]) if len(values) >= 2 else None
+    return SeriesStats(
+        count=len(values),
+        min=round(float(values.min()), decimals),
+        max=round(float(values.max()), decimals),
+        mean=round(float(values.mean()), decimals),
+        p10=round(float(percentiles[0]), decimals),
+        p50=round(float(percentiles[1]), decimals),
+        p90=round(float(percentiles[2]), decimals),
+        first=round(first, decimals),
+        last=round(last, decimals),
+        change=round(last - first, decimals),
+        change_pct=round((last - first) / first * 100, 2) if first else None,
+        trend_per_step=None if trend is None else round(trend, decimals),
+    )
+
+
+def _summary(series_id: str, label: str, xs: list[str], values: np.ndarray, *, point_budget: int, decimals: int) -> SeriesSummary:
+    if not len(values):
+        return SeriesSummary(series_id=series_id, label=label)
+    indices = lttb_indices(values, point_budget)
+    return SeriesSummary(
+        series_id=series_id,
+        label=label,
+        start=xs[0],
+        end=xs[-1],
+        stats=_series_stats(values, decimals=decimals),
+        points=[SeriesPoint(x=xs[index], y=round(float(values[index]), decimals)) for index in indices.tolist()],
+        downsampled=len(indices) < len(values),
+    )
+
+
+def summarize_series(
+    label: str,
+    xs: list[str],
+    ys: list[float | None],
+    *,
+    tool_name: str,
+    point_budget: int | None = None,
+    decimals: int = 6,
+) -> SeriesSummary:
+    values = np.array([np.nan if y is None else y for y in ys], dtype=np.float64)
+    valid = ~np.isnan(values)
+    valid_xs = [x for x, is_valid in zip(xs, valid.tolist()) if is_valid]
+    valid_values = values[valid]
+    series_id = _series_id(tool_name, label, valid_xs, valid_values.tolist())
+    if len(valid_values):
+        get_series_store().put(series_id, label, valid_xs, valid_values.tolist())
+    return _summary(
+        series_id,
+        label,
+        valid_xs,
+        valid_values,
+        point_budget=point_budget or point_budget_for_tool(tool_name),
+        decimals=decimals,
+    )
+
+
+def read_series(
+    series_id: str,
+    *,
+    start: str | None = None,
+    end: str | None = None,
+    max_points: int = SERIES_READ_MAX_POINTS,
+    decimals: int = 6,
+) -> SeriesSummary | None:
+    """Stats and points of a stored series between `start` and `end` (inclusive), or None once it has expired.
+
+    X values are ISO dates or timestamps, so the window compares them as strings.
+    """
+    stored = get_series_store().get(series_id)
+    if stored is None:
+        return None
+    window = [
+        (x, y)
+        for x, y in zip(stored.xs, stored.ys)
+        if (not start or x >= start) and (not end or x[: len(end)] <= end)
+    ]
+    return _summary(
+        series_id,
+        stored.label,
+        [x for x, _ in window],
+        np.array([y for _, y in window], dtype=np.float64),
+        point_budget=max(3, max_points),
+        decimals=decimals,
+    )
+
+
+def describe_series(summary: SeriesSummary, *, unit: str = "") -> str:
+    stats = summary.stats
+    if stats is None:
+        return f"No data for {summary.label}."
+    suffix = f" {unit}" if unit else ""
+    change_text = f" ({stats.change_pct:+.2f}%)" if stats.change_pct is not None else ""
+    return (
+        f"{summary.label} from {summary.start} to {summary.end} ({stats.count} points): "
+        f"min {stats.min}{suffix}, max {stats.max}{suffix}, mean {stats.mean}{suffix}, "
+        f"first {stats.first}{suffix}, last {stats.last}{suffix}{change_text}."
+    )
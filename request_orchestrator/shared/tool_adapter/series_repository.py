@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from psycopg.rows import dict_row
+
+from db.connection import PooledConnection
+
+
+class SeriesRepository:
+    def __init__(self, conn: PooledConnection | None = None):
+        self._conn = conn or PooledConnection()
+
+    def get(self, series_id: str) -> tuple[str, list[str], list[float]] | None:
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                """
+                SELECT label, xs, ys FROM series_store
+                WHERE series_id = %s AND expires_at > now()
+                """,
+                (series_id,),
+            )
+            row = cur.fetchone()
+        if row is None:
+            return None
+        return row["label"], list(row["xs"]), [float(y) for y in row["ys"]]
+
+    def put(self, series_id: str, label: str, xs: list[str], ys: list[float], ttl: timedelta) -> None:
+        """Store a series; storing it again (same id, same points) only extends its expiry."""
+        with self._conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO series_store (series_id, label, xs, ys, expires_at)
+                VALUES (%s, %s, %s, %s, now() + %s)
+                ON CONFLICT (series_id) DO UPDATE
+                    SET expires_at = GREATEST(series_store.expires_at, EXCLUDED.expires_at)
+                """,
+                (series_id, label, xs, ys, ttl),
+            )
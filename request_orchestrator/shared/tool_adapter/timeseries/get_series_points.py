@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from langchain_core.tools import tool
+from pydantic import BaseModel, Field
+
+from request_orchestrator.models.evidence import EvidenceView, HydratedEvidence, ToolResult
+from request_orchestrator.shared.tool_adapter.series import SERIES_READ_MAX_POINTS, SeriesSummary, describe_series, read_series
+from tool.constants import TOOL_NAME_GET_SERIES_POINTS
+from tool.constants import TOOL_RESULT_TYPE_SERIES
+
+
+class GetSeriesPointsArgs(BaseModel):
+    series_id: str = Field(..., description="A series_id from earlier finance or weather evidence.")
+    start: str | None = Field(default=None, description="Optional first date (YYYY-MM-DD) of the window to read.")
+    end: str | None = Field(default=None, description="Optional last date (YYYY-MM-DD) of the window to read.")
+    max_points: int = Field(
+        default=SERIES_READ_MAX_POINTS,
+        ge=3,
+        le=SERIES_READ_MAX_POINTS,
+        description=f"Maximum points to return (at most {SERIES_READ_MAX_POINTS}); longer windows are downsampled keeping their shape.",
+    )
+
+
+class GetSeriesPointsResult(BaseModel):
+    error: str = ""
+    series: SeriesSummary | None = None
+
+
+class SeriesPointsMetadata(BaseModel):
+    series_id: str
+    start: str
+    end: str
+    count: int
+    downsampled: bool
+
+
+def _tool_result(series_id: str, summary: SeriesSummary | None) -> ToolResult:
+    if summary is None:
+        return ToolResult(
+            result=GetSeriesPointsResult(error=f"Series '{series_id}' is no longer available; call the original tool again."),
+            evidence_views=[],
+            hydrated_evidence=[],
+        )
+    metadata = SeriesPointsMetadata(
+        series_id=summary.series_id,
+        start=summary.start,
+        end=summary.end,
+        count=0 if summary.stats is None else summary.stats.count,
+        downsampled=summary.downsampled,
+    )
+    hydrated = HydratedEvidence(
+        item_id=f"{summary.series_id}:{summary.start}..{summary.end}",
+        tool_name=TOOL_NAME_GET_SERIES_POINTS,
+        title=f"{summary.label} series points",
+        summary=describe_series(summary),
+        published_at=summary.end,
+        source=TOOL_NAME_GET_SERIES_POINTS,
+        entity_type=TOOL_RESULT_TYPE_SERIES,
+        metadata=metadata.model_dump(),
+        raw_payload=summary,
+    )
+    return ToolResult(
+        result=GetSeriesPointsResult(series=summary),
+        evidence_views=[
+            EvidenceView(item_id=hydrated.item_id, title=hydrated.title, summary=hydrated.summary, metadata=dict(hydrated.metadata))
+        ],
+        hydrated_evidence=[hydrated],
+    )
+
+
+@tool(
+    TOOL_NAME_GET_SERIES_POINTS,
+    args_schema=GetSeriesPointsArgs,
+    description="""
+Read the full-resolution points of a series summarized by an earlier finance or weather tool call.
+
+Required fields:
+- series_id (string): the series_id (or history_series_id / daily_series_ids entry) from earlier evidence.
+
+Optional fields:
+- start, end (YYYY-MM-DD strings): limit the read to a window.
+- max_points (integer): cap on returned points.
+
+Use this only when the summary statistics and sampled points are not enough, e.g. to find the value on a specific date.
+
+Example valid call:
+{"series_id": "series_0123456789abcdef", "start": "2024-03-01", "end": "2024-03-31"}
+""",
+)
+def get_series_points(
+    series_id: str,
+    start: str | None = None,
+    end: str | None = None,
+    max_points: int = SERIES_READ_MAX_POINTS,
+) -> ToolResult:
+    return _tool_result(series_id, read_series(series_id, start=start, end=end, max_points=max_points))
@@ -4,7 +4,7 @@ from langchain_core.tools import tool
 from pydantic import BaseModel, Field
 
 from common.data import normalize_string_list
-from llm.clients.embeddings import embed_text
+from llm.clients.embeddings import embed_query
 from personalization.user_attributes.models.user_attribute_models import UserAttributeSearchResult
 from personalization.user_attributes.models.user_attribute_types import ATTRIBUTE_TYPE_COMPACT_DESCRIPTION, UserAttributeType
 from personalization.user_attributes.repository.repo_factory import get_user_attribute_repo
@@ -90,7 +90,7 @@ def search_user_attributes(
     group_key: str | None = None,
     source: str | None = None,
 ) -> ToolResult:
-    query_embedding = embed_text(query)
+    query_embedding = embed_query(query)
     return _tool_result(
         get_user_attribute_repo().search_attributes(
             query_embedding=query_embedding,
@@ -2,36 +2,80 @@ from langchain_core.tools import tool
 from pydantic import BaseModel, Field
 
 from integrations.open_meteo import OPEN_METEO_WEBSITE_URL, OpenMeteoClient
-from integrations.open_meteo.models import MonthlyWeatherSummary
+from integrations.open_meteo.models import DailyWeather, MonthlyWeatherSummary
 from request_orchestrator.models.evidence import EvidenceUrl, EvidenceUrlType, EvidenceView, HydratedEvidence, ToolResult
+from request_orchestrator.shared.tool_adapter.series import SeriesSummary, point_budget_for_tool, summarize_series
 from tool.constants import TOOL_NAME_GET_HISTORICAL_MONTH_WEATHER
 from tool.constants import TOOL_RESULT_TYPE_WEATHER
 
 _weather_client = OpenMeteoClient()
 
 
+# A month has at most 31 days; a handful of shape-preserving points is enough for the prompt.
+HISTORICAL_MONTH_WEATHER_POINT_BUDGET = 8
+
+
+class HistoricalMonthWeatherResult(MonthlyWeatherSummary):
+    # Raw per-day arrays are replaced by `daily_series`; the full data stays in the series store.
+    daily: DailyWeather | None = Field(default=None, exclude=True)
+    daily_series: list[SeriesSummary] = []
+
+
 class HistoricalMonthWeatherMetadata(BaseModel):
     year: int
     month: int
-    temperature_mean: float | None = None
-    temperature_max: float | None = None
-    temperature_min: float | None = None
-    precipitation_sum: float | None = None
+    avg_temp_max_c: float | None = None
+    avg_temp_min_c: float | None = None
+    total_precip_mm: float | None = None
+    avg_wind_max_kmh: float | None = None
+    daily_series_ids: list[str] = []
+
+
+def _summarize_daily(result: MonthlyWeatherSummary) -> HistoricalMonthWeatherResult:
+    daily = result.daily
+    daily_series: list[SeriesSummary] = []
+    if daily is not None:
+        point_budget = point_budget_for_tool(TOOL_NAME_GET_HISTORICAL_MONTH_WEATHER, default=HISTORICAL_MONTH_WEATHER_POINT_BUDGET)
+        daily_series = [
+            summarize_series(
+                label,
+                daily.date,
+                values,
+                tool_name=TOOL_NAME_GET_HISTORICAL_MONTH_WEATHER,
+                point_budget=point_budget,
+                decimals=1,
+            )
+            for label, values in (
+                ("temperature_2m_max", daily.temperature_2m_max),
+                ("temperature_2m_min", daily.temperature_2m_min),
+                ("precipitation_sum", daily.precipitation_sum),
+                ("windspeed_10m_max", daily.windspeed_10m_max),
+            )
+        ]
+    return HistoricalMonthWeatherResult(**result.model_dump(exclude={"daily"}), daily_series=daily_series)
 
 
-def _tool_result(result: MonthlyWeatherSummary | None) -> ToolResult:
+def _tool_result(result: HistoricalMonthWeatherResult | None) -> ToolResult:
     if result is None:
         return ToolResult(result=None, evidence_views=[], hydrated_evidence=[])
 
-    location_name = (result.location_name or "").strip()
-    summary = f"{location_name} historical weather for {result.year}-{result.month:02d}."
+    location_name = ", ".join(part for part in (result.city.strip(), result.country.strip()) if part)
+    summary_parts = [
+        f"average high {result.avg_temp_max_c}°C" if result.avg_temp_max_c is not None else "",
+        f"average low {result.avg_temp_min_c}°C" if result.avg_temp_min_c is not None else "",
+        f"total precipitation {result.total_precip_mm} mm" if result.total_precip_mm is not None else "",
+    ]
+    summary = f"{location_name} historical weather for {result.year}-{result.month:02d}"
+    details = ", ".join(part for part in summary_parts if part)
+    summary = f"{summary}: {details}." if details else f"{summary}."
     metadata = HistoricalMonthWeatherMetadata(
         year=result.year,
         month=result.month,
-        temperature_mean=result.temperature_mean,
-        temperature_max=result.temperature_max,
-        temperature_min=result.temperature_min,
-        precipitation_sum=result.precipitation_sum,
+        avg_temp_max_c=result.avg_temp_max_c,
+        avg_temp_min_c=result.avg_temp_min_c,
+        total_precip_mm=result.total_precip_mm,
+        avg_wind_max_kmh=result.avg_wind_max_kmh,
+        daily_series_ids=[series.series_id for series in result.daily_series],
     )
     hydrated = HydratedEvidence(
         item_id=location_name or f"{result.year}-{result.month:02d}",
@@ -99,4 +143,4 @@ Example valid call:
 )
 def get_historical_month_weather(city: str, year: int, month: int) -> ToolResult:
     result = _weather_client.get_historical_month(city, year, month)
-    return _tool_result(result.model_copy(update={"daily": None}))
+    return _tool_result(_summarize_daily(result))
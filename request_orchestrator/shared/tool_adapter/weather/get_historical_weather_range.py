@@ -0,0 +1,193 @@
+from typing import Literal
+
+import numpy as np
+from langchain_core.tools import tool
+from pydantic import BaseModel, Field
+
+from integrations.open_meteo import OPEN_METEO_WEBSITE_URL, OpenMeteoClient
+from integrations.open_meteo.models import WeatherArchiveRange, WeatherPeriodAggregate
+from request_orchestrator.models.evidence import EvidenceUrl, EvidenceUrlType, EvidenceView, HydratedEvidence, ToolResult
+from tool.constants import TOOL_NAME_GET_HISTORICAL_WEATHER_RANGE
+from tool.constants import TOOL_RESULT_TYPE_WEATHER
+
+_weather_client = OpenMeteoClient()
+
+
+class HistoricalWeatherRangeMetadata(BaseModel):
+    start_date: str
+    end_date: str
+    granularity: str
+    months: list[int] = []
+    periods_count: int
+    mean_avg_temp_max_c: float | None = None
+    mean_avg_temp_min_c: float | None = None
+    mean_total_precip_mm: float | None = None
+    wettest_period: str | None = None
+    driest_period: str | None = None
+    warmest_period: str | None = None
+    coldest_period: str | None = None
+
+
+def _column(periods: list[WeatherPeriodAggregate], field_name: str) -> np.ndarray:
+    return np.array([np.nan if getattr(period, field_name) is None else getattr(period, field_name) for period in periods], dtype=np.float64)
+
+
+def _mean(values: np.ndarray) -> float | None:
+    return None if np.isnan(values).all() else round(float(np.nanmean(values)), 2)
+
+
+def _period_at(periods: list[WeatherPeriodAggregate], values: np.ndarray, *, highest: bool) -> WeatherPeriodAggregate | None:
+    if np.isnan(values).all():
+        return None
+    return periods[int(np.nanargmax(values) if highest else np.nanargmin(values))]
+
+
+def _tool_result(result: WeatherArchiveRange | None) -> ToolResult:
+    if result is None or not result.periods:
+        return ToolResult(result=result, evidence_views=[], hydrated_evidence=[])
+
+    periods = result.periods
+    temp_max = _column(periods, "avg_temp_max_c")
+    temp_min = _column(periods, "avg_temp_min_c")
+    precip = _column(periods, "total_precip_mm")
+    wettest = _period_at(periods, precip, highest=True)
+    driest = _period_at(periods, precip, highest=False)
+    warmest = _period_at(periods, temp_max, highest=True)
+    coldest = _period_at(periods, temp_min, highest=False)
+    metadata = HistoricalWeatherRangeMetadata(
+        start_date=result.start_date,
+        end_date=result.end_date,
+        granularity=result.granularity,
+        months=result.months,
+        periods_count=len(periods),
+        mean_avg_temp_max_c=_mean(temp_max),
+        mean_avg_temp_min_c=_mean(temp_min),
+        mean_total_precip_mm=_mean(precip),
+        wettest_period=None if wettest is None else wettest.period,
+        driest_period=None if driest is None else driest.period,
+        warmest_period=None if warmest is None else warmest.period,
+        coldest_period=None if coldest is None else coldest.period,
+    )
+
+    location_name = ", ".join(part for part in (result.city.strip(), result.country.strip()) if part)
+    summary_parts = [
+        f"average high {metadata.mean_avg_temp_max_c}°C" if metadata.mean_avg_temp_max_c is not None else "",
+        f"average low {metadata.mean_avg_temp_min_c}°C" if metadata.mean_avg_temp_min_c is not None else "",
+        f"average precipitation {metadata.mean_total_precip_mm} mm per {result.granularity}" if metadata.mean_total_precip_mm is not None else "",
+        f"wettest {wettest.period} ({wettest.total_precip_mm} mm)" if wettest is not None else "",
+        f"driest {driest.period} ({driest.total_precip_mm} mm)" if driest is not None else "",
+    ]
+    summary = f"{location_name} historical weather from {result.start_date} to {result.end_date} ({len(periods)} {result.granularity}s)"
+    details = ", ".join(part for part in summary_parts if part)
+    summary = f"{summary}: {details}." if details else f"{summary}."
+    hydrated = HydratedEvidence(
+        item_id=f"{location_name}:{result.start_date}..{result.end_date}:{result.granularity}",
+        tool_name=TOOL_NAME_GET_HISTORICAL_WEATHER_RANGE,
+        title="Historical Weather Range",
+        summary=summary,
+        urls=[EvidenceUrl(url=OPEN_METEO_WEBSITE_URL, url_type=EvidenceUrlType.WEBSITE)],
+        location_name=location_name,
+        source=TOOL_NAME_GET_HISTORICAL_WEATHER_RANGE,
+        entity_type=TOOL_RESULT_TYPE_WEATHER,
+        metadata=metadata.model_dump(exclude_none=True),
+        raw_payload=result,
+    )
+    return ToolResult(
+        result=result,
+        evidence_views=[
+            EvidenceView(
+                item_id=hydrated.item_id,
+                title=hydrated.title,
+                summary=hydrated.summary,
+                metadata=dict(hydrated.metadata),
+            )
+        ],
+        hydrated_evidence=[hydrated],
+    )
+
+
+class HistoricalWeatherRangeArgs(BaseModel):
+    city: str = Field(
+        ...,
+        description="City name only. Example: 'Lisbon'. Do NOT include years or months.",
+    )
+    start_year: int = Field(
+        ...,
+        description="First 4-digit year of the range. Example: 2015.",
+    )
+    end_year: int = Field(
+        ...,
+        description="Last 4-digit year of the range (inclusive). Example: 2024.",
+    )
+    start_month: int = Field(
+        default=1,
+        description="Month number (1-12) the range starts in, within start_year.",
+        ge=1,
+        le=12,
+    )
+    end_month: int = Field(
+        default=12,
+        description="Month number (1-12) the range ends in, within end_year.",
+        ge=1,
+        le=12,
+    )
+    months: list[int] | None = Field(
+        default=None,
+        description="Optional calendar months (1-12) to keep. Example: [3] for every March in the range.",
+    )
+    granularity: Literal["month", "year"] = Field(
+        default="month",
+        description="Aggregate per 'month' or per 'year'.",
+    )
+
+
+@tool(
+    TOOL_NAME_GET_HISTORICAL_WEATHER_RANGE,
+    args_schema=HistoricalWeatherRangeArgs,
+    description="""
+Get aggregated historical weather for a city across many months or years in a single call.
+Returns per-month or per-year average high/low temperature, total precipitation, rainy days, and average max wind.
+
+Use this instead of repeated get_historical_month_weather calls when the question spans more than one month,
+e.g. "how rainy is Lisbon in March over the last 10 years".
+
+Required fields:
+- city (string)
+- start_year (integer)
+- end_year (integer)
+
+Optional fields:
+- start_month, end_month (integer 1-12)
+- months (list of integers 1-12)
+- granularity ("month" or "year")
+
+Example valid call:
+{
+  "city": "Lisbon",
+  "start_year": 2015,
+  "end_year": 2024,
+  "months": [3],
+  "granularity": "year"
+}
+""",
+)
+def get_historical_weather_range(
+    city: str,
+    start_year: int,
+    end_year: int,
+    start_month: int = 1,
+    end_month: int = 12,
+    months: list[int] | None = None,
+    granularity: str = "month",
+) -> ToolResult:
+    return _tool_result(
+        _weather_client.get_historical_range(
+            city,
+            start_year,
+            end_year,
+            start_month=start_month,
+            end_month=end_month,
+            months=months,
+            granularity=granularity,
+        )
+    )
@@ -56,6 +56,8 @@ class RerankerPrompt:
                 "metadata": {
                     "source": metadata.get("source"),
                     "retrieval_distance": metadata.get("retrieval_distance"),
+                    "fused_score": metadata.get("fused_score"),
+                    "exact_name_match": metadata.get("exact_name_match"),
                     "flags": metadata.get("flags"),
                     "reasons": metadata.get("reasons"),
                 },
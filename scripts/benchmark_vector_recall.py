@@ -0,0 +1,130 @@
+import argparse
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import psycopg
+from pgvector.psycopg import register_vector
+
+from common.config import EMBEDDING_DIMENSIONS
+from db.constants import DB_URL
+from db.embedding_migration import resolve_embedding_slot
+from db.vector import EMBEDDING_SQL_TYPE, PRODUCT_EMBEDDING, binary_quantized_sql, recall_at_k
+
+SearchFn = Callable[[psycopg.Connection, list[float], int], list[str]]
+
+
+def _embedding() -> str:
+    """The products slot holding vectors of the configured embedding model."""
+    return resolve_embedding_slot(PRODUCT_EMBEDDING).name
+
+
+def _ids(conn: psycopg.Connection, sql: str, params: tuple[Any, ...], *, exact: bool = False) -> list[str]:
+    with conn.transaction(), conn.cursor() as cur:
+        if exact:
+            # Force a full scan so the baseline is the true nearest-neighbour order.
+            cur.execute("SET LOCAL enable_indexscan = off")
+            cur.execute("SET LOCAL enable_bitmapscan = off")
+        cur.execute(sql, params)
+        return [str(row[0]) for row in cur.fetchall()]
+
+
+def exact_search(conn: psycopg.Connection, query: list[float], k: int) -> list[str]:
+    return _ids(
+        conn,
+        f"SELECT id FROM products ORDER BY {_embedding()}::vector <-> (%s)::vector({EMBEDDING_DIMENSIONS}) LIMIT %s",
+        (query, k),
+        exact=True,
+    )
+
+
+def ann_search(conn: psycopg.Connection, query: list[float], k: int) -> list[str]:
+    return _ids(conn, f"SELECT id FROM products ORDER BY {_embedding()} <-> (%s)::{EMBEDDING_SQL_TYPE} LIMIT %s", (query, k))
+
+
+def halfvec_search(conn: psycopg.Connection, query: list[float], k: int) -> list[str]:
+    halfvec_type = f"halfvec({EMBEDDING_DIMENSIONS})"
+    return _ids(
+        conn,
+        f"SELECT id FROM products ORDER BY {_embedding()}::{halfvec_type} <-> (%s)::{halfvec_type} LIMIT %s",
+        (query, k),
+        exact=True,
+    )
+
+
+def binary_search(oversample: int) -> SearchFn:
+    def search(conn: psycopg.Connection, query: list[float], k: int) -> list[str]:
+        return _ids(
+            conn,
+            f"""
+            WITH query AS (SELECT (%s)::{EMBEDDING_SQL_TYPE} AS embedding),
+            candidates AS (
+                SELECT products.id, products.{_embedding()} AS embedding
+                FROM products, query
+                ORDER BY {binary_quantized_sql(f"products.{_embedding()}")} <~> {binary_quantized_sql("query.embedding")}
+                LIMIT %s
+            )
+            SELECT candidates.id
+            FROM candidates, query
+            ORDER BY candidates.embedding <-> query.embedding
+            LIMIT %s
+            """,
+            (query, k * oversample, k),
+        )
+
+    return search
+
+
+def sample_queries(conn: psycopg.Connection, count: int, seed: float) -> list[list[float]]:
+    with conn.cursor() as cur:
+        cur.execute("SELECT setseed(%s)", (seed,))
+        cur.execute(
+            f"SELECT {_embedding()}::vector FROM products WHERE {_embedding()} IS NOT NULL ORDER BY random() LIMIT %s",
+            (count,),
+        )
+        return [row[0].tolist() for row in cur.fetchall()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recall@k and latency of the product vector search strategies.")
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--oversample", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seed", type=float, default=0.42)
+    args = parser.parse_args()
+
+    strategies: dict[str, SearchFn] = {
+        "ann index": ann_search,
+        "halfvec (exact scan)": halfvec_search,
+        **{f"binary + re-rank x{factor}": binary_search(factor) for factor in args.oversample},
+    }
+    with psycopg.connect(DB_URL, autocommit=True) as conn:
+        register_vector(conn)
+        queries = sample_queries(conn, args.queries, args.seed)
+        if not queries:
+            raise SystemExit("No product embeddings to benchmark; seed the catalog first.")
+        expected = [exact_search(conn, query, args.k) for query in queries]
+
+        print(f"{len(queries)} queries, k={args.k}, storage {EMBEDDING_SQL_TYPE}")
+        print(f"{'strategy':<28}{'recall@k':>10}{'p50 ms':>10}{'p95 ms':>10}")
+        for name, search in strategies.items():
+            recalls: list[float] = []
+            latencies: list[float] = []
+            for query, exact_ids in zip(queries, expected):
+                started = perf_counter()
+                ids = search(conn, query, args.k)
+                latencies.append((perf_counter() - started) * 1000)
+                recalls.append(recall_at_k(exact_ids, ids, args.k))
+            latencies.sort()
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            print(f"{name:<28}{statistics.fmean(recalls):>10.3f}{statistics.median(latencies):>10.1f}{p95:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
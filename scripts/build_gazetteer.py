@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from integrations.open_meteo.gazetteer import GAZETTEER_DEFAULT_SIZE, OPEN_METEO_GAZETTEER_PATH, build_gazetteer
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else GAZETTEER_DEFAULT_SIZE
+    count = build_gazetteer(OPEN_METEO_GAZETTEER_PATH, size=size)
+    print(f"Wrote {count} places to {OPEN_METEO_GAZETTEER_PATH}")
+
+
+if __name__ == "__main__":
+    main()
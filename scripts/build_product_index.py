@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from products.vector_index import PRODUCT_INDEX_PATH, build_product_index_from_db
+
+
+def main() -> None:
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else PRODUCT_INDEX_PATH
+    index = build_product_index_from_db(path)
+    print(f"Indexed {len(index)} products (catalog version {index.catalog_version}) into {path}")
+
+
+if __name__ == "__main__":
+    main()
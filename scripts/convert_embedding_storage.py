@@ -0,0 +1,116 @@
+import argparse
+import re
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import psycopg
+
+from common.config import EMBEDDING_DIMENSIONS
+from db.constants import DB_URL
+from db.embedding_migration import EmbeddingMigrationRepository
+from db.vector import EMBEDDING_COLUMNS, EMBEDDING_STORAGE, EMBEDDING_STORAGE_TYPES, embedding_column_conversion_sql
+
+
+def column_type(conn: psycopg.Connection, table: str, column: str) -> tuple[str, int] | None:
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT format_type(a.atttypid, a.atttypmod)
+            FROM pg_attribute a
+            WHERE a.attrelid = to_regclass(%s)
+              AND a.attname = %s
+              AND NOT a.attisdropped
+            """,
+            (table, column),
+        )
+        row = cur.fetchone()
+    if row is None:
+        return None
+    match = re.fullmatch(r"(\w+)\((\d+)\)", row[0])
+    if match is None:
+        raise RuntimeError(f"{table}.{column} has unexpected type {row[0]}")
+    return match.group(1), int(match.group(2))
+
+
+def table_exists(conn: psycopg.Connection, table: str) -> bool:
+    with conn.cursor() as cur:
+        cur.execute("SELECT to_regclass(%s) IS NOT NULL", (table,))
+        row = cur.fetchone()
+    return bool(row and row[0])
+
+
+def has_embeddings(conn: psycopg.Connection, table: str, column: str) -> bool:
+    with conn.cursor() as cur:
+        cur.execute(f"SELECT EXISTS (SELECT 1 FROM {table} WHERE {column} IS NOT NULL)")
+        row = cur.fetchone()
+    return bool(row and row[0])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert every embedding column to another storage type or size.")
+    parser.add_argument("--storage", choices=EMBEDDING_STORAGE_TYPES, default=EMBEDDING_STORAGE)
+    parser.add_argument("--dimensions", type=int, default=EMBEDDING_DIMENSIONS)
+    args = parser.parse_args()
+
+    # Autocommit, so each column is converted and committed in its own transaction.
+    with psycopg.connect(DB_URL, autocommit=True) as conn:
+        migrations = EmbeddingMigrationRepository(conn)
+        for column in EMBEDDING_COLUMNS:
+            state = migrations.get_state(column) if table_exists(conn, "embedding_migration") else None
+            if state is not None and state.in_progress:
+                raise SystemExit(
+                    f"{column.key} is being re-embedded with {state.target_model}; "
+                    "switch slots or restart that run before converting it."
+                )
+            # Only the slot being served is converted; the other one is recreated by the next re-embedding run.
+            slot = state.active_slot if state is not None else column.column
+            current = column_type(conn, column.table, slot)
+            if current is None:
+                print(f"Skipping {column.table}.{slot}: column not found")
+                continue
+            current_storage, current_dimensions = current
+            if (current_storage, current_dimensions) == (args.storage, args.dimensions):
+                print(f"{column.table}.{slot} is already {args.storage}({args.dimensions})")
+                continue
+            if args.dimensions > current_dimensions and has_embeddings(conn, column.table, slot):
+                raise SystemExit(
+                    f"{column.table}.{slot} holds {current_dimensions}-dimension embeddings; "
+                    f"they cannot be widened to {args.dimensions} and must be re-embedded "
+                    "(scripts/reembed_embeddings.py)."
+                )
+            statements = embedding_column_conversion_sql(
+                column,
+                storage=args.storage,
+                dimensions=args.dimensions,
+                truncate=args.dimensions < current_dimensions,
+                slot=slot,
+            )
+            with conn.transaction(), conn.cursor() as cur:
+                for statement in statements:
+                    cur.execute(statement)
+                if state is not None:
+                    cur.execute(
+                        """
+                        UPDATE embedding_migration
+                        SET active_model = split_part(active_model, '@', 1) || '@' || %s,
+                            previous_model = NULL,
+                            updated_at = now()
+                        WHERE table_name = %s AND column_name = %s
+                        """,
+                        (args.dimensions, column.table, column.column),
+                    )
+            print(
+                f"Converted {column.table}.{slot} from {current_storage}({current_dimensions}) "
+                f"to {args.storage}({args.dimensions})"
+            )
+
+    print(f"Set EMBEDDING_STORAGE={args.storage} and EMBEDDING_DIMENSIONS={args.dimensions} for the app and workers.")
+    print("Rebuild the in-process product index if it is enabled: python scripts/build_product_index.py")
+
+
+if __name__ == "__main__":
+    main()
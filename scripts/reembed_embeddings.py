@@ -0,0 +1,99 @@
+import argparse
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from common.config import EMBEDDING_DIMENSIONS, EMBEDDING_VERSION, embedding_version
+from db.embedding_migration import get_embedding_column, get_embedding_migration_repo
+from db.vector import EMBEDDING_COLUMNS, EmbeddingColumn
+from jobs.embedding_migration import EmbeddingMigrationRunner
+from jobs.enqueue import enqueue_embedding_migration
+
+
+def selected_columns(keys: list[str] | None) -> list[EmbeddingColumn]:
+    return [get_embedding_column(key) for key in keys] if keys else list(EMBEDDING_COLUMNS)
+
+
+def print_status(columns: list[EmbeddingColumn]) -> None:
+    repository = get_embedding_migration_repo()
+    for column in columns:
+        state = repository.get_state(column)
+        if state is None:
+            print(f"{column.key}: serving {column.column} (never migrated, assumed {EMBEDDING_VERSION})")
+            continue
+        line = f"{column.key}: serving {state.active_slot} ({state.active_model})"
+        if state.in_progress:
+            pending = repository.count_pending(column, state)
+            line += (
+                f", filling {state.fill_slot(column)} with {state.target_model}: "
+                f"{state.rows_done} rows processed, {pending} pending, checkpoint {state.checkpoint or '-'}"
+            )
+        elif state.previous_model:
+            line += f", {state.previous_model} still readable from {column.other_slot(state.active_slot)}"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Re-embed stored vectors with another model alongside the live ones, then switch to them."
+    )
+    parser.add_argument("command", choices=("start", "run", "switch", "status"))
+    parser.add_argument("--column", action="append", help="table.column to migrate; repeatable (default: all)")
+    parser.add_argument("--model", help="target embedding model (start)")
+    parser.add_argument("--dimensions", type=int, default=EMBEDDING_DIMENSIONS, help="target dimensions (start)")
+    parser.add_argument(
+        "--queue",
+        action="store_true",
+        help="hand the run to the job workers instead of embedding in this process (start)",
+    )
+    parser.add_argument("--switch", action="store_true", help="switch slots once a column is fully re-embedded")
+    args = parser.parse_args()
+
+    columns = selected_columns(args.column)
+    repository = get_embedding_migration_repo()
+
+    if args.command == "status":
+        print_status(columns)
+        return
+
+    if args.command == "start":
+        if not args.model:
+            parser.error("start needs --model")
+        target = embedding_version(args.model, args.dimensions)
+        for column in columns:
+            state = repository.begin(column, target)
+            print(f"{column.key}: filling {state.fill_slot(column)} with {target}")
+            if args.queue:
+                enqueue_embedding_migration(column.key, switch_slots=args.switch)
+        if args.queue:
+            print("Queued; job workers continue from the stored checkpoints. Check progress with `status`.")
+            return
+
+    if args.command in ("start", "run"):
+        for column in columns:
+            runner = EmbeddingMigrationRunner(column)
+            embedded = 0
+            while (written := runner.run_batch()) is not None:
+                embedded += written
+                if written:
+                    print(f"{column.key}: {embedded} rows embedded")
+    for column in columns:
+        state = repository.get_state(column)
+        if state is None or not state.in_progress or not (args.switch or args.command == "switch"):
+            continue
+        repository.build_indexes(column, state)
+        state = repository.switch_slots(column)
+        print(f"{column.key}: now serving {state.active_slot} ({state.active_model})")
+    print_status(columns)
+    print("Set EMBEDDING_MODEL and EMBEDDING_DIMENSIONS to the new model once every column has switched.")
+
+
+if __name__ == "__main__":
+    main()
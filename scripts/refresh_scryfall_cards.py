@@ -0,0 +1,20 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from integrations.scryfall.card_index import SCRYFALL_CARD_INDEX_PATH, refresh_card_snapshot
+
+
+def main() -> None:
+    force = "--force" in sys.argv[1:]
+    if refresh_card_snapshot(path=SCRYFALL_CARD_INDEX_PATH, force=force):
+        print(f"Refreshed Scryfall card snapshot at {SCRYFALL_CARD_INDEX_PATH}")
+    else:
+        print("Scryfall card snapshot is already up to date.")
+
+
+if __name__ == "__main__":
+    main()
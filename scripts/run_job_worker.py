@@ -0,0 +1,25 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from jobs.worker import JobWorker
+
+
+def main() -> None:
+    worker = JobWorker()
+    print(f"Job worker {worker.worker_id} polling for jobs. Press Ctrl+C to stop.")
+    try:
+        worker.run_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
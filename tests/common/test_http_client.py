@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from common.http import CircuitBreaker, CircuitBreakerPolicy, HttpClient, HttpClientError
+from common.http.circuit_breaker import CIRCUIT_STATE_CLOSED, CIRCUIT_STATE_HALF_OPEN, CIRCUIT_STATE_OPEN, CircuitOpenError
+
+
+def _response(status_code: int = 200, payload=None, headers=None):
+    return SimpleNamespace(
+        ok=200 <= status_code < 400,
+        status_code=status_code,
+        headers=headers or {},
+        text="",
+        json=lambda: payload if payload is not None else {},
+    )
+
+
+def test_circuit_breaker_opens_on_error_rate_and_recovers_through_half_open() -> None:
+    breaker = CircuitBreaker("example", CircuitBreakerPolicy(window_size=4, min_calls=4, open_seconds=0.05))
+
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_success(0.01)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure(0.01)
+
+    assert breaker.state == CIRCUIT_STATE_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    time.sleep(0.06)
+    assert breaker.state == CIRCUIT_STATE_HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success(0.01)
+
+    assert breaker.state == CIRCUIT_STATE_CLOSED
+
+
+def test_circuit_breaker_opens_on_slow_calls() -> None:
+    breaker = CircuitBreaker(
+        "example",
+        CircuitBreakerPolicy(window_size=3, min_calls=3, slow_call_seconds=1.0, slow_call_rate_threshold=0.6),
+    )
+
+    for latency_seconds in (0.1, 2.0, 3.0):
+        breaker.before_call()
+        breaker.record_success(latency_seconds)
+
+    assert breaker.state == CIRCUIT_STATE_OPEN
+
+
+def test_http_client_fails_fast_while_circuit_is_open() -> None:
+    client = HttpClient(
+        circuit_breaker_key="test_fail_fast",
+        circuit_breaker_policy=CircuitBreakerPolicy(window_size=2, min_calls=2, open_seconds=60.0),
+    )
+
+    with patch("common.http.http_client.requests.get", side_effect=requests.Timeout("timed out")) as get:
+        for _ in range(2):
+            with pytest.raises(requests.Timeout):
+                client.get("https://example.com/slow")
+        with pytest.raises(HttpClientError, match="Circuit open"):
+            client.get("https://example.com/slow")
+
+    assert get.call_count == 2
+
+
+def test_http_client_does_not_count_client_errors_against_circuit() -> None:
+    client = HttpClient(
+        circuit_breaker_key="test_client_errors",
+        circuit_breaker_policy=CircuitBreakerPolicy(window_size=2, min_calls=2),
+    )
+
+    with patch("common.http.http_client.requests.get", return_value=_response(404)):
+        for _ in range(3):
+            with pytest.raises(HttpClientError) as exc_info:
+                client.get("https://example.com/missing")
+            assert exc_info.value.status_code == 404
+
+
+def test_http_client_hedges_get_after_p95_latency() -> None:
+    client = HttpClient(
+        circuit_breaker_key="test_hedging",
+        circuit_breaker_policy=CircuitBreakerPolicy(window_size=10, min_calls=2, slow_call_seconds=10.0),
+        hedge_requests=True,
+    )
+    calls = 0
+    lock = threading.Lock()
+
+    def fake_get(*_args, **_kwargs):
+        nonlocal calls
+        with lock:
+            calls += 1
+            call_number = calls
+        if call_number == 3:
+            time.sleep(0.5)
+            return _response(payload={"call": "slow"})
+        time.sleep(0.01)
+        return _response(payload={"call": call_number})
+
+    with patch("common.http.http_client.requests.get", side_effect=fake_get):
+        client.get("https://example.com/a")
+        client.get("https://example.com/a")
+        started_at = time.perf_counter()
+        payload = client.get("https://example.com/a")
+        elapsed = time.perf_counter() - started_at
+
+    assert payload == {"call": 4}
+    assert elapsed < 0.4
@@ -4,7 +4,7 @@ from uuid import uuid4
 from unittest.mock import patch
 
 from conversation.context_builder import build_roundtrip_context
-from conversation.models.conversation_models import Conversation, ConversationRoundtrip, ConversationSummary
+from conversation.models.conversation_models import Conversation, ConversationRoundtrip, ConversationSummary, RoundtripProjection
 
 
 class FakeConversationRepository:
@@ -33,13 +33,14 @@ class FakeConversationRepository:
             created_at='2026-08-05T00:00:00Z',
         )
 
-    def list_roundtrips(self, conversation_id, limit=50, after_message_index=None, newest_first=False):
+    def list_roundtrips(self, conversation_id, limit=50, after_message_index=None, newest_first=False, projection=None):
         self.list_roundtrips_calls.append(
             {
                 'conversation_id': conversation_id,
                 'limit': limit,
                 'after_message_index': after_message_index,
                 'newest_first': newest_first,
+                'projection': projection,
             }
         )
         return [
@@ -104,6 +105,7 @@ def test_build_roundtrip_context_requests_latest_unsummarized_roundtrips() -> No
             'limit': 3,
             'after_message_index': 5,
             'newest_first': True,
+            'projection': RoundtripProjection.CONTEXT,
         }
     ]
     assert [roundtrip.message_index for roundtrip in context.recent_roundtrips] == [6, 7, 8]
@@ -114,13 +116,14 @@ def test_build_roundtrip_context_uses_completed_roundtrips_from_repository() ->
     fake_repo = FakeConversationRepository()
     conversation_id = str(uuid4())
 
-    def list_completed_roundtrips(conversation_id, limit=50, after_message_index=None, newest_first=False):
+    def list_completed_roundtrips(conversation_id, limit=50, after_message_index=None, newest_first=False, projection=None):
         fake_repo.list_roundtrips_calls.append(
             {
                 'conversation_id': conversation_id,
                 'limit': limit,
                 'after_message_index': after_message_index,
                 'newest_first': newest_first,
+                'projection': projection,
             }
         )
         return [
@@ -633,9 +633,12 @@ def test_run_request_orchestrator_records_resolved_model_config_snapshot() -> No
         'request_orchestrator.service.run_agent',
         return_value=OrchestratorResult(agent_result=AgentResult(), answer=['done']),
     ), patch(
-        'request_orchestrator.service.embed_text',
-        return_value=[0.1, 0.2, 0.3],
-    ):
+        'request_orchestrator.service.enqueue_roundtrip_embedding',
+        return_value=True,
+    ), patch(
+        'request_orchestrator.service.enqueue_tool_call_summaries',
+        return_value=True,
+    ) as enqueue_tool_call_summaries:
         run_request_orchestrator_for_query(str(conversation_id), 'hello world', user_id='anonymous')
 
     assert fake_repo.pending_calls[0]['model'] == config.main_agent.planner.model
@@ -650,6 +653,7 @@ def test_run_request_orchestrator_records_resolved_model_config_snapshot() -> No
     assert 'agent_logs' not in fake_repo.update_calls[0]['payload']
     assert isinstance(fake_repo.update_calls[0]['payload']['roundtrip_latency_ms'], int)
     assert fake_repo.update_calls[0]['payload']['roundtrip_latency_ms'] >= 0
+    enqueue_tool_call_summaries.assert_called_once()
 
 
 def test_run_request_orchestrator_passes_geometadata_to_user_profile_builder() -> None:
@@ -683,9 +687,12 @@ def test_run_request_orchestrator_passes_geometadata_to_user_profile_builder() -
         'request_orchestrator.service.run_agent',
         return_value=OrchestratorResult(agent_result=AgentResult(), answer=['done']),
     ), patch(
-        'request_orchestrator.service.embed_text',
-        return_value=[0.1, 0.2, 0.3],
-    ):
+        'request_orchestrator.service.enqueue_roundtrip_embedding',
+        return_value=True,
+    ), patch(
+        'request_orchestrator.service.enqueue_tool_call_summaries',
+        return_value=True,
+    ) as enqueue_tool_call_summaries:
         run_request_orchestrator_for_query(str(conversation_id), 'hello world', user_id='anonymous')
 
     assert captured_profile_kwargs['geometadata'] is None
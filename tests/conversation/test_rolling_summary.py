@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import conversation.summary_service as summary_service
+from conversation.models.conversation_models import (
+    ConversationRoundtrip,
+    ConversationSummaryResponse,
+    ConversationSummaryState,
+)
+from conversation.summary_service import rebuild_conversation_summaries, summary_needs_reembedding
+
+
+def _roundtrip(conversation_id, message_index: int) -> ConversationRoundtrip:
+    return ConversationRoundtrip(
+        id=uuid4(),
+        conversation_id=conversation_id,
+        message_index=message_index,
+        user_prompt=f"question {message_index}",
+        generated_response=f"answer {message_index}",
+        roundtrip_summary=None,
+        roundtrip_summary_embedding=None,
+        response_payload={},
+        parsed_query={},
+        created_at="",
+        metadata={},
+    )
+
+
+class FakeConversationRepo:
+    def __init__(self, conversation_id, roundtrip_count: int, *, summary: str = "", watermark: int = -1) -> None:
+        self.conversation_id = conversation_id
+        self.roundtrips = [_roundtrip(conversation_id, index) for index in range(roundtrip_count)]
+        self.state = ConversationSummaryState(conversation_id, summary, watermark, summary or None)
+        self.summary_updates: list[tuple[str, int, bool]] = []
+
+    def get_latest_summary(self, conversation_id):
+        return None
+
+    def get_conversation_summary_state(self, conversation_id):
+        return self.state
+
+    def list_roundtrips(self, conversation_id, limit=50, after_message_index=None, newest_first=False, projection=None):
+        after = -1 if after_message_index is None else after_message_index
+        return [rt for rt in self.roundtrips if rt.message_index > after][:limit]
+
+    def update_conversation_summary(self, conversation_id, summary, *, message_index_cutoff, summary_embedding=None):
+        self.summary_updates.append((summary, message_index_cutoff, summary_embedding is not None))
+        self.state = ConversationSummaryState(
+            conversation_id,
+            summary,
+            message_index_cutoff,
+            summary if summary_embedding is not None else self.state.summary_embedding_source,
+        )
+        return True
+
+
+class FakeToolCallRepository:
+    def get_tool_calls_by_roundtrips(self, roundtrip_ids):
+        return {}
+
+
+def _rebuild(repo: FakeConversationRepo, summarize, *, fold_batch_size: int, max_roundtrips: int = 20) -> list[str]:
+    embedded: list[str] = []
+    with (
+        patch.object(summary_service, "get_conversation_repo", return_value=repo),
+        patch.object(summary_service, "ToolCallRepository", FakeToolCallRepository),
+        patch.object(summary_service, "generate_conversation_summary", side_effect=summarize),
+        patch.object(summary_service, "embed_text", side_effect=lambda text: embedded.append(text) or [0.0]),
+        patch.object(summary_service, "CONVERSATION_SUMMARY_FOLD_MAX_ROUNDTRIPS", max_roundtrips),
+    ):
+        rebuild_conversation_summaries(
+            str(repo.conversation_id),
+            summary_batch_size=20,
+            summary_trigger_size=10,
+            fold_batch_size=fold_batch_size,
+        )
+    return embedded
+
+
+def test_only_roundtrips_past_the_watermark_are_folded_once_a_batch_is_waiting() -> None:
+    conversation_id = uuid4()
+    repo = FakeConversationRepo(conversation_id, 5, summary="covers 0-2", watermark=2)
+    folded: list[tuple[list[int], str | None]] = []
+
+    def summarize(roundtrips, tool_call_map, previous_summary):
+        folded.append(([rt.message_index for rt in roundtrips], previous_summary))
+        return ConversationSummaryResponse(conversation_summary="covers 0-4 with a rather different wording")
+
+    assert _rebuild(repo, summarize, fold_batch_size=3) == []
+    assert folded == []
+
+    embedded = _rebuild(repo, summarize, fold_batch_size=2)
+    assert folded == [([3, 4], "covers 0-2")]
+    assert repo.state.summary_message_index == 4
+    assert embedded == ["covers 0-4 with a rather different wording"]
+
+
+def test_long_backlogs_are_folded_in_bounded_chunks() -> None:
+    conversation_id = uuid4()
+    repo = FakeConversationRepo(conversation_id, 5)
+    chunks: list[list[int]] = []
+
+    def summarize(roundtrips, tool_call_map, previous_summary):
+        chunks.append([rt.message_index for rt in roundtrips])
+        return ConversationSummaryResponse(conversation_summary=f"summary through {roundtrips[-1].message_index}")
+
+    _rebuild(repo, summarize, fold_batch_size=1, max_roundtrips=2)
+    assert chunks == [[0, 1], [2, 3], [4]]
+    assert [cutoff for _, cutoff, _ in repo.summary_updates] == [1, 3, 4]
+
+
+def test_nearly_unchanged_summary_keeps_the_stored_embedding() -> None:
+    conversation_id = uuid4()
+    previous = "The user compared three trail running shoes and preferred the lighter pair for long races."
+    repo = FakeConversationRepo(conversation_id, 3, summary=previous, watermark=0)
+
+    embedded = _rebuild(
+        repo,
+        lambda roundtrips, tool_call_map, previous_summary: ConversationSummaryResponse(conversation_summary=previous + " Ok."),
+        fold_batch_size=1,
+    )
+    assert embedded == []
+    assert repo.summary_updates == [(previous + " Ok.", 2, False)]
+
+
+def test_summary_needs_reembedding() -> None:
+    assert summary_needs_reembedding(None, "new summary")
+    assert not summary_needs_reembedding("same  summary", "same summary\n")
+    assert not summary_needs_reembedding("anything", "")
+    assert summary_needs_reembedding("shoes for running", "a completely different topic about tents")
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+from uuid import uuid4
+
+from conversation.models.conversation_models import RoundtripProjection
+from conversation.repository.conversation_repository import ConversationRepository
+
+
+class FakeCursor:
+    def __init__(self, fetchone_row=None, fetchall_rows=None):
+        self.fetchone_row = fetchone_row
+        self.fetchall_rows = fetchall_rows or []
+        self.executed: list[tuple[str, tuple]] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def execute(self, sql, params):
+        self.executed.append((sql, params))
+
+    def fetchone(self):
+        return self.fetchone_row
+
+    def fetchall(self):
+        return self.fetchall_rows
+
+
+class FakeConnection:
+    def __init__(self, cursors):
+        self._cursors = list(cursors)
+
+    def cursor(self, row_factory=None):
+        return self._cursors.pop(0)
+
+
+def _repo(*cursors: FakeCursor) -> ConversationRepository:
+    with patch('conversation.repository.conversation_repository.register_vector', lambda conn: None):
+        return ConversationRepository(conn=FakeConnection(cursors))
+
+
+def _base_row(message_index: int, conversation_id) -> dict:
+    return {
+        'id': uuid4(),
+        'conversation_id': conversation_id,
+        'message_index': message_index,
+        'user_prompt': f'user {message_index}',
+        'generated_response': f'assistant {message_index}',
+        'roundtrip_summary': f'summary {message_index}',
+        'created_at': '2026-10-01T00:00:00Z',
+        'model': 'gpt-5.6-luna',
+    }
+
+
+def test_context_projection_extracts_tool_summary_and_skips_embedding_and_payload() -> None:
+    conversation_id = uuid4()
+    tool_summary = {'used_tools': ['find_products'], 'produced': [], 'entities': [], 'freshness': ''}
+    cursor = FakeCursor(
+        fetchall_rows=[
+            {**_base_row(4, conversation_id), 'tool_summary': None},
+            {**_base_row(3, conversation_id), 'tool_summary': tool_summary},
+        ]
+    )
+
+    roundtrips = _repo(cursor).list_roundtrips(
+        conversation_id,
+        limit=2,
+        after_message_index=1,
+        newest_first=True,
+        projection=RoundtripProjection.CONTEXT,
+    )
+
+    sql, params = cursor.executed[0]
+    assert "rt.response_payload->'tool_summary' AS tool_summary" in sql
+    assert 'roundtrip_summary_embedding' not in sql
+    assert 'rt.response_payload,' not in sql
+    assert 'roundtrip_feedback' not in sql
+    assert 'rt.message_index > %s' in sql
+    assert params == (conversation_id, 1, 2)
+    assert [roundtrip.message_index for roundtrip in roundtrips] == [3, 4]
+    assert roundtrips[0].response_payload == {'tool_summary': tool_summary}
+    assert roundtrips[1].response_payload == {}
+    assert roundtrips[0].roundtrip_summary_embedding is None
+    assert roundtrips[0].feedback_id is None
+
+
+def test_render_and_full_projections_load_payload_but_not_embedding() -> None:
+    conversation_id = uuid4()
+    feedback_id = uuid4()
+    render_cursor = FakeCursor(
+        fetchall_rows=[{**_base_row(0, conversation_id), 'response_payload': {'result': []}, 'feedback_id': feedback_id}]
+    )
+    full_row = {
+        **_base_row(0, conversation_id),
+        'response_payload': {'result': []},
+        'parsed_query': {'goal': 'compare'},
+        'metadata': {'source': 'chat'},
+        'feedback_id': None,
+    }
+    full_cursor = FakeCursor(fetchone_row=full_row)
+    repo = _repo(render_cursor, full_cursor)
+
+    rendered = repo.list_roundtrips(conversation_id, projection=RoundtripProjection.RENDER)
+    full = repo.get_roundtrip(full_row['id'])
+
+    render_sql, render_params = render_cursor.executed[0]
+    assert 'rt.response_payload' in render_sql and 'rt.parsed_query' not in render_sql
+    assert 'LEFT JOIN roundtrip_feedback' in render_sql
+    assert render_params == (conversation_id, 50)
+    assert rendered[0].feedback_id == feedback_id
+    assert rendered[0].parsed_query == {}
+
+    full_sql, _ = full_cursor.executed[0]
+    assert 'rt.parsed_query' in full_sql and 'roundtrip_summary_embedding' not in full_sql
+    assert full is not None
+    assert full.parsed_query == {'goal': 'compare'}
+    assert full.metadata == {'source': 'chat'}
+    assert full.roundtrip_summary_embedding is None
+
+
+def test_summary_embedding_is_read_only_on_request() -> None:
+    cursor = FakeCursor(fetchone_row={'roundtrip_summary_embedding': [0.1, 0.2]})
+    roundtrip_id = uuid4()
+
+    embedding = _repo(cursor).get_roundtrip_summary_embedding(roundtrip_id)
+
+    assert embedding == [0.1, 0.2]
+    assert cursor.executed == [
+        ('SELECT roundtrip_summary_embedding::vector AS roundtrip_summary_embedding FROM conversation_roundtrip WHERE id = %s', (roundtrip_id,))
+    ]
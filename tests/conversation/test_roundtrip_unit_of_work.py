@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import copy_context
+from threading import Thread
+from unittest.mock import patch
+from uuid import uuid4
+
+from common.logging import create_conversation_event, log_roundtrip_prompt
+from conversation.models.conversation_models import NewConversationEvent
+from conversation.repository.unit_of_work import RoundtripUnitOfWork, get_current_unit_of_work, roundtrip_unit_of_work
+from db.connection import PooledConnection
+from request_orchestrator.shared.runtime_context import bind_runtime_context
+
+
+class RecordingRepo:
+    def __init__(self) -> None:
+        self.event_batches: list[list[NewConversationEvent]] = []
+        self.prompt_batches: list[list] = []
+        self.direct_events: list[dict] = []
+
+    def create_conversation_events(self, events):
+        self.event_batches.append(list(events))
+
+    def create_roundtrip_prompts(self, prompts):
+        self.prompt_batches.append(list(prompts))
+
+    def create_conversation_event(self, **kwargs):
+        self.direct_events.append(kwargs)
+
+
+def _event(index: int) -> NewConversationEvent:
+    return NewConversationEvent(
+        conversation_id=uuid4(),
+        roundtrip_id=None,
+        event_type='tool_call',
+        source='executor',
+        iteration=index,
+    )
+
+
+def test_unit_of_work_writes_full_batches_and_remaining_rows_on_close() -> None:
+    repo = RecordingRepo()
+    unit_of_work = RoundtripUnitOfWork(repo, batch_size=3)
+
+    for index in range(4):
+        unit_of_work.add_conversation_event(_event(index))
+    assert [[event.iteration for event in batch] for batch in repo.event_batches] == [[0, 1, 2]]
+
+    unit_of_work.close()
+    assert [[event.iteration for event in batch] for batch in repo.event_batches] == [[0, 1, 2], [3]]
+
+    unit_of_work.add_conversation_event(_event(4))
+    assert [event.iteration for event in repo.event_batches[-1]] == [4]
+
+
+def test_logged_events_from_executor_threads_share_the_roundtrip_unit_of_work() -> None:
+    repo = RecordingRepo()
+    conversation_id = str(uuid4())
+    roundtrip_id = uuid4()
+
+    with bind_runtime_context(
+        conversation_id=conversation_id,
+        conversation_model_config=None,
+        roundtrip_id=str(roundtrip_id),
+    ), roundtrip_unit_of_work(repo):
+        log_roundtrip_prompt(roundtrip_id=roundtrip_id, agent='planner', prompt_step='plan', prompt='Plan it.')
+        workers = [
+            Thread(
+                target=copy_context().run,
+                args=(create_conversation_event,),
+                kwargs={'event_type': 'tool_call', 'source': 'executor', 'step_id': f'step-{index}'},
+            )
+            for index in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert repo.event_batches == []
+
+    assert get_current_unit_of_work() is None
+    assert repo.direct_events == []
+    assert [[prompt.prompt_step for prompt in batch] for batch in repo.prompt_batches] == [['plan']]
+    events = [event for batch in repo.event_batches for event in batch]
+    assert sorted(event.step_id for event in events if event.event_type == 'tool_call') == [f'step-{index}' for index in range(4)]
+    assert {event.roundtrip_id for event in events} == {roundtrip_id}
+
+
+def test_events_outside_a_unit_of_work_are_written_directly() -> None:
+    repo = RecordingRepo()
+
+    with patch('common.logging.conversation_event_logger.get_conversation_repo', return_value=repo):
+        create_conversation_event(event_type='status', source='ui', conversation_id=str(uuid4()), payload={'ok': True})
+
+    assert repo.event_batches == []
+    assert repo.direct_events[0]['event_type'] == 'status'
+    assert repo.direct_events[0]['payload'] == {'ok': True}
+
+
+class FakePool:
+    def __init__(self) -> None:
+        self.checkouts: list[object] = []
+
+    @contextmanager
+    def connection(self):
+        conn = FakeConnection()
+        self.checkouts.append(conn)
+        yield conn
+
+
+class FakeConnection:
+    @contextmanager
+    def cursor(self, *args, **kwargs):
+        yield self
+
+    @contextmanager
+    def transaction(self):
+        yield self
+
+
+def test_pooled_connection_borrows_per_cursor_and_pins_inside_a_connection_scope() -> None:
+    pool = FakePool()
+    conn = PooledConnection(pool)
+
+    with conn.cursor() as first:
+        pass
+    with conn.cursor() as second:
+        pass
+    assert first is not second
+    assert len(pool.checkouts) == 2
+
+    with conn.connection() as pinned, conn.transaction(), conn.cursor() as cur:
+        assert cur is pinned
+    assert len(pool.checkouts) == 3
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from common.http import HttpClientError
+from integrations.frankfurter import ExchangeRateStore, ExchangeRatesSeries, FrankfurterClient
+from integrations.frankfurter import client as client_module
+
+HISTORY = {
+    "2024-01-02": {"USD": 1.1, "GBP": 0.86},
+    "2024-01-03": {"USD": 1.09, "GBP": 0.865},
+    "2024-01-05": {"USD": 1.1, "GBP": 0.86, "JPY": 158.0},
+}
+
+
+def _history_payload(rates: dict[str, dict[str, float]]) -> dict:
+    dates = sorted(rates)
+    return {"base": "EUR", "start_date": dates[0], "end_date": dates[-1], "rates": rates}
+
+
+def test_rate_store_answers_cross_rates_and_persists(tmp_path) -> None:
+    path = tmp_path / "eur_rates.npz"
+    store = ExchangeRateStore(path=path)
+    assert store.append_series(ExchangeRatesSeries.model_validate(_history_payload(HISTORY))) == 3
+    assert store.append_series(ExchangeRatesSeries.model_validate(_history_payload({"2024-01-03": {"USD": 2.0}}))) == 0
+    store.save()
+
+    reloaded = ExchangeRateStore.load(path)
+    assert reloaded.last_date == date(2024, 1, 5)
+
+    series = reloaded.time_series(date(2024, 1, 3), date(2024, 1, 31), base="USD", symbols=["GBP", "EUR", "JPY"])
+    assert series is not None
+    assert series.start_date == "2024-01-03"
+    assert series.end_date == "2024-01-05"
+    assert series.rates == {
+        "2024-01-03": {"GBP": round(0.865 / 1.09, 6), "EUR": round(1 / 1.09, 6)},
+        "2024-01-05": {"GBP": round(0.86 / 1.1, 6), "EUR": round(1 / 1.1, 6), "JPY": round(158.0 / 1.1, 6)},
+    }
+
+    weekend = reloaded.rates_on(date(2024, 1, 4), base="EUR", symbols=None)
+    assert weekend is not None
+    assert weekend.date == "2024-01-03"
+    assert weekend.rates == {"USD": 1.09, "GBP": 0.865}
+    assert reloaded.rates_on(date(1998, 12, 31), base="EUR", symbols=None) is None
+    assert reloaded.time_series(date(2024, 1, 2), None, base="EUR", symbols=["CHF"]) is None
+
+
+def test_frankfurter_client_backfills_in_the_background_then_fetches_short_gaps_inline(tmp_path) -> None:
+    store = ExchangeRateStore(path=tmp_path / "eur_rates.npz")
+    client = FrankfurterClient(rate_store=store)
+    requested_paths: list[str] = []
+    backfills: list = []
+
+    def fake_get(url, params=None):
+        path = url.rsplit("/", 1)[-1]
+        requested_paths.append(path)
+        if path == "1999-01-04..":
+            return _history_payload(HISTORY)
+        if path == "2024-01-02..2024-01-03":
+            return _history_payload({key: HISTORY[key] for key in ("2024-01-02", "2024-01-03")})
+        return _history_payload({"2024-01-05": HISTORY["2024-01-05"], "2024-01-08": {"USD": 1.095, "GBP": 0.861}})
+
+    with patch.object(client._http, "get", side_effect=fake_get), patch.object(client_module, "Thread") as thread:
+        thread.side_effect = lambda target, args, **kwargs: SimpleNamespace(start=lambda: backfills.append((target, args)))
+        series = client.get_time_series("2024-01-02", "2024-01-03", base="EUR", symbols=["USD"])
+        # The empty store is backfilled off the request path; this request is answered by the API.
+        assert series.as_of is None
+        assert series.rates["2024-01-02"]["USD"] == 1.1
+        assert requested_paths == ["2024-01-02..2024-01-03"]
+
+        target, args = backfills.pop()
+        target(*args)
+        assert requested_paths[-1] == "1999-01-04.."
+
+        store._checked_at = None
+        with patch.object(client_module, "FRANKFURTER_INLINE_REFRESH_MAX_DAYS", 100_000):
+            snapshot = client.get_historical_rates("2024-01-08", base="GBP", symbols=["USD"])
+
+    assert requested_paths[-1] == "2024-01-06.."
+    assert not backfills
+    assert (snapshot.date, snapshot.as_of, snapshot.stale) == ("2024-01-08", "2024-01-08", False)
+    assert snapshot.rates == {"USD": round(1.095 / 0.861, 6)}
+    assert (tmp_path / "eur_rates.npz").exists()
+
+
+def test_frankfurter_client_flags_stored_rates_as_stale_when_the_refresh_fails(tmp_path) -> None:
+    store = ExchangeRateStore(path=tmp_path / "eur_rates.npz")
+    store.append_series(ExchangeRatesSeries.model_validate(_history_payload(HISTORY)))
+    client = FrankfurterClient(rate_store=store)
+
+    with (
+        patch.object(client._http, "get", side_effect=HttpClientError("503")),
+        patch.object(client_module, "FRANKFURTER_INLINE_REFRESH_MAX_DAYS", 100_000),
+    ):
+        snapshot = client.get_historical_rates("2024-01-05", base="EUR", symbols=["USD"])
+
+    assert (snapshot.rates, snapshot.as_of, snapshot.stale) == ({"USD": 1.1}, "2024-01-05", True)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import calendar
+from datetime import date
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from integrations.open_meteo import OpenMeteoClient, WeatherArchiveError
+from integrations.open_meteo.archive import (
+    MONTH_CACHE_BACKEND_POSTGRES,
+    WeatherMonthCache,
+    aggregate_periods,
+    get_weather_month_cache,
+    month_totals,
+)
+from integrations.open_meteo.gazetteer import Gazetteer
+from integrations.open_meteo.geocode_cache import GeocodeCache
+from integrations.open_meteo.models import DailyWeather
+
+
+def _archive_payload(start: date, end: date) -> dict:
+    days = np.arange(np.datetime64(start.isoformat()), np.datetime64(end.isoformat()) + np.timedelta64(1, "D"))
+    months = days.astype("datetime64[M]").astype(int) % 12 + 1
+    return {
+        "daily": {
+            "time": [str(day) for day in days],
+            "temperature_2m_max": [float(month) for month in months],
+            "temperature_2m_min": [float(month) - 10 for month in months],
+            # March days are all rainy, every other month is dry.
+            "precipitation_sum": [2.0 if month == 3 else 0.0 for month in months],
+            "windspeed_10m_max": [None] * len(days),
+        }
+    }
+
+
+@pytest.fixture(autouse=True)
+def _clear_month_cache():
+    get_weather_month_cache().clear()
+    yield
+    get_weather_month_cache().clear()
+
+
+def _client() -> OpenMeteoClient:
+    return OpenMeteoClient(geocode_cache=GeocodeCache(), gazetteer=Gazetteer([]))
+
+
+def test_month_totals_aggregate_into_months_and_years() -> None:
+    daily = DailyWeather(
+        date=["2023-12-30", "2023-12-31", "2024-01-01", "2024-01-02"],
+        temperature_2m_max=[1.0, 3.0, 5.0, None],
+        temperature_2m_min=[-1.0, -3.0, -5.0, -7.0],
+        precipitation_sum=[0.5, 1.5, 4.0, 0.0],
+        windspeed_10m_max=[None, None, None, None],
+    )
+
+    months, totals = month_totals(daily)
+    by_month = aggregate_periods(months, totals, granularity="month")
+    by_year = aggregate_periods(months, totals, granularity="year")
+
+    assert [period.period for period in by_month] == ["2023-12", "2024-01"]
+    assert by_month[1].avg_temp_max_c == 5.0
+    assert by_month[1].total_precip_mm == 4.0
+    assert by_month[0].rainy_days == 1
+    assert by_month[0].avg_wind_max_kmh is None
+    assert [(period.period, period.months_count, period.days_count) for period in by_year] == [("2023", 1, 2), ("2024", 1, 2)]
+
+
+def test_historical_range_fetches_once_and_serves_settled_months_from_cache() -> None:
+    client = _client()
+    archive_calls: list[dict] = []
+
+    def fake_get(url, params=None):
+        if url.endswith("/search"):
+            return {"results": [{"name": "Lisbon", "country": "Portugal", "latitude": 38.72, "longitude": -9.14}]}
+        archive_calls.append(params)
+        return _archive_payload(date.fromisoformat(params["start_date"]), date.fromisoformat(params["end_date"]))
+
+    with patch.object(client._http, "get", side_effect=fake_get) as get:
+        result = client.get_historical_range("Lisbon", 2015, 2024, months=[3], granularity="year")
+        assert [period.period for period in result.periods] == [str(year) for year in range(2015, 2025)]
+        assert all(period.total_precip_mm == 62.0 and period.rainy_days == 31 for period in result.periods)
+        assert result.periods[0].avg_temp_max_c == 3.0
+        assert archive_calls == [
+            {
+                "latitude": 38.72,
+                "longitude": -9.14,
+                "start_date": "2015-03-01",
+                "end_date": "2024-03-31",
+                "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,windspeed_10m_max",
+                "timezone": "auto",
+            }
+        ]
+
+        monthly = client.get_historical_range("Lisbon", 2016, 2024, start_month=2, end_month=3)
+        assert len(archive_calls) == 1
+        assert len(monthly.periods) == 11 + 12 * 7 + 3
+        assert get.call_count == 2
+
+        client.get_historical_month("Lisbon", 2024, 3)
+        assert len(archive_calls) == 2
+
+
+def test_historical_range_does_not_cache_months_the_archive_may_still_backfill() -> None:
+    client = _client()
+    today = date.today()
+    archive_calls: list[dict] = []
+
+    def fake_get(url, params=None):
+        if url.endswith("/search"):
+            return {"results": [{"name": "Lisbon", "country": "Portugal", "latitude": 38.72, "longitude": -9.14}]}
+        archive_calls.append(params)
+        return _archive_payload(date.fromisoformat(params["start_date"]), date.fromisoformat(params["end_date"]))
+
+    with patch.object(client._http, "get", side_effect=fake_get):
+        result = client.get_historical_range("Lisbon", today.year, today.year + 1, start_month=today.month)
+        client.get_historical_range("Lisbon", today.year, today.year, start_month=today.month, end_month=today.month)
+
+    assert [period.period for period in result.periods] == [f"{today.year}-{today.month:02d}"]
+    assert result.end_date == today.isoformat()
+    assert len(archive_calls) == 2
+
+
+def test_historical_range_validates_arguments() -> None:
+    client = _client()
+    with pytest.raises(WeatherArchiveError):
+        client.get_historical_range("Lisbon", 2024, 2020)
+    with pytest.raises(WeatherArchiveError):
+        client.get_historical_range("Lisbon", 1930, 2020)
+    with pytest.raises(WeatherArchiveError):
+        client.get_historical_range("Lisbon", 2020, 2021, months=[13])
+    with pytest.raises(WeatherArchiveError):
+        client.get_historical_range("Lisbon", 1950, 2020)
+    with pytest.raises(WeatherArchiveError):
+        client.get_historical_range("Lisbon", 2020, 2020, start_month=1, end_month=2, months=[calendar.MARCH])
+
+
+def test_month_cache_keeps_settled_months_in_the_shared_tier() -> None:
+    class FakeMonthTotalsRepository:
+        def __init__(self) -> None:
+            self.rows: dict[tuple[float, float, int, int], list[float]] = {}
+            self.reads: list[list[tuple[int, int]]] = []
+
+        def get_many(self, latitude, longitude, months):
+            self.reads.append(list(months))
+            return {key: self.rows[(latitude, longitude, *key)] for key in months if (latitude, longitude, *key) in self.rows}
+
+        def put_many(self, latitude, longitude, rows):
+            for key, totals in rows.items():
+                self.rows[(latitude, longitude, *key)] = totals
+
+    repository = FakeMonthTotalsRepository()
+    row = np.arange(10, dtype=np.float64)
+    WeatherMonthCache(MONTH_CACHE_BACKEND_POSTGRES, repository=repository).put_many(43.70011, -79.4163, {(2023, 3): row})
+
+    # A fresh cache (another worker, or after a restart) reads the month back in one query.
+    cache = WeatherMonthCache(MONTH_CACHE_BACKEND_POSTGRES, repository=repository)
+    found = cache.get_many(43.70011, -79.4163, [(2023, 3), (2023, 4)])
+
+    assert list(found) == [(2023, 3)]
+    assert found[(2023, 3)].tolist() == row.tolist()
+    assert repository.reads == [[(2023, 3), (2023, 4)]]
+    cache.get_many(43.70011, -79.4163, [(2023, 3)])
+    assert len(repository.reads) == 1
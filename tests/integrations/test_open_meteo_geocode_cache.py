@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from integrations.open_meteo import OpenMeteoClient, WeatherNotFoundError
+from integrations.open_meteo.gazetteer import Gazetteer, GazetteerPlace, read_gazetteer, write_gazetteer
+from integrations.open_meteo.geocode_cache import GeocodeCache, normalize_place_name
+
+PLACES = [
+    GazetteerPlace("São Paulo", "Brazil", -23.55, -46.63, "America/Sao_Paulo", 12_000_000),
+    GazetteerPlace("Saint Petersburg", "Russia", 59.94, 30.31, "Europe/Moscow", 5_000_000),
+    GazetteerPlace("Paris", "France", 48.85, 2.35, "Europe/Paris", 2_100_000),
+    GazetteerPlace("Paris", "United States", 33.66, -95.56, "America/Chicago", 25_000),
+    GazetteerPlace("Lisbon", "Portugal", 38.72, -9.14, "Europe/Lisbon", 500_000),
+    GazetteerPlace("Lismore", "Australia", -28.81, 153.28, "Australia/Sydney", 28_000),
+    GazetteerPlace("Zürich", "Switzerland", 47.37, 8.55, "Europe/Zurich", 400_000),
+]
+
+
+def test_normalize_place_name_strips_accents_punctuation_and_applies_aliases() -> None:
+    assert normalize_place_name("  Zürich ") == "zurich"
+    assert normalize_place_name("St. Petersburg") == "saint petersburg"
+    assert normalize_place_name("NYC") == "new york"
+    assert normalize_place_name("NYC", apply_aliases=False) == "nyc"
+
+
+def test_gazetteer_exact_prefix_and_fuzzy_lookups(tmp_path) -> None:
+    path = tmp_path / "cities.tsv.gz"
+    rows = [
+        {
+            "name": place.name,
+            "country": place.country,
+            "latitude": place.latitude,
+            "longitude": place.longitude,
+            "timezone": place.timezone,
+            "population": place.population,
+        }
+        for place in PLACES
+    ]
+    assert write_gazetteer(rows, path) == len(PLACES)
+    gazetteer = read_gazetteer(path)
+
+    assert [place.country for place in gazetteer.lookup("paris")] == ["France", "United States"]
+    assert gazetteer.lookup("sao paulo")[0].name == "São Paulo"
+    assert [place.name for place in gazetteer.complete("lis")] == []
+    assert [place.name for place in gazetteer.complete("Lism")] == ["Lismore"]
+    assert gazetteer.fuzzy("Lisbonn")[0].name == "Lisbon"
+    assert gazetteer.fuzzy("Zurch")[0].name == "Zürich"
+    assert [place.name for place in gazetteer.fuzzy("Sao Pablo")] == ["São Paulo"]
+    assert gazetteer.fuzzy("Reykjavik") == []
+
+
+def test_geocode_city_uses_cache_gazetteer_and_negative_caching() -> None:
+    client = OpenMeteoClient(geocode_cache=GeocodeCache(), gazetteer=Gazetteer(PLACES))
+    upstream_queries: list[str] = []
+
+    def fake_get(url, params=None):
+        upstream_queries.append(params["name"])
+        if params["name"] == "new york":
+            return {"results": [{"name": "New York", "country": "United States", "latitude": 40.71, "longitude": -74.0}]}
+        return {"results": []}
+
+    with patch.object(client._http, "get", side_effect=fake_get):
+        assert client.geocode_city("Paris").country == "France"
+        assert client.geocode_city("NYC").name == "New York"
+        assert client.geocode_city("new york city").name == "New York"
+        assert client.geocode_city("Lisbonn").name == "Lisbon"
+        for _ in range(2):
+            with pytest.raises(WeatherNotFoundError):
+                client.geocode_city("Atlantis")
+
+    assert upstream_queries == ["new york", "Lisbonn", "Atlantis"]
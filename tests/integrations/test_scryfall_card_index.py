@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from integrations.scryfall import ScryfallClient
+from integrations.scryfall.card_index import ScryfallCardIndex, read_card_snapshot, write_card_snapshot
+from integrations.scryfall.card_query import UnsupportedCardQueryError, parse_card_query
+
+CARDS = [
+    {
+        "id": "sol-ring",
+        "name": "Sol Ring",
+        "lang": "en",
+        "mana_cost": "{1}",
+        "cmc": 1,
+        "type_line": "Artifact",
+        "oracle_text": "{T}: Add {C}{C}.",
+        "colors": [],
+        "color_identity": [],
+        "legalities": {"commander": "legal", "vintage": "restricted", "legacy": "banned"},
+        "prices": {"usd": "1.50"},
+        "edhrec_rank": 1,
+    },
+    {
+        "id": "llanowar-elves",
+        "name": "Llanowar Elves",
+        "lang": "en",
+        "mana_cost": "{G}",
+        "cmc": 1,
+        "type_line": "Creature — Elf Druid",
+        "oracle_text": "{T}: Add {G}.",
+        "colors": ["G"],
+        "color_identity": ["G"],
+        "legalities": {"commander": "legal", "legacy": "legal"},
+    },
+    {
+        "id": "growth-spiral",
+        "name": "Growth Spiral",
+        "lang": "en",
+        "mana_cost": "{G}{U}",
+        "cmc": 2,
+        "type_line": "Instant",
+        "oracle_text": "Draw a card. You may put a land card from your hand onto the battlefield.",
+        "colors": ["G", "U"],
+        "color_identity": ["G", "U"],
+        "legalities": {"commander": "legal"},
+    },
+    {
+        "id": "delver",
+        "name": "Delver of Secrets // Insectile Aberration",
+        "lang": "en",
+        "cmc": 1,
+        "color_identity": ["U"],
+        "card_faces": [
+            {"name": "Delver of Secrets", "mana_cost": "{U}", "type_line": "Creature — Human Wizard", "oracle_text": "Look at the top card of your library.", "colors": ["U"]},
+            {"name": "Insectile Aberration", "type_line": "Creature — Human Insect", "oracle_text": "Flying", "colors": ["U"]},
+        ],
+        "legalities": {"commander": "legal"},
+    },
+    {
+        "id": "lightning-bolt",
+        "name": "Lightning Bolt",
+        "lang": "en",
+        "mana_cost": "{R}",
+        "cmc": 1,
+        "type_line": "Instant",
+        "oracle_text": "Lightning Bolt deals 3 damage to any target.",
+        "colors": ["R"],
+        "color_identity": ["R"],
+        "legalities": {"commander": "legal"},
+    },
+]
+
+
+def _names(index: ScryfallCardIndex, query: str) -> list[str]:
+    return [index.names[position] for position in index.sort_positions(parse_card_query(query).evaluate(index))]
+
+
+def test_card_query_evaluates_supported_search_syntax_locally() -> None:
+    index = ScryfallCardIndex.from_records(CARDS)
+
+    assert _names(index, "id<=g") == ["Llanowar Elves", "Sol Ring"]
+    assert _names(index, "id:gu t:instant") == ["Growth Spiral"]
+    assert _names(index, "c:u") == ["Delver of Secrets // Insectile Aberration", "Growth Spiral"]
+    assert _names(index, "c:c") == ["Sol Ring"]
+    assert _names(index, 't:instant (o:"draw a card" or o:damage)') == ["Growth Spiral", "Lightning Bolt"]
+    assert _names(index, 'o:"~ deals"') == ["Lightning Bolt"]
+    assert _names(index, "cmc>=2") == ["Growth Spiral"]
+    assert _names(index, "t:creature -t:elf") == ["Delver of Secrets // Insectile Aberration"]
+    assert _names(index, "f:vintage") == ["Sol Ring"]
+    assert _names(index, "banned:legacy") == ["Sol Ring"]
+    assert _names(index, '!"lightning bolt"') == ["Lightning Bolt"]
+    assert _names(index, "elves") == ["Llanowar Elves"]
+
+
+def test_card_query_rejects_syntax_it_cannot_answer() -> None:
+    for query in ("set:lea", "r:rare", "id<=naya", "(t:instant"):
+        with pytest.raises(UnsupportedCardQueryError):
+            parse_card_query(query)
+
+
+def test_card_index_resolves_fuzzy_and_face_names(tmp_path) -> None:
+    path = tmp_path / "oracle_cards.json.gz"
+    assert write_card_snapshot(CARDS, updated_at="2026-01-01T00:00:00+00:00", path=path) == len(CARDS)
+    index = read_card_snapshot(path)
+
+    assert index.updated_at == "2026-01-01T00:00:00+00:00"
+    assert "edhrec_rank" not in index.records[0]
+    assert index.names[index.find_fuzzy("llanowar elf")] == "Llanowar Elves"
+    assert index.names[index.find_fuzzy("lightnin bolt")] == "Lightning Bolt"
+    assert index.names[index.find_exact("Insectile Aberration")] == "Delver of Secrets // Insectile Aberration"
+    assert index.find_fuzzy("l") is None
+
+
+def test_scryfall_client_answers_from_local_index_and_falls_back_upstream() -> None:
+    client = ScryfallClient(card_index=ScryfallCardIndex.from_records(CARDS))
+    upstream_calls: list[tuple[str, object]] = []
+
+    def fake_get(url, params=None):
+        upstream_calls.append((url, params))
+        return {"object": "list", "total_cards": 1, "data": [{"id": "black-lotus", "name": "Black Lotus"}]}
+
+    def fake_post(url, payload):
+        upstream_calls.append((url, payload))
+        return {"data": [{"id": "black-lotus", "name": "Black Lotus"}]}
+
+    with patch.object(client._http, "get", side_effect=fake_get), patch.object(client._http, "post", side_effect=fake_post):
+        local_search = client.search_cards("id<=gu t:instant")
+        assert [card.name for card in local_search.data] == ["Growth Spiral"]
+        assert client.get_card_by_name("sol rin").id == "sol-ring"
+        cards = client.get_cards_by_names(["Black Lotus", "Lightning Bolt"])
+        assert [card.name for card in cards] == ["Black Lotus", "Lightning Bolt"]
+        assert upstream_calls == [
+            ("https://api.scryfall.com/cards/collection", {"identifiers": [{"name": "Black Lotus"}]}),
+        ]
+
+        client.search_cards("set:lea")
+        client.search_cards('!"Sol Ring"', unique="prints", order="released")
+        assert len(upstream_calls) == 3
+
+        # Nothing in the snapshot matches, but a newer card might: the search goes upstream.
+        assert [card.name for card in client.search_cards("t:planeswalker").data] == ["Black Lotus"]
+        assert upstream_calls[-1][1]["q"] == "t:planeswalker"
+
+
+def test_card_index_leaves_out_tokens_emblems_and_art_cards(tmp_path) -> None:
+    extras = [
+        {"id": "dragon-token", "name": "Dragon", "lang": "en", "layout": "token", "type_line": "Token Creature — Dragon"},
+        {"id": "emblem", "name": "Chandra Emblem", "lang": "en", "layout": "emblem", "type_line": "Emblem — Chandra"},
+        {"id": "bolt-art", "name": "Lightning Bolt // Lightning Bolt", "lang": "en", "layout": "art_series", "type_line": "Card // Card"},
+    ]
+    records = [CARDS[0], {**CARDS[1], "layout": "normal"}, *CARDS[2:], *extras]
+    path = tmp_path / "oracle_cards.json.gz"
+
+    assert write_card_snapshot(records, updated_at="2026-01-01T00:00:00+00:00", path=path) == len(CARDS)
+    index = ScryfallCardIndex.from_records(records)
+
+    assert index.find_exact("Dragon") is None
+    assert _names(index, "t:dragon or t:emblem") == []
+    assert index.records[index.find_exact("Llanowar Elves")]["layout"] == "normal"
+    assert len(read_card_snapshot(path)) == len(index)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+from unittest.mock import patch
+
+from integrations.wikipedia import client as wikipedia_client
+from integrations.wikipedia.client import WikipediaClient, WikipediaNotFoundError
+
+_REVISIONS = {"Python (programming language)": 100, "Guido van Rossum": 200, "Monty Python": 300}
+
+
+def _query_response(params: dict[str, Any]) -> dict[str, Any]:
+    titles = params["titles"].split("|")
+    normalized = [{"from": title, "to": title[:1].upper() + title[1:]} for title in titles if title[:1].islower()]
+    redirects = [{"from": "Python language", "to": "Python (programming language)"}] if "Python language" in titles else []
+    resolved = [title[:1].upper() + title[1:] for title in titles]
+    resolved = ["Python (programming language)" if title == "Python language" else title for title in resolved]
+    pages: dict[str, Any] = {}
+    for index, title in enumerate(resolved):
+        if title not in _REVISIONS:
+            pages[str(-index - 1)] = {"ns": 0, "title": title, "missing": ""}
+            continue
+        page: dict[str, Any] = {"pageid": _REVISIONS[title] // 100, "ns": 0, "title": title, "lastrevid": _REVISIONS[title]}
+        if "extracts" in params["prop"]:
+            page["extract"] = f"{title} summary."
+            page["canonicalurl"] = f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"
+            page["thumbnail"] = {"source": f"https://upload.wikimedia.org/{page['pageid']}.png"}
+        pages[str(page["pageid"])] = page
+    return {"query": {"normalized": normalized, "redirects": redirects, "pages": pages}}
+
+
+def test_get_page_summaries_batches_titles_and_follows_redirects() -> None:
+    client = WikipediaClient()
+    with patch.object(client._http, "get", side_effect=lambda url, params: _query_response(params)) as get:
+        summaries = client.get_page_summaries(["Python language", "guido van Rossum", "Nonexistent page"])
+
+    assert get.call_count == 1
+    params = get.call_args.args[1]
+    assert params["prop"] == "extracts|pageimages|info"
+    assert params["titles"] == "Python language|guido van Rossum|Nonexistent page"
+    assert set(summaries) == {"Python language", "guido van Rossum"}
+    assert summaries["Python language"].title == "Python (programming language)"
+    assert summaries["Python language"].revision_id == 100
+    assert summaries["guido van Rossum"].summary == "Guido van Rossum summary."
+    assert summaries["guido van Rossum"].thumbnail_url == "https://upload.wikimedia.org/2.png"
+
+
+def test_get_page_summaries_splits_extract_requests_at_the_extracts_limit() -> None:
+    client = WikipediaClient()
+    titles = [f"Page {index}" for index in range(45)]
+    with patch.object(client._http, "get", side_effect=lambda url, params: _query_response(params)) as get:
+        client.get_page_summaries(titles)
+
+    assert [len(call.args[1]["titles"].split("|")) for call in get.call_args_list] == [20, 20, 5]
+
+
+def test_cached_extracts_are_revalidated_by_revision() -> None:
+    client = WikipediaClient()
+    with patch.object(client._http, "get", side_effect=lambda url, params: _query_response(params)) as get:
+        client.get_page_summaries(["Monty Python", "Guido van Rossum"])
+        client.get_page_summaries(["Monty Python", "Guido van Rossum"])
+        assert get.call_count == 1
+
+        with patch.object(wikipedia_client, "WIKIPEDIA_REVISION_CHECK_SECONDS", 0.0), patch.dict(_REVISIONS, {"Monty Python": 301}):
+            summaries = client.get_page_summaries(["Monty Python", "Guido van Rossum"])
+
+    revalidate, refetch = (call.args[1] for call in get.call_args_list[1:])
+    assert revalidate["prop"] == "info"
+    assert revalidate["titles"] == "Monty Python|Guido van Rossum"
+    assert refetch["prop"] == "extracts|pageimages|info"
+    assert refetch["titles"] == "Monty Python"
+    assert summaries["Monty Python"].revision_id == 301
+    assert summaries["Guido van Rossum"].revision_id == 200
+
+
+def test_concurrent_page_summary_lookups_share_one_request() -> None:
+    client = WikipediaClient()
+    client._summary_batcher._window_seconds = 0.2
+    results: dict[str, str] = {}
+
+    def lookup(title: str) -> None:
+        try:
+            results[title] = client.get_page_summary(title).title
+        except WikipediaNotFoundError:
+            results[title] = "missing"
+
+    with patch.object(client._http, "get", side_effect=lambda url, params: _query_response(params)) as get:
+        threads = [threading.Thread(target=lookup, args=(title,)) for title in ("Monty Python", "Guido van Rossum", "Nope")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert get.call_count == 1
+    assert results == {"Monty Python": "Monty Python", "Guido van Rossum": "Guido van Rossum", "Nope": "missing"}
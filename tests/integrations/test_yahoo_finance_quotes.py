@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import threading
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from integrations.yahoo_finance import client as yahoo_client
+from integrations.yahoo_finance.client import QuoteBatcher, YahooFinanceClient
+from integrations.yahoo_finance.market_hours import STOCK_QUOTE_TTL_OPEN_SECONDS, quote_ttl_seconds
+from integrations.yahoo_finance.models import StockQuote
+from integrations.yahoo_finance.ohlc_store import OhlcStore
+
+
+def _download_frame(tickers: list[str], days: list[date]) -> pd.DataFrame:
+    index = pd.DatetimeIndex([pd.Timestamp(day) for day in days])
+    columns = pd.MultiIndex.from_product([tickers, ["Open", "High", "Low", "Close", "Adj Close", "Volume"]])
+    data = np.array(
+        [
+            [value for ticker_index in range(len(tickers)) for value in (10.0 * (ticker_index + 1) + row,) * 4 + (0.0, 1000.0)]
+            for row in range(len(days))
+        ]
+    )
+    return pd.DataFrame(data, index=index, columns=columns)
+
+
+def test_quote_batcher_coalesces_concurrent_lookups() -> None:
+    fetched: list[list[str]] = []
+
+    def fetch(tickers: list[str]) -> dict[str, StockQuote]:
+        fetched.append(sorted(tickers))
+        return {ticker: StockQuote(ticker=ticker, current_price=1.0) for ticker in tickers}
+
+    batcher = QuoteBatcher(fetch, window_seconds=0.2)
+    results: dict[str, StockQuote | None] = {}
+    threads = [
+        threading.Thread(target=lambda ticker=ticker: results.__setitem__(ticker, batcher.get(ticker)))
+        for ticker in ("AAPL", "MSFT", "NVDA", "AAPL")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert fetched == [["AAPL", "MSFT", "NVDA"]]
+    assert {ticker: quote.ticker for ticker, quote in results.items()} == {"AAPL": "AAPL", "MSFT": "MSFT", "NVDA": "NVDA"}
+
+
+def test_quote_ttl_follows_us_market_hours() -> None:
+    session = datetime(2026, 3, 4, 15, 0, tzinfo=timezone.utc)  # Wednesday 10:00 in New York
+    friday_evening = datetime(2026, 3, 6, 23, 0, tzinfo=timezone.utc)
+
+    assert quote_ttl_seconds("AAPL", session) == STOCK_QUOTE_TTL_OPEN_SECONDS
+    assert quote_ttl_seconds("AAPL", friday_evening) > STOCK_QUOTE_TTL_OPEN_SECONDS
+    assert quote_ttl_seconds("GC=F", friday_evening) == STOCK_QUOTE_TTL_OPEN_SECONDS
+
+
+def test_get_quotes_downloads_once_and_serves_repeats_from_cache() -> None:
+    client = YahooFinanceClient(ohlc_store=OhlcStore())
+    today = datetime.now(timezone.utc).date()
+    downloads: list[list[str]] = []
+
+    def fake_download(tickers, **kwargs):
+        downloads.append(list(tickers))
+        return _download_frame(list(tickers), [today - timedelta(days=1), today])
+
+    with patch.object(yahoo_client.yf, "download", side_effect=fake_download, create=True), patch.object(
+        client, "_shares_outstanding", return_value={"AAPL": 100.0, "MSFT": None}
+    ):
+        quotes = client.get_quotes(["aapl", "MSFT", "AAPL"])
+        assert list(quotes) == ["AAPL", "MSFT"]
+        assert quotes["AAPL"].current_price == 11.0
+        assert quotes["AAPL"].previous_close == 10.0
+        assert quotes["AAPL"].market_cap == 1100.0
+        assert quotes["MSFT"].market_cap is None
+        assert client.get_quote("msft").current_price == 21.0
+
+    assert downloads == [["AAPL", "MSFT"]]
+
+
+def test_close_history_only_downloads_ranges_missing_from_the_store(tmp_path) -> None:
+    store = OhlcStore(tmp_path)
+    client = YahooFinanceClient(ohlc_store=store)
+    yesterday = datetime.now(timezone.utc).date() - timedelta(days=1)
+    requested_ranges: list[tuple[str, str]] = []
+
+    def fake_download(tickers, start, end, **kwargs):
+        requested_ranges.append((start, end))
+        first, last = date.fromisoformat(start), date.fromisoformat(end) - timedelta(days=1)
+        days = [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+        return _download_frame(list(tickers), days)
+
+    with patch.object(yahoo_client.yf, "download", side_effect=fake_download, create=True):
+        history = client.get_close_history(["AAPL"], yesterday - timedelta(days=9))
+        assert len(history["AAPL"].closes) == 10
+        client.get_close_history(["AAPL"], yesterday - timedelta(days=4))
+        client.get_close_history(["AAPL"], yesterday - timedelta(days=14))
+
+    assert requested_ranges == [
+        ((yesterday - timedelta(days=9)).isoformat(), (yesterday + timedelta(days=1)).isoformat()),
+        ((yesterday - timedelta(days=14)).isoformat(), (yesterday - timedelta(days=9)).isoformat()),
+    ]
+    reloaded = OhlcStore(tmp_path).get("AAPL")
+    assert reloaded is not None and len(reloaded.dates) == 15
+    assert reloaded.covered_from == yesterday - timedelta(days=14)
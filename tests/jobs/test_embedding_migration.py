@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from unittest.mock import patch
+
+import db.embedding_migration as embedding_migration
+import jobs.handlers as handlers
+from db.embedding_migration import EmbeddingMigrationState, resolve_embedding_slot
+from db.vector import PRODUCT_EMBEDDING, ROUNDTRIP_SUMMARY_EMBEDDING
+from jobs.embedding_migration import EmbeddingMigrationRunner
+
+OLD = "text-embedding-3-small@1536"
+NEW = "text-embedding-3-large@512"
+
+
+def _state(**overrides) -> EmbeddingMigrationState:
+    values = dict(
+        table_name="conversation_roundtrip",
+        column_name="roundtrip_summary_embedding",
+        active_slot="roundtrip_summary_embedding",
+        active_model=OLD,
+    )
+    values.update(overrides)
+    return EmbeddingMigrationState(**values)
+
+
+class FakeMigrationRepository:
+    def __init__(
+        self, state: EmbeddingMigrationState, rows: list[tuple[str, str]], done: set[str] | None = None
+    ) -> None:
+        self.state = state
+        self.rows = rows
+        self.done = set(done or ())
+        self.stored: list[tuple[str, list[float]]] = []
+        self.sweeps = 0
+
+    def get_state(self, column):
+        return self.state
+
+    def pending_rows(self, column, state, *, limit):
+        after = state.checkpoint or ""
+        return [row for row in self.rows if row[0] > after and row[0] not in self.done][:limit]
+
+    def store_embeddings(self, column, state, rows, embeddings):
+        self.stored.extend((row_id, list(embedding)) for (row_id, _), embedding in zip(rows, embeddings))
+        self.done.update(row_id for row_id, _ in rows)
+        self.state = replace(self.state, checkpoint=rows[-1][0], rows_done=self.state.rows_done + len(rows))
+        return len(rows)
+
+    def restart_sweep(self, column):
+        self.sweeps += 1
+        self.state = replace(self.state, checkpoint=None)
+
+
+class RecordingRateLimiter:
+    def __init__(self) -> None:
+        self.acquired: list[str] = []
+
+    def acquire(self, key, policy):
+        self.acquired.append(key)
+        return 0.0
+
+
+def test_processes_resolve_the_slot_holding_their_model() -> None:
+    migrating = _state(target_model=NEW)
+    switched = _state(active_slot="roundtrip_summary_embedding_alt", active_model=NEW, previous_model=OLD)
+
+    assert migrating.slot_for(ROUNDTRIP_SUMMARY_EMBEDDING, OLD) == "roundtrip_summary_embedding"
+    assert migrating.slot_for(ROUNDTRIP_SUMMARY_EMBEDDING, NEW) == "roundtrip_summary_embedding_alt"
+    assert switched.slot_for(ROUNDTRIP_SUMMARY_EMBEDDING, NEW) == "roundtrip_summary_embedding_alt"
+    assert switched.slot_for(ROUNDTRIP_SUMMARY_EMBEDDING, OLD) == "roundtrip_summary_embedding"
+    assert switched.slot_for(ROUNDTRIP_SUMMARY_EMBEDDING, "unknown@8") == "roundtrip_summary_embedding_alt"
+    assert migrating.fill_slot(ROUNDTRIP_SUMMARY_EMBEDDING) == "roundtrip_summary_embedding_alt"
+    assert switched.fill_slot(ROUNDTRIP_SUMMARY_EMBEDDING) == "roundtrip_summary_embedding_alt"
+
+
+def test_writes_to_the_active_slot_clear_the_slot_being_refilled() -> None:
+    states = {ROUNDTRIP_SUMMARY_EMBEDDING.key: _state(target_model=NEW)}
+    with patch.object(embedding_migration, "_embedding_migration_states", return_value=states):
+        live = resolve_embedding_slot(ROUNDTRIP_SUMMARY_EMBEDDING, OLD)
+        upcoming = resolve_embedding_slot(ROUNDTRIP_SUMMARY_EMBEDDING, NEW)
+        untouched = resolve_embedding_slot(PRODUCT_EMBEDDING, OLD)
+
+    assert live.assignment_sql("(%s)::vector(3)") == (
+        "roundtrip_summary_embedding = (%s)::vector(3), roundtrip_summary_embedding_model = %s, "
+        "roundtrip_summary_embedding_alt = NULL, roundtrip_summary_embedding_alt_model = NULL"
+    )
+    assert upcoming.assignment_sql("(%s)::vector(3)") == (
+        "roundtrip_summary_embedding_alt = (%s)::vector(3), roundtrip_summary_embedding_alt_model = %s"
+    )
+    assert untouched.name == "embedding"
+    assert untouched.model_for(None) is None
+    assert untouched.model_for([0.1]) == OLD
+
+
+def test_conditional_assignment_keeps_the_stored_vector_otherwise() -> None:
+    with patch.object(embedding_migration, "_embedding_migration_states", return_value={}):
+        slot = resolve_embedding_slot(ROUNDTRIP_SUMMARY_EMBEDDING, OLD)
+
+    sql = slot.assignment_sql("%(embedding)s", "%(model)s", when="%(reembed)s")
+
+    assert sql.startswith(
+        "roundtrip_summary_embedding = CASE WHEN %(reembed)s THEN %(embedding)s ELSE roundtrip_summary_embedding END"
+    )
+    assert (
+        "roundtrip_summary_embedding_alt = CASE WHEN %(reembed)s THEN NULL ELSE roundtrip_summary_embedding_alt END"
+        in sql
+    )
+
+
+def test_runner_embeds_in_rate_limited_batches_with_the_target_model_and_sweeps_once_more() -> None:
+    repository = FakeMigrationRepository(
+        _state(target_model=NEW, checkpoint="b"),
+        [("a", "first"), ("b", "second"), ("c", "third"), ("d", "fourth")],
+        # "a" was edited after the first pass embedded it, which cleared its new-model vector.
+        done={"b"},
+    )
+    calls: list[tuple[list[str], str, int]] = []
+
+    def embed(texts, *, model, dimensions):
+        calls.append((list(texts), model, dimensions))
+        return [[float(len(text))] for text in texts]
+
+    limiter = RecordingRateLimiter()
+    runner = EmbeddingMigrationRunner(
+        ROUNDTRIP_SUMMARY_EMBEDDING,
+        repository=repository,
+        embed=embed,
+        rate_limiter=limiter,
+        batch_size=2,
+    )
+
+    assert runner.run() is True
+
+    # Resumes after the stored checkpoint, then sweeps from the start for rows it has not covered.
+    assert [texts for texts, _, _ in calls] == [["third", "fourth"], ["first"]]
+    assert {(model, dimensions) for _, model, dimensions in calls} == {("text-embedding-3-large", 512)}
+    assert [row_id for row_id, _ in repository.stored] == ["c", "d", "a"]
+    # The sweep that re-embedded "a" ends with a checkpoint, so one more clean sweep confirms it is done.
+    assert repository.sweeps == 2
+    assert len(limiter.acquired) == 2
+
+
+def test_runner_stops_after_max_batches_and_reports_unfinished() -> None:
+    repository = FakeMigrationRepository(_state(target_model=NEW), [("a", "x"), ("b", "y"), ("c", "z")])
+    runner = EmbeddingMigrationRunner(
+        ROUNDTRIP_SUMMARY_EMBEDDING,
+        repository=repository,
+        embed=lambda texts, **_: [[0.0] for _ in texts],
+        rate_limiter=RecordingRateLimiter(),
+        batch_size=1,
+    )
+
+    assert runner.run(max_batches=2) is False
+    assert repository.state.checkpoint == "b"
+
+
+def test_job_requeues_itself_until_the_column_is_done() -> None:
+    enqueued: list[tuple[str, bool]] = []
+
+    class UnfinishedRunner:
+        def __init__(self, column):
+            pass
+
+        def run(self, max_batches=None):
+            return False
+
+    with (
+        patch.object(handlers, "EmbeddingMigrationRunner", UnfinishedRunner),
+        patch.object(
+            handlers,
+            "enqueue_embedding_migration",
+            side_effect=lambda key, *, switch_slots: enqueued.append((key, switch_slots)),
+        ),
+    ):
+        handlers.run_embedding_migration_job({"column": "products.embedding", "switch_slots": True})
+
+    assert enqueued == [("products.embedding", True)]
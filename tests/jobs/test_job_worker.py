@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import psycopg
+
+from jobs.constants import JOB_RETRY_BASE_SECONDS, JOB_TYPE_CONVERSATION_SUMMARY, JOB_TYPE_CONVERSATION_TITLE
+from jobs.enqueue import enqueue_conversation_summary, enqueue_conversation_title
+from jobs.models import BackgroundJob
+from jobs.repository.job_repository import JobRepository
+from jobs.worker import JobWorker, retry_delay_seconds
+
+
+class FakeJobRepository:
+    def __init__(self, jobs: list[BackgroundJob]) -> None:
+        self.jobs = list(jobs)
+        self.claims: list[tuple[str, list[str]]] = []
+        self.completed: list[int] = []
+        self.failed: list[tuple[int, str, float]] = []
+        self.enqueued: list[tuple[str, str, dict]] = []
+
+    def claim(self, worker_id, job_types):
+        self.claims.append((worker_id, list(job_types)))
+        return self.jobs.pop(0) if self.jobs else None
+
+    def complete(self, job_id):
+        self.completed.append(job_id)
+
+    def fail(self, job_id, error, *, retry_in_seconds):
+        self.failed.append((job_id, error, retry_in_seconds))
+
+    def enqueue(self, job_type, job_key, payload=None, **kwargs):
+        self.enqueued.append((job_type, job_key, payload))
+        return len(self.enqueued)
+
+
+def _job(job_id: int, job_type: str, *, attempts: int = 1) -> BackgroundJob:
+    return BackgroundJob(
+        id=job_id,
+        job_type=job_type,
+        job_key='conversation-1',
+        payload={'conversation_id': 'conversation-1'},
+        status='running',
+        attempts=attempts,
+        max_attempts=5,
+        run_after='2026-10-01T00:00:00Z',
+    )
+
+
+def test_worker_completes_successful_jobs_and_reschedules_failures_with_backoff() -> None:
+    handled: list[dict] = []
+
+    def failing_title(payload):
+        raise RuntimeError('model unavailable')
+
+    repository = FakeJobRepository(
+        [_job(1, JOB_TYPE_CONVERSATION_SUMMARY), _job(2, JOB_TYPE_CONVERSATION_TITLE, attempts=3)]
+    )
+    worker = JobWorker(
+        repository,
+        {JOB_TYPE_CONVERSATION_SUMMARY: handled.append, JOB_TYPE_CONVERSATION_TITLE: failing_title},
+        worker_id='worker-1',
+    )
+
+    assert worker.run_once().id == 1
+    assert worker.run_once().id == 2
+    assert worker.run_once() is None
+
+    assert handled == [{'conversation_id': 'conversation-1'}]
+    assert repository.completed == [1]
+    assert repository.failed == [(2, 'RuntimeError: model unavailable', retry_delay_seconds(3))]
+    assert repository.claims[0] == ('worker-1', [JOB_TYPE_CONVERSATION_SUMMARY, JOB_TYPE_CONVERSATION_TITLE])
+
+
+def test_retry_delay_doubles_per_attempt_up_to_the_cap() -> None:
+    assert retry_delay_seconds(1) == JOB_RETRY_BASE_SECONDS
+    assert retry_delay_seconds(3) == JOB_RETRY_BASE_SECONDS * 4
+    assert retry_delay_seconds(50) == retry_delay_seconds(60)
+
+
+def test_enqueue_helpers_key_jobs_per_conversation_and_never_raise() -> None:
+    conversation_id = uuid4()
+    repository = FakeJobRepository([])
+
+    with patch('jobs.enqueue.get_job_repository', return_value=repository):
+        assert enqueue_conversation_summary(conversation_id)
+        assert enqueue_conversation_title(conversation_id, 'Compare trail shoes')
+
+    assert repository.enqueued == [
+        (JOB_TYPE_CONVERSATION_SUMMARY, str(conversation_id), {'conversation_id': str(conversation_id)}),
+        (
+            JOB_TYPE_CONVERSATION_TITLE,
+            str(conversation_id),
+            {'conversation_id': str(conversation_id), 'prompt': 'Compare trail shoes'},
+        ),
+    ]
+
+    with patch('jobs.enqueue.get_job_repository', side_effect=RuntimeError('database down')):
+        assert enqueue_conversation_summary(conversation_id) is False
+
+
+class FakeCursor:
+    def __init__(self, fetchone_row=None):
+        self.fetchone_row = fetchone_row
+        self.executed: list[tuple[str, tuple]] = []
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def execute(self, sql, params):
+        self.executed.append((sql, params))
+
+    def fetchone(self):
+        return self.fetchone_row
+
+
+class FakeConnection:
+    def __init__(self, cursors):
+        self._cursors = list(cursors)
+
+    def cursor(self, row_factory=None):
+        return self._cursors.pop(0)
+
+
+def test_job_repository_coalesces_pending_keys_and_claims_with_skip_locked() -> None:
+    enqueue_cursor = FakeCursor({'id': 7})
+    claim_cursor = FakeCursor(
+        {
+            'id': 7,
+            'job_type': JOB_TYPE_CONVERSATION_SUMMARY,
+            'job_key': 'conversation-1',
+            'payload': {'conversation_id': 'conversation-1'},
+            'status': 'running',
+            'attempts': 1,
+            'max_attempts': 5,
+            'run_after': '2026-10-01T00:00:00Z',
+            'last_error': None,
+        }
+    )
+    repository = JobRepository(FakeConnection([enqueue_cursor, claim_cursor]))
+
+    assert repository.enqueue(JOB_TYPE_CONVERSATION_SUMMARY, 'conversation-1', {'conversation_id': 'conversation-1'}) == 7
+    job = repository.claim('worker-1', [JOB_TYPE_CONVERSATION_SUMMARY])
+
+    enqueue_sql, _ = enqueue_cursor.executed[0]
+    assert "ON CONFLICT (job_type, job_key) WHERE status = 'pending'" in enqueue_sql
+    claim_sql, claim_params = claim_cursor.executed[0]
+    assert 'FOR UPDATE SKIP LOCKED' in claim_sql
+    assert "running.status = 'running'" in claim_sql
+    assert claim_params == ('worker-1', [JOB_TYPE_CONVERSATION_SUMMARY])
+    assert job is not None and job.attempts == 1 and job.payload == {'conversation_id': 'conversation-1'}
+
+
+def test_job_repository_fails_a_job_whose_key_was_requeued_mid_update() -> None:
+    class RacingCursor(FakeCursor):
+        def execute(self, sql, params):
+            super().execute(sql, params)
+            raise psycopg.errors.UniqueViolation('uq_background_job_pending_key')
+
+    retry_cursor = RacingCursor()
+    close_cursor = FakeCursor()
+    repository = JobRepository(FakeConnection([retry_cursor, close_cursor]))
+
+    repository.fail(7, 'boom', retry_in_seconds=5.0)
+
+    assert 'CASE' in retry_cursor.executed[0][0]
+    close_sql, close_params = close_cursor.executed[0]
+    assert "SET status = 'failed'" in close_sql
+    assert close_params == (5.0, 'boom', 7)
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import hashlib
+from dataclasses import replace
+
+import pytest
+
+from db.embedding_migration import EmbeddingSlot
+from db.vector import PRODUCT_EMBEDDING
+from products.catalog_loader import ProductCatalogLoader
+from products.models.catalog_product import CatalogProduct
+from products.repository.catalog_load_repository import CatalogLoadState, ProductCatalogLoadRepository, StoredProduct
+
+VERSION = "text-embedding-3-small@1536"
+SLOT = EmbeddingSlot(PRODUCT_EMBEDDING, "embedding", VERSION)
+
+
+def _product(product_id: str, description: str = "", **overrides) -> CatalogProduct:
+    values = dict(
+        id=product_id,
+        name=f"Product {product_id}",
+        description=description or f"Description {product_id}",
+        category="Shirts",
+        color="Blue",
+        style="Casual",
+        gender="Men",
+        season="Summer",
+        year=2020,
+        price=19.99,
+        image_url=None,
+    )
+    values.update(overrides)
+    return CatalogProduct(**values)
+
+
+class FakeCatalogLoadRepository:
+    def __init__(self, stored: dict[str, CatalogProduct] | None = None, *, rows_done: int = 0) -> None:
+        self.stored = dict(stored or {})
+        self.state = CatalogLoadState(source="dataset", rows_done=rows_done)
+        self.batches: list[list[tuple[str, bool]]] = []
+        self.deferred = False
+        self.finished = False
+
+    def start(self, source, *, restart=False):
+        if restart:
+            self.state = replace(self.state, rows_done=0)
+        return self.state
+
+    def catalog_is_empty(self):
+        return not self.stored
+
+    def defer_indexes(self, source):
+        self.deferred = True
+        self.state = replace(self.state, deferred_indexes=("CREATE INDEX products_color_idx ON products (color)",))
+        return self.state
+
+    def stored_products(self, ids, slot):
+        return {
+            product_id: StoredProduct(
+                source_hash=self.stored[product_id].source_hash,
+                embedding_source_hash=hashlib.md5(self.stored[product_id].embedding_text.encode()).hexdigest(),
+                embedding_current=True,
+            )
+            for product_id in ids
+            if product_id in self.stored
+        }
+
+    def write_batch(self, source, rows, slot, *, rows_done):
+        self.batches.append([(product.id, embedding is not None) for product, embedding in rows])
+        self.stored.update((product.id, product) for product, _ in rows)
+        self.state = replace(self.state, rows_done=self.state.rows_done + rows_done)
+        return len(rows)
+
+    def finish(self, source, *, maintenance_work_mem=None):
+        self.finished = True
+
+
+def _loader(repository, embed, **kwargs) -> ProductCatalogLoader:
+    kwargs.setdefault("sleep_fn", lambda seconds: None)
+    return ProductCatalogLoader("dataset", repository=repository, embed=embed, embedding_slot=SLOT, **kwargs)
+
+
+def _recording_embed(calls: list[list[str]]):
+    def embed(texts, *, model, dimensions):
+        assert (model, dimensions) == ("text-embedding-3-small", 1536)
+        calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    return embed
+
+
+def test_first_load_defers_indexes_and_writes_batches_in_source_order() -> None:
+    repository = FakeCatalogLoadRepository()
+    calls: list[list[str]] = []
+    products = [_product(str(index)) for index in range(5)]
+
+    stats = _loader(repository, _recording_embed(calls), batch_size=2, embed_batch_size=1, concurrency=3).load(
+        lambda offset: products[offset:]
+    )
+
+    assert repository.deferred and repository.finished
+    assert repository.batches == [[("0", True), ("1", True)], [("2", True), ("3", True)], [("4", True)]]
+    assert sorted(text for batch in calls for text in batch) == [f"Description {index}" for index in range(5)]
+    assert (stats.rows_read, stats.rows_written, stats.rows_embedded, stats.rows_unchanged) == (5, 5, 5, 0)
+    assert repository.state.rows_done == 5
+
+
+def test_reload_skips_unchanged_products_and_embeds_only_changed_text() -> None:
+    stored = {product.id: product for product in [_product("a"), _product("b"), _product("c")]}
+    repository = FakeCatalogLoadRepository(stored)
+    calls: list[list[str]] = []
+    source = [_product("a"), _product("b", price=24.5), _product("c", description="Now in red"), _product("d")]
+
+    stats = _loader(repository, _recording_embed(calls)).load(lambda offset: source[offset:])
+
+    assert not repository.deferred
+    # "b" only changed price, so its stored vector is kept.
+    assert repository.batches == [[("b", False), ("c", True), ("d", True)]]
+    assert calls == [["Now in red", "Description d"]]
+    assert (stats.rows_written, stats.rows_embedded, stats.rows_unchanged) == (3, 2, 1)
+
+
+def test_interrupted_load_resumes_after_the_committed_rows() -> None:
+    repository = FakeCatalogLoadRepository({"0": _product("0")}, rows_done=3)
+    offsets: list[int] = []
+    products = [_product(str(index)) for index in range(5)]
+
+    def read(offset: int):
+        offsets.append(offset)
+        return products[offset:]
+
+    stats = _loader(repository, _recording_embed([])).load(read)
+
+    assert offsets == [3]
+    assert repository.batches == [[("3", True), ("4", True)]]
+    assert stats.rows_read == 5
+
+
+def test_duplicate_ids_in_a_batch_keep_the_last_version() -> None:
+    repository = FakeCatalogLoadRepository()
+    source = [_product("a", description="old"), _product("a", description="new")]
+
+    _loader(repository, _recording_embed([])).load(lambda offset: source[offset:])
+
+    assert repository.stored["a"].description == "new"
+    assert repository.state.rows_done == 2
+
+
+def test_failed_embedding_requests_are_retried_with_backoff() -> None:
+    attempts: list[int] = []
+    sleeps: list[float] = []
+
+    def flaky_embed(texts, *, model, dimensions):
+        attempts.append(len(texts))
+        if len(attempts) < 3:
+            raise RuntimeError("rate limited")
+        return [[0.0] for _ in texts]
+
+    repository = FakeCatalogLoadRepository()
+    _loader(repository, flaky_embed, sleep_fn=sleeps.append, retry_backoff_seconds=1.0).load(lambda offset: [_product("a")])
+
+    assert len(attempts) == 3
+    assert len(sleeps) == 2 and 0.5 <= sleeps[0] <= 1.0 and 1.0 <= sleeps[1] <= 2.0
+    assert repository.batches == [[("a", True)]]
+
+
+def test_load_stops_without_advancing_past_a_batch_that_cannot_be_embedded() -> None:
+    def failing_embed(texts, *, model, dimensions):
+        raise RuntimeError("down")
+
+    repository = FakeCatalogLoadRepository()
+    with pytest.raises(RuntimeError):
+        _loader(repository, failing_embed, max_attempts=2).load(lambda offset: [_product("a")])
+
+    assert repository.state.rows_done == 0
+    assert not repository.finished
+
+
+def test_merge_keeps_stored_vectors_when_the_batch_has_none_and_clears_the_stale_slot() -> None:
+    sql = ProductCatalogLoadRepository._merge_sql(SLOT)
+
+    assert "embedding = COALESCE(EXCLUDED.embedding, products.embedding)" in sql
+    assert "embedding_alt = CASE WHEN EXCLUDED.embedding IS NULL THEN products.embedding_alt END" in sql
+    assert "WHERE products.source_hash IS DISTINCT FROM EXCLUDED.source_hash OR EXCLUDED.embedding IS NOT NULL" in sql
+
+    filling_slot = EmbeddingSlot(PRODUCT_EMBEDDING, "embedding_alt", VERSION, clears_other=False)
+    filling = ProductCatalogLoadRepository._merge_sql(filling_slot)
+    assert "source_hash, embedding_alt, embedding_alt_model)" in filling
+    assert "embedding = CASE" not in filling
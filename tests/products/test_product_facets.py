@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+import products.facets as facets_module
+from products.facets import format_product_facet_summary, get_product_facets, invalidate_product_facets, product_facet_planner_rules
+from products.models.product_facets import PriceBucket, ProductFacets, ProductFacetValue
+
+
+def _facets() -> ProductFacets:
+    return ProductFacets(
+        values={
+            "category": (
+                ProductFacetValue("Tshirts", 7000, 10.0, 40.0),
+                ProductFacetValue("Jackets", 300, 50.0, 300.0),
+                ProductFacetValue("Bags", 120, 20.0, 120.0),
+            ),
+            "color": (ProductFacetValue("Black", 5000), ProductFacetValue("Blue", 2000), ProductFacetValue("Red", 420)),
+            "gender": (ProductFacetValue("Men", 4000), ProductFacetValue("Women", 3420)),
+        },
+        price_histogram=(
+            PriceBucket(10.0, 39.5, 6000),
+            PriceBucket(40.0, 69.0, 1000),
+            PriceBucket(70.0, 300.0, 420),
+        ),
+    )
+
+
+class FakeFacetRepository:
+    def __init__(self, *results) -> None:
+        self.results = list(results)
+        self.calls = 0
+
+    def get_facets(self) -> ProductFacets:
+        self.calls += 1
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    with patch.object(facets_module, "_FACETS", None):
+        invalidate_product_facets()
+        yield
+        invalidate_product_facets()
+
+
+def test_categories_are_listed_alphabetically() -> None:
+    assert _facets().categories() == ["Bags", "Jackets", "Tshirts"]
+    assert _facets().categories(2) == ["Bags", "Jackets"]
+
+
+def test_price_percentiles_come_from_the_histogram() -> None:
+    assert _facets().price_percentile(0.5) == 39.5
+    assert _facets().price_percentile(0.9) == 69.0
+    assert ProductFacets().price_percentile(0.5) is None
+
+
+def test_summary_lists_common_values_with_counts_and_price_distribution() -> None:
+    lines = format_product_facet_summary(_facets(), max_values=2)
+
+    assert lines == [
+        "category: Tshirts (7000, $10-$40), Jackets (300, $50-$300) and 1 more",
+        "color: Black (5000), Blue (2000) and 1 more",
+        "gender: Men (4000), Women (3420)",
+        "price: $10-$300, half under $40, 90% under $69",
+    ]
+
+
+def test_facets_are_cached_and_the_last_copy_survives_database_errors() -> None:
+    repository = FakeFacetRepository(_facets(), RuntimeError("database down"))
+    with patch.object(facets_module, "get_product_repository", return_value=repository):
+        first = get_product_facets()
+        assert get_product_facets() is first
+        assert repository.calls == 1
+
+        invalidate_product_facets()
+        assert get_product_facets() is first
+        assert repository.calls == 2
+
+
+def test_planner_rules_are_empty_when_facets_cannot_be_loaded() -> None:
+    with patch.object(facets_module, "get_product_repository", side_effect=RuntimeError("no database")):
+        assert product_facet_planner_rules() == []
+
+
+def test_planner_rules_name_the_catalog_values() -> None:
+    with patch.object(facets_module, "get_product_facets", return_value=_facets()):
+        rules = product_facet_planner_rules()
+
+    assert rules[0].startswith("Catalog filter values (product counts): category: Tshirts (7000, $10-$40)")
+    assert "gender: Men (4000), Women (3420)" in rules[0]
+    assert rules[1].startswith("Prefer find_products filter values listed above")
+    assert "use the user's value when it is not listed" in rules[1]
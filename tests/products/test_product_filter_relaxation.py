@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from products import product_retrieval
+from products.filter_relaxation import relax_product_filters
+from products.hybrid_search import is_confident_ranking
+from products.models.product_query import ProductQuery
+from products.models.product_result import ProductResult
+from products.repository.product_repository import ProductRepository
+
+
+def _product(product_id: str, score: float | None = None) -> ProductResult:
+    return ProductResult(
+        id=product_id,
+        name=product_id,
+        description=None,
+        category=None,
+        color=None,
+        style=None,
+        gender=None,
+        season=None,
+        year=None,
+        price=None,
+        score=score,
+    )
+
+
+def test_filters_are_relaxed_style_then_color_then_price_band() -> None:
+    filters = ProductQuery(category=["Shoes"], style="trail", color="Purple", price_min=40, price_max=80, gender="Women")
+
+    tiers = relax_product_filters(filters, price_relaxation=0.25)
+
+    assert [tier.relaxed for tier in tiers] == [(), ("style",), ("style", "color"), ("style", "color", "price")]
+    assert tiers[0].filters is filters
+    last = tiers[-1].filters
+    assert (last.style, last.color, last.price_min, last.price_max) == (None, None, 30, 100)
+    assert (last.category, last.gender) == (["Shoes"], "Women")
+
+
+def test_only_filters_that_are_set_produce_tiers() -> None:
+    assert [tier.relaxed for tier in relax_product_filters(ProductQuery(color="Black"))] == [(), ("color",)]
+    assert [tier.relaxed for tier in relax_product_filters(ProductQuery(category=["Bags"]))] == [()]
+    assert [tier.relaxed for tier in relax_product_filters(None)] == [()]
+
+
+def test_relaxed_search_sql_gates_each_tier_on_the_earlier_ones_being_empty() -> None:
+    repo = ProductRepository.__new__(ProductRepository)
+    repo._has_description_column = True
+    tiers = [ProductQuery(color="Purple", price_max=80), ProductQuery(price_max=80)]
+
+    sql, params = repo._build_relaxed_search_sql([0.1, 0.2], tiers, 40, "trail shoes")
+
+    assert sql.count("AS MATERIALIZED") == 4
+    assert sql.count("UNION ALL") == 3
+    assert "0 AS tier, 'vector' AS retriever FROM tier_0_vector\n" in sql
+    assert (
+        "1 AS tier, 'lexical' AS retriever FROM tier_1_lexical "
+        "WHERE NOT EXISTS (SELECT 1 FROM tier_0_vector) AND NOT EXISTS (SELECT 1 FROM tier_0_lexical)"
+    ) in sql
+    assert sql.count("%s") == len(params)
+    assert params.count("Purple") == 2
+
+
+def test_decisive_distance_gap_skips_the_rerank() -> None:
+    decisive = [_product("a", 0.30), _product("b", 0.52), _product("c", 0.55)]
+    close = [_product("a", 0.30), _product("b", 0.35), _product("c", 0.90)]
+
+    assert is_confident_ranking(decisive)
+    assert not is_confident_ranking(close)
+    assert not is_confident_ranking([_product("a", 0.30), _product("b")])
+
+
+def test_find_products_reports_the_relaxed_filters() -> None:
+    products = [_product("a", 0.40), _product("b", 0.45)]
+    filters = ProductQuery(style="trail", color="Purple")
+
+    with (
+        patch.object(product_retrieval, "get_product_index", return_value=None),
+        patch.object(product_retrieval, "get_product_repository") as repository,
+        patch.object(product_retrieval, "embed_text", return_value=[0.1]),
+        patch.object(product_retrieval, "rerank_product_results", side_effect=lambda results, goal: results) as rerank,
+    ):
+        repository.return_value.search_products_relaxed.return_value = (products, 2)
+        results = product_retrieval.find_products("running shoes", filters)
+
+    rerank.assert_called_once()
+    assert results.relaxed_filters == ("style", "color")
+    filter_tiers = repository.return_value.search_products_relaxed.call_args.kwargs["filter_tiers"]
+    assert [(tier.style, tier.color) for tier in filter_tiers] == [("trail", "Purple"), (None, "Purple"), (None, None)]
+
+
+def test_find_products_relaxes_in_memory_index_tiers_in_turn() -> None:
+    calls: list[ProductQuery | None] = []
+
+    class FakeIndex:
+        def search_products(self, *, product_filters, **kwargs):
+            calls.append(product_filters)
+            return [] if product_filters.style else [_product("a", 0.2)]
+
+    with (
+        patch.object(product_retrieval, "get_product_index", return_value=FakeIndex()),
+        patch.object(product_retrieval, "embed_text", return_value=[0.1]),
+    ):
+        results = product_retrieval.find_products("boots", ProductQuery(style="chelsea", color="Brown"))
+
+    assert len(calls) == 2
+    assert results.relaxed_filters == ("style",)
+    assert [product.id for product in results.internal_results] == ["a"]
@@ -0,0 +1,111 @@
+from unittest.mock import MagicMock, patch
+
+from products import product_retrieval
+from products.hybrid_search import fuse_product_rankings, is_confident_ranking
+from products.models.product_query import ProductQuery
+from products.models.product_result import ProductResult
+from products.repository.product_repository import ProductRepository
+
+
+def _product(product_id: str, *, name: str | None = None, exact_name_match: bool = False) -> ProductResult:
+    return ProductResult(
+        id=product_id,
+        name=name or product_id,
+        description=None,
+        category=None,
+        color=None,
+        style=None,
+        gender=None,
+        season=None,
+        year=None,
+        price=None,
+        exact_name_match=exact_name_match,
+    )
+
+
+def test_fuse_product_rankings_rewards_agreement_between_retrievers() -> None:
+    vector = [_product("a"), _product("b"), _product("c")]
+    lexical = [_product("b"), _product("d"), _product("e")]
+
+    fused = fuse_product_rankings(vector, lexical, limit=10, k=60)
+
+    assert [product.id for product in fused] == ["b", "a", "d", "c", "e"]
+    assert fused[0].vector_rank == 2
+    assert fused[0].lexical_rank == 1
+    assert fused[0].fused_score == 1 / 62 + 1 / 61
+    assert fused[-1].vector_rank is None
+
+
+def test_fuse_product_rankings_pins_exact_name_matches() -> None:
+    vector = [_product("a"), _product("b")]
+    lexical = [_product("z", name="Air Zoom Pegasus", exact_name_match=True)]
+
+    fused = fuse_product_rankings(vector, lexical, limit=2)
+
+    assert [product.id for product in fused] == ["z", "a"]
+    assert is_confident_ranking(fused)
+
+
+def test_is_confident_ranking_requires_both_retrievers_to_rank_the_top_product_first() -> None:
+    agreeing = fuse_product_rankings([_product("a"), _product("b")], [_product("a"), _product("c")], limit=5)
+    disagreeing = fuse_product_rankings([_product("a"), _product("b")], [_product("b"), _product("a")], limit=5)
+
+    assert is_confident_ranking(agreeing)
+    assert not is_confident_ranking(disagreeing)
+    assert not is_confident_ranking([_product("a")])
+
+
+def test_product_repository_builds_lexical_sql_with_shared_filters() -> None:
+    repo = ProductRepository.__new__(ProductRepository)
+    repo._has_description_column = True
+
+    sql, params = repo._build_lexical_sql("air zoom pegasus", ProductQuery(color="Black", price_max=150), 40)
+
+    assert "search_tsv @@ websearch_to_tsquery('english', %s)" in sql
+    assert "LOWER(name) %% LOWER(%s)" in sql
+    assert "LOWER(color) = LOWER(%s)" in sql
+    assert sql.count("%s") == len(params)
+    assert params[1:3] == ["Black", 150]
+    assert params[-1] == 40
+
+
+def test_find_products_skips_llm_rerank_when_fused_ranking_is_confident() -> None:
+    products = fuse_product_rankings(
+        [_product(f"sku-{index}") for index in range(10)],
+        [_product("sku-0"), _product("sku-5")],
+        limit=20,
+    )
+
+    with (
+        patch.object(product_retrieval, "get_product_index", return_value=None),
+        patch.object(product_retrieval, "get_product_repository") as repository,
+        patch.object(product_retrieval, "embed_text", return_value=[0.1]),
+        patch.object(product_retrieval, "rerank_product_results") as rerank,
+    ):
+        repository.return_value.search_products_relaxed.return_value = (products, 0)
+        results = product_retrieval.find_products("trail shoes")
+
+    rerank.assert_not_called()
+    assert results.reranked is False
+    assert results.retrieved_count == 10
+    assert [product.id for product in results.internal_results][:2] == ["sku-0", "sku-5"]
+    assert repository.return_value.search_products_relaxed.call_args.kwargs["query_text"] == "trail shoes"
+
+
+def test_hybrid_search_pipelines_both_legs_on_one_pooled_connection() -> None:
+    pooled = MagicMock()
+    conn = pooled.connection.return_value.__enter__.return_value
+    conn.cursor.return_value.__enter__.return_value.fetchall.return_value = []
+    repo = ProductRepository.__new__(ProductRepository)
+    repo._conn = pooled
+    repo._has_description_column = True
+    repo._has_search_text_column = True
+
+    assert repo.search_products([0.1], ProductQuery(color="Black"), query_text="air zoom") == []
+
+    pooled.connection.assert_called_once()
+    conn.pipeline.assert_called_once()
+    assert conn.cursor.return_value.__enter__.return_value.execute.call_count == 2
+    # The trigram threshold is set transaction-locally so it does not leak to the next borrower.
+    conn.transaction.assert_called_once()
+    assert "set_config('pg_trgm.similarity_threshold', %s, true)" in conn.execute.call_args.args[0]
@@ -0,0 +1,171 @@
+from pathlib import Path
+from time import monotonic
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+
+from products import vector_index
+from products.models.product_query import ProductQuery
+from products.vector_index import ProductIndexProvider, build_product_index, load_product_index
+
+COLORS = ("Black", "Blue", "Red", "White")
+
+
+def _catalog(count: int = 400, dimensions: int = 16) -> tuple[list[dict], np.ndarray]:
+    rng = np.random.default_rng(7)
+    embeddings = rng.normal(size=(count, dimensions)).astype(np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    products = [
+        {
+            "id": f"sku-{row}",
+            "name": f"Trail Runner {row}" if row % 10 == 0 else f"Canvas Tote {row}",
+            "category": "Shoes" if row % 10 == 0 else "Bags",
+            "color": COLORS[row % len(COLORS)],
+            "style": "Sports" if row % 2 else "Casual",
+            "gender": "Men" if row % 3 else "Women",
+            "season": "Summer",
+            "price": float(row % 100),
+        }
+        for row in range(count)
+    ]
+    return products, embeddings
+
+
+def _exact_top_ids(products: list[dict], embeddings: np.ndarray, query: np.ndarray, rows: np.ndarray, limit: int) -> list[str]:
+    vectors = embeddings[rows]
+    distances = np.linalg.norm(vectors - query, axis=1)
+    return [products[rows[i]]["id"] for i in np.argsort(distances)[:limit]]
+
+
+def test_vector_search_with_all_lists_probed_matches_exact_search() -> None:
+    products, embeddings = _catalog()
+    index = build_product_index(products, embeddings, catalog_version=3, n_lists=8)
+    query = embeddings[5]
+
+    with patch.object(vector_index, "PRODUCT_INDEX_PROBE_LISTS", 8):
+        results = index.vector_search(query, limit=5)
+
+    assert [result.id for result in results] == _exact_top_ids(products, embeddings, query, np.arange(len(products)), 5)
+    assert results[0].id == "sku-5"
+    assert results[0].score < 1e-2
+
+
+def test_vector_search_applies_filters_exactly_for_small_filtered_sets() -> None:
+    products, embeddings = _catalog()
+    index = build_product_index(products, embeddings, catalog_version=3, n_lists=8)
+    filters = ProductQuery(color="blue", gender="Men", style="sport", price_min=10, price_max=60)
+
+    results = index.vector_search(embeddings[0], filters, limit=50)
+
+    expected_rows = np.array(
+        [
+            row
+            for row, product in enumerate(products)
+            if product["color"] == "Blue" and product["gender"] == "Men" and product["style"] == "Sports" and 10 <= product["price"] <= 60
+        ]
+    )
+    assert sorted(result.id for result in results) == sorted(products[row]["id"] for row in expected_rows)
+    assert [result.id for result in results][:3] == _exact_top_ids(products, embeddings, embeddings[0], expected_rows, 3)
+
+
+def test_lexical_search_ranks_exact_names_first() -> None:
+    products, embeddings = _catalog()
+    index = build_product_index(products, embeddings, catalog_version=3, n_lists=8)
+
+    results = index.lexical_search("trail runner 120", limit=3)
+    fused = index.search_products(embeddings[7], query_text="Trail Runner 120", limit=5)
+
+    assert results[0].id == "sku-120"
+    assert results[0].exact_name_match
+    assert fused[0].id == "sku-120"
+    assert index.lexical_search("trail runner", ProductQuery(category="Bags")) == []
+
+
+def test_saved_index_loads_memory_mapped_and_keeps_results(tmp_path: Path) -> None:
+    products, embeddings = _catalog()
+    index = build_product_index(products, embeddings, catalog_version=3, n_lists=8)
+    index.save(tmp_path / "index")
+
+    loaded = load_product_index(tmp_path / "index")
+
+    assert loaded is not None
+    assert isinstance(loaded.embeddings, np.memmap)
+    assert loaded.catalog_version == 3
+    assert [result.id for result in loaded.vector_search(embeddings[9], limit=5)] == [
+        result.id for result in index.vector_search(embeddings[9], limit=5)
+    ]
+
+
+def test_provider_falls_back_when_catalog_version_changes(tmp_path: Path) -> None:
+    products, embeddings = _catalog()
+    build_product_index(products, embeddings, catalog_version=3, n_lists=8).save(tmp_path / "index")
+    provider = ProductIndexProvider(tmp_path / "index", auto_rebuild=False)
+
+    with patch.object(vector_index, "PRODUCT_INDEX_VERSION_CHECK_SECONDS", 0.0):
+        with patch.object(provider, "_catalog_version", return_value=3):
+            assert provider.get() is not None
+        with patch.object(provider, "_catalog_version", return_value=4):
+            assert provider.get() is None
+
+
+def test_hamming_distances_fall_back_to_unpacked_bits_without_bitwise_count(monkeypatch) -> None:
+    codes = np.array([[0b1011, 0], [0, 2**63]], dtype=np.uint64)
+    query_code = np.array([0b0001, 0], dtype=np.uint64)
+    assert vector_index._hamming_distances(codes, query_code).tolist() == [2, 2]
+
+    monkeypatch.delattr(np, "bitwise_count", raising=False)
+    assert vector_index._hamming_distances(codes, query_code).tolist() == [2, 2]
+
+
+def test_provider_keeps_the_index_when_the_catalog_has_no_version(tmp_path: Path) -> None:
+    products, embeddings = _catalog()
+    build_product_index(products, embeddings, catalog_version=3, n_lists=8).save(tmp_path / "index")
+    provider = ProductIndexProvider(tmp_path / "index", auto_rebuild=False)
+
+    with patch.object(vector_index, "PRODUCT_INDEX_VERSION_CHECK_SECONDS", 0.0):
+        with patch.object(provider, "_catalog_version", return_value=None):
+            assert provider.get() is not None
+
+
+def test_provider_backs_off_after_a_failed_rebuild(tmp_path: Path) -> None:
+    provider = ProductIndexProvider(tmp_path / "missing")
+    builds: list[Path] = []
+
+    def failing_build(path):
+        builds.append(path)
+        raise RuntimeError("database down")
+
+    with (
+        patch.object(vector_index, "build_product_index_from_db", side_effect=failing_build),
+        patch.object(vector_index, "Thread") as thread,
+        patch.object(provider, "_catalog_version", return_value=7),
+    ):
+        targets: list = []
+        thread.side_effect = lambda target, **kwargs: SimpleNamespace(start=lambda: targets.append(target))
+        assert provider.get() is None
+        targets.pop()()
+        assert provider.get() is None
+
+    assert len(builds) == 1
+    assert not targets
+
+
+def test_provider_waits_for_the_catalog_version_to_settle_before_rebuilding(tmp_path: Path) -> None:
+    products, embeddings = _catalog()
+    build_product_index(products, embeddings, catalog_version=3, n_lists=8).save(tmp_path / "index")
+    provider = ProductIndexProvider(tmp_path / "index")
+
+    with (
+        patch.object(vector_index, "PRODUCT_INDEX_VERSION_CHECK_SECONDS", 0.0),
+        patch.object(vector_index, "PRODUCT_INDEX_REBUILD_DEBOUNCE_SECONDS", 60.0),
+        patch.object(vector_index, "Thread") as thread,
+        patch.object(provider, "_catalog_version", side_effect=[4, 5]),
+    ):
+        assert provider.get() is None
+        assert provider.get() is None
+        thread.assert_not_called()
+
+        with patch.object(vector_index, "monotonic", return_value=monotonic() + 61.0), patch.object(provider, "_catalog_version", return_value=5):
+            assert provider.get() is None
+        thread.assert_called_once()
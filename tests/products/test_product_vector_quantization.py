@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+import products.repository.product_repository as product_repository
+from db.vector import EMBEDDING_COLUMNS, embedding_column_conversion_sql, recall_at_k
+from products.models.product_query import ProductQuery
+from products.repository.product_repository import ProductRepository
+
+
+def _repo() -> ProductRepository:
+    repo = ProductRepository.__new__(ProductRepository)
+    repo._has_description_column = True
+    return repo
+
+
+def test_quantized_search_ranks_hamming_candidates_then_reranks_on_full_vectors() -> None:
+    with (
+        patch.object(product_repository, "PRODUCT_SEARCH_BINARY_QUANTIZATION", True),
+        patch.object(product_repository, "BINARY_QUANTIZATION_OVERSAMPLE", 4),
+    ):
+        sql, params = _repo()._build_search_sql([0.1, 0.2], ProductQuery(color="red"), 6)
+
+    assert "binary_quantize(products.embedding)::bit(" in sql
+    assert "<~>" in sql
+    assert "ORDER BY candidates.embedding <-> query.embedding" in sql
+    assert params == [[0.1, 0.2], "red", 24, product_repository.MAX_VECTOR_DISTANCE, 6]
+
+
+def test_full_precision_search_is_unchanged_without_quantization() -> None:
+    sql, params = _repo()._build_search_sql([0.1, 0.2], None, 6)
+
+    assert "binary_quantize" not in sql
+    assert params == [[0.1, 0.2], product_repository.MAX_VECTOR_DISTANCE, 6]
+
+
+def test_conversion_to_truncated_halfvec_rebuilds_indexes_for_the_new_type() -> None:
+    products_column = next(column for column in EMBEDDING_COLUMNS if column.table == "products")
+
+    statements = embedding_column_conversion_sql(products_column, storage="halfvec", dimensions=512, truncate=True)
+
+    assert statements == [
+        "DROP INDEX IF EXISTS products_embedding_idx",
+        "DROP INDEX IF EXISTS products_embedding_bq_idx",
+        "ALTER TABLE products ALTER COLUMN embedding TYPE halfvec(512) "
+        "USING (l2_normalize(subvector(embedding::vector, 1, 512)))::halfvec(512)",
+        "UPDATE products SET embedding_model = split_part(embedding_model, '@', 1) || '@512' "
+        "WHERE embedding_model IS NOT NULL",
+        "CREATE INDEX products_embedding_idx ON products USING ivfflat (embedding halfvec_l2_ops) WITH (lists = 100)",
+        "CREATE INDEX products_embedding_bq_idx ON products "
+        "USING hnsw ((binary_quantize(embedding)::bit(512)) bit_hamming_ops)",
+    ]
+
+
+def test_conversion_rejects_unknown_storage() -> None:
+    with pytest.raises(ValueError):
+        embedding_column_conversion_sql(EMBEDDING_COLUMNS[0], storage="float8", dimensions=1536, truncate=False)
+
+
+def test_recall_at_k() -> None:
+    assert recall_at_k(["a", "b", "c", "d"], ["b", "a", "x", "y"], 4) == 0.5
+    assert recall_at_k(["a", "b"], ["a", "b", "c"], 2) == 1.0
+    assert recall_at_k([], ["a"], 3) == 1.0
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import uuid4
+
+from conversation.models.conversation_models import LlmUsageAggregate
+from rendering.render_cache import RenderCache, fetch_llm_usage_summaries_for_roundtrips
+from rendering.rendering import _format_roundtrip_usage_summary
+
+
+def _aggregate(roundtrip_id, *, call_count: int = 2) -> LlmUsageAggregate:
+    return LlmUsageAggregate(
+        roundtrip_id=roundtrip_id,
+        call_count=call_count,
+        input_tokens=1200,
+        cached_input_tokens=200,
+        output_tokens=300,
+        total_tokens=1500,
+        total_latency_ms=840,
+        computed_input_cost=Decimal("0.00120"),
+        computed_output_cost=Decimal("0.00060"),
+        computed_total_cost=Decimal("0.00180"),
+    )
+
+
+class FakeRepo:
+    def __init__(self, with_usage: set) -> None:
+        self.with_usage = with_usage
+        self.summary_calls: list[list] = []
+
+    def summarize_llm_calls_for_roundtrips(self, roundtrip_ids):
+        self.summary_calls.append(list(roundtrip_ids))
+        return {roundtrip_id: _aggregate(roundtrip_id) for roundtrip_id in roundtrip_ids if roundtrip_id in self.with_usage}
+
+
+def test_fetch_llm_usage_summaries_builds_usage_payload_shape() -> None:
+    roundtrip_id = uuid4()
+    repo = FakeRepo({roundtrip_id})
+
+    with patch("rendering.render_cache.get_conversation_repo", return_value=repo):
+        summaries = fetch_llm_usage_summaries_for_roundtrips([str(roundtrip_id), "not-a-uuid"])
+
+    assert repo.summary_calls == [[roundtrip_id]]
+    usage = summaries[str(roundtrip_id)]
+    assert usage["retrieved_call_count"] == 2
+    assert usage["calls"] == []
+    assert usage["summary"] == {
+        "input_tokens": 1200,
+        "cached_input_tokens": 200,
+        "output_tokens": 300,
+        "total_tokens": 1500,
+        "total_latency_ms": 840,
+        "computed_input_cost": "0.0012",
+        "computed_output_cost": "0.0006",
+        "computed_total_cost": "0.0018",
+    }
+    assert _format_roundtrip_usage_summary(usage) == "Total Tokens: 1,500 | Estimated Cost: $0.0018"
+
+
+def test_render_cache_preloads_visible_usage_in_one_query_and_reloads_on_new_turn() -> None:
+    first_id, second_id, third_id = uuid4(), uuid4(), uuid4()
+    repo = FakeRepo({first_id, third_id})
+    cache = RenderCache()
+
+    with patch("rendering.render_cache.get_conversation_repo", return_value=repo):
+        cache.preload([str(first_id), str(second_id)])
+        cache.preload([str(first_id), str(second_id)])
+        assert cache.llm_usage_summary(str(first_id))["retrieved_call_count"] == 2
+        assert cache.llm_usage_summary(str(second_id)) is None
+        assert repo.summary_calls == [[first_id, second_id]]
+
+        cache.preload([str(first_id), str(second_id), str(third_id)])
+        assert cache.llm_usage_summary(str(third_id)) is not None
+
+    assert repo.summary_calls == [[first_id, second_id], [first_id, second_id, third_id]]
+
+
+def test_render_cache_memoizes_content_per_roundtrip_until_payload_changes() -> None:
+    roundtrip_id = str(uuid4())
+    payload = {"result": [{"content": "Answer", "evidence_ids": []}]}
+    builds: list[tuple[str, dict | None]] = []
+
+    def build(content, built_payload):
+        builds.append((content, built_payload))
+        return len(builds)
+
+    cache = RenderCache()
+    assert cache.rendered_content(roundtrip_id, "Answer", payload, build) == 1
+    assert cache.rendered_content(roundtrip_id, "Answer", payload, build) == 1
+    assert cache.rendered_content(roundtrip_id, "Answer", dict(payload), build) == 2
+    assert cache.rendered_content(None, "Answer", payload, build) == 3
+
+    cache.invalidate(roundtrip_id)
+    assert cache.rendered_content(roundtrip_id, "Answer", payload, build) == 4
+
+
+def test_render_cache_prunes_hidden_roundtrips_and_refetches_agent_logs_on_new_turn() -> None:
+    kept_id, dropped_id, new_id = str(uuid4()), str(uuid4()), str(uuid4())
+    cache = RenderCache()
+    fetched: list[str] = []
+
+    def fetch_logs(roundtrip_id):
+        fetched.append(roundtrip_id)
+        return {"planner": [{"kind": "plan"}]}
+
+    with (
+        patch("rendering.render_cache.get_conversation_repo", return_value=FakeRepo(set())),
+        patch("rendering.render_cache.fetch_agent_logs_for_roundtrip", side_effect=fetch_logs),
+    ):
+        cache.preload([kept_id, dropped_id])
+        cache.rendered_content(kept_id, "Kept", None, lambda content, payload: content)
+        cache.rendered_content(dropped_id, "Dropped", None, lambda content, payload: content)
+        cache.roundtrip_agent_logs(kept_id)
+        cache.roundtrip_agent_logs(kept_id)
+        assert fetched == [kept_id]
+
+        cache.preload([kept_id, new_id])
+        cache.roundtrip_agent_logs(kept_id)
+
+    assert set(cache.contents) == {kept_id}
+    assert fetched == [kept_id, kept_id]
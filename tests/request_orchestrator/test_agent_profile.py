@@ -50,3 +50,26 @@ def test_agent_profile_extra_tools_override_category_tools_by_name() -> None:
 
     resolved_tool = next(tool for tool in profile.tools if tool.name == category_tool.name)
     assert resolved_tool is replacement_tool
+
+
+def test_agent_profile_resolves_tool_timeout_from_override_then_tool_then_default() -> None:
+    profile = AgentProfile(
+        name="test_agent",
+        scope=MAIN_AGENT_MODEL_SCOPE,
+        allowed_categories={"math"},
+        extra_tools=[
+            SimpleNamespace(name="plain_tool"),
+            SimpleNamespace(name="overridden_tool", timeout_seconds=5.0),
+            SimpleNamespace(name="unbounded_tool", timeout_seconds=0),
+            SimpleNamespace(name="unbounded_override_tool", timeout_seconds=5.0),
+        ],
+        tool_timeout_seconds=20.0,
+        tool_timeout_overrides={"overridden_tool": 1.5, "unbounded_override_tool": 0},
+    )
+
+    assert profile.timeout_seconds_for_tool("calculate") == TOOL_CATEGORIES["math"].tools[0].timeout_seconds
+    assert profile.timeout_seconds_for_tool("plain_tool") == 20.0
+    assert profile.timeout_seconds_for_tool("overridden_tool") == 1.5
+    assert profile.timeout_seconds_for_tool("unbounded_tool") is None
+    assert profile.timeout_seconds_for_tool("unbounded_override_tool") is None
+    assert AgentProfile(name="unbounded", scope=MAIN_AGENT_MODEL_SCOPE, tool_timeout_seconds=0).timeout_seconds_for_tool("plain_tool") is None
@@ -22,6 +22,7 @@ from integrations.wikipedia.models import WikipediaPageSummary, WikipediaSearchR
 from request_orchestrator.models.evidence import ToolResult
 from request_orchestrator.models.plan import Plan
 from request_orchestrator.shared.evidence import (
+    EvidenceIndex,
     build_evidence_bundle_from_tool_results,
     build_evidence_steps_from_tool_results,
 )
@@ -870,3 +871,54 @@ def test_build_evidence_steps_puts_wrapper_search_metadata_on_parent_step() -> N
         "search_type": "web_search",
     }
     assert evidence_steps[0].evidence[0].metadata == {}
+
+
+def _commander_tool_result(step_id: str, commander_slug: str, title: str) -> ToolResult:
+    return ToolResult.model_validate(
+        {
+            "step_id": step_id,
+            "tool_name": "get_commander_details",
+            "metadata": {"commander_slug": commander_slug},
+            "hydrated_evidence": [
+                {
+                    "item_id": commander_slug,
+                    "tool_name": "get_commander_details",
+                    "title": title,
+                    "summary": f"{title} deck context.",
+                }
+            ],
+        }
+    )
+
+
+def test_evidence_index_matches_full_rebuild() -> None:
+    tool_results = [
+        _commander_tool_result("main_agent:P1E1", "uril-the-miststalker", "Uril, the Miststalker"),
+        _commander_tool_result("main_agent:P2E1", "sigarda-host-of-herons", "Sigarda, Host of Herons"),
+    ]
+    index = EvidenceIndex()
+    for tool_result in tool_results:
+        index.record(tool_result)
+
+    bundle = build_evidence_bundle_from_tool_results(tool_results)
+    expected_steps = build_evidence_steps_from_tool_results(tool_results, bundle.evidence_views_by_step_id)
+
+    assert index.to_bundle() == bundle
+    assert index.evidence_steps() == expected_steps
+
+
+def test_evidence_index_sync_only_indexes_new_step_ids() -> None:
+    first = _commander_tool_result("main_agent:P1E1", "uril-the-miststalker", "Uril, the Miststalker")
+    second = _commander_tool_result("main_agent:P2E1", "sigarda-host-of-herons", "Sigarda, Host of Herons")
+    index = EvidenceIndex()
+    index.record(first)
+    indexed_first = index.entries_by_step_id["main_agent:P1E1"]
+
+    index.sync([first, second])
+
+    assert index.entries_by_step_id["main_agent:P1E1"] is indexed_first
+    assert list(index.entries_by_step_id) == ["main_agent:P1E1", "main_agent:P2E1"]
+
+    index.sync([second])
+
+    assert list(index.entries_by_step_id) == ["main_agent:P2E1"]
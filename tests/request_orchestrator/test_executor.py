@@ -23,7 +23,7 @@ from request_orchestrator.models.evidence import EvidenceView, HydratedEvidence,
 from request_orchestrator.models.plan import Plan
 from request_orchestrator.models.plan_step_ids import format_plan_step_id, namespace_step_id
 from request_orchestrator.shared.evidence import build_evidence_bundle_from_tool_results
-from request_orchestrator.shared.executor.executor import run_executor
+from request_orchestrator.shared.executor.executor import attach_late_tool_results, run_executor
 from request_orchestrator.shared.runtime_context import bind_runtime_context, get_current_conversation_id, get_current_roundtrip_id, get_current_user_id
 
 
@@ -309,3 +309,119 @@ def test_run_executor_propagates_runtime_context_to_worker_threads() -> None:
         "roundtrip_id": "roundtrip-456",
         "user_id": "user-789",
     }
+
+
+def test_run_executor_records_timed_out_step_and_keeps_finished_results() -> None:
+    profile = AgentProfile(
+        name="test_agent",
+        scope=MAIN_AGENT_MODEL_SCOPE,
+        extra_tools=[
+            SimpleNamespace(name="fast_tool"),
+            SimpleNamespace(name="slow_tool"),
+        ],
+        tool_timeout_overrides={"slow_tool": 0.05},
+        attach_late_tool_results=False,
+    )
+    state = AgentState.new(
+        task="Run tools",
+        llm=object(),
+        agent_profile=profile,
+        execution_context=AgentExecutionContext.new(conversation_id=str(uuid4())),
+    )
+    _set_plan_state(
+        state,
+        plan=Plan.model_validate(
+            {
+                "steps": [
+                    {"id": "E1", "plan": "Run slow tool", "tool": "slow_tool", "args": {}},
+                    {"id": "E2", "plan": "Run fast tool", "tool": "fast_tool", "args": {}},
+                ]
+            }
+        ),
+    )
+    released = threading.Event()
+
+    def fake_call_tool(name: str, tool_input=None, allowed_tool_names=None):
+        if name == "slow_tool":
+            released.wait(timeout=2.0)
+        return ToolResult(result={"tool": name})
+
+    started_at = time.monotonic()
+    try:
+        with patch(
+            "request_orchestrator.shared.executor.executor.call_tool",
+            side_effect=fake_call_tool,
+        ), patch(
+            'common.logging.conversation_event_logger.get_conversation_repo',
+            return_value=RecordingRepo(),
+        ) as repo_getter:
+            run_executor(state)
+    finally:
+        released.set()
+
+    assert time.monotonic() - started_at < 1.0
+    current_results = state.result.tool_results_by_step_id()
+    assert current_results["test_agent:P1E1"].result["error"] == "Tool 'slow_tool' timed out after 0.05s"
+    assert current_results["test_agent:P1E1"].result["timed_out"] is True
+    assert current_results["test_agent:P1E2"].result == {"tool": "fast_tool"}
+    assert state.pending_step_executions == []
+    timed_out_flags = {
+        event["payload"]["tool_name"]: event["payload"]["data"]["timed_out"]
+        for event in repo_getter.return_value.conversation_events
+    }
+    assert timed_out_flags == {"slow_tool": True, "fast_tool": False}
+
+
+def test_attach_late_tool_results_replaces_timed_out_result_once_finished() -> None:
+    profile = AgentProfile(
+        name="test_agent",
+        scope=MAIN_AGENT_MODEL_SCOPE,
+        extra_tools=[SimpleNamespace(name="slow_tool")],
+        tool_timeout_seconds=None,
+        iteration_timeout_seconds=0.05,
+    )
+    state = AgentState.new(
+        task="Run tools",
+        llm=object(),
+        agent_profile=profile,
+        execution_context=AgentExecutionContext.new(conversation_id=str(uuid4()), roundtrip_id=uuid4()),
+    )
+    _set_plan_state(
+        state,
+        plan=Plan.model_validate(
+            {"steps": [{"id": "E1", "plan": "Run slow tool", "tool": "slow_tool", "args": {"value": "a"}}]}
+        ),
+    )
+    released = threading.Event()
+
+    def fake_call_tool(name: str, tool_input=None, allowed_tool_names=None):
+        released.wait(timeout=2.0)
+        return ToolResult(result={"tool": name, **(tool_input or {})})
+
+    with patch(
+        "request_orchestrator.shared.executor.executor.call_tool",
+        side_effect=fake_call_tool,
+    ), patch(
+        "request_orchestrator.shared.executor.executor.ToolCallRepository",
+    ) as tool_repo_class, patch(
+        'common.logging.conversation_event_logger.get_conversation_repo',
+        return_value=RecordingRepo(),
+    ) as repo_getter:
+        tool_repo_class.return_value.update_tool_call_result.return_value = True
+        run_executor(state)
+        assert state.result.tool_results_by_step_id()["test_agent:P1E1"].result["timed_out"] is True
+        assert len(state.pending_step_executions) == 1
+
+        released.set()
+        state.pending_step_executions[0].future.result(timeout=2.0)
+        attach_late_tool_results(state)
+
+    late_result = state.result.tool_results_by_step_id()["test_agent:P1E1"]
+    assert late_result.result == {"tool": "slow_tool", "value": "a"}
+    assert late_result.step_id == "test_agent:P1E1"
+    assert state.pending_step_executions == []
+    assert [event["payload"]["data"]["late"] for event in repo_getter.return_value.conversation_events] == [False, True]
+    tool_repo = tool_repo_class.return_value
+    assert tool_repo.append_tool_call.call_count == 1
+    tool_repo.update_tool_call_result.assert_called_once()
+    assert tool_repo.update_tool_call_result.call_args.kwargs["error_message"] is None
@@ -93,3 +93,98 @@ def test_get_memory_detail_rejects_invalid_roundtrip_id() -> None:
     }
     assert result.evidence_views == []
     assert result.hydrated_evidence == []
+
+
+def test_recall_memories_ranks_all_memory_types_from_one_embedding() -> None:
+    from conversation.models.conversation_models import MemoryIndexHit
+
+    conversation_id = uuid4()
+    roundtrip_id = uuid4()
+    hits = [
+        MemoryIndexHit(
+            memory_type="roundtrip",
+            memory_id=str(roundtrip_id),
+            title="Memory from message 3",
+            summary="Decided on 30-day returns.",
+            occurred_at="2026-08-01 12:00:00+00:00",
+            similarity=0.91,
+            recency=0.8,
+            score=0.86,
+            conversation_id=conversation_id,
+            roundtrip_id=roundtrip_id,
+            message_index=3,
+        ),
+        MemoryIndexHit(
+            memory_type="user_attribute",
+            memory_id=str(uuid4()),
+            title="food.likes",
+            summary="ramen; sushi",
+            occurred_at="2026-07-01 12:00:00+00:00",
+            similarity=0.7,
+            recency=0.5,
+            score=0.6,
+            importance=0.9,
+        ),
+    ]
+
+    class FakeMemoryIndexRepo:
+        def __init__(self) -> None:
+            self.calls: list[dict] = []
+
+        def search(self, query_embedding, **kwargs):
+            self.calls.append({"query_embedding": query_embedding, **kwargs})
+            return hits
+
+    module = importlib.import_module("request_orchestrator.shared.tool_adapter.memories.recall_memories")
+    fake_repo = FakeMemoryIndexRepo()
+    embedded: list[str] = []
+    original_repo_getter = module.get_memory_index_repo
+    original_embed = module.embed_query
+    module.get_memory_index_repo = lambda: fake_repo
+    module.embed_query = lambda text: embedded.append(text) or [0.5, 0.5]
+    try:
+        with bind_runtime_context(
+            conversation_id="conversation-1",
+            conversation_model_config=None,
+            roundtrip_id="roundtrip-1",
+            user_id="user-123",
+        ):
+            result = module.recall_memories.invoke({"query": "return policy", "limit": 4})
+    finally:
+        module.get_memory_index_repo = original_repo_getter
+        module.embed_query = original_embed
+
+    assert embedded == ["return policy"]
+    assert fake_repo.calls == [
+        {"query_embedding": [0.5, 0.5], "user_id": "user-123", "limit": 4, "include_attributes": True}
+    ]
+    assert [view.item_id for view in result.evidence_views] == [str(roundtrip_id), hits[1].memory_id]
+    assert result.evidence_views[0].metadata == {
+        "memory_type": "roundtrip",
+        "conversation_id": str(conversation_id),
+        "roundtrip_id": str(roundtrip_id),
+        "message_index": 3,
+        "similarity": 0.91,
+        "recency": 0.8,
+        "relevance_score": 0.86,
+    }
+    assert result.evidence_views[1].metadata["importance"] == 0.9
+
+
+def test_embed_query_reuses_the_embedding_for_a_repeated_query() -> None:
+    from llm.clients import embeddings
+
+    calls: list[str] = []
+    original_embed_text = embeddings.embed_text
+    embeddings.embed_text = lambda text: calls.append(text) or [float(len(calls))]
+    embeddings._cached_query_embedding.cache_clear()
+    try:
+        first = embeddings.embed_query("  hiking boots ")
+        first.append(99.0)
+        second = embeddings.embed_query("hiking boots")
+    finally:
+        embeddings.embed_text = original_embed_text
+        embeddings._cached_query_embedding.cache_clear()
+
+    assert calls == ["hiking boots"]
+    assert second == [1.0]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import sys
 from types import ModuleType, SimpleNamespace
+from unittest.mock import patch
 
 if "yfinance" not in sys.modules:
     sys.modules["yfinance"] = ModuleType("yfinance")
@@ -11,7 +12,9 @@ if "pycountry" not in sys.modules:
     pycountry_module.countries = SimpleNamespace(lookup=lambda value: SimpleNamespace(alpha_2=str(value).upper()))
     sys.modules["pycountry"] = pycountry_module
 
+from products.models.product_facets import ProductFacets, ProductFacetValue
 from request_orchestrator.agents.main_agent.profile import MAIN_AGENT_PROFILE
+from request_orchestrator.models.agent_inputs import AgentInputs
 from request_orchestrator.models.agent_prompt import PromptSectionKeys
 from request_orchestrator.models.agent_state import AgentState
 from request_orchestrator.models.evidence import EvidenceView, HydratedEvidence, ToolResult
@@ -72,3 +75,19 @@ def test_planner_prompt_exposes_top_level_evidence_views_not_tool_results() -> N
     assert evidence_section[0]["evidence"][0]["summary"] == "Short evidence summary."
     assert evidence_section[0]["evidence"][0]["metadata"] == {"kind": "web"}
     assert "secret" not in str(evidence_section)
+
+
+def test_planner_prompt_lists_catalog_facets_in_product_rules() -> None:
+    state = AgentState.new(
+        task="Find a red jacket",
+        inputs=AgentInputs.new(task="Find a red jacket", tool_category_names=["products"]),
+        llm=object(),
+        agent_profile=MAIN_AGENT_PROFILE,
+    )
+    facets = ProductFacets(values={"color": (ProductFacetValue("Red", 42),)})
+
+    with patch("products.facets.get_product_facets", return_value=facets):
+        rules = build_planner_prompt(state).to_log_input_object()["sections_raw"][PromptSectionKeys.RULES]
+
+    assert "products Rules:" in rules
+    assert "Catalog filter values (product counts): color: Red (42)." in rules
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import importlib
+import math
+import sys
+from types import ModuleType, SimpleNamespace
+
+if 'yfinance' not in sys.modules:
+    sys.modules['yfinance'] = ModuleType('yfinance')
+
+if 'pycountry' not in sys.modules:
+    pycountry_module = ModuleType('pycountry')
+    pycountry_module.countries = SimpleNamespace(lookup=lambda value: SimpleNamespace(alpha_2=str(value).upper()))
+    sys.modules['pycountry'] = pycountry_module
+
+import numpy as np
+
+from integrations.frankfurter.models import ExchangeRatesSeries
+from integrations.open_meteo.models import DailyWeather, MonthlyWeatherSummary
+from request_orchestrator.shared.tool_adapter.finance.exchange_rates_time_series import exchange_rates_time_series
+from request_orchestrator.shared.tool_adapter.series import SERIES_STORE_BACKEND_POSTGRES, SeriesStore, get_series_store, lttb_indices, summarize_series
+from request_orchestrator.shared.tool_adapter.timeseries.get_series_points import get_series_points
+from request_orchestrator.shared.tool_adapter.weather.get_historical_month_weather import get_historical_month_weather
+
+
+def test_lttb_keeps_endpoints_and_extremes_within_budget() -> None:
+    values = np.sin(np.linspace(0, 4 * math.pi, 500))
+    values[137] = 5.0
+
+    indices = lttb_indices(values, 20)
+
+    assert len(indices) == 20
+    assert indices[0] == 0
+    assert indices[-1] == 499
+    assert 137 in indices.tolist()
+    assert np.all(np.diff(indices) > 0)
+    assert lttb_indices(values[:5], 20).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_summarize_series_reports_stats_and_stores_full_resolution() -> None:
+    xs = [f"2024-01-{day:02d}" for day in range(1, 31)]
+    ys: list[float | None] = [float(day) for day in range(1, 31)]
+    ys[3] = None
+
+    summary = summarize_series("USD", xs, ys, tool_name="example_tool", point_budget=5)
+
+    assert summary.stats is not None
+    assert summary.stats.count == 29
+    assert (summary.stats.min, summary.stats.max, summary.stats.first, summary.stats.last) == (1.0, 30.0, 1.0, 30.0)
+    assert summary.stats.trend_per_step is not None and summary.stats.trend_per_step > 0
+    assert len(summary.points) == 5
+    assert summary.downsampled is True
+    stored = get_series_store().get(summary.series_id)
+    assert stored is not None
+    assert len(stored.xs) == 29
+    assert "2024-01-04" not in stored.xs
+
+
+def test_exchange_rates_time_series_returns_per_currency_summaries() -> None:
+    module = importlib.import_module("request_orchestrator.shared.tool_adapter.finance.exchange_rates_time_series")
+    date_keys = [f"2024-{month:02d}-{day:02d}" for month in range(1, 13) for day in (1, 8, 15, 22)]
+
+    class FakeFrankfurterClient:
+        def get_time_series(self, start_date, end_date=None, base="EUR", symbols=None):
+            return ExchangeRatesSeries(
+                base="EUR",
+                start_date=date_keys[0],
+                end_date=date_keys[-1],
+                rates={date_key: {"USD": 1.0 + index / 100, "GBP": 0.85} for index, date_key in enumerate(date_keys)},
+            )
+
+    original_client = module._exchange_rates_client
+    module._exchange_rates_client = FakeFrankfurterClient()
+    try:
+        result = exchange_rates_time_series.invoke({"start_date": "2024-01-01", "end_date": "2024-12-31"})
+    finally:
+        module._exchange_rates_client = original_client
+
+    assert [summary.label for summary in result.result.currencies] == ["USD", "GBP"]
+    assert len(result.hydrated_evidence) == 2
+    usd = result.result.currencies[0]
+    assert len(usd.points) == module.point_budget_for_tool("exchange_rates_time_series")
+    assert result.hydrated_evidence[0].metadata["series_id"] == usd.series_id
+    assert result.hydrated_evidence[0].summary.startswith("1 EUR in USD from 2024-01-01 to 2024-12-22 (48 points)")
+
+
+def test_historical_month_weather_replaces_daily_arrays_with_summaries() -> None:
+    module = importlib.import_module("request_orchestrator.shared.tool_adapter.weather.get_historical_month_weather")
+    dates = [f"2024-02-{day:02d}" for day in range(1, 30)]
+
+    class FakeOpenMeteoClient:
+        def get_historical_month(self, city, year, month):
+            return MonthlyWeatherSummary(
+                city="Toronto",
+                country="Canada",
+                year=year,
+                month=month,
+                days_count=len(dates),
+                avg_temp_max_c=1.5,
+                avg_temp_min_c=-6.2,
+                total_precip_mm=48.0,
+                avg_wind_max_kmh=22.0,
+                daily=DailyWeather(
+                    date=dates,
+                    temperature_2m_max=[float(day % 7) for day in range(29)],
+                    temperature_2m_min=[-float(day % 5) for day in range(29)],
+                    precipitation_sum=[0.0] * 29,
+                    windspeed_10m_max=[20.0] * 29,
+                ),
+            )
+
+    original_client = module._weather_client
+    module._weather_client = FakeOpenMeteoClient()
+    try:
+        result = get_historical_month_weather.invoke({"city": "Toronto", "year": 2024, "month": 2})
+    finally:
+        module._weather_client = original_client
+
+    assert "daily" not in result.result.model_dump()
+    assert [series.label for series in result.result.daily_series] == [
+        "temperature_2m_max",
+        "temperature_2m_min",
+        "precipitation_sum",
+        "windspeed_10m_max",
+    ]
+    assert all(len(series.points) <= 8 for series in result.result.daily_series)
+    assert result.hydrated_evidence[0].location_name == "Toronto, Canada"
+    assert result.hydrated_evidence[0].summary == (
+        "Toronto, Canada historical weather for 2024-02: average high 1.5°C, average low -6.2°C, total precipitation 48.0 mm."
+    )
+
+
+def test_get_series_points_reads_a_window_of_the_stored_series() -> None:
+    xs = [f"2024-{month:02d}-{day:02d}" for month in (1, 2, 3) for day in range(1, 29)]
+    summary = summarize_series("AAPL close", xs, [float(index) for index in range(len(xs))], tool_name="example_tool", point_budget=5)
+
+    result = get_series_points.invoke({"series_id": summary.series_id, "start": "2024-02-01", "end": "2024-02-28"})
+
+    window = result.result.series
+    assert (window.start, window.end) == ("2024-02-01", "2024-02-28")
+    assert window.stats.count == 28
+    assert len(window.points) == 28 and window.downsampled is False
+    assert window.points[9].y == 37.0
+    assert result.hydrated_evidence[0].metadata["series_id"] == summary.series_id
+
+    missing = get_series_points.invoke({"series_id": "series_missing"})
+    assert missing.result.error and missing.hydrated_evidence == []
+
+
+def test_series_store_writes_through_and_reads_back_from_the_shared_tier() -> None:
+    class FakeSeriesRepository:
+        def __init__(self) -> None:
+            self.rows: dict[str, tuple[str, list[str], list[float]]] = {}
+
+        def get(self, series_id):
+            return self.rows.get(series_id)
+
+        def put(self, series_id, label, xs, ys, ttl):
+            self.rows[series_id] = (label, list(xs), list(ys))
+
+    repository = FakeSeriesRepository()
+    SeriesStore(SERIES_STORE_BACKEND_POSTGRES, repository=repository).put("series_a", "AAPL close", ["2024-01-01"], [1.5])
+
+    # A fresh store (another worker, or after a restart) finds the series in the shared tier.
+    stored = SeriesStore(SERIES_STORE_BACKEND_POSTGRES, repository=repository, max_entries=1).get("series_a")
+
+    assert stored is not None
+    assert (stored.label, stored.xs, stored.ys) == ("AAPL close", ("2024-01-01",), (1.5,))
+    assert SeriesStore(repository=repository).get("series_a") is None
@@ -13,10 +13,16 @@ if 'pycountry' not in sys.modules:
     pycountry_module.countries = SimpleNamespace(lookup=lambda value: SimpleNamespace(alpha_2=str(value).upper()))
     sys.modules['pycountry'] = pycountry_module
 
-from common.http import HttpClientError
+import pytest
+
+from common.http import HttpClientError, InProcessRateLimiter, parse_retry_after
+from common.http import rate_limiter as rate_limiter_module
+from llm.conversation_model_config import ConversationModelConfig
+from request_orchestrator.models.evidence import ToolResult
+from request_orchestrator.shared.runtime_context import bind_runtime_context
 from requests.exceptions import Timeout
-from tool.registry.global_registry import ToolRegistry
-from tool.models import RateLimitPolicy, RetryPolicy, Tool
+from tool.registry.global_registry import ToolRegistry, ToolRegistryError
+from tool.models import CACHE_SCOPE_CONVERSATION, CACHE_SCOPE_ROUNDTRIP, CachePolicy, RateLimitPolicy, RetryPolicy, Tool
 
 
 class _FakeTool:
@@ -128,3 +134,136 @@ def test_tool_registry_retries_wrapped_http_429_when_policy_allows() -> None:
 
     assert result == {"ok": True}
     assert attempts == 2
+
+
+def test_tool_registry_memoizes_results_for_canonical_args() -> None:
+    registry = ToolRegistry()
+    attempts = 0
+
+    def callback(tool_input):
+        nonlocal attempts
+        attempts += 1
+        return ToolResult(result={"city": tool_input["city"], "attempt": attempts})
+
+    registry.register(
+        Tool(
+            _FakeTool("resolve_city_location", callback),
+            cache_policy=CachePolicy(ttl_seconds=60.0, scope=CACHE_SCOPE_CONVERSATION),
+        )
+    )
+
+    with bind_runtime_context(conversation_id="conversation-1", conversation_model_config=ConversationModelConfig.build_default()):
+        first = registry.call_tool("resolve_city_location", {"city": "Lisbon", "country": "PT"})
+        second = registry.call_tool("resolve_city_location", {"country": "PT", "city": "Lisbon"})
+    with bind_runtime_context(conversation_id="conversation-2", conversation_model_config=ConversationModelConfig.build_default()):
+        third = registry.call_tool("resolve_city_location", {"city": "Lisbon", "country": "PT"})
+
+    assert attempts == 2
+    assert first.cache_hit is False
+    assert second.cache_hit is True
+    assert second.result == first.result
+    assert second is not first
+    assert third.cache_hit is False
+    assert "cache_hit" not in second.model_dump()
+
+
+def test_tool_registry_skips_cache_without_scope_id_or_on_error() -> None:
+    registry = ToolRegistry()
+    attempts = 0
+
+    def callback(_tool_input):
+        nonlocal attempts
+        attempts += 1
+        return ToolResult.error("upstream unavailable")
+
+    registry.register(
+        Tool(
+            _FakeTool("get_current_weather", callback),
+            cache_policy=CachePolicy(ttl_seconds=60.0, scope=CACHE_SCOPE_ROUNDTRIP),
+        )
+    )
+
+    registry.call_tool("get_current_weather", {"city": "Lisbon"})
+    with bind_runtime_context(conversation_id="conversation-1", conversation_model_config=None, roundtrip_id="roundtrip-1"):
+        registry.call_tool("get_current_weather", {"city": "Lisbon"})
+        registry.call_tool("get_current_weather", {"city": "Lisbon"})
+
+    assert attempts == 3
+
+
+def test_tool_registry_rejects_cache_policy_on_side_effecting_tool() -> None:
+    registry = ToolRegistry()
+
+    with pytest.raises(ToolRegistryError):
+        registry.register(
+            Tool(
+                _FakeTool("update_user_attribute", lambda _tool_input: {}),
+                cache_policy=CachePolicy(ttl_seconds=60.0),
+                side_effects=True,
+            )
+        )
+
+
+def test_in_process_rate_limiter_allows_burst_then_queues() -> None:
+    limiter = InProcessRateLimiter()
+    policy = RateLimitPolicy(max_requests=2, window_seconds=0.1)
+
+    waits = [limiter.acquire("scryfall", policy) for _ in range(3)]
+
+    assert waits[0] == 0.0
+    assert waits[1] == 0.0
+    assert 0.03 <= waits[2] <= 0.06
+
+
+def test_tool_registry_honors_retry_after_on_http_429() -> None:
+    limiter = InProcessRateLimiter()
+    registry = ToolRegistry(rate_limiter=limiter)
+    call_times: list[float] = []
+
+    def callback(_tool_input):
+        call_times.append(time.monotonic())
+        if len(call_times) == 1:
+            raise HttpClientError("HTTP 429 on https://example.com: rate limited", status_code=429, retry_after_seconds=0.05)
+        return {"ok": True}
+
+    registry.register(
+        Tool(
+            _FakeTool("retry_tool", callback),
+            rate_limit_key="example",
+            rate_limit_policy=RateLimitPolicy(max_requests=10, window_seconds=1.0),
+            retry_policy=RetryPolicy(max_attempts=2, backoff_seconds=0.0),
+        )
+    )
+
+    result = registry.call_tool("retry_tool", {})
+
+    assert result == {"ok": True}
+    assert call_times[1] - call_times[0] >= 0.045
+
+
+def test_rate_limiter_cools_down_after_a_429_without_retry_after(monkeypatch) -> None:
+    monkeypatch.setattr(rate_limiter_module, "RATE_LIMIT_DEFAULT_COOLDOWN_SECONDS", 0.05)
+    limiter = InProcessRateLimiter()
+    policy = RateLimitPolicy(max_requests=100, window_seconds=1.0)
+    limiter.acquire("example", policy)
+
+    limiter.penalize("example", None)
+
+    assert 0.03 <= limiter.acquire("example", policy) <= 0.06
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates() -> None:
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_retry_policy_backoff_grows_exponentially_with_jitter() -> None:
+    policy = RetryPolicy(max_attempts=5, backoff_seconds=1.0, max_backoff_seconds=3.0)
+
+    for attempt, ceiling in ((1, 1.0), (2, 2.0), (3, 3.0), (4, 3.0)):
+        backoff_seconds = policy.backoff_for_attempt(attempt)
+        assert ceiling / 2 <= backoff_seconds <= ceiling
+
+    assert RetryPolicy(backoff_seconds=1.0, jitter=False).backoff_for_attempt(2) == 2.0
@@ -4,10 +4,12 @@ TOOL_NAME_FIND_PRODUCTS_WEB = "find_products_web"
 TOOL_NAME_RESOLVE_CITY_LOCATION = "resolve_city_location"
 TOOL_NAME_GET_CURRENT_WEATHER = "get_current_weather"
 TOOL_NAME_GET_HISTORICAL_MONTH_WEATHER = "get_historical_month_weather"
+TOOL_NAME_GET_HISTORICAL_WEATHER_RANGE = "get_historical_weather_range"
 TOOL_NAME_EXCHANGE_RATES_LOOKUP = "exchange_rates_lookup"
 TOOL_NAME_EXCHANGE_RATES_TIME_SERIES = "exchange_rates_time_series"
 TOOL_NAME_GET_LATEST_EXCHANGE_RATES = "get_latest_exchange_rates"
 TOOL_NAME_GET_STOCK_PRICE = "get_stock_price"
+TOOL_NAME_GET_STOCK_PRICES = "get_stock_prices"
 TOOL_NAME_GET_CRYPTO_MARKETS = "get_crypto_markets"
 TOOL_NAME_GENERIC_WEB_SEARCH = "generic_web_search"
 TOOL_NAME_NEWS_SEARCH = "news_search"
@@ -26,6 +28,7 @@ TOOL_NAME_GET_ADVICE = "get_advice"
 TOOL_NAME_GET_QUOTE = "get_quote"
 TOOL_NAME_GET_ASTRONOMY_PICTURE = "get_astronomy_picture"
 TOOL_NAME_CALCULATE = "calculate"
+TOOL_NAME_GET_SERIES_POINTS = "get_series_points"
 TOOL_NAME_SEARCH_MAGIC_CARDS = "search_magic_cards"
 TOOL_NAME_GET_MAGIC_CARD_RULINGS = "get_magic_card_rulings"
 TOOL_NAME_GET_COMMANDER_DETAILS = "get_commander_details"
@@ -33,6 +36,7 @@ TOOL_NAME_GET_COMMANDER_CARDS = "get_commander_cards"
 TOOL_NAME_SEARCH_MEMORIES = "search_memories"
 TOOL_NAME_SEARCH_ROUNDTRIP_MEMORIES = "search_roundtrip_memories"
 TOOL_NAME_GET_MEMORY_DETAIL = "get_memory_detail"
+TOOL_NAME_RECALL_MEMORIES = "recall_memories"
 TOOL_NAME_CREATE_USER_ATTRIBUTE = "create_user_attribute"
 TOOL_NAME_UPDATE_USER_ATTRIBUTE = "update_user_attribute"
 TOOL_NAME_GET_USER_ATTRIBUTES = "get_user_attributes"
@@ -67,6 +71,7 @@ TOOL_RESULT_TYPE_ADVICE = "advice"
 TOOL_RESULT_TYPE_QUOTE = "quote"
 TOOL_RESULT_TYPE_ASTRONOMY_PICTURE = "astronomy_picture"
 TOOL_RESULT_TYPE_CALCULATION = "calculation"
+TOOL_RESULT_TYPE_SERIES = "series"
 TOOL_RESULT_TYPE_CARD_RESULTS = "card_results"
 TOOL_RESULT_TYPE_RULES = "rules"
 TOOL_RESULT_TYPE_DECKS = "decks"
@@ -1,7 +1,19 @@
 from tool.models.tool_category import ToolCategory
-from tool.models.tool_definition import RateLimitPolicy, RetryPolicy, Tool
+from tool.models.tool_definition import (
+    CACHE_SCOPE_CONVERSATION,
+    CACHE_SCOPE_GLOBAL,
+    CACHE_SCOPE_ROUNDTRIP,
+    CachePolicy,
+    RateLimitPolicy,
+    RetryPolicy,
+    Tool,
+)
 
 __all__ = [
+    "CACHE_SCOPE_CONVERSATION",
+    "CACHE_SCOPE_GLOBAL",
+    "CACHE_SCOPE_ROUNDTRIP",
+    "CachePolicy",
     "RateLimitPolicy",
     "RetryPolicy",
     "Tool",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Callable, Optional
 
 
 @dataclass
@@ -9,3 +10,10 @@ class ToolCategory:
     description: str
     rules: list[str] = field(default_factory=list)
     result_rules: list[str] = field(default_factory=list)
+    # Extra planner rules computed when the prompt is built, e.g. from live catalog data.
+    dynamic_rules: Optional[Callable[[], list[str]]] = None
+
+    def planner_rules(self) -> list[str]:
+        if self.dynamic_rules is None:
+            return list(self.rules)
+        return [*self.rules, *self.dynamic_rules()]
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass, field
 from typing import Any
 
+from common.http.rate_limiter import RateLimitPolicy
+
 
 @dataclass(frozen=True)
 class RetryPolicy:
@@ -11,12 +14,25 @@ class RetryPolicy:
     retry_on_429: bool = True
     retry_on_5xx: bool = True
     backoff_seconds: float = 1.0
+    max_backoff_seconds: float = 10.0
+    jitter: bool = True
+
+    def backoff_for_attempt(self, attempt: int) -> float:
+        backoff_seconds = min(max(0.0, self.max_backoff_seconds), max(0.0, self.backoff_seconds) * 2 ** max(0, attempt - 1))
+        if self.jitter and backoff_seconds > 0:
+            return random.uniform(backoff_seconds / 2, backoff_seconds)
+        return backoff_seconds
+
+
+CACHE_SCOPE_ROUNDTRIP = "roundtrip"
+CACHE_SCOPE_CONVERSATION = "conversation"
+CACHE_SCOPE_GLOBAL = "global"
 
 
 @dataclass(frozen=True)
-class RateLimitPolicy:
-    max_requests: int
-    window_seconds: float
+class CachePolicy:
+    ttl_seconds: float
+    scope: str = CACHE_SCOPE_CONVERSATION
 
 
 @dataclass(frozen=True)
@@ -26,6 +42,9 @@ class Tool:
     rate_limit_key: str | None = None
     retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
     rate_limit_policy: RateLimitPolicy | None = None
+    cache_policy: CachePolicy | None = None
+    side_effects: bool = False
+    timeout_seconds: float | None = None
 
     @property
     def name(self) -> str:
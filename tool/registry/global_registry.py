@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-from collections import defaultdict, deque
-from dataclasses import dataclass, field
-from threading import Lock
-from time import monotonic, sleep
+import re
+from time import sleep
 from typing import Any
 
-from common.http import HttpClientError
+from common.http import HttpClientError, RateLimiter, get_rate_limiter
 from rendering.debug import emit_debug_message
+from tool.registry.tool_result_cache import ToolResultCache
 from tool.tools import tools
 from requests.exceptions import Timeout
 
 
+_HTTP_STATUS_PATTERN = re.compile(r"\bHTTP (\d{3})\b")
+
+
 class ToolRegistryError(Exception):
     pass
 
@@ -24,16 +26,31 @@ class DisallowedToolError(ToolRegistryError):
     pass
 
 
-@dataclass
-class _RateLimitState:
-    lock: Lock = field(default_factory=Lock)
-    request_timestamps: deque[float] = field(default_factory=deque)
+def _retry_after_seconds(exc: BaseException | None) -> float | None:
+    while exc is not None:
+        retry_after_seconds = getattr(exc, "retry_after_seconds", None)
+        if isinstance(retry_after_seconds, (int, float)):
+            return float(retry_after_seconds)
+        exc = exc.__cause__
+    return None
+
+
+def _http_status_code(exc: BaseException | None) -> int | None:
+    message = str(exc)
+    while exc is not None:
+        if isinstance(exc, HttpClientError) and exc.status_code is not None:
+            return exc.status_code
+        exc = exc.__cause__
+    # Integration wrappers sometimes re-raise without chaining; fall back to the message format.
+    match = _HTTP_STATUS_PATTERN.search(message)
+    return int(match.group(1)) if match else None
 
 
 class ToolRegistry:
-    def __init__(self) -> None:
+    def __init__(self, rate_limiter: RateLimiter | None = None) -> None:
         self._tools: dict[str, Any] = {}
-        self._rate_limit_states: dict[str, _RateLimitState] = defaultdict(_RateLimitState)
+        self._rate_limiter = rate_limiter
+        self._result_cache = ToolResultCache()
 
     def register(self, tool: Any) -> None:
         name = getattr(tool, "name", None)
@@ -42,36 +59,38 @@ class ToolRegistry:
             raise ToolRegistryError("Tool must define a non-empty string name.")
         if not callable(invoke):
             raise ToolRegistryError(f"Tool '{name}' must expose an invoke method.")
+        if getattr(tool, "cache_policy", None) is not None and getattr(tool, "side_effects", False):
+            raise ToolRegistryError(f"Tool '{name}' has side effects and cannot define a cache policy.")
         self._tools[name] = tool
 
+    def clear_result_cache(self) -> None:
+        self._result_cache.clear()
+
     def get(self, name: str) -> Any:
         tool = self._tools.get(name)
         if tool is None:
             raise UnknownToolError(f"Unknown tool '{name}'.")
         return tool
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        if self._rate_limiter is None:
+            self._rate_limiter = get_rate_limiter()
+        return self._rate_limiter
+
     def _acquire_rate_limit_slot(self, tool: Any) -> None:
         rate_limit_key = getattr(tool, "rate_limit_key", None)
         rate_limit_policy = getattr(tool, "rate_limit_policy", None)
         if not rate_limit_key or rate_limit_policy is None:
             return
+        self.rate_limiter.acquire(rate_limit_key, rate_limit_policy)
 
-        state = self._rate_limit_states[rate_limit_key]
-        while True:
-            with state.lock:
-                now = monotonic()
-                cutoff = now - rate_limit_policy.window_seconds
-                while state.request_timestamps and state.request_timestamps[0] <= cutoff:
-                    state.request_timestamps.popleft()
-
-                if len(state.request_timestamps) < rate_limit_policy.max_requests:
-                    state.request_timestamps.append(now)
-                    return
-
-                wait_seconds = max(0.0, state.request_timestamps[0] + rate_limit_policy.window_seconds - now)
-
-            if wait_seconds > 0:
-                sleep(wait_seconds)
+    def _record_throttle(self, exc: Exception, tool: Any) -> float:
+        retry_after_seconds = _retry_after_seconds(exc)
+        rate_limit_key = getattr(tool, "rate_limit_key", None)
+        if rate_limit_key and _http_status_code(exc) == 429:
+            self.rate_limiter.penalize(rate_limit_key, retry_after_seconds)
+        return retry_after_seconds or 0.0
 
     @staticmethod
     def _should_retry(exc: Exception, tool: Any) -> bool:
@@ -80,30 +99,38 @@ class ToolRegistry:
             return False
         if retry_policy.retry_on_timeout and isinstance(exc, Timeout):
             return True
-        message = str(exc)
-        if isinstance(exc, HttpClientError) or "HTTP " in message:
-            if retry_policy.retry_on_429 and "HTTP 429" in message:
-                return True
-            if retry_policy.retry_on_5xx and any(f"HTTP {status}" in message for status in range(500, 600)):
+        status_code = _http_status_code(exc)
+        if status_code is not None:
+            if retry_policy.retry_on_429 and status_code == 429:
                 return True
+            return retry_policy.retry_on_5xx and 500 <= status_code < 600
         return False
 
     def call_tool(self, name: str, tool_input: Any = None, *, allowed_tool_names: set[str] | None = None) -> Any:
         if allowed_tool_names is not None and name not in allowed_tool_names:
             raise DisallowedToolError(f"Tool '{name}' is not allowed for this agent.")
         tool = self.get(name)
+        cache_policy = None if getattr(tool, "side_effects", False) else getattr(tool, "cache_policy", None)
+        if cache_policy is not None:
+            cached = self._result_cache.get(name, tool_input, cache_policy)
+            if cached is not None:
+                return cached
         retry_policy = getattr(tool, "retry_policy", None)
         max_attempts = max(1, getattr(retry_policy, "max_attempts", 1))
         try:
             for attempt in range(1, max_attempts + 1):
                 self._acquire_rate_limit_slot(tool)
                 try:
-                    return tool.invoke(tool_input or {})
+                    output = tool.invoke(tool_input or {})
+                    if cache_policy is not None:
+                        self._result_cache.put(name, tool_input, cache_policy, output)
+                    return output
                 except Exception as exc:
+                    retry_after_seconds = self._record_throttle(exc, tool)
                     should_retry = attempt < max_attempts and self._should_retry(exc, tool)
                     if not should_retry:
                         raise
-                    backoff_seconds = max(0.0, getattr(retry_policy, "backoff_seconds", 0.0))
+                    backoff_seconds = max(retry_policy.backoff_for_attempt(attempt), retry_after_seconds)
                     if backoff_seconds > 0:
                         sleep(backoff_seconds)
         except Exception as exc:
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+from request_orchestrator.models.evidence import ToolResult
+from request_orchestrator.shared.runtime_context import get_current_conversation_id, get_current_roundtrip_id
+from tool.models import CACHE_SCOPE_CONVERSATION, CACHE_SCOPE_GLOBAL, CACHE_SCOPE_ROUNDTRIP, CachePolicy
+
+DEFAULT_TOOL_RESULT_CACHE_MAX_ENTRIES = 2048
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    tool_result: ToolResult
+    expires_at: float
+
+
+def canonicalize_tool_input(tool_input: Any) -> str:
+    canonical = json.dumps(tool_input or {}, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def resolve_cache_scope_id(scope: str) -> str | None:
+    if scope == CACHE_SCOPE_GLOBAL:
+        return ""
+    if scope == CACHE_SCOPE_CONVERSATION:
+        return get_current_conversation_id()
+    if scope == CACHE_SCOPE_ROUNDTRIP:
+        return get_current_roundtrip_id()
+    return None
+
+
+def _is_cacheable(output: Any) -> bool:
+    if not isinstance(output, ToolResult):
+        return False
+    return not (isinstance(output.result, dict) and "error" in output.result)
+
+
+class ToolResultCache:
+    def __init__(self, max_entries: int = DEFAULT_TOOL_RESULT_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[tuple[str, str, str, str], _CacheEntry] = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(name: str, tool_input: Any, policy: CachePolicy) -> tuple[str, str, str, str] | None:
+        scope_id = resolve_cache_scope_id(policy.scope)
+        if scope_id is None:
+            return None
+        return (policy.scope, scope_id, name, canonicalize_tool_input(tool_input))
+
+    def get(self, name: str, tool_input: Any, policy: CachePolicy) -> ToolResult | None:
+        key = self._key(name, tool_input, policy)
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return entry.tool_result.model_copy(deep=True, update={"cache_hit": True})
+
+    def put(self, name: str, tool_input: Any, policy: CachePolicy, output: Any) -> None:
+        if policy.ttl_seconds <= 0 or not _is_cacheable(output):
+            return
+        key = self._key(name, tool_input, policy)
+        if key is None:
+            return
+        entry = _CacheEntry(
+            tool_result=output.model_copy(deep=True),
+            expires_at=monotonic() + policy.ttl_seconds,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -8,7 +8,7 @@ from psycopg.rows import dict_row
 from psycopg.types.json import Jsonb
 from pydantic import BaseModel
 
-from db.connection import get_connection
+from db.connection import PooledConnection
 from request_orchestrator.models.plan import Plan
 from request_orchestrator.models.plan import PlanStep
 from tool.repository.models import ToolCall
@@ -16,7 +16,7 @@ from tool.repository.models import ToolCall
 
 class ToolCallRepository:
     def __init__(self):
-        self._conn = get_connection()
+        self._conn = PooledConnection()
 
     def append_tool_call(
         self,
@@ -68,6 +68,32 @@ class ToolCallRepository:
                 ),
             )
 
+    def update_tool_call_result(
+        self,
+        roundtrip_id: UUID,
+        step: PlanStep,
+        *,
+        output_payload: Any,
+        error_message: str | None = None,
+        duration_ms: int | None = None,
+    ) -> bool:
+        """Overwrite the row already recorded for `step`, e.g. a timed-out call whose result arrived late."""
+        output = self._sanitize_for_storage(output_payload)
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                """
+                UPDATE tool_calls
+                SET status = 'completed',
+                    output_payload = %s,
+                    error_message = %s,
+                    duration_ms = %s
+                WHERE roundtrip_id = %s
+                  AND plan_step_id = %s
+                """,
+                (Jsonb(output), error_message, duration_ms, roundtrip_id, step.db_id),
+            )
+            return cur.rowcount > 0
+
     def update_tool_call_summary(self, tool_call_id: UUID, summary: str) -> None:
         with self._conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
@@ -9,6 +9,7 @@ from request_orchestrator.shared.tool_adapter.finance.crypto_markets import get_
 from request_orchestrator.shared.tool_adapter.finance.exchange_rates_lookup import exchange_rates_lookup
 from request_orchestrator.shared.tool_adapter.finance.exchange_rates_time_series import exchange_rates_time_series
 from request_orchestrator.shared.tool_adapter.finance.get_stock_price import get_stock_price
+from request_orchestrator.shared.tool_adapter.finance.get_stock_prices import get_stock_prices
 from request_orchestrator.shared.tool_adapter.finance.latest_exchange_rates import get_latest_exchange_rates
 from request_orchestrator.shared.tool_adapter.food.search_cocktails import search_cocktails
 from request_orchestrator.shared.tool_adapter.food.search_meals import search_meals
@@ -23,6 +24,7 @@ from request_orchestrator.shared.tool_adapter.language.define_word import define
 from request_orchestrator.shared.tool_adapter.location.get_caller_location import get_caller_location
 from request_orchestrator.shared.tool_adapter.math.calculate import calculate
 from request_orchestrator.shared.tool_adapter.memories.get_memory_detail import get_memory_detail
+from request_orchestrator.shared.tool_adapter.memories.recall_memories import recall_memories
 from request_orchestrator.shared.tool_adapter.memories.search_memories import search_memories
 from request_orchestrator.shared.tool_adapter.memories.search_roundtrip_memories import search_roundtrip_memories
 from request_orchestrator.shared.tool_adapter.news.hn_search import hn_search
@@ -37,13 +39,16 @@ from request_orchestrator.shared.tool_adapter.profile.set_user_last_name import
 from request_orchestrator.shared.tool_adapter.profile.update_user_tone import update_user_tone
 from request_orchestrator.shared.tool_adapter.products.find_products_web import find_products_web
 from request_orchestrator.shared.tool_adapter.products.list_product_categories import list_product_categories
+from products.facets import product_facet_planner_rules
 from request_orchestrator.shared.tool_adapter.search.brave_news_search import news_search
 from request_orchestrator.shared.tool_adapter.search.country_lookup import country_lookup
 from request_orchestrator.shared.tool_adapter.search.generic_web_search import generic_web_search
 from request_orchestrator.shared.tool_adapter.search.structured_facts_lookup import structured_facts_lookup
 from request_orchestrator.shared.tool_adapter.search.wikipedia_search import wikipedia_search
+from request_orchestrator.shared.tool_adapter.timeseries.get_series_points import get_series_points
 from request_orchestrator.shared.tool_adapter.weather.get_current_weather import get_current_weather
 from request_orchestrator.shared.tool_adapter.weather.get_historical_month_weather import get_historical_month_weather
+from request_orchestrator.shared.tool_adapter.weather.get_historical_weather_range import get_historical_weather_range
 from request_orchestrator.shared.tool_adapter.weather.resolve_city_location import resolve_city_location
 from tool.constants import TOOL_RESULT_TYPE_ADVICE
 from tool.constants import TOOL_RESULT_TYPE_ASTRONOMY_PICTURE
@@ -71,6 +76,7 @@ from tool.constants import TOOL_RESULT_TYPE_PRODUCT_CATEGORIES
 from tool.constants import TOOL_RESULT_TYPE_PRODUCT_RESULTS
 from tool.constants import TOOL_RESULT_TYPE_PROFILE
 from tool.constants import TOOL_RESULT_TYPE_QUOTE
+from tool.constants import TOOL_RESULT_TYPE_SERIES
 from tool.constants import TOOL_RESULT_TYPE_RULES
 from tool.constants import TOOL_RESULT_TYPE_STRUCTURED_FACTS
 from tool.constants import TOOL_RESULT_TYPE_TIME
@@ -78,7 +84,16 @@ from tool.constants import TOOL_RESULT_TYPE_TONE
 from tool.constants import TOOL_RESULT_TYPE_USER_ATTRIBUTE
 from tool.constants import TOOL_RESULT_TYPE_WEATHER
 from tool.constants import TOOL_RESULT_TYPE_WEB_SEARCH_RESULTS
-from tool.models import RateLimitPolicy, RetryPolicy, Tool, ToolCategory
+from tool.models import (
+    CACHE_SCOPE_CONVERSATION,
+    CACHE_SCOPE_GLOBAL,
+    CACHE_SCOPE_ROUNDTRIP,
+    CachePolicy,
+    RateLimitPolicy,
+    RetryPolicy,
+    Tool,
+    ToolCategory,
+)
 
 # Rate limiter and retry policy
 BRAVE_RATE_LIMIT_POLICY = RateLimitPolicy(
@@ -93,52 +108,74 @@ BRAVE_RETRY_POLICY = RetryPolicy(
     backoff_seconds=max(0.0, get_env_float("BRAVE_RETRY_BACKOFF_SECONDS", 1.0)),
 )
 
+# Tool result memoization. Only read-only tools opt in; tools that mutate user state are marked with side_effects.
+REFERENCE_CACHE_POLICY = CachePolicy(
+    ttl_seconds=max(0.0, get_env_float("TOOL_CACHE_REFERENCE_TTL_SECONDS", 6 * 60 * 60)),
+    scope=CACHE_SCOPE_GLOBAL,
+)
+CONVERSATION_CACHE_POLICY = CachePolicy(
+    ttl_seconds=max(0.0, get_env_float("TOOL_CACHE_CONVERSATION_TTL_SECONDS", 15 * 60)),
+    scope=CACHE_SCOPE_CONVERSATION,
+)
+LIVE_DATA_CACHE_POLICY = CachePolicy(
+    ttl_seconds=max(0.0, get_env_float("TOOL_CACHE_LIVE_DATA_TTL_SECONDS", 60)),
+    scope=CACHE_SCOPE_ROUNDTRIP,
+)
+
+# Latency budgets. Tools without one fall back to the agent profile's tool_timeout_seconds.
+FAST_TOOL_TIMEOUT_SECONDS = max(0.0, get_env_float("TOOL_TIMEOUT_FAST_SECONDS", 10))
+SLOW_TOOL_TIMEOUT_SECONDS = max(0.0, get_env_float("TOOL_TIMEOUT_SLOW_SECONDS", 45))
+
 # Tool Definitions
-PRODUCT_TOOLS = [Tool(find_products, result_type=TOOL_RESULT_TYPE_PRODUCT_RESULTS), Tool(list_product_categories, result_type=TOOL_RESULT_TYPE_PRODUCT_CATEGORIES)]
-PRODUCT_WEB_TOOLS = [Tool(find_products_web, result_type=TOOL_RESULT_TYPE_PRODUCT_RESULTS)]
+PRODUCT_TOOLS = [Tool(find_products, result_type=TOOL_RESULT_TYPE_PRODUCT_RESULTS, timeout_seconds=SLOW_TOOL_TIMEOUT_SECONDS), Tool(list_product_categories, result_type=TOOL_RESULT_TYPE_PRODUCT_CATEGORIES, cache_policy=CONVERSATION_CACHE_POLICY)]
+PRODUCT_WEB_TOOLS = [Tool(find_products_web, result_type=TOOL_RESULT_TYPE_PRODUCT_RESULTS, timeout_seconds=SLOW_TOOL_TIMEOUT_SECONDS)]
 WEATHER_TOOLS = [
-    Tool(resolve_city_location, result_type=TOOL_RESULT_TYPE_LOCATION),
-    Tool(get_current_weather, result_type=TOOL_RESULT_TYPE_WEATHER),
-    Tool(get_historical_month_weather, result_type=TOOL_RESULT_TYPE_WEATHER),
+    Tool(resolve_city_location, result_type=TOOL_RESULT_TYPE_LOCATION, cache_policy=REFERENCE_CACHE_POLICY),
+    Tool(get_current_weather, result_type=TOOL_RESULT_TYPE_WEATHER, cache_policy=LIVE_DATA_CACHE_POLICY, timeout_seconds=FAST_TOOL_TIMEOUT_SECONDS),
+    Tool(get_historical_month_weather, result_type=TOOL_RESULT_TYPE_WEATHER, cache_policy=REFERENCE_CACHE_POLICY),
+    Tool(get_historical_weather_range, result_type=TOOL_RESULT_TYPE_WEATHER, cache_policy=REFERENCE_CACHE_POLICY, timeout_seconds=SLOW_TOOL_TIMEOUT_SECONDS),
 ]
 FINANCE_TOOLS = [
-    Tool(exchange_rates_lookup, result_type=TOOL_RESULT_TYPE_FINANCE),
-    Tool(exchange_rates_time_series, result_type=TOOL_RESULT_TYPE_FINANCE),
-    Tool(get_latest_exchange_rates, result_type=TOOL_RESULT_TYPE_FINANCE),
-    Tool(get_stock_price, result_type=TOOL_RESULT_TYPE_FINANCE),
+    Tool(exchange_rates_lookup, result_type=TOOL_RESULT_TYPE_FINANCE, cache_policy=CONVERSATION_CACHE_POLICY),
+    Tool(exchange_rates_time_series, result_type=TOOL_RESULT_TYPE_FINANCE, cache_policy=CONVERSATION_CACHE_POLICY),
+    Tool(get_latest_exchange_rates, result_type=TOOL_RESULT_TYPE_FINANCE, cache_policy=LIVE_DATA_CACHE_POLICY, timeout_seconds=FAST_TOOL_TIMEOUT_SECONDS),
+    Tool(get_stock_price, result_type=TOOL_RESULT_TYPE_FINANCE, cache_policy=LIVE_DATA_CACHE_POLICY),
+    Tool(get_stock_prices, result_type=TOOL_RESULT_TYPE_FINANCE, cache_policy=LIVE_DATA_CACHE_POLICY),
 ]
-CRYPTO_TOOLS = [Tool(get_crypto_markets, result_type=TOOL_RESULT_TYPE_CRYPTO_MARKET)]
+SERIES_TOOLS = [Tool(get_series_points, result_type=TOOL_RESULT_TYPE_SERIES, timeout_seconds=FAST_TOOL_TIMEOUT_SECONDS)]
+CRYPTO_TOOLS = [Tool(get_crypto_markets, result_type=TOOL_RESULT_TYPE_CRYPTO_MARKET, cache_policy=LIVE_DATA_CACHE_POLICY, timeout_seconds=FAST_TOOL_TIMEOUT_SECONDS)]
 WEB_SEARCH_TOOLS = [
     Tool(generic_web_search, result_type=TOOL_RESULT_TYPE_WEB_SEARCH_RESULTS, rate_limit_key="brave", retry_policy=BRAVE_RETRY_POLICY, rate_limit_policy=BRAVE_RATE_LIMIT_POLICY),
     Tool(news_search, result_type=TOOL_RESULT_TYPE_NEWS_RESULTS, rate_limit_key="brave", retry_policy=BRAVE_RETRY_POLICY, rate_limit_policy=BRAVE_RATE_LIMIT_POLICY),
 ]
 KNOWLEDGE_TOOLS = [
-    Tool(wikipedia_search, result_type=TOOL_RESULT_TYPE_KNOWLEDGE),
-    Tool(structured_facts_lookup, result_type=TOOL_RESULT_TYPE_STRUCTURED_FACTS),
+    Tool(wikipedia_search, result_type=TOOL_RESULT_TYPE_KNOWLEDGE, cache_policy=CONVERSATION_CACHE_POLICY),
+    Tool(structured_facts_lookup, result_type=TOOL_RESULT_TYPE_STRUCTURED_FACTS, cache_policy=CONVERSATION_CACHE_POLICY),
     Tool(hn_search, result_type=TOOL_RESULT_TYPE_NEWS_RESULTS),
-    Tool(country_lookup, result_type=TOOL_RESULT_TYPE_COUNTRY),
+    Tool(country_lookup, result_type=TOOL_RESULT_TYPE_COUNTRY, cache_policy=REFERENCE_CACHE_POLICY),
 ]
-CALENDAR_TOOLS = [Tool(public_holidays_lookup, result_type=TOOL_RESULT_TYPE_CALENDAR), Tool(get_world_time, result_type=TOOL_RESULT_TYPE_TIME)]
-LOCATION_TOOLS = [Tool(get_caller_location, result_type=TOOL_RESULT_TYPE_LOCATION)]
+CALENDAR_TOOLS = [Tool(public_holidays_lookup, result_type=TOOL_RESULT_TYPE_CALENDAR, cache_policy=REFERENCE_CACHE_POLICY), Tool(get_world_time, result_type=TOOL_RESULT_TYPE_TIME, timeout_seconds=FAST_TOOL_TIMEOUT_SECONDS)]
+LOCATION_TOOLS = [Tool(get_caller_location, result_type=TOOL_RESULT_TYPE_LOCATION, timeout_seconds=FAST_TOOL_TIMEOUT_SECONDS)]
 BOOKS_TOOLS = [Tool(search_books, result_type=TOOL_RESULT_TYPE_BOOK_RESULTS)]
-LANGUAGE_TOOLS = [Tool(define_word, result_type=TOOL_RESULT_TYPE_DEFINITION)]
+LANGUAGE_TOOLS = [Tool(define_word, result_type=TOOL_RESULT_TYPE_DEFINITION, cache_policy=REFERENCE_CACHE_POLICY)]
 FOOD_TOOLS = [Tool(search_meals, result_type=TOOL_RESULT_TYPE_MEAL_RESULTS), Tool(search_cocktails, result_type=TOOL_RESULT_TYPE_COCKTAIL_RESULTS)]
-FUN_TOOLS = [Tool(get_advice, result_type=TOOL_RESULT_TYPE_ADVICE), Tool(get_quote, result_type=TOOL_RESULT_TYPE_QUOTE), Tool(get_astronomy_picture, result_type=TOOL_RESULT_TYPE_ASTRONOMY_PICTURE)]
-MATH_TOOLS = [Tool(calculate, result_type=TOOL_RESULT_TYPE_CALCULATION)]
+FUN_TOOLS = [Tool(get_advice, result_type=TOOL_RESULT_TYPE_ADVICE, timeout_seconds=FAST_TOOL_TIMEOUT_SECONDS), Tool(get_quote, result_type=TOOL_RESULT_TYPE_QUOTE, timeout_seconds=FAST_TOOL_TIMEOUT_SECONDS), Tool(get_astronomy_picture, result_type=TOOL_RESULT_TYPE_ASTRONOMY_PICTURE)]
+MATH_TOOLS = [Tool(calculate, result_type=TOOL_RESULT_TYPE_CALCULATION, timeout_seconds=FAST_TOOL_TIMEOUT_SECONDS)]
 GAMES_TOOLS = [
-    Tool(get_commander_details, result_type=TOOL_RESULT_TYPE_DECKS),
-    Tool(get_commander_cards, result_type=TOOL_RESULT_TYPE_CARD_RESULTS),
-    Tool(search_magic_cards, result_type=TOOL_RESULT_TYPE_CARD_RESULTS),
-    Tool(get_magic_card_rulings, result_type=TOOL_RESULT_TYPE_RULES),
+    Tool(get_commander_details, result_type=TOOL_RESULT_TYPE_DECKS, cache_policy=REFERENCE_CACHE_POLICY),
+    Tool(get_commander_cards, result_type=TOOL_RESULT_TYPE_CARD_RESULTS, cache_policy=CONVERSATION_CACHE_POLICY, timeout_seconds=SLOW_TOOL_TIMEOUT_SECONDS),
+    Tool(search_magic_cards, result_type=TOOL_RESULT_TYPE_CARD_RESULTS, cache_policy=CONVERSATION_CACHE_POLICY),
+    Tool(get_magic_card_rulings, result_type=TOOL_RESULT_TYPE_RULES, cache_policy=REFERENCE_CACHE_POLICY),
 ]
 MEMORY_TOOLS = [
     Tool(get_memory_detail, result_type=TOOL_RESULT_TYPE_MEMORY_DETAIL),
+    Tool(recall_memories, result_type=TOOL_RESULT_TYPE_MEMORY_RESULTS),
     Tool(search_memories, result_type=TOOL_RESULT_TYPE_MEMORY_RESULTS),
     Tool(search_roundtrip_memories, result_type=TOOL_RESULT_TYPE_MEMORY_RESULTS),
 ]
-USER_ATTRIBUTE_TOOLS = [Tool(create_user_attribute, result_type=TOOL_RESULT_TYPE_USER_ATTRIBUTE), Tool(update_user_attribute, result_type=TOOL_RESULT_TYPE_USER_ATTRIBUTE), Tool(get_user_attributes, result_type=TOOL_RESULT_TYPE_USER_ATTRIBUTE), Tool(search_user_attributes, result_type=TOOL_RESULT_TYPE_USER_ATTRIBUTE)]
+USER_ATTRIBUTE_TOOLS = [Tool(create_user_attribute, result_type=TOOL_RESULT_TYPE_USER_ATTRIBUTE, side_effects=True), Tool(update_user_attribute, result_type=TOOL_RESULT_TYPE_USER_ATTRIBUTE, side_effects=True), Tool(get_user_attributes, result_type=TOOL_RESULT_TYPE_USER_ATTRIBUTE), Tool(search_user_attributes, result_type=TOOL_RESULT_TYPE_USER_ATTRIBUTE)]
 FILE_TOOLS = [Tool(search_files, result_type=TOOL_RESULT_TYPE_FILE_RESULTS), Tool(search_file_for_details, result_type=TOOL_RESULT_TYPE_FILE_DETAILS), Tool(get_file_by_id, result_type=TOOL_RESULT_TYPE_FILE)]
-PROFILE_TOOLS = [Tool(set_user_display_name, result_type=TOOL_RESULT_TYPE_PROFILE), Tool(set_user_first_name, result_type=TOOL_RESULT_TYPE_PROFILE), Tool(set_user_last_name, result_type=TOOL_RESULT_TYPE_PROFILE), Tool(update_user_tone, result_type=TOOL_RESULT_TYPE_TONE)]
+PROFILE_TOOLS = [Tool(set_user_display_name, result_type=TOOL_RESULT_TYPE_PROFILE, side_effects=True), Tool(set_user_first_name, result_type=TOOL_RESULT_TYPE_PROFILE, side_effects=True), Tool(set_user_last_name, result_type=TOOL_RESULT_TYPE_PROFILE, side_effects=True), Tool(update_user_tone, result_type=TOOL_RESULT_TYPE_TONE, side_effects=True)]
 
 # if this were to grow much larger I would probably create sub categories or a tree structure of tools
 TOOL_CATEGORIES: dict[str, ToolCategory] = {
@@ -148,7 +185,8 @@ TOOL_CATEGORIES: dict[str, ToolCategory] = {
         rules=[
             "Make sure that previous context is taken into account when providing filters unless explicitly told not to.",
             "When utilizing an image for comparison make sure that we load its description first. Utilize the description not the file name.",
-        ]
+        ],
+        dynamic_rules=product_facet_planner_rules,
     ),
     "products_web": ToolCategory(
         tools=PRODUCT_WEB_TOOLS,
@@ -158,10 +196,17 @@ TOOL_CATEGORIES: dict[str, ToolCategory] = {
     "weather": ToolCategory(
         tools=WEATHER_TOOLS,
         description="Look up current or historical weather conditions for a city.",
+        rules=["For questions spanning more than one month, make ONE get_historical_weather_range call instead of one call per month."],
     ),
     "finance": ToolCategory(
         tools=FINANCE_TOOLS,
         description="Retrieve currency exchange rates, historical rate time series, stock prices, and commodity prices (e.g. gold, silver via futures tickers like GC=F, SI=F).",
+        rules=["When more than one ticker is needed, make ONE get_stock_prices call with all of them."],
+    ),
+    "series": ToolCategory(
+        tools=SERIES_TOOLS,
+        description="Read the full-resolution points of a time series (stock history, exchange rates, daily weather) that an earlier tool call summarized under a series_id.",
+        rules=["Only use with a series_id taken from earlier evidence, and only when its summary stats and sampled points do not answer the question."],
     ),
     "finance_crypto": ToolCategory(
         tools=CRYPTO_TOOLS,
@@ -213,10 +258,11 @@ TOOL_CATEGORIES: dict[str, ToolCategory] = {
         tools=MEMORY_TOOLS,
         description="Search prior conversation summaries for relevant past requests and discussions as memories.",
         rules=[
-            "Use search_memories first to locate the most relevant conversations for a topic or prior discussion.",
+            "Use recall_memories first: one call ranks prior conversations, the specific exchanges inside them, and stored user attributes together.",
+            "Use search_memories only when recall_memories did not surface the conversations you need.",
             "Use search_roundtrip_memories after search_memories when you need specific historical mentions or exchanges inside those conversations.",
-            "Use get_memory_detail after search_roundtrip_memories when you need the exact prior prompt, response, or structured payload for one memory hit.",
-            "When the user asks what was previously said, decided, suggested, or discussed about a topic, prefer the two-step memories flow over guessing from current context.",
+            "Use get_memory_detail after recall_memories or search_roundtrip_memories when you need the exact prior prompt, response, or structured payload for one memory hit.",
+            "When the user asks what was previously said, decided, suggested, or discussed about a topic, prefer recalling memories over guessing from current context.",
         ],
     ),
     "user_attributes": ToolCategory(
@@ -251,7 +297,7 @@ TOOL_CATEGORIES: dict[str, ToolCategory] = {
     ),
 }
 
-tools = [*PRODUCT_TOOLS, *PRODUCT_WEB_TOOLS, *WEATHER_TOOLS, *FINANCE_TOOLS, *CRYPTO_TOOLS, *WEB_SEARCH_TOOLS, *KNOWLEDGE_TOOLS, *CALENDAR_TOOLS, *LOCATION_TOOLS, *BOOKS_TOOLS, *LANGUAGE_TOOLS, *FOOD_TOOLS, *FUN_TOOLS, *MATH_TOOLS, *GAMES_TOOLS, *MEMORY_TOOLS, *USER_ATTRIBUTE_TOOLS, *FILE_TOOLS, *PROFILE_TOOLS]
+tools = [*PRODUCT_TOOLS, *PRODUCT_WEB_TOOLS, *WEATHER_TOOLS, *FINANCE_TOOLS, *SERIES_TOOLS, *CRYPTO_TOOLS, *WEB_SEARCH_TOOLS, *KNOWLEDGE_TOOLS, *CALENDAR_TOOLS, *LOCATION_TOOLS, *BOOKS_TOOLS, *LANGUAGE_TOOLS, *FOOD_TOOLS, *FUN_TOOLS, *MATH_TOOLS, *GAMES_TOOLS, *MEMORY_TOOLS, *USER_ATTRIBUTE_TOOLS, *FILE_TOOLS, *PROFILE_TOOLS]
 
 TOOLS_BY_NAME = {tool.name: tool for tool in tools}
 